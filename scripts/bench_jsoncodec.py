@@ -0,0 +1,98 @@
+"""Microbenchmark for the JSON codec on a Zephyr Scale search response.
+
+Compares the former path (stdlib decode of the response text, then
+`json.dumps(indent=2)` for the tool result) with `utils.jsoncodec`, on the
+standard library and, when installed, orjson, and with passing the body
+through untouched as RawJSON.
+
+Usage: python scripts/bench_jsoncodec.py [--entries 500] [--repeat 20]
+"""
+
+import argparse
+import json
+import statistics
+import time
+from collections.abc import Callable
+from unittest.mock import patch
+
+from zephyr_mcp.utils import jsoncodec
+
+
+def search_response(entries: int) -> bytes:
+    """Build a /testcases search body shaped like the real API, with `entries` test cases."""
+    values = [
+        {
+            "id": 100000 + i,
+            "key": f"PROJ-T{i}",
+            "name": f"Verify checkout flow handles coupon variant {i} with localised prices (ü, é, ✓)",
+            "project": {"id": 10001, "self": "https://api.zephyrscale.smartbear.com/v2/projects/10001"},
+            "createdOn": "2024-05-14T09:12:33Z",
+            "objective": "Ensure the order total, taxes and discounts are computed and displayed correctly. " * 2,
+            "precondition": "User is logged in and the cart contains at least two items.",
+            "estimatedTime": 180000,
+            "labels": ["regression", "checkout", f"sprint-{i % 12}"],
+            "component": {"id": 20000 + i % 7, "self": f"https://example.atlassian.net/rest/api/2/component/{20000 + i % 7}"},
+            "priority": {"id": 3, "self": "https://api.zephyrscale.smartbear.com/v2/priorities/3"},
+            "status": {"id": 1, "self": "https://api.zephyrscale.smartbear.com/v2/statuses/1"},
+            "folder": {"id": 300 + i % 25, "self": f"https://api.zephyrscale.smartbear.com/v2/folders/{300 + i % 25}"},
+            "owner": {
+                "self": "https://example.atlassian.net/rest/api/2/user?accountId=5b10ac8d82e05b22cc7d4ef5",
+                "accountId": "5b10ac8d82e05b22cc7d4ef5",
+            },
+            "testScript": {"self": f"https://api.zephyrscale.smartbear.com/v2/testcases/PROJ-T{i}/testscript"},
+            "customFields": {"Build Number": 20 + i % 5, "Release Date": "2024-06-01", "Pre-Condition(s)": None, "Implemented": i % 2 == 0},
+            "links": {"issues": [{"issueId": 10100 + i, "id": i, "target": "https://example.atlassian.net/browse/PROJ-1", "type": "COVERAGE"}]},
+        }
+        for i in range(entries)
+    ]
+    body = {"next": None, "startAt": 0, "maxResults": entries, "total": entries, "isLast": True, "values": values}
+    return json.dumps(body).encode()
+
+
+def measure(func: Callable[[], object], repeat: int) -> float:
+    """Median wall time of func in milliseconds."""
+    func()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    body = search_response(args.entries)
+    text = body.decode()
+    parsed = json.loads(body)
+
+    backends = ["json"] + (["orjson"] if jsoncodec.orjson is not None else [])
+    print(f"Payload: {args.entries} test cases, {len(body) / 1024:.0f} KiB response body")
+    print(f"{'path':<34}{'decode ms':>11}{'encode ms':>11}{'total ms':>10}{'result KiB':>12}")
+    base_decode = measure(lambda: json.loads(text), args.repeat)
+    base_encode = measure(lambda: json.dumps(parsed, indent=2), args.repeat)
+    base_total = base_decode + base_encode
+    base_size = len(json.dumps(parsed, indent=2)) / 1024
+    print(f"{'baseline (json, indent=2)':<34}{base_decode:>11.2f}{base_encode:>11.2f}{base_total:>10.2f}{base_size:>12.0f}")
+    for backend in backends:
+        with patch.object(jsoncodec, "orjson", jsoncodec.orjson if backend == "orjson" else None):
+            decode = measure(lambda: jsoncodec.loads(body), args.repeat)
+            encode = measure(lambda: jsoncodec.dumps(parsed), args.repeat)
+            size = len(jsoncodec.dumps(parsed)) / 1024
+        total = decode + encode
+        label = f"jsoncodec ({backend}, compact)"
+        speedup = base_total / total
+        print(f"{label:<34}{decode:>11.2f}{encode:>11.2f}{total:>10.2f}{size:>12.0f}   x{speedup:.1f}")
+    passthrough = measure(lambda: jsoncodec.dumps(jsoncodec.RawJSON(body)), args.repeat)
+    label = "RawJSON passthrough"
+    print(f"{label:<34}{0:>11.2f}{passthrough:>11.2f}{passthrough:>10.2f}{len(body) / 1024:>12.0f}   x{base_total / passthrough:.0f}")
+    if jsoncodec.orjson is None:
+        print("orjson is not installed; install the 'fast' extra to compare it.")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,8 +20,9 @@ def main() -> None:
 @click.option("--port", type=int, default=8000, help="Port for SSE transport")
 @click.option("--host", type=str, default="0.0.0.0", help="Host for SSE transport")  # noqa: S104
 @click.option("--read-only", is_flag=True, default=False, help="Run in read-only mode")
+@click.option("--workers", type=click.IntRange(min=1), default=None, help="Worker threads for blocking API calls (default: ZEPHYR_WORKER_THREADS)")
 @click.option("-v", "--verbose", count=True, help="Increase logging verbosity (-v for INFO, -vv for DEBUG)")
-def _cli(transport: str, port: int, host: str, read_only: bool, verbose: int) -> None:
+def _cli(transport: str, port: int, host: str, read_only: bool, workers: int | None, verbose: int) -> None:
     """Start the Zephyr Scale MCP server."""
     from zephyr_mcp.server import create_server
 
@@ -33,7 +34,7 @@ def _cli(transport: str, port: int, host: str, read_only: bool, verbose: int) ->
 
     logging.basicConfig(level=log_level, stream=sys.stderr, format="%(levelname)s - %(name)s - %(message)s")
 
-    server = create_server(read_only=read_only)
+    server = create_server(read_only=read_only, worker_threads=workers)
 
     if transport == "stdio":
         server.run(transport="stdio")
@@ -0,0 +1,38 @@
+"""Caching of Zephyr API data."""
+
+from zephyr_mcp.cache.backend import CacheBackend, CacheBackendPolicy, get_cache_backend
+from zephyr_mcp.cache.entity import EntityCache, EntityCachePolicy, StaleJSON, get_entity_cache, reset_entity_caches
+from zephyr_mcp.cache.http import CachedResponse, HTTPCache, HTTPCachePolicy, get_http_cache, reset_http_caches
+from zephyr_mcp.cache.metadata import MetadataCache, MetadataCachePolicy, get_metadata_cache, reset_metadata_caches
+from zephyr_mcp.cache.mixin import EntityCacheMixin
+from zephyr_mcp.cache.persistent import PersistentCache, PersistentCachePolicy, get_persistent_cache, reset_persistent_caches
+from zephyr_mcp.cache.shared import RedisCache, RedisCachePolicy, get_redis_cache, reset_redis_caches
+
+__all__ = [
+    "CacheBackend",
+    "CacheBackendPolicy",
+    "CachedResponse",
+    "EntityCache",
+    "EntityCacheMixin",
+    "EntityCachePolicy",
+    "HTTPCache",
+    "HTTPCachePolicy",
+    "MetadataCache",
+    "MetadataCachePolicy",
+    "PersistentCache",
+    "PersistentCachePolicy",
+    "RedisCache",
+    "RedisCachePolicy",
+    "StaleJSON",
+    "get_cache_backend",
+    "get_entity_cache",
+    "get_http_cache",
+    "get_metadata_cache",
+    "get_persistent_cache",
+    "get_redis_cache",
+    "reset_entity_caches",
+    "reset_http_caches",
+    "reset_metadata_caches",
+    "reset_persistent_caches",
+    "reset_redis_caches",
+]
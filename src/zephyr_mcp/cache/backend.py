@@ -0,0 +1,87 @@
+"""The store behind the in-process caches: none, a SQLite file or a shared Redis-protocol server."""
+
+import dataclasses
+import logging
+import os
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+
+from zephyr_mcp.cache.persistent import PersistentCachePolicy, get_persistent_cache
+from zephyr_mcp.cache.shared import RedisCachePolicy, get_redis_cache
+
+logger = logging.getLogger("mcp-zephyr")
+
+BACKEND_MEMORY = "memory"
+BACKEND_SQLITE = "sqlite"
+BACKEND_REDIS = "redis"
+CACHE_BACKENDS = (BACKEND_MEMORY, BACKEND_SQLITE, BACKEND_REDIS)
+
+
+class CacheBackend(Protocol):
+    """What the entity and HTTP caches need from the store behind their memory tier.
+
+    Rows are keyed by partition (the credential scope), namespace and key and
+    carry a body, optional JSON metadata and a wall-clock expiry. Stores log
+    their own errors and answer with misses instead of raising.
+    """
+
+    @property
+    def available(self) -> bool: ...
+
+    def get(self, partition: str, namespace: str, key: str) -> tuple[bytes, dict[str, Any] | None, float] | None: ...
+
+    def put(self, partition: str, namespace: str, key: str, body: bytes, meta: dict[str, Any] | None = None, ttl: float | None = None) -> None: ...
+
+    def delete(self, partition: str, namespace: str, key: str) -> None: ...
+
+    def invalidate(self, partition: str, namespace: str, key: str) -> None:
+        """Delete a row after a write and tell other processes sharing the store, where the store supports it."""
+        ...
+
+    def subscribe(self, callback: Callable[[str, str, str], None]) -> None:
+        """Register a bound method called with (partition, namespace, key) for rows other processes invalidate."""
+        ...
+
+    def clear(self, partition: str | None = None) -> None: ...
+
+    def stats(self) -> dict[str, int]: ...
+
+    def close(self) -> None: ...
+
+
+@dataclass(frozen=True)
+class CacheBackendPolicy:
+    """Which store backs the caches, with the settings of each kind."""
+
+    backend: str = BACKEND_MEMORY
+    persistent: PersistentCachePolicy = field(default_factory=PersistentCachePolicy)
+    redis: RedisCachePolicy = field(default_factory=RedisCachePolicy)
+
+    @classmethod
+    def from_env(cls) -> "CacheBackendPolicy":
+        """Read ZEPHYR_CACHE_BACKEND (memory, sqlite or redis).
+
+        Unset, it is redis when ZEPHYR_CACHE_REDIS_URL is set, sqlite when
+        ZEPHYR_PERSISTENT_CACHE is enabled and memory otherwise.
+        """
+        persistent = PersistentCachePolicy.from_env()
+        redis = RedisCachePolicy.from_env()
+        backend = (os.getenv("ZEPHYR_CACHE_BACKEND") or "").strip().lower()
+        if backend and backend not in CACHE_BACKENDS:
+            logger.warning(f"Ignoring unknown ZEPHYR_CACHE_BACKEND {backend!r}. Valid backends: {', '.join(CACHE_BACKENDS)}")
+            backend = ""
+        if not backend:
+            backend = BACKEND_REDIS if redis.url else BACKEND_SQLITE if persistent.enabled else BACKEND_MEMORY
+        if backend == BACKEND_SQLITE and not persistent.enabled:
+            persistent = dataclasses.replace(persistent, enabled=persistent.ttl > 0 and persistent.max_bytes > 0)
+        return cls(backend=backend, persistent=persistent, redis=redis)
+
+
+def get_cache_backend(policy: CacheBackendPolicy) -> CacheBackend | None:
+    """Return the process-wide store for the policy, or None for memory only (or when the store cannot be used)."""
+    if policy.backend == BACKEND_SQLITE:
+        return get_persistent_cache(policy.persistent)
+    if policy.backend == BACKEND_REDIS:
+        return get_redis_cache(policy.redis)
+    return None
@@ -0,0 +1,373 @@
+"""In-process entity cache with TTL and memory-bounded LRU eviction."""
+
+import logging
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from zephyr_mcp.cache.backend import CacheBackend
+from zephyr_mcp.utils.env import get_env_float, is_env_truthy
+from zephyr_mcp.utils.jsoncodec import RawJSON
+from zephyr_mcp.utils.metrics import metrics
+
+logger = logging.getLogger("mcp-zephyr")
+
+DEFAULT_ENTITY_CACHE_TTL = 60.0
+DEFAULT_ENTITY_CACHE_MAX_MB = 64.0
+DEFAULT_ENTITY_CACHE_NEGATIVE_TTL = 30.0
+DEFAULT_STALE_WHILE_REVALIDATE = 30.0
+DEFAULT_STALE_IF_ERROR = 900.0
+
+# Keys remembered as not found; they carry no body, so they are bounded by count.
+_MAX_MISSING = 4096
+
+# Approximate bookkeeping cost of one entry beyond its body, so many tiny entries still count against the bound.
+_ENTRY_OVERHEAD = 200
+
+CacheKey = tuple[str, str, str]
+
+
+@dataclass(frozen=True)
+class EntityCachePolicy:
+    """How long fetched entities (and 404s for unknown keys) are remembered, and how much memory the cache may hold."""
+
+    enabled: bool = True
+    ttl: float = DEFAULT_ENTITY_CACHE_TTL
+    max_bytes: int = int(DEFAULT_ENTITY_CACHE_MAX_MB * 1024 * 1024)
+    negative_ttl: float = DEFAULT_ENTITY_CACHE_NEGATIVE_TTL
+    # Seconds past the TTL an entry is still served while a background refresh runs, and when the API fails.
+    stale_while_revalidate: float = DEFAULT_STALE_WHILE_REVALIDATE
+    stale_if_error: float = DEFAULT_STALE_IF_ERROR
+    # Per-kind caps on both staleness windows, as (kind, seconds) pairs.
+    max_stale: tuple[tuple[str, float], ...] = ()
+
+    @classmethod
+    def from_env(cls) -> "EntityCachePolicy":
+        """Read ZEPHYR_ENTITY_CACHE, ZEPHYR_ENTITY_CACHE_TTL, ZEPHYR_ENTITY_CACHE_MAX_MB, ZEPHYR_ENTITY_CACHE_NEGATIVE_TTL,
+        ZEPHYR_ENTITY_CACHE_STALE_WHILE_REVALIDATE, ZEPHYR_ENTITY_CACHE_STALE_IF_ERROR and ZEPHYR_ENTITY_CACHE_MAX_STALE."""
+        ttl = max(0.0, get_env_float("ZEPHYR_ENTITY_CACHE_TTL", DEFAULT_ENTITY_CACHE_TTL))
+        max_mb = max(0.0, get_env_float("ZEPHYR_ENTITY_CACHE_MAX_MB", DEFAULT_ENTITY_CACHE_MAX_MB))
+        return cls(
+            enabled=is_env_truthy("ZEPHYR_ENTITY_CACHE", "true") and ttl > 0 and max_mb > 0,
+            ttl=ttl,
+            max_bytes=int(max_mb * 1024 * 1024),
+            negative_ttl=max(0.0, get_env_float("ZEPHYR_ENTITY_CACHE_NEGATIVE_TTL", DEFAULT_ENTITY_CACHE_NEGATIVE_TTL)),
+            stale_while_revalidate=max(0.0, get_env_float("ZEPHYR_ENTITY_CACHE_STALE_WHILE_REVALIDATE", DEFAULT_STALE_WHILE_REVALIDATE)),
+            stale_if_error=max(0.0, get_env_float("ZEPHYR_ENTITY_CACHE_STALE_IF_ERROR", DEFAULT_STALE_IF_ERROR)),
+            max_stale=_parse_max_stale("ZEPHYR_ENTITY_CACHE_MAX_STALE"),
+        )
+
+    def stale_window(self, kind: str, on_error: bool) -> float:
+        """Seconds past the TTL an entity of this kind may be served, while revalidating or because the API failed."""
+        window = self.stale_if_error if on_error else self.stale_while_revalidate
+        return min(window, dict(self.max_stale).get(kind, window))
+
+    def retention(self, kind: str) -> float:
+        """Seconds past the TTL an entry of this kind is kept for stale reads."""
+        return max(self.stale_window(kind, False), self.stale_window(kind, True))
+
+
+class StaleJSON(RawJSON):
+    """A cached body served past its TTL.
+
+    age is the number of seconds since it was fetched; error is the failure
+    that made the cache fall back to it, or None while a refresh is running.
+    """
+
+    def __init__(self, content: bytes, age: float, error: str | None = None) -> None:
+        super().__init__(content)
+        self.age = age
+        self.error = error
+
+    def describe(self) -> str:
+        """A one-line note for tool results that says how old the data is and why it was served."""
+        if self.error is None:
+            return f"Cached copy from {self.age:.0f}s ago; a refresh is in progress."
+        return f"STALE: cached copy from {self.age:.0f}s ago, served because the API is unavailable ({self.error})."
+
+
+class EntityCache:
+    """Raw JSON bodies of single entities, keyed by (credential scope, kind, id).
+
+    Entries expire after the policy TTL; once the bodies exceed max_bytes the
+    least recently used entries are evicted. Bodies are kept as bytes so the
+    bound is exact and every reader decodes its own copy.
+
+    Writes bump a generation counter: a read that started before a write
+    invalidated its entry must not put the stale body it fetched back.
+
+    With a store (SQLite or Redis), entries are also written there, kept for
+    the store's own TTL with the time they were fetched, and a memory miss is
+    looked up there before it counts as a miss. A stored row past the entity
+    TTL is loaded as a stale entry, which stale() serves while a refresh runs
+    (within the kind's max_stale cap only), so a new process answers its first
+    reads at once. Invalidations delete the stored row; on a shared store,
+    invalidations made by other replicas drop the copy held here too.
+
+    Keys the API answered with 404 are remembered, with the error message,
+    for the shorter negative_ttl, so retries of a guessed key stay local.
+    They are kept in memory only.
+
+    Expired entries stay in memory for the policy's staleness windows, so
+    stale() can hand them out while a refresh runs or the API is down.
+    """
+
+    def __init__(self, policy: EntityCachePolicy, name: str = "", store: CacheBackend | None = None) -> None:
+        self.policy = policy
+        self.name = name
+        self.store = store
+        self._lock = threading.Lock()
+        # Each entry is (expires at, body, TTL it was stored with, loaded from the store past that TTL).
+        self._entries: OrderedDict[CacheKey, tuple[float, bytes, float, bool]] = OrderedDict()
+        self._missing: OrderedDict[CacheKey, tuple[float, str]] = OrderedDict()
+        self._bytes = 0
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._negative_hits = 0
+        self._stale_served = 0
+        self._refreshing: set[CacheKey] = set()
+        if store is not None:
+            store.subscribe(self._forget)
+
+    def generation(self) -> int:
+        """Token to pass to put() for a body fetched from now on."""
+        with self._lock:
+            return self._generation
+
+    def get(self, scope: str, kind: str, entity_id: str) -> bytes | None:
+        """Return the fresh cached body, or None on a miss."""
+        key = (scope, kind, entity_id)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            held = entry is not None
+            if entry is not None and entry[0] <= now:
+                if entry[0] + self.policy.retention(kind) <= now:
+                    self._remove(key)
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+        body = entry[1] if entry is not None else self._load(key, first=not held)
+        with self._lock:
+            if body is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        labels = {"cache": self.name, "kind": kind}
+        metrics.increment("zephyr_entity_cache_hits_total" if body is not None else "zephyr_entity_cache_misses_total", labels=labels)
+        return body
+
+    def put(self, scope: str, kind: str, entity_id: str, body: bytes, generation: int | None = None, ttl: float | None = None) -> None:
+        """Store a body for ttl seconds (the policy TTL by default); skipped when an invalidation happened since generation was taken."""
+        key = (scope, kind, entity_id)
+        ttl = self.policy.ttl if ttl is None else ttl
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            generation = self._generation
+            self._insert(key, body, time.monotonic() + ttl, ttl)
+        if self.store is not None:
+            self.store.put(scope, "entity", _store_key(kind, entity_id), body, meta={"fetched_at": time.time(), "ttl": ttl})
+            if self.generation() != generation:
+                # An invalidation may have deleted the row before it was written.
+                self.store.delete(scope, "entity", _store_key(kind, entity_id))
+
+    def stale(self, scope: str, kind: str, entity_id: str, error: str | None = None) -> StaleJSON | None:
+        """Return an expired body still within its staleness window, or None.
+
+        Without error the stale-while-revalidate window applies; with the
+        message of a failed request, the longer stale-if-error window.
+        """
+        key = (scope, kind, entity_id)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] > now:
+                return None
+            window = dict(self.policy.max_stale).get(kind, math.inf) if entry[3] else self.policy.stale_window(kind, error is not None)
+            if now - entry[0] >= window:
+                return None
+            self._stale_served += 1
+        metrics.increment(
+            "zephyr_entity_cache_stale_total", labels={"cache": self.name, "kind": kind, "reason": "revalidate" if error is None else "error"}
+        )
+        return StaleJSON(entry[1], now - entry[0] + entry[2], error)
+
+    def begin_refresh(self, scope: str, kind: str, entity_id: str) -> bool:
+        """Claim the background refresh of an entry; False when one is already running."""
+        with self._lock:
+            if (scope, kind, entity_id) in self._refreshing:
+                return False
+            self._refreshing.add((scope, kind, entity_id))
+            return True
+
+    def end_refresh(self, scope: str, kind: str, entity_id: str) -> None:
+        with self._lock:
+            self._refreshing.discard((scope, kind, entity_id))
+
+    def missing(self, scope: str, kind: str, entity_id: str) -> str | None:
+        """Return the error message of a recent 404 for the entity, or None."""
+        key = (scope, kind, entity_id)
+        with self._lock:
+            entry = self._missing.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._missing[key]
+                return None
+            self._negative_hits += 1
+        metrics.increment("zephyr_entity_cache_negative_hits_total", labels={"cache": self.name, "kind": kind})
+        return entry[1]
+
+    def put_missing(self, scope: str, kind: str, entity_id: str, message: str, generation: int | None = None) -> None:
+        """Remember that the entity was not found, dropping any stale body; skipped when an invalidation happened since generation was taken."""
+        key = (scope, kind, entity_id)
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._remove(key)
+            self._publish()
+            if self.policy.negative_ttl <= 0:
+                return
+            self._missing.pop(key, None)
+            self._missing[key] = (time.monotonic() + self.policy.negative_ttl, message)
+            while len(self._missing) > _MAX_MISSING:
+                self._missing.popitem(last=False)
+
+    def _load(self, key: CacheKey, first: bool = True) -> bytes | None:
+        """Read an entry another process (or an earlier run) left in the store into memory; returns its body while fresh.
+
+        A row past its TTL is only loaded on the first read of the key here
+        (first), as a stale entry; later reads keep the expired entry they hold.
+        """
+        if self.store is None:
+            return None
+        scope, kind, entity_id = key
+        row = self.store.get(scope, "entity", _store_key(kind, entity_id))
+        if row is None:
+            return None
+        body, meta, expires_at = row
+        try:
+            ttl = float((meta or {}).get("ttl", self.policy.ttl))
+            age = time.time() - float((meta or {}).get("fetched_at", expires_at - ttl))
+        except (AttributeError, TypeError, ValueError):
+            return None
+        fresh = age < ttl
+        if not fresh and not first:
+            return None
+        with self._lock:
+            self._insert(key, body, time.monotonic() - age + ttl, ttl, from_store=not fresh)
+        return body if fresh else None
+
+    def invalidate(self, scope: str, kind: str, entity_id: str) -> None:
+        """Drop an entry after a write to the entity."""
+        with self._lock:
+            self._generation += 1
+            self._remove((scope, kind, entity_id))
+            self._missing.pop((scope, kind, entity_id), None)
+            self._publish()
+        if self.store is not None:
+            self.store.invalidate(scope, "entity", _store_key(kind, entity_id))
+
+    def _forget(self, partition: str, namespace: str, key: str) -> None:
+        """Drop the memory copy of an entity another replica invalidated."""
+        if namespace != "entity":
+            return
+        kind, _, entity_id = key.partition("/")
+        with self._lock:
+            self._generation += 1
+            self._remove((partition, kind, entity_id))
+            self._missing.pop((partition, kind, entity_id), None)
+            self._publish()
+
+    def clear(self) -> None:
+        """Drop every entry held in memory; stored rows expire on their own."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._missing.clear()
+            self._bytes = 0
+            self._publish()
+
+    def stats(self) -> dict[str, int]:
+        """Hit, miss, eviction, cached-404 and stale counts plus the current entry count and size."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "negative_hits": self._negative_hits,
+                "stale_served": self._stale_served,
+                "entries": len(self._entries),
+                "not_found_entries": len(self._missing),
+                "bytes": self._bytes,
+            }
+
+    def _insert(self, key: CacheKey, body: bytes, expires_at: float, ttl: float, from_store: bool = False) -> None:
+        """Caller must hold the lock."""
+        size = len(body) + _ENTRY_OVERHEAD
+        if size > self.policy.max_bytes:
+            return
+        self._remove(key)
+        self._entries[key] = (expires_at, body, ttl, from_store)
+        self._bytes += size
+        while self._bytes > self.policy.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self._evictions += 1
+            metrics.increment("zephyr_entity_cache_evictions_total", labels={"cache": self.name})
+        self._publish()
+
+    def _remove(self, key: CacheKey) -> None:
+        """Caller must hold the lock."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry[1]) + _ENTRY_OVERHEAD
+
+    def _publish(self) -> None:
+        """Caller must hold the lock."""
+        metrics.set_gauge("zephyr_entity_cache_entries", len(self._entries), labels={"cache": self.name})
+        metrics.set_gauge("zephyr_entity_cache_bytes", self._bytes, labels={"cache": self.name})
+
+
+_caches: dict[str, EntityCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_entity_cache(key: str, policy: EntityCachePolicy, store: CacheBackend | None = None) -> EntityCache | None:
+    """Return the process-wide entity cache for key, or None when the policy disables caching."""
+    if not policy.enabled:
+        return None
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None or cache.policy != policy or cache.store is not store:
+            cache = _caches[key] = EntityCache(policy, name=key, store=store)
+        return cache
+
+
+def reset_entity_caches() -> None:
+    """Forget every entity cache (used by tests)."""
+    with _caches_lock:
+        _caches.clear()
+
+
+def _store_key(kind: str, entity_id: str) -> str:
+    return f"{kind}/{entity_id}"
+
+
+def _parse_max_stale(env_var_name: str) -> tuple[tuple[str, float], ...]:
+    """Parse comma-separated kind=seconds pairs, such as "testexecution=60,execution=60"."""
+    bounds = []
+    for pair in os.getenv(env_var_name, "").split(","):
+        kind, _, seconds = pair.partition("=")
+        if not pair.strip():
+            continue
+        try:
+            bounds.append((kind.strip(), max(0.0, float(seconds))))
+        except ValueError:
+            logger.warning(f"Ignoring invalid staleness bound in {env_var_name}: {pair.strip()!r}")
+    return tuple(bounds)
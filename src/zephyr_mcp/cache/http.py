@@ -0,0 +1,300 @@
+"""HTTP response cache that revalidates with ETag and Last-Modified and honours Cache-Control."""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, MutableMapping
+from dataclasses import dataclass
+from typing import Any
+
+from requests.structures import CaseInsensitiveDict
+
+from zephyr_mcp.cache.backend import CacheBackend
+from zephyr_mcp.utils.env import get_env_float, is_env_truthy
+from zephyr_mcp.utils.metrics import metrics
+
+logger = logging.getLogger("mcp-zephyr")
+
+DEFAULT_HTTP_CACHE_MAX_MB = 32.0
+
+# Response headers kept with a cached body; a 304 may update any of them.
+_STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Cache-Control")
+_ENTRY_OVERHEAD = 200
+
+
+@dataclass(frozen=True)
+class HTTPCachePolicy:
+    """Whether GET responses are cached for revalidation, and how much memory their bodies may take."""
+
+    enabled: bool = True
+    max_bytes: int = int(DEFAULT_HTTP_CACHE_MAX_MB * 1024 * 1024)
+
+    @classmethod
+    def from_env(cls, *prefixes: str) -> "HTTPCachePolicy":
+        """Read `<PREFIX>_HTTP_CACHE` and `<PREFIX>_HTTP_CACHE_MAX_MB`, each from the first prefix that sets it."""
+        prefixes = prefixes or ("ZEPHYR",)
+
+        def _name(suffix: str) -> str:
+            return next((f"{prefix}_{suffix}" for prefix in prefixes if os.getenv(f"{prefix}_{suffix}")), f"{prefixes[-1]}_{suffix}")
+
+        max_mb = max(0.0, get_env_float(_name("HTTP_CACHE_MAX_MB"), DEFAULT_HTTP_CACHE_MAX_MB))
+        return cls(enabled=is_env_truthy(_name("HTTP_CACHE"), "true") and max_mb > 0, max_bytes=int(max_mb * 1024 * 1024))
+
+
+class CachedResponse:
+    """A stored 200 response, handed out in place of a 304 or when the stored copy is still fresh."""
+
+    status_code = 200
+
+    def __init__(self, content: bytes, headers: CaseInsensitiveDict) -> None:
+        self.content = content
+        self.headers = headers
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def __repr__(self) -> str:
+        return f"CachedResponse({len(self.content)} bytes)"
+
+
+@dataclass
+class _Entry:
+    content: bytes
+    headers: CaseInsensitiveDict
+    fresh_until: float
+
+    @property
+    def size(self) -> int:
+        return len(self.content) + _ENTRY_OVERHEAD
+
+    def validators(self) -> dict[str, str]:
+        validators = {}
+        if self.headers.get("ETag"):
+            validators["If-None-Match"] = self.headers["ETag"]
+        if self.headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = self.headers["Last-Modified"]
+        return validators
+
+
+def _header(response: Any, name: str) -> str | None:
+    value = response.headers.get(name)
+    return value if isinstance(value, str) else None
+
+
+def _cache_control(value: str | None) -> dict[str, str | None]:
+    """Parse a Cache-Control header into lower-cased directives and their values."""
+    directives: dict[str, str | None] = {}
+    for part in (value or "").split(","):
+        name, _, argument = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip('"') or None
+    return directives
+
+
+def _fresh_until(headers: CaseInsensitiveDict, age: str | None, now: float) -> float | None:
+    """When a response with these headers stops being fresh, or None when it must not be stored.
+
+    Only an explicit max-age makes a response fresh; everything else is
+    revalidated on every use.
+    """
+    directives = _cache_control(headers.get("Cache-Control"))
+    if "no-store" in directives:
+        return None
+    if "no-cache" in directives:
+        return now
+    try:
+        max_age = int(directives.get("max-age") or 0)
+        current_age = int(age or 0)
+    except ValueError:
+        return now
+    return now + max(0, max_age - current_age)
+
+
+def _storable(response: Any, headers: CaseInsensitiveDict, fresh_until: float | None, now: float) -> bool:
+    """A 200 is worth storing when it may be stored and can either be served fresh or revalidated."""
+    if fresh_until is None or _header(response, "Vary") == "*" or not isinstance(response.content, bytes):
+        return False
+    return fresh_until > now or "ETag" in headers or "Last-Modified" in headers
+
+
+def _store_key(key: Hashable) -> tuple[str, str, str]:
+    """The (partition, namespace, key) row of a (credential scope, request) cache key in the store."""
+    if isinstance(key, tuple) and len(key) == 2 and isinstance(key[0], str):
+        return key[0], "http", repr(key[1])
+    return "", "http", repr(key)
+
+
+class HTTPCache:
+    """GET response bodies keyed by (credential scope, method, URL, query), kept to revalidate them cheaply.
+
+    A stored response is served without a request while its Cache-Control
+    max-age lasts. After that, the next identical GET carries If-None-Match /
+    If-Modified-Since, and a 304 reuses the stored body. Responses marked
+    no-store, or with neither validators nor a max-age, are not stored.
+    Bodies are bounded by max_bytes, evicting the least recently used.
+
+    With a store, entries are also kept on disk or in Redis, so a new process
+    or another replica can revalidate what an earlier one fetched. A dropped
+    entry is invalidated in the store, which tells the other replicas to drop
+    their memory copies too.
+    """
+
+    def __init__(self, policy: HTTPCachePolicy, name: str = "", store: CacheBackend | None = None) -> None:
+        self.policy = policy
+        self.name = name
+        self.store = store
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._bytes = 0
+        if store is not None:
+            store.subscribe(self._forget)
+
+    def fresh(self, key: Hashable) -> CachedResponse | None:
+        """Return the stored response while it is fresh, so no request is needed."""
+        entry = self._lookup(key)
+        if entry is None or entry.fresh_until <= time.monotonic():
+            return None
+        self._count("hit")
+        return CachedResponse(entry.content, entry.headers)
+
+    def prepare(self, key: Hashable, headers: MutableMapping[str, str] | None) -> _Entry | None:
+        """Add the stored validators for key to the outgoing request headers; returns the entry they came from."""
+        if headers is None:
+            return None
+        entry = self._lookup(key)
+        if entry is None:
+            return None
+        validators = entry.validators()
+        if not validators:
+            return None
+        headers.update(validators)
+        return entry
+
+    def complete(self, key: Hashable, entry: _Entry | None, response: Any) -> Any:
+        """Store a 200 response, or turn a 304 into the stored response it confirmed."""
+        now = time.monotonic()
+        if response.status_code == 304 and entry is not None:
+            headers = CaseInsensitiveDict(entry.headers)
+            for name in _STORED_HEADERS:
+                value = _header(response, name)
+                if value is not None:
+                    headers[name] = value
+            fresh_until = _fresh_until(headers, _header(response, "Age"), now)
+            if fresh_until is None:
+                self._drop(key)
+            else:
+                self._store(key, _Entry(entry.content, headers, fresh_until))
+            self._count("revalidated")
+            return CachedResponse(entry.content, headers)
+        if response.status_code == 200:
+            self._count("miss")
+            headers = CaseInsensitiveDict({name: value for name in _STORED_HEADERS if (value := _header(response, name)) is not None})
+            fresh_until = _fresh_until(headers, _header(response, "Age"), now)
+            if _storable(response, headers, fresh_until, now):
+                self._store(key, _Entry(response.content, headers, fresh_until))
+            else:
+                self._drop(key)
+        return response
+
+    def invalidate(self, key: Hashable) -> None:
+        """Forget the stored response for key, here and in the store, after a write changed the resource."""
+        self._drop(key)
+
+    def clear(self) -> None:
+        """Drop every entry held in memory; rows on disk expire on their own."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._publish()
+
+    def _lookup(self, key: Hashable) -> _Entry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        if self.store is None:
+            return None
+        row = self.store.get(*_store_key(key))
+        if row is None or row[1] is None:
+            return None
+        content, meta, _ = row
+        entry = _Entry(content, CaseInsensitiveDict(meta["headers"]), time.monotonic() + meta["fresh_until"] - time.time())
+        self._remember(key, entry)
+        return entry
+
+    def _store(self, key: Hashable, entry: _Entry) -> None:
+        self._remember(key, entry)
+        if self.store is not None:
+            meta = {"headers": dict(entry.headers), "fresh_until": time.time() + entry.fresh_until - time.monotonic()}
+            self.store.put(*_store_key(key), entry.content, meta=meta)
+
+    def _remember(self, key: Hashable, entry: _Entry) -> None:
+        if entry.size > self.policy.max_bytes:
+            return
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = entry
+            self._bytes += entry.size
+            while self._bytes > self.policy.max_bytes:
+                self._remove(next(iter(self._entries)))
+            self._publish()
+
+    def _drop(self, key: Hashable) -> None:
+        with self._lock:
+            self._remove(key)
+            self._publish()
+        if self.store is not None:
+            self.store.invalidate(*_store_key(key))
+
+    def _forget(self, partition: str, namespace: str, key: str) -> None:
+        """Drop the memory copy of a response another replica invalidated."""
+        if namespace != "http":
+            return
+        with self._lock:
+            for cached in [cached for cached in self._entries if _store_key(cached) == (partition, namespace, key)]:
+                self._remove(cached)
+            self._publish()
+
+    def _remove(self, key: Hashable) -> None:
+        """Caller must hold the lock."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def _publish(self) -> None:
+        """Caller must hold the lock."""
+        metrics.set_gauge("zephyr_http_cache_bytes", self._bytes, labels={"target": self.name})
+
+    def _count(self, result: str) -> None:
+        metrics.increment("zephyr_http_cache_total", labels={"target": self.name, "result": result})
+
+
+_caches: dict[str, HTTPCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_http_cache(key: str, policy: HTTPCachePolicy, name: str = "", store: CacheBackend | None = None) -> HTTPCache | None:
+    """Return the process-wide HTTP cache for key, or None when the policy disables it."""
+    if not policy.enabled:
+        return None
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None or cache.policy != policy or cache.store is not store:
+            cache = _caches[key] = HTTPCache(policy, name=name, store=store)
+        return cache
+
+
+def reset_http_caches() -> None:
+    """Forget every HTTP cache (used by tests)."""
+    with _caches_lock:
+        _caches.clear()
@@ -0,0 +1,132 @@
+"""Per-project metadata (statuses, priorities, environments, folders) kept for a long TTL."""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from zephyr_mcp.cache.backend import CacheBackend
+from zephyr_mcp.utils.env import get_env_float
+from zephyr_mcp.utils.jsoncodec import dumps, loads
+from zephyr_mcp.utils.metrics import metrics
+
+logger = logging.getLogger("mcp-zephyr")
+
+DEFAULT_METADATA_CACHE_TTL = 3600.0
+DEFAULT_METADATA_REFRESH_AFTER = 60.0
+
+MetadataKey = tuple[str, str, str]
+
+
+@dataclass(frozen=True)
+class MetadataCachePolicy:
+    """How long a project's metadata lists are kept, and how old a list must be before an unknown value reloads it."""
+
+    ttl: float = DEFAULT_METADATA_CACHE_TTL
+    refresh_after: float = DEFAULT_METADATA_REFRESH_AFTER
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    @classmethod
+    def from_env(cls) -> "MetadataCachePolicy":
+        """Read ZEPHYR_METADATA_CACHE_TTL (0 disables local validation) and ZEPHYR_METADATA_REFRESH_AFTER."""
+        return cls(
+            ttl=max(0.0, get_env_float("ZEPHYR_METADATA_CACHE_TTL", DEFAULT_METADATA_CACHE_TTL)),
+            refresh_after=max(0.0, get_env_float("ZEPHYR_METADATA_REFRESH_AFTER", DEFAULT_METADATA_REFRESH_AFTER)),
+        )
+
+
+class MetadataCache:
+    """Lists of metadata entries keyed by (credential scope, project, category).
+
+    The lists are small and change rarely, so they are kept whole for the
+    policy TTL rather than entity by entity. With a store, lists are written
+    there too and a memory miss is looked up there, so replicas and restarts
+    reuse what another process loaded.
+    """
+
+    def __init__(self, policy: MetadataCachePolicy, store: CacheBackend | None = None) -> None:
+        self.policy = policy
+        self.store = store
+        self._lock = threading.Lock()
+        self._entries: dict[MetadataKey, tuple[float, list[dict[str, Any]]]] = {}
+
+    def get(self, scope: str, project: str, category: str) -> tuple[list[dict[str, Any]], float] | None:
+        """Return (entries, age in seconds) for an unexpired list, or None."""
+        key = (scope, project, category)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] + self.policy.ttl <= now:
+                del self._entries[key]
+                entry = None
+        if entry is None:
+            entry = self._load(key)
+        if entry is None:
+            metrics.increment("zephyr_metadata_cache_misses_total", labels={"category": category})
+            return None
+        metrics.increment("zephyr_metadata_cache_hits_total", labels={"category": category})
+        return entry[1], now - entry[0]
+
+    def put(self, scope: str, project: str, category: str, entries: list[dict[str, Any]]) -> None:
+        loaded_at = time.time()
+        with self._lock:
+            self._entries[(scope, project, category)] = (loaded_at, entries)
+        if self.store is not None:
+            body = dumps(entries).encode()
+            self.store.put(scope, "metadata", _store_key(project, category), body, meta={"loaded_at": loaded_at}, ttl=self.policy.ttl)
+
+    def clear(self) -> None:
+        """Drop every list held in memory; stored rows expire on their own."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"lists": len(self._entries), "entries": sum(len(entry[1]) for entry in self._entries.values())}
+
+    def _load(self, key: MetadataKey) -> tuple[float, list[dict[str, Any]]] | None:
+        """Read a list another process (or an earlier run) left in the store into memory."""
+        if self.store is None:
+            return None
+        scope, project, category = key
+        row = self.store.get(scope, "metadata", _store_key(project, category))
+        if row is None:
+            return None
+        body, meta, _ = row
+        try:
+            entry = (float((meta or {})["loaded_at"]), loads(body))
+        except (KeyError, ValueError, TypeError) as e:
+            logger.debug(f"Ignoring unreadable metadata row {project}/{category}: {e}")
+            return None
+        with self._lock:
+            self._entries[key] = entry
+        return entry
+
+
+_caches: dict[str, MetadataCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_metadata_cache(key: str, policy: MetadataCachePolicy, store: CacheBackend | None = None) -> MetadataCache | None:
+    """Return the process-wide metadata cache for key, or None when the policy disables it."""
+    if not policy.enabled:
+        return None
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None or cache.policy != policy or cache.store is not store:
+            cache = _caches[key] = MetadataCache(policy, store=store)
+        return cache
+
+
+def reset_metadata_caches() -> None:
+    """Forget every metadata cache (used by tests)."""
+    with _caches_lock:
+        _caches.clear()
+
+
+def _store_key(project: str, category: str) -> str:
+    return f"{project}/{category}"
@@ -0,0 +1,209 @@
+"""Read-through entity caching for fetcher mixins, on both the sync and async engines."""
+
+import asyncio
+import logging
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from zephyr_mcp.cache.entity import EntityCache
+from zephyr_mcp.exceptions import CircuitOpenError, EntityNotFoundError
+from zephyr_mcp.utils.jsoncodec import RawJSON
+from zephyr_mcp.utils.retry import RETRYABLE_STATUSES, is_transient_error
+
+logger = logging.getLogger("mcp-zephyr")
+
+# Background refreshes of stale entries on the sync engine.
+_REFRESH_WORKERS = 4
+
+
+class EntityCacheMixin:
+    """Serves single-entity reads from the fetcher's EntityCache and drops entries on writes.
+
+    Fetchers set entity_cache and cache_scope (the API and credential the
+    cache entries belong to); without a cache every call goes straight to the
+    client. On the async engine the client returns awaitables, and so do these
+    helpers.
+
+    A 404 is remembered briefly, and repeated reads of that key raise
+    EntityNotFoundError with the original message. A create drops whatever is
+    remembered for the keys it returns.
+
+    Shortly after its TTL an entry is still returned at once, as StaleJSON,
+    while a background request refreshes it (stale-while-revalidate). When the
+    API fails with a connection error, a retryable status or an open circuit,
+    an entry within the longer stale-if-error window is returned, marked with
+    the error, instead of the exception.
+    """
+
+    entity_cache: EntityCache | None = None
+    cache_scope: str = ""
+
+    def _cached_get(self, kind: str, entity_id: str, endpoint: str, raw: bool = False) -> Any:
+        """GET a single entity through the cache; with raw, the body is returned undecoded as RawJSON."""
+        cache = self.entity_cache
+        if cache is None:
+            return self.client.get(endpoint, raw=raw)
+        if getattr(self, "is_async", False):
+            return self._cached_get_async(cache, kind, entity_id, endpoint, raw)
+
+        body = self._lookup(cache, kind, entity_id)
+        if body is not None:
+            return _view(RawJSON(body), raw)
+        stale = cache.stale(self.cache_scope, kind, entity_id)
+        if stale is not None:
+            if cache.begin_refresh(self.cache_scope, kind, entity_id):
+                _refresh_pool().submit(self._refresh, cache, kind, entity_id, endpoint)
+            return _view(stale, raw)
+        generation = cache.generation()
+        try:
+            result = self.client.get(endpoint, raw=True)
+        except Exception as e:
+            self._remember_not_found(cache, kind, entity_id, e, generation)
+            return _view(self._stale_on_error(cache, kind, entity_id, e), raw)
+        return _view(self._fill(cache, kind, entity_id, result, generation), raw)
+
+    async def _cached_get_async(self, cache: EntityCache, kind: str, entity_id: str, endpoint: str, raw: bool) -> Any:
+        body = self._lookup(cache, kind, entity_id)
+        if body is not None:
+            return _view(RawJSON(body), raw)
+        stale = cache.stale(self.cache_scope, kind, entity_id)
+        if stale is not None:
+            if cache.begin_refresh(self.cache_scope, kind, entity_id):
+                task = asyncio.get_running_loop().create_task(self._refresh_async(cache, kind, entity_id, endpoint))
+                _refresh_tasks.add(task)
+                task.add_done_callback(_refresh_tasks.discard)
+            return _view(stale, raw)
+        generation = cache.generation()
+        try:
+            result = await self.client.get(endpoint, raw=True)
+        except Exception as e:
+            self._remember_not_found(cache, kind, entity_id, e, generation)
+            return _view(self._stale_on_error(cache, kind, entity_id, e), raw)
+        return _view(self._fill(cache, kind, entity_id, result, generation), raw)
+
+    def _refresh(self, cache: EntityCache, kind: str, entity_id: str, endpoint: str) -> None:
+        generation = cache.generation()
+        try:
+            self._fill(cache, kind, entity_id, self.client.get(endpoint, raw=True), generation)
+        except Exception as e:
+            self._remember_not_found(cache, kind, entity_id, e, generation)
+            logger.debug(f"Background refresh of {kind} {entity_id} failed: {e}")
+        finally:
+            cache.end_refresh(self.cache_scope, kind, entity_id)
+
+    async def _refresh_async(self, cache: EntityCache, kind: str, entity_id: str, endpoint: str) -> None:
+        generation = cache.generation()
+        try:
+            self._fill(cache, kind, entity_id, await self.client.get(endpoint, raw=True), generation)
+        except Exception as e:
+            self._remember_not_found(cache, kind, entity_id, e, generation)
+            logger.debug(f"Background refresh of {kind} {entity_id} failed: {e}")
+        finally:
+            cache.end_refresh(self.cache_scope, kind, entity_id)
+
+    def _stale_on_error(self, cache: EntityCache, kind: str, entity_id: str, error: Exception) -> RawJSON:
+        """Return the stale entry for a read that failed upstream, or re-raise the error."""
+        stale = cache.stale(self.cache_scope, kind, entity_id, error=str(error)) if _is_outage(error) else None
+        if stale is None:
+            raise error
+        logger.warning(f"Serving {kind} {entity_id} from cache, {stale.age:.0f}s old, because the API failed: {error}")
+        return stale
+
+    def _lookup(self, cache: EntityCache, kind: str, entity_id: str) -> bytes | None:
+        message = cache.missing(self.cache_scope, kind, entity_id)
+        if message is not None:
+            raise EntityNotFoundError(message)
+        return cache.get(self.cache_scope, kind, entity_id)
+
+    def _fill(self, cache: EntityCache, kind: str, entity_id: str, result: Any, generation: int) -> Any:
+        if isinstance(result, RawJSON):
+            cache.put(self.cache_scope, kind, entity_id, result.content, generation=generation)
+        return result
+
+    def _remember_not_found(self, cache: EntityCache, kind: str, entity_id: str, error: Exception, generation: int) -> None:
+        if getattr(getattr(error, "response", None), "status_code", None) == 404:
+            cache.put_missing(self.cache_scope, kind, entity_id, str(error), generation=generation)
+
+    def _write(self, kind: str, entity_id: str, endpoint: str, send: Callable[[], Any]) -> Any:
+        """Send a write to an entity and invalidate its cache entry afterwards, even when the write fails.
+
+        endpoint is the one the entity is read from; its HTTP cache entry is
+        dropped too, or a response still within its max-age would put the
+        old body back into the entity cache on the next read.
+        """
+        if getattr(self, "is_async", False):
+            return self._write_async(kind, entity_id, endpoint, send)
+        try:
+            return send()
+        finally:
+            self._invalidate(kind, entity_id, endpoint)
+
+    async def _write_async(self, kind: str, entity_id: str, endpoint: str, send: Callable[[], Any]) -> Any:
+        try:
+            return await send()
+        finally:
+            self._invalidate(kind, entity_id, endpoint)
+
+    def _invalidate(self, kind: str, entity_id: str, endpoint: str) -> None:
+        self.client.invalidate_cached(endpoint)
+        if self.entity_cache is not None:
+            self.entity_cache.invalidate(self.cache_scope, kind, entity_id)
+
+    def _create(self, kind: str, send: Callable[[], Any]) -> Any:
+        """Send a create and invalidate the cache entries of the keys it returns, such as a remembered 404."""
+        cache = self.entity_cache
+        if cache is None:
+            return send()
+        if getattr(self, "is_async", False):
+            return self._create_async(cache, kind, send)
+        result = send()
+        self._invalidate_created(cache, kind, result)
+        return result
+
+    async def _create_async(self, cache: EntityCache, kind: str, send: Callable[[], Any]) -> Any:
+        result = await send()
+        self._invalidate_created(cache, kind, result)
+        return result
+
+    def _invalidate_created(self, cache: EntityCache, kind: str, result: Any) -> None:
+        for entity_id in _created_ids(result):
+            cache.invalidate(self.cache_scope, kind, entity_id)
+
+
+def _view(result: Any, raw: bool) -> Any:
+    """Hand out a raw body as is, or as a freshly decoded value that callers may modify."""
+    if raw or not isinstance(result, RawJSON):
+        return result
+    return result.value
+
+
+def _is_outage(error: Exception) -> bool:
+    """Whether a failed read says the API is unavailable, rather than that the request or the credentials are wrong."""
+    if isinstance(error, CircuitOpenError) or is_transient_error(error):
+        return True
+    return getattr(getattr(error, "response", None), "status_code", None) in RETRYABLE_STATUSES
+
+
+_refresh_executor: ThreadPoolExecutor | None = None
+_refresh_lock = threading.Lock()
+_refresh_tasks: set[asyncio.Task[None]] = set()
+
+
+def _refresh_pool() -> ThreadPoolExecutor:
+    global _refresh_executor
+    with _refresh_lock:
+        if _refresh_executor is None:
+            _refresh_executor = ThreadPoolExecutor(max_workers=_REFRESH_WORKERS, thread_name_prefix="zephyr-refresh")
+        return _refresh_executor
+
+
+def _created_ids(result: Any) -> list[str]:
+    """The key and id of a created entity, at the top level or under "execution" (Zephyr Squad)."""
+    if not isinstance(result, dict):
+        return []
+    found = [result.get("key"), result.get("id")]
+    if isinstance(result.get("execution"), dict):
+        found.append(result["execution"].get("id"))
+    return [str(value) for value in found if value is not None]
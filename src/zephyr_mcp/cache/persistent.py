@@ -0,0 +1,237 @@
+"""On-disk cache shared by processes, backed by SQLite, so new processes start warm."""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from zephyr_mcp.utils.env import get_env_float, is_env_truthy
+from zephyr_mcp.utils.jsoncodec import dumps, loads
+from zephyr_mcp.utils.metrics import metrics
+
+logger = logging.getLogger("mcp-zephyr")
+
+DEFAULT_CACHE_DIR = "~/.zephyr-mcp"
+DEFAULT_PERSISTENT_CACHE_TTL = 7 * 24 * 3600.0
+DEFAULT_PERSISTENT_CACHE_MAX_MB = 256.0
+CACHE_FILE_NAME = "cache.sqlite3"
+
+_SCHEMA_VERSION = 1
+# Size and expiry are enforced every this many writes, and when the file is opened.
+_PRUNE_EVERY = 32
+_ROW_OVERHEAD = 100
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    partition TEXT NOT NULL,
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    body BLOB NOT NULL,
+    meta TEXT,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (partition, namespace, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+"""
+
+
+@dataclass(frozen=True)
+class PersistentCachePolicy:
+    """Whether cached API data is also kept on disk, where, for how long at most and within what size."""
+
+    enabled: bool = False
+    directory: str = DEFAULT_CACHE_DIR
+    ttl: float = DEFAULT_PERSISTENT_CACHE_TTL
+    max_bytes: int = int(DEFAULT_PERSISTENT_CACHE_MAX_MB * 1024 * 1024)
+
+    @property
+    def path(self) -> Path:
+        return Path(self.directory).expanduser() / CACHE_FILE_NAME
+
+    @classmethod
+    def from_env(cls) -> "PersistentCachePolicy":
+        """Read ZEPHYR_PERSISTENT_CACHE, ZEPHYR_CACHE_DIR, ZEPHYR_PERSISTENT_CACHE_TTL and ZEPHYR_PERSISTENT_CACHE_MAX_MB."""
+        ttl = max(0.0, get_env_float("ZEPHYR_PERSISTENT_CACHE_TTL", DEFAULT_PERSISTENT_CACHE_TTL))
+        max_mb = max(0.0, get_env_float("ZEPHYR_PERSISTENT_CACHE_MAX_MB", DEFAULT_PERSISTENT_CACHE_MAX_MB))
+        return cls(
+            enabled=is_env_truthy("ZEPHYR_PERSISTENT_CACHE") and ttl > 0 and max_mb > 0,
+            directory=os.getenv("ZEPHYR_CACHE_DIR") or DEFAULT_CACHE_DIR,
+            ttl=ttl,
+            max_bytes=int(max_mb * 1024 * 1024),
+        )
+
+
+class PersistentCache:
+    """zlib-compressed bodies in a SQLite file, keyed by (partition, namespace, key).
+
+    The partition is the credential scope the data was read with; namespace
+    separates the entity and HTTP caches. The database runs in WAL mode so
+    several server processes can read and write it at once. Rows expire at
+    the earlier of the caller's TTL and the policy TTL. Once the compressed
+    bodies exceed max_bytes, the least recently read rows are deleted.
+
+    Disk errors are logged and treated as misses: the cache must never fail a
+    request.
+    """
+
+    def __init__(self, policy: PersistentCachePolicy) -> None:
+        self.policy = policy
+        self.path = policy.path
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._conn: sqlite3.Connection | None = None
+        try:
+            self._conn = self._open()
+            self._prune()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Persistent cache at {self.path} is unavailable: {e}")
+            self._conn = None
+
+    def _open(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False, isolation_level=None)
+        try:
+            os.chmod(self.path, 0o600)
+        except OSError:
+            pass
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        if conn.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+            conn.execute("DROP TABLE IF EXISTS entries")
+            conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+        conn.executescript(_SCHEMA)
+        logger.debug(f"Persistent cache opened at {self.path}")
+        return conn
+
+    @property
+    def available(self) -> bool:
+        return self._conn is not None
+
+    def get(self, partition: str, namespace: str, key: str) -> tuple[bytes, dict[str, Any] | None, float] | None:
+        """Return (body, meta, expires_at) for an unexpired row, or None."""
+        now = time.time()
+        row = self._execute(
+            "SELECT body, meta, expires_at FROM entries WHERE partition = ? AND namespace = ? AND key = ? AND expires_at > ?",
+            (partition, namespace, key, now),
+            fetch=True,
+        )
+        metrics.increment("zephyr_persistent_cache_hits_total" if row else "zephyr_persistent_cache_misses_total", labels={"namespace": namespace})
+        if not row:
+            return None
+        body, meta, expires_at = row[0]
+        self._execute("UPDATE entries SET accessed_at = ? WHERE partition = ? AND namespace = ? AND key = ?", (now, partition, namespace, key))
+        try:
+            return zlib.decompress(body), loads(meta) if meta else None, expires_at
+        except (zlib.error, ValueError) as e:
+            logger.debug(f"Dropping unreadable persistent cache row {namespace}/{key}: {e}")
+            self.delete(partition, namespace, key)
+            return None
+
+    def put(self, partition: str, namespace: str, key: str, body: bytes, meta: dict[str, Any] | None = None, ttl: float | None = None) -> None:
+        """Store a body for ttl seconds (capped at the policy TTL)."""
+        now = time.time()
+        ttl = self.policy.ttl if ttl is None else min(ttl, self.policy.ttl)
+        if ttl <= 0:
+            return
+        compressed = zlib.compress(body)
+        size = len(compressed) + _ROW_OVERHEAD
+        if size > self.policy.max_bytes:
+            return
+        self._execute(
+            "INSERT OR REPLACE INTO entries (partition, namespace, key, body, meta, size, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (partition, namespace, key, compressed, dumps(meta) if meta is not None else None, size, now + ttl, now),
+        )
+        with self._lock:
+            self._writes += 1
+            due = self._writes % _PRUNE_EVERY == 0
+        if due:
+            self._prune()
+
+    def delete(self, partition: str, namespace: str, key: str) -> None:
+        self._execute("DELETE FROM entries WHERE partition = ? AND namespace = ? AND key = ?", (partition, namespace, key))
+
+    def invalidate(self, partition: str, namespace: str, key: str) -> None:
+        """Delete a row after a write; other processes on this host stop reading it at once."""
+        self.delete(partition, namespace, key)
+
+    def subscribe(self, callback: Callable[[str, str, str], None]) -> None:
+        """SQLite has no notifications: memory copies in other processes expire with their TTL."""
+
+    def clear(self, partition: str | None = None) -> None:
+        """Delete every row, or only those of one credential scope."""
+        if partition is None:
+            self._execute("DELETE FROM entries", ())
+        else:
+            self._execute("DELETE FROM entries WHERE partition = ?", (partition,))
+
+    def stats(self) -> dict[str, int]:
+        """The number of rows and their compressed size."""
+        rows = self._execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries", (), fetch=True)
+        entries, size = rows[0] if rows else (0, 0)
+        return {"entries": entries, "bytes": size}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _prune(self) -> None:
+        """Delete expired rows, then the least recently read ones until the size bound holds."""
+        self._execute("DELETE FROM entries WHERE expires_at <= ?", (time.time(),))
+        total = self.stats()["bytes"]
+        excess = total - self.policy.max_bytes
+        if excess > 0:
+            # Delete the oldest rows whose running size total covers the excess.
+            self._execute(
+                "DELETE FROM entries WHERE (partition, namespace, key) IN ("
+                " SELECT partition, namespace, key FROM ("
+                "  SELECT partition, namespace, key, SUM(size) OVER (ORDER BY accessed_at ROWS UNBOUNDED PRECEDING) - size AS before FROM entries"
+                " ) WHERE before < ?)",
+                (excess,),
+            )
+        metrics.set_gauge("zephyr_persistent_cache_bytes", min(total, self.policy.max_bytes), labels={"path": str(self.path)})
+
+    def _execute(self, sql: str, params: tuple[Any, ...], fetch: bool = False) -> list[tuple[Any, ...]] | None:
+        with self._lock:
+            if self._conn is None:
+                return None
+            try:
+                cursor = self._conn.execute(sql, params)
+                return cursor.fetchall() if fetch else None
+            except sqlite3.Error as e:
+                logger.warning(f"Persistent cache at {self.path} failed: {e}")
+                return None
+
+
+_stores: dict[Path, PersistentCache] = {}
+_stores_lock = threading.Lock()
+
+
+def get_persistent_cache(policy: PersistentCachePolicy) -> PersistentCache | None:
+    """Return the process-wide persistent cache for the policy's directory, or None when it is disabled or cannot be opened."""
+    if not policy.enabled:
+        return None
+    with _stores_lock:
+        store = _stores.get(policy.path)
+        if store is None or store.policy != policy:
+            if store is not None:
+                store.close()
+            store = _stores[policy.path] = PersistentCache(policy)
+    return store if store.available else None
+
+
+def reset_persistent_caches() -> None:
+    """Close and forget every persistent cache (used by tests)."""
+    with _stores_lock:
+        for store in _stores.values():
+            store.close()
+        _stores.clear()
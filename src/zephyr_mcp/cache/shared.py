@@ -0,0 +1,304 @@
+"""Cache shared by server replicas through a Redis-protocol server, with invalidation messages between them."""
+
+import contextlib
+import logging
+import os
+import threading
+import time
+import uuid
+import weakref
+import zlib
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from zephyr_mcp.utils.env import get_env_float
+from zephyr_mcp.utils.jsoncodec import dumps, loads
+from zephyr_mcp.utils.metrics import metrics
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - exercised when the "redis" extra is not installed
+    redis = None
+
+logger = logging.getLogger("mcp-zephyr")
+
+DEFAULT_REDIS_PREFIX = "zephyr-mcp"
+DEFAULT_REDIS_CACHE_TTL = 24 * 3600.0
+DEFAULT_REDIS_TIMEOUT = 2.0
+# How long the invalidation listener waits for a message before checking whether it should stop.
+_LISTEN_TIMEOUT = 1.0
+# After a failure the server is left alone for this long, doubling per failed retry up to the maximum.
+_RETRY_MIN = 1.0
+_RETRY_MAX = 30.0
+
+_GLOB_SPECIAL = str.maketrans({c: f"\\{c}" for c in "*?[]\\"})
+
+
+@dataclass(frozen=True)
+class RedisCachePolicy:
+    """Where the shared cache lives, how its keys are prefixed and how long rows are kept at most."""
+
+    url: str | None = None
+    prefix: str = DEFAULT_REDIS_PREFIX
+    ttl: float = DEFAULT_REDIS_CACHE_TTL
+    timeout: float = DEFAULT_REDIS_TIMEOUT
+
+    @classmethod
+    def from_env(cls) -> "RedisCachePolicy":
+        """Read ZEPHYR_CACHE_REDIS_URL, ZEPHYR_CACHE_REDIS_PREFIX, ZEPHYR_CACHE_REDIS_TTL and ZEPHYR_CACHE_REDIS_TIMEOUT."""
+        return cls(
+            url=os.getenv("ZEPHYR_CACHE_REDIS_URL") or None,
+            prefix=os.getenv("ZEPHYR_CACHE_REDIS_PREFIX") or DEFAULT_REDIS_PREFIX,
+            ttl=max(0.0, get_env_float("ZEPHYR_CACHE_REDIS_TTL", DEFAULT_REDIS_CACHE_TTL)),
+            timeout=max(0.1, get_env_float("ZEPHYR_CACHE_REDIS_TIMEOUT", DEFAULT_REDIS_TIMEOUT)),
+        )
+
+
+class RedisCache:
+    """zlib-compressed bodies in Redis hashes, keyed by prefix, partition, namespace and key.
+
+    Every replica pointed at the same server reads what the others fetched.
+    Rows expire through Redis at the earlier of the caller's TTL and the
+    policy TTL; the memory bound is the server's maxmemory setting.
+
+    invalidate() deletes a row and publishes the key on a channel. Each
+    replica listens on a background thread and passes keys deleted by the
+    others to its subscribers, which drop their in-process copies.
+
+    Server errors are logged and treated as misses: the cache must never fail
+    a request. After an error every call is a miss without touching the
+    server for a backoff window (1s, doubling up to 30s); then one call tries
+    again, and the first one that succeeds brings the cache back. A server
+    that is down at start-up is retried the same way, so an outage costs one
+    timeout per window rather than one per operation.
+    """
+
+    def __init__(self, policy: RedisCachePolicy, client: Any = None) -> None:
+        self.policy = policy
+        self.channel = f"{policy.prefix}:invalidate"
+        self._origin = uuid.uuid4().hex
+        self._lock = threading.Lock()
+        self._subscribers: list[weakref.WeakMethod[Callable[[str, str, str], None]]] = []
+        self._listener: Any = None
+        self._failures = 0
+        self._retry_at = 0.0
+        self._client = client
+        if self._client is None:
+            if redis is None:
+                hint = "pip install 'zephyr-mcp[redis]'"
+                logger.warning(f"Shared cache at {_redact(policy.url)} is unavailable: the redis package is not installed ({hint})")
+                return
+            self._client = redis.Redis.from_url(policy.url, socket_timeout=policy.timeout, socket_connect_timeout=policy.timeout)
+        try:
+            self._client.ping()
+            logger.debug(f"Shared cache connected to {_redact(policy.url)}")
+        except Exception as e:
+            self._failed(e)
+
+    @property
+    def available(self) -> bool:
+        """Whether the cache has a client; the server behind it may still be down for a while."""
+        return self._client is not None
+
+    @property
+    def healthy(self) -> bool:
+        """Whether the last call to the server succeeded."""
+        return self._client is not None and self._failures == 0
+
+    def get(self, partition: str, namespace: str, key: str) -> tuple[bytes, dict[str, Any] | None, float] | None:
+        """Return (body, meta, expires_at) for an unexpired row, or None."""
+        row = self._call(lambda client: client.hmget(self._key(partition, namespace, key), "body", "meta", "expires_at"))
+        found = bool(row and row[0] is not None)
+        metrics.increment("zephyr_shared_cache_hits_total" if found else "zephyr_shared_cache_misses_total", labels={"namespace": namespace})
+        if not found:
+            return None
+        body, meta, expires_at = row
+        try:
+            return zlib.decompress(body), loads(meta) if meta else None, float(expires_at)
+        except (zlib.error, ValueError, TypeError) as e:
+            logger.debug(f"Dropping unreadable shared cache row {namespace}/{key}: {e}")
+            self.delete(partition, namespace, key)
+            return None
+
+    def put(self, partition: str, namespace: str, key: str, body: bytes, meta: dict[str, Any] | None = None, ttl: float | None = None) -> None:
+        """Store a body for ttl seconds (capped at the policy TTL)."""
+        ttl = self.policy.ttl if ttl is None else min(ttl, self.policy.ttl)
+        if ttl <= 0:
+            return
+        mapping = {"body": zlib.compress(body), "meta": dumps(meta) if meta is not None else "", "expires_at": repr(time.time() + ttl)}
+        name = self._key(partition, namespace, key)
+
+        def _store(client: Any) -> None:
+            pipe = client.pipeline()
+            pipe.hset(name, mapping=mapping)
+            pipe.pexpire(name, max(1, int(ttl * 1000)))
+            pipe.execute()
+
+        self._call(_store)
+
+    def delete(self, partition: str, namespace: str, key: str) -> None:
+        self._call(lambda client: client.delete(self._key(partition, namespace, key)))
+
+    def invalidate(self, partition: str, namespace: str, key: str) -> None:
+        """Delete a row and tell the other replicas to drop their in-process copies."""
+        self.delete(partition, namespace, key)
+        message = dumps({"origin": self._origin, "partition": partition, "namespace": namespace, "key": key})
+        self._call(lambda client: client.publish(self.channel, message))
+
+    def subscribe(self, callback: Callable[[str, str, str], None]) -> None:
+        """Call callback(partition, namespace, key) for rows other replicas invalidate.
+
+        Only a weak reference to the bound method is kept, so a cache that is
+        replaced stops receiving messages once it is collected.
+        """
+        with self._lock:
+            self._subscribers.append(weakref.WeakMethod(callback))
+            self._start_listener()
+
+    def clear(self, partition: str | None = None) -> None:
+        """Delete every row under the prefix, or only those of one credential scope."""
+        scope = "*" if partition is None else partition.translate(_GLOB_SPECIAL)
+        pattern = f"{self.policy.prefix}:{scope}:*"
+
+        def _clear(client: Any) -> None:
+            for name in client.scan_iter(match=pattern, count=500):
+                client.delete(name)
+
+        self._call(_clear)
+
+    def stats(self) -> dict[str, int]:
+        """The number of rows under the prefix and the size of their compressed bodies."""
+
+        def _stats(client: Any) -> dict[str, int]:
+            names = list(client.scan_iter(match=f"{self.policy.prefix}:*", count=500))
+            return {"entries": len(names), "bytes": sum(client.hstrlen(name, "body") for name in names)}
+
+        return self._call(_stats) or {"entries": 0, "bytes": 0}
+
+    def close(self) -> None:
+        with self._lock:
+            listener, self._listener = self._listener, None
+            client, self._client = self._client, None
+        if listener is not None:
+            listener.stop()
+            # Wake the listener from its wait so it exits before the connection closes.
+            with contextlib.suppress(Exception):
+                client.publish(self.channel, "")
+            listener.join(timeout=_LISTEN_TIMEOUT)
+        if client is not None:
+            client.close()
+
+    def _start_listener(self) -> None:
+        """Listen for invalidations once there are subscribers and the server answers. Caller must hold the lock."""
+        if self._listener is not None or self._client is None or self._failures or not self._subscribers:
+            return
+        try:
+            pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(**{self.channel: self._on_message})
+            self._listener = pubsub.run_in_thread(sleep_time=_LISTEN_TIMEOUT, daemon=True, exception_handler=_listener_failed)
+        except Exception as e:
+            logger.warning(f"Shared cache invalidation listener could not start: {e}")
+
+    def _on_message(self, message: dict[str, Any]) -> None:
+        try:
+            data = loads(message["data"])
+        except (KeyError, ValueError, TypeError):
+            return
+        if data.get("origin") == self._origin:
+            return
+        metrics.increment("zephyr_shared_cache_invalidations_total", labels={"namespace": str(data.get("namespace"))})
+        with self._lock:
+            callbacks = [ref() for ref in self._subscribers]
+            self._subscribers = [ref for ref in self._subscribers if ref() is not None]
+        for callback in callbacks:
+            if callback is not None:
+                callback(data["partition"], data["namespace"], data["key"])
+
+    def _key(self, partition: str, namespace: str, key: str) -> str:
+        return f"{self.policy.prefix}:{partition}:{namespace}:{key}"
+
+    def _call(self, func: Callable[[Any], Any]) -> Any:
+        client = self._client
+        if client is None:
+            return None
+        with self._lock:
+            now = time.monotonic()
+            if now < self._retry_at:
+                return None
+            retrying = self._failures > 0
+            if retrying:
+                # This call probes the server; the others keep missing until its window ends.
+                self._retry_at = now + self._backoff()
+        try:
+            result = func(client)
+        except Exception as e:
+            self._failed(e)
+            return None
+        if retrying:
+            with self._lock:
+                self._failures = 0
+                self._retry_at = 0.0
+                self._start_listener()
+            logger.info(f"Shared cache at {_redact(self.policy.url)} is reachable again")
+        return result
+
+    def _failed(self, error: Exception) -> None:
+        with self._lock:
+            self._failures += 1
+            backoff = self._backoff()
+            self._retry_at = time.monotonic() + backoff
+            first = self._failures == 1
+        message = f"Shared cache at {_redact(self.policy.url)} is unavailable: {error}; retrying in {backoff:g}s"
+        if first:
+            logger.warning(message)
+        else:
+            logger.debug(message)
+
+    def _backoff(self) -> float:
+        """Caller must hold the lock."""
+        return min(_RETRY_MAX, _RETRY_MIN * 2 ** max(0, self._failures - 1))
+
+
+_caches: dict[tuple[str | None, str], RedisCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_redis_cache(policy: RedisCachePolicy) -> RedisCache | None:
+    """Return the process-wide shared cache for the policy's server and prefix, or None without a URL or the redis package.
+
+    A server that is down is retried by the cache itself, so the cache is
+    returned and used once the server answers.
+    """
+    if not policy.url:
+        return None
+    with _caches_lock:
+        key = (policy.url, policy.prefix)
+        cache = _caches.get(key)
+        if cache is None or cache.policy != policy:
+            if cache is not None:
+                cache.close()
+            cache = _caches[key] = RedisCache(policy)
+    return cache if cache.available else None
+
+
+def reset_redis_caches() -> None:
+    """Close and forget every shared cache (used by tests)."""
+    with _caches_lock:
+        for cache in _caches.values():
+            cache.close()
+        _caches.clear()
+
+
+def _listener_failed(error: BaseException, pubsub: Any, thread: Any) -> None:
+    """Keep the invalidation listener alive through an outage; redis-py resubscribes once it reconnects."""
+    logger.debug(f"Shared cache invalidation listener lost its connection: {error}")
+    time.sleep(_LISTEN_TIMEOUT)
+
+
+def _redact(url: str | None) -> str:
+    """The server URL without its password, for logs."""
+    if not url or "@" not in url:
+        return url or ""
+    scheme, _, rest = url.partition("://")
+    return f"{scheme}://***@{rest.rsplit('@', 1)[1]}"
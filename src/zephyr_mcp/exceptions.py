@@ -5,3 +5,27 @@ class ZephyrAuthenticationError(Exception):
     """Raised when Zephyr Scale API authentication fails (401/403)."""
 
     pass
+
+
+class CircuitOpenError(Exception):
+    """Raised without contacting the API while its circuit breaker is open."""
+
+    pass
+
+
+class RequestCancelledError(Exception):
+    """Raised when a tool call is cancelled by its client or runs past its deadline before an API call completes."""
+
+    pass
+
+
+class EntityNotFoundError(Exception):
+    """Raised from the entity cache, without contacting the API, for a key the API recently answered with 404."""
+
+    pass
+
+
+class InvalidMetadataError(Exception):
+    """Raised without contacting the API for a status, priority, environment or folder the project does not define."""
+
+    pass
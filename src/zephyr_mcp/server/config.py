@@ -0,0 +1,54 @@
+"""Server-wide configuration for the Zephyr MCP server."""
+
+import logging
+import os
+from dataclasses import dataclass
+
+from zephyr_mcp.utils.env import get_env_float, get_env_int, is_env_truthy
+
+logger = logging.getLogger("mcp-zephyr")
+
+DEFAULT_USER_FETCHER_CACHE_SIZE = 256
+DEFAULT_USER_FETCHER_CACHE_TTL = 900.0
+DEFAULT_WORKER_THREADS = 16
+DEFAULT_TOOL_TIMEOUT = 120.0
+DEFAULT_WARMUP_CONNECTIONS = 2
+DEFAULT_PREFETCH_RATE = 2.0
+DEFAULT_PREFETCH_MAX_ITEMS = 5000
+DEFAULT_PREFETCH_TTL = 900.0
+
+
+@dataclass(frozen=True)
+class ServerConfig:
+    """Tuning knobs for the server process, independent of any Zephyr backend."""
+
+    user_fetcher_cache_size: int = DEFAULT_USER_FETCHER_CACHE_SIZE
+    user_fetcher_cache_ttl: float = DEFAULT_USER_FETCHER_CACHE_TTL
+    worker_threads: int = DEFAULT_WORKER_THREADS
+    tool_timeout: float = DEFAULT_TOOL_TIMEOUT
+    warmup: bool = False
+    warmup_connections: int = DEFAULT_WARMUP_CONNECTIONS
+    prefetch: bool = False
+    # Projects to prefetch; empty means those in ZEPHYR_PROJECT_KEY.
+    prefetch_projects: tuple[str, ...] = ()
+    prefetch_rate: float = DEFAULT_PREFETCH_RATE
+    prefetch_max_items: int = DEFAULT_PREFETCH_MAX_ITEMS
+    # Seconds prefetched entities stay fresh; the entity cache TTL is too short to outlive the prefetch itself.
+    prefetch_ttl: float = DEFAULT_PREFETCH_TTL
+
+    @classmethod
+    def from_env(cls) -> "ServerConfig":
+        """Create configuration from environment variables."""
+        return cls(
+            user_fetcher_cache_size=max(1, get_env_int("ZEPHYR_USER_FETCHER_CACHE_SIZE", DEFAULT_USER_FETCHER_CACHE_SIZE)),
+            user_fetcher_cache_ttl=max(0.0, get_env_float("ZEPHYR_USER_FETCHER_CACHE_TTL", DEFAULT_USER_FETCHER_CACHE_TTL)),
+            worker_threads=max(1, get_env_int("ZEPHYR_WORKER_THREADS", DEFAULT_WORKER_THREADS)),
+            tool_timeout=max(0.0, get_env_float("ZEPHYR_TOOL_TIMEOUT", DEFAULT_TOOL_TIMEOUT)),
+            warmup=is_env_truthy("ZEPHYR_WARMUP"),
+            warmup_connections=max(0, get_env_int("ZEPHYR_WARMUP_CONNECTIONS", DEFAULT_WARMUP_CONNECTIONS)),
+            prefetch=is_env_truthy("ZEPHYR_PREFETCH"),
+            prefetch_projects=tuple(key.strip() for key in os.getenv("ZEPHYR_PREFETCH_PROJECTS", "").split(",") if key.strip()),
+            prefetch_rate=max(0.1, get_env_float("ZEPHYR_PREFETCH_RATE", DEFAULT_PREFETCH_RATE)),
+            prefetch_max_items=max(1, get_env_int("ZEPHYR_PREFETCH_MAX_ITEMS", DEFAULT_PREFETCH_MAX_ITEMS)),
+            prefetch_ttl=max(0.0, get_env_float("ZEPHYR_PREFETCH_TTL", DEFAULT_PREFETCH_TTL)),
+        )
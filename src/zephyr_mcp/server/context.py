@@ -6,6 +6,9 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from zephyr_mcp.server.config import ServerConfig
+    from zephyr_mcp.server.executor import FetcherExecutor
+    from zephyr_mcp.server.pool import FetcherPool
     from zephyr_mcp.squad.config import ZephyrSquadConfig
     from zephyr_mcp.zephyr.config import ZephyrConfig
 
@@ -18,3 +21,7 @@ class AppContext:
     squad_config: ZephyrSquadConfig | None = None
     read_only: bool = False
     enabled_tools: list[str] | None = None
+    fetcher_pool: FetcherPool | None = None
+    user_fetcher_pool: FetcherPool | None = None
+    server_config: ServerConfig | None = None
+    executor: FetcherExecutor | None = None
@@ -2,18 +2,22 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
+from collections.abc import Callable
 from typing import Any
 
 from fastmcp import Context
 
 from zephyr_mcp.server.context import AppContext
-from zephyr_mcp.zephyr import ZephyrConfig, ZephyrFetcher
+from zephyr_mcp.server.pool import get_pooled_fetcher
+from zephyr_mcp.utils.http import HTTP_ENGINE_ASYNC, HTTP_ENGINE_SYNC
+from zephyr_mcp.zephyr import AsyncZephyrFetcher, ZephyrConfig, ZephyrFetcher
 
 logger = logging.getLogger("mcp-zephyr.server.dependencies")
 
 
-async def get_zephyr_fetcher(ctx: Context) -> ZephyrFetcher:
+async def get_zephyr_fetcher(ctx: Context) -> ZephyrFetcher | AsyncZephyrFetcher:
     """Returns a ZephyrFetcher instance appropriate for the current request context."""
     logger.debug(f"get_zephyr_fetcher: ENTERED. Context ID: {id(ctx)}")
 
@@ -38,14 +42,20 @@ async def get_zephyr_fetcher(ctx: Context) -> ZephyrFetcher:
 
         if user_auth_type == "pat" and zephyr_url_header and zephyr_token_header and not hasattr(request.state, "user_token"):
             logger.info(f"Creating header-based ZephyrFetcher with URL: {zephyr_url_header}")
+            app_lifespan_ctx = _get_app_context(ctx)
             header_config = ZephyrConfig(
                 url=zephyr_url_header,
                 auth_type="pat",
                 personal_token=zephyr_token_header,
                 ssl_verify=True,
+                http_engine=app_lifespan_ctx.full_zephyr_config.http_engine
+                if app_lifespan_ctx and app_lifespan_ctx.full_zephyr_config
+                else HTTP_ENGINE_SYNC,
             )
             try:
-                header_zephyr_fetcher = ZephyrFetcher(config=header_config)
+                header_zephyr_fetcher = await _get_user_fetcher(
+                    ctx, zephyr_url_header, "pat", zephyr_token_header, lambda: _new_fetcher(header_config)
+                )
                 request.state.zephyr_fetcher = header_zephyr_fetcher
                 return header_zephyr_fetcher
             except Exception as e:
@@ -67,7 +77,9 @@ async def get_zephyr_fetcher(ctx: Context) -> ZephyrFetcher:
                 token=user_token,
             )
             try:
-                user_zephyr_fetcher = ZephyrFetcher(config=user_specific_config)
+                user_zephyr_fetcher = await _get_user_fetcher(
+                    ctx, user_specific_config.url, user_auth_type, user_token, lambda: _new_fetcher(user_specific_config)
+                )
                 request.state.zephyr_fetcher = user_zephyr_fetcher
                 return user_zephyr_fetcher
             except Exception as e:
@@ -83,7 +95,8 @@ async def get_zephyr_fetcher(ctx: Context) -> ZephyrFetcher:
     app_lifespan_ctx = _get_app_context(ctx)
     if app_lifespan_ctx and app_lifespan_ctx.full_zephyr_config:
         logger.debug(f"get_zephyr_fetcher: Using global config. auth_type: {app_lifespan_ctx.full_zephyr_config.auth_type}")
-        return ZephyrFetcher(config=app_lifespan_ctx.full_zephyr_config)
+        config = app_lifespan_ctx.full_zephyr_config
+        return await get_pooled_fetcher(app_lifespan_ctx.fetcher_pool, config.fingerprint(), lambda: _new_fetcher(config))
 
     logger.error("Zephyr configuration could not be resolved.")
     raise ValueError("Zephyr client (fetcher) not available. Ensure server is configured correctly.")
@@ -97,6 +110,35 @@ def _get_app_context(ctx: Context) -> AppContext | None:
     return None
 
 
+def get_global_zephyr_fetcher(app_ctx: AppContext) -> ZephyrFetcher | AsyncZephyrFetcher:
+    """Return the pooled fetcher for the lifespan Zephyr config, creating it on first use."""
+    config = app_ctx.full_zephyr_config
+    if app_ctx.fetcher_pool is not None:
+        return app_ctx.fetcher_pool.get_or_create(config.fingerprint(), lambda: _new_fetcher(config))
+    return _new_fetcher(config)
+
+
+def _new_fetcher(config: ZephyrConfig) -> ZephyrFetcher | AsyncZephyrFetcher:
+    """Create a fetcher on the HTTP engine selected by the config."""
+    if config.http_engine == HTTP_ENGINE_ASYNC:
+        return AsyncZephyrFetcher(config=config)
+    return ZephyrFetcher(config=config)
+
+
+def _user_fetcher_key(url: str | None, auth_type: str, token: str) -> str:
+    """Build the pool key for a per-user fetcher without keeping the raw token around."""
+    return hashlib.sha256(f"{url}\0{auth_type}\0{token}".encode()).hexdigest()
+
+
+async def _get_user_fetcher(
+    ctx: Context, url: str | None, auth_type: str, token: str, factory: Callable[[], ZephyrFetcher | AsyncZephyrFetcher]
+) -> ZephyrFetcher | AsyncZephyrFetcher:
+    """Return a per-user fetcher from the bounded user pool, creating it on a miss."""
+    app_lifespan_ctx = _get_app_context(ctx)
+    pool = app_lifespan_ctx.user_fetcher_pool if app_lifespan_ctx is not None else None
+    return await get_pooled_fetcher(pool, _user_fetcher_key(url, auth_type, token), factory)
+
+
 def _create_user_config(base_config: ZephyrConfig, auth_type: str, token: str) -> ZephyrConfig:
     """Create a user-specific ZephyrConfig from a base config and per-request credentials."""
     import dataclasses
@@ -0,0 +1,197 @@
+"""Run fetcher calls from async tool handlers without blocking the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, asynccontextmanager, contextmanager
+from typing import TYPE_CHECKING, Any
+
+from zephyr_mcp.exceptions import RequestCancelledError
+from zephyr_mcp.server.pool import fetcher_in_use
+from zephyr_mcp.utils.cancellation import cancellation_scope, current_scope
+from zephyr_mcp.utils.metrics import metrics
+
+if TYPE_CHECKING:
+    from fastmcp import Context
+
+logger = logging.getLogger("mcp-zephyr.server.executor")
+
+# Fetcher leases taken inside a tool_deadline() block, released when the block ends.
+_held_fetchers: contextvars.ContextVar[ExitStack | None] = contextvars.ContextVar("zephyr_held_fetchers", default=None)
+
+
+class FetcherExecutor:
+    """Bounded worker pool for blocking fetcher calls.
+
+    Tool handlers are coroutines, while the requests-based fetchers block for a
+    full network round trip. Running those calls here keeps the event loop free
+    for pings, tool listing and other sessions, and caps outbound parallelism at
+    max_workers. Queue depth, active workers and queue wait time are published
+    to the metrics registry.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="zephyr-fetcher")
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        metrics.set_gauge("zephyr_worker_threads", max_workers)
+        self._publish()
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of submitted calls still waiting for a worker."""
+        return self._queued
+
+    @property
+    def active(self) -> int:
+        """Number of calls currently running on a worker."""
+        return self._active
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run func on a worker thread and await its result."""
+        submitted = time.monotonic()
+        context = contextvars.copy_context()
+
+        def _task() -> Any:
+            metrics.observe("zephyr_worker_wait_seconds", time.monotonic() - submitted)
+            with self._lock:
+                self._queued -= 1
+                self._active += 1
+                self._publish()
+            try:
+                return context.run(func, *args, **kwargs)
+            finally:
+                with self._lock:
+                    self._active -= 1
+                    self._publish()
+
+        with self._lock:
+            self._queued += 1
+            self._publish()
+        try:
+            future = self._executor.submit(_task)
+        except RuntimeError:
+            self._drop_queued()
+            raise
+        # A call cancelled before it reached a worker never runs _task, so it leaves the queue here.
+        future.add_done_callback(lambda f: self._drop_queued() if f.cancelled() else None)
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self) -> None:
+        """Stop accepting calls and cancel any that have not started."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        logger.debug("Fetcher executor shut down")
+
+    def _drop_queued(self) -> None:
+        """Remove a call that will never start from the queue depth."""
+        with self._lock:
+            self._queued -= 1
+            self._publish()
+
+    def _publish(self) -> None:
+        """Push the current queue state to the metrics registry. Caller must hold the lock."""
+        metrics.set_gauge("zephyr_worker_queue_depth", self._queued)
+        metrics.set_gauge("zephyr_worker_active", self._active)
+
+
+async def call_fetcher(ctx: Context, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Call a fetcher method from a tool handler.
+
+    Methods of async-engine fetchers are awaited on the event loop; blocking
+    methods run on the server's FetcherExecutor (or a default worker thread
+    when no executor is configured).
+
+    The call is bounded by the server's tool timeout, or by the enclosing
+    tool_deadline() block. When the tool call is cancelled or times out, a
+    blocking call is signalled through its cancellation scope, so it stops
+    before its next request, retry or page instead of running to completion;
+    async calls are cancelled outright. The fetcher is held until the tool
+    call ends, so the pool does not close it while it is in use.
+    """
+    fetcher = getattr(func, "__self__", None)
+    async with tool_deadline(ctx, getattr(func, "__name__", "Fetcher call")):
+        with _holding(fetcher):
+            if getattr(fetcher, "is_async", False) is True:
+                return await func(*args, **kwargs)
+            executor = _get_executor(ctx)
+            if executor is None:
+                return await asyncio.to_thread(func, *args, **kwargs)
+            return await executor.run(func, *args, **kwargs)
+
+
+@asynccontextmanager
+async def tool_deadline(ctx: Context, name: str = "Tool call") -> AsyncIterator[None]:
+    """Bound every fetcher call in the block by one tool timeout and one cancellation scope.
+
+    Tools that make several calls for one request (such as checking arguments
+    before a write) use this so the calls share the deadline instead of each
+    getting a full timeout. Inside a block that already has a scope, the
+    outer deadline applies. Fetchers used in the block stay held until it ends.
+    """
+    if current_scope() is not None:
+        yield
+        return
+    timeout = _get_tool_timeout(ctx)
+    deadline = asyncio.timeout(timeout)
+    with ExitStack() as held, cancellation_scope(timeout) as scope:
+        token = _held_fetchers.set(held)
+        try:
+            async with deadline:
+                yield
+        except asyncio.CancelledError:
+            scope.cancel()
+            raise
+        except TimeoutError as e:
+            if not deadline.expired():
+                raise
+            scope.cancel("deadline exceeded")
+            logger.warning(f"{name} abandoned after the {timeout:g}s tool timeout")
+            raise RequestCancelledError(f"Request abandoned: no response within the {timeout:g}s tool timeout.") from e
+        finally:
+            _held_fetchers.reset(token)
+
+
+@contextmanager
+def _holding(fetcher: Any) -> Iterator[None]:
+    """Hold fetcher for the enclosing tool_deadline() block, or for this call outside one."""
+    held = _held_fetchers.get()
+    if fetcher is None:
+        yield
+    elif held is not None:
+        held.enter_context(fetcher_in_use(fetcher))
+        yield
+    else:
+        with fetcher_in_use(fetcher):
+            yield
+
+
+def _get_app_context(ctx: Context) -> Any:
+    """Extract the AppContext from the FastMCP lifespan context."""
+    try:
+        lifespan_ctx = ctx.request_context.lifespan_context
+    except (AttributeError, ValueError):
+        return None
+    if isinstance(lifespan_ctx, dict):
+        return lifespan_ctx.get("app_lifespan_context")
+    return None
+
+
+def _get_executor(ctx: Context) -> FetcherExecutor | None:
+    """Extract the FetcherExecutor from the FastMCP lifespan context."""
+    return getattr(_get_app_context(ctx), "executor", None)
+
+
+def _get_tool_timeout(ctx: Context) -> float | None:
+    """Return the per-call deadline in seconds from the server config, or None when disabled."""
+    timeout = getattr(getattr(_get_app_context(ctx), "server_config", None), "tool_timeout", None)
+    if isinstance(timeout, int | float) and timeout > 0:
+        return float(timeout)
+    return None
@@ -1,13 +1,22 @@
 """Factory for creating the Zephyr Scale and Squad MCP server."""
 
+import asyncio
+import contextlib
+import dataclasses
 import logging
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from typing import Any
 
 from fastmcp import FastMCP
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
 
+from zephyr_mcp.server.config import ServerConfig
 from zephyr_mcp.server.context import AppContext
+from zephyr_mcp.server.executor import FetcherExecutor
+from zephyr_mcp.server.pool import FetcherPool
+from zephyr_mcp.server.prefetch import prefetch
 from zephyr_mcp.server.squad_tools import (
     squad_add_test_to_cycle,
     squad_create_cycle,
@@ -22,6 +31,7 @@ from zephyr_mcp.server.tools import (
     zephyr_create_test_case,
     zephyr_create_test_cycle,
     zephyr_create_test_execution,
+    zephyr_get_project_metadata,
     zephyr_get_test_case,
     zephyr_get_test_cycle,
     zephyr_get_test_execution,
@@ -30,13 +40,15 @@ from zephyr_mcp.server.tools import (
     zephyr_update_test_case,
     zephyr_update_test_execution,
 )
+from zephyr_mcp.server.warmup import warm_up
 from zephyr_mcp.squad.config import ZephyrSquadConfig
+from zephyr_mcp.utils.metrics import metrics
 from zephyr_mcp.zephyr.config import ZephyrConfig
 
 logger = logging.getLogger("mcp-zephyr")
 
 
-def create_server(read_only: bool = False) -> FastMCP:
+def create_server(read_only: bool = False, worker_threads: int | None = None) -> FastMCP:
     """Create and configure the Zephyr MCP server with Scale and Squad support."""
 
     @asynccontextmanager
@@ -59,14 +71,43 @@ def create_server(read_only: bool = False) -> FastMCP:
         except Exception as e:
             logger.info(f"Zephyr Squad configuration not available: {e}")
 
+        server_config = ServerConfig.from_env()
+        if worker_threads is not None:
+            server_config = dataclasses.replace(server_config, worker_threads=max(1, worker_threads))
+        executor = FetcherExecutor(max_workers=server_config.worker_threads)
+        logger.info(f"Blocking fetcher calls run on {server_config.worker_threads} worker threads")
+        fetcher_pool = FetcherPool()
+        user_fetcher_pool = FetcherPool(
+            max_entries=server_config.user_fetcher_cache_size,
+            idle_ttl=server_config.user_fetcher_cache_ttl,
+        )
         app_context = AppContext(
             full_zephyr_config=zephyr_config,
             squad_config=squad_config,
             read_only=read_only,
+            fetcher_pool=fetcher_pool,
+            user_fetcher_pool=user_fetcher_pool,
+            server_config=server_config,
+            executor=executor,
         )
 
-        yield {"app_lifespan_context": app_context}
-        logger.info("Zephyr MCP server shutting down.")
+        # Warm-up runs in the background so the MCP handshake is not held up; tool calls that
+        # arrive meanwhile share the pooled fetchers it is creating.
+        warmup_task = asyncio.create_task(warm_up(app_context)) if server_config.warmup else None
+        prefetch_task = asyncio.create_task(prefetch(app_context)) if server_config.prefetch else None
+
+        try:
+            yield {"app_lifespan_context": app_context}
+        finally:
+            logger.info("Zephyr MCP server shutting down.")
+            for task in (warmup_task, prefetch_task):
+                if task is not None and not task.done():
+                    task.cancel()
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await task
+            await fetcher_pool.aclose()
+            await user_fetcher_pool.aclose()
+            executor.shutdown()
 
     mcp = FastMCP(
         "Zephyr Scale MCP",
@@ -77,11 +118,17 @@ def create_server(read_only: bool = False) -> FastMCP:
         lifespan=lifespan,
     )
 
+    @mcp.custom_route("/metrics", methods=["GET"])
+    async def metrics_endpoint(request: Request) -> PlainTextResponse:
+        """Expose in-process metrics in the Prometheus text format."""
+        return PlainTextResponse(metrics.render_prometheus(), media_type="text/plain; version=0.0.4")
+
     # Register Zephyr Scale read tools
     mcp.tool()(zephyr_get_test_case)
     mcp.tool()(zephyr_search_test_cases)
     mcp.tool()(zephyr_get_test_cycle)
     mcp.tool()(zephyr_get_test_execution)
+    mcp.tool()(zephyr_get_project_metadata)
 
     # Register Zephyr Scale write tools
     mcp.tool()(zephyr_create_test_case)
@@ -103,6 +150,6 @@ def create_server(read_only: bool = False) -> FastMCP:
     mcp.tool()(squad_add_test_to_cycle)
     mcp.tool()(squad_update_execution)
 
-    tool_count = 18
+    tool_count = 19
     logger.info(f"Zephyr MCP server created with {tool_count} tools (read_only={read_only})")
     return mcp
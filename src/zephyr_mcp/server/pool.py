@@ -0,0 +1,225 @@
+"""Long-lived fetcher pool shared across tool calls."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Any, TypeVar
+
+logger = logging.getLogger("mcp-zephyr.server.pool")
+
+T = TypeVar("T")
+
+
+class FetcherPool:
+    """Thread-safe registry of fetchers keyed by the fingerprint of their effective config.
+
+    Reusing a fetcher keeps its HTTP session, and therefore its keep-alive
+    connections, alive across tool calls instead of paying a new TCP+TLS
+    handshake on every call.
+
+    When max_entries or idle_ttl are set the pool behaves as an LRU cache:
+    entries idle for longer than idle_ttl seconds, or the least recently used
+    entry once the pool is full, are evicted and their sessions closed. A
+    fetcher evicted while a tool call holds it (see fetcher_in_use) is closed
+    when that call releases it.
+
+    Fetchers are built outside the pool lock, so building one (which may
+    refresh an OAuth token) never holds up lookups of other keys; concurrent
+    first calls for the same key wait for the one build and share its result.
+    """
+
+    def __init__(self, max_entries: int | None = None, idle_ttl: float | None = None) -> None:
+        self.max_entries = max_entries
+        self.idle_ttl = idle_ttl
+        self._lock = threading.Lock()
+        self._fetchers: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        self._building: dict[str, Future[Any]] = {}
+        self._closed = False
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._fetchers)
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return key in self._fetchers
+
+    def get_or_create(self, key: str, factory: Callable[[], T]) -> T:
+        """Return the pooled fetcher for key, creating it with factory on first use."""
+        now = time.monotonic()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Fetcher pool is closed.")
+            evicted = self._pop_expired(now)
+
+            entry = self._fetchers.get(key)
+            building = self._building.get(key)
+            if entry is not None:
+                self._fetchers[key] = (entry[0], now)
+                self._fetchers.move_to_end(key)
+            elif building is None:
+                build = self._building[key] = Future()
+
+        _retire_all(evicted)
+        if entry is not None:
+            return entry[0]
+        if building is not None:
+            return building.result()
+        return self._build(key, factory, build)
+
+    async def aget_or_create(self, key: str, factory: Callable[[], T]) -> T:
+        """get_or_create for the event loop: a pooled fetcher is returned at once, a new one is built on a worker thread."""
+        with self._lock:
+            entry = self._fetchers.get(key)
+            if entry is not None and not self._closed and not (self.idle_ttl and time.monotonic() - entry[1] >= self.idle_ttl):
+                self._fetchers[key] = (entry[0], time.monotonic())
+                self._fetchers.move_to_end(key)
+                return entry[0]
+        return await asyncio.to_thread(self.get_or_create, key, factory)
+
+    def evict(self, key: str) -> bool:
+        """Remove a fetcher from the pool and close it once no tool call holds it. Returns whether key was pooled."""
+        with self._lock:
+            entry = self._fetchers.pop(key, None)
+        if entry is None:
+            return False
+        _retire(entry[0])
+        return True
+
+    def close(self) -> None:
+        """Close every pooled fetcher and reject further use of the pool."""
+        with self._lock:
+            fetchers = [fetcher for fetcher, _ in self._fetchers.values()]
+            self._fetchers.clear()
+            self._closed = True
+
+        for fetcher in fetchers:
+            _close_quietly(fetcher)
+        logger.debug(f"Fetcher pool closed ({len(fetchers)} fetchers released)")
+
+    async def aclose(self) -> None:
+        """Close every pooled fetcher, awaiting async fetchers, and reject further use of the pool."""
+        with self._lock:
+            fetchers = [fetcher for fetcher, _ in self._fetchers.values()]
+            self._fetchers.clear()
+            self._closed = True
+
+        for fetcher in fetchers:
+            if getattr(fetcher, "is_async", False) is not True:
+                _close_quietly(fetcher)
+                continue
+            try:
+                await fetcher.aclose()
+            except Exception as e:
+                logger.warning(f"Failed to close pooled fetcher {type(fetcher).__name__}: {e}")
+        logger.debug(f"Fetcher pool closed ({len(fetchers)} fetchers released)")
+
+    def _build(self, key: str, factory: Callable[[], T], build: Future[Any]) -> T:
+        """Run factory for key outside the lock and pool its fetcher, handing the outcome to callers waiting on build."""
+        try:
+            fetcher = factory()
+        except BaseException as e:
+            with self._lock:
+                del self._building[key]
+            build.set_exception(e)
+            raise
+
+        evicted: list[Any] = []
+        with self._lock:
+            del self._building[key]
+            closed = self._closed
+            if not closed:
+                self._fetchers[key] = (fetcher, time.monotonic())
+                logger.debug(f"Pooled new fetcher {type(fetcher).__name__} (pool size: {len(self._fetchers)})")
+                if self.max_entries is not None:
+                    while len(self._fetchers) > self.max_entries:
+                        evicted.append(self._fetchers.popitem(last=False)[1][0])
+        if closed:
+            _close_quietly(fetcher)
+            error = RuntimeError("Fetcher pool is closed.")
+            build.set_exception(error)
+            raise error
+        build.set_result(fetcher)
+        _retire_all(evicted)
+        return fetcher
+
+    def _pop_expired(self, now: float) -> list[Any]:
+        """Remove entries idle for longer than idle_ttl. Caller must hold the lock."""
+        if not self.idle_ttl:
+            return []
+        expired = []
+        # Entries are kept in last-used order, so expired ones sit at the front.
+        while self._fetchers:
+            key, (fetcher, last_used) = next(iter(self._fetchers.items()))
+            if now - last_used < self.idle_ttl:
+                break
+            del self._fetchers[key]
+            expired.append(fetcher)
+        if expired:
+            logger.debug(f"Evicted {len(expired)} idle fetchers")
+        return expired
+
+
+async def get_pooled_fetcher(pool: FetcherPool | None, key: str, factory: Callable[[], T]) -> T:
+    """Return the fetcher for key from async code; without a pool a new one is built, on a worker thread."""
+    if pool is None:
+        return await asyncio.to_thread(factory)
+    return await pool.aget_or_create(key, factory)
+
+
+# Running tool calls per fetcher (by id), and evicted fetchers waiting for their last call to end.
+_leases: dict[int, int] = {}
+_retired: dict[int, Any] = {}
+_leases_lock = threading.Lock()
+
+
+@contextmanager
+def fetcher_in_use(fetcher: Any) -> Iterator[None]:
+    """Keep the pool from closing fetcher while the block runs; an eviction in the meantime closes it on exit."""
+    key = id(fetcher)
+    with _leases_lock:
+        _leases[key] = _leases.get(key, 0) + 1
+    try:
+        yield
+    finally:
+        with _leases_lock:
+            _leases[key] -= 1
+            retired = None
+            if not _leases[key]:
+                del _leases[key]
+                retired = _retired.pop(key, None)
+        if retired is not None:
+            logger.debug(f"Closing evicted fetcher {type(retired).__name__} after its last call")
+            _close_quietly(retired)
+
+
+def _retire_all(fetchers: list[Any]) -> None:
+    for fetcher in fetchers:
+        _retire(fetcher)
+
+
+def _retire(fetcher: Any) -> None:
+    """Close an evicted fetcher now, or when the tool calls holding it end."""
+    with _leases_lock:
+        if id(fetcher) in _leases:
+            _retired[id(fetcher)] = fetcher
+            return
+    _close_quietly(fetcher)
+
+
+def _close_quietly(fetcher: Any) -> None:
+    """Close a fetcher, logging rather than raising on failure."""
+    close = getattr(fetcher, "close", None)
+    if close is None:
+        return
+    try:
+        close()
+    except Exception as e:
+        logger.warning(f"Failed to close pooled fetcher {type(fetcher).__name__}: {e}")
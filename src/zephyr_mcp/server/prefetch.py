@@ -0,0 +1,132 @@
+"""Optional start-up prefetch of project test cases, active test cycles and metadata into the caches."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+
+from zephyr_mcp.server.context import AppContext
+from zephyr_mcp.server.dependencies import get_global_zephyr_fetcher
+from zephyr_mcp.utils.jsoncodec import dumps
+from zephyr_mcp.utils.metrics import metrics
+from zephyr_mcp.utils.ratelimit import TokenBucket
+from zephyr_mcp.zephyr.metadata import METADATA_CATEGORIES
+
+logger = logging.getLogger("mcp-zephyr.server.prefetch")
+
+PAGE_SIZE = 100
+# Progress is logged every this many pages of a listing.
+_LOG_EVERY = 10
+
+
+async def prefetch(app_ctx: AppContext) -> None:
+    """Prefetch every configured Zephyr Scale project into the caches; failures are logged, never raised."""
+    config = app_ctx.full_zephyr_config
+    server_config = app_ctx.server_config
+    if config is None or server_config is None:
+        return
+    projects = server_config.prefetch_projects or config.project_keys()
+    if not projects:
+        logger.info("Prefetch skipped: no project keys in ZEPHYR_PREFETCH_PROJECTS or ZEPHYR_PROJECT_KEY")
+        return
+    try:
+        fetcher = await asyncio.to_thread(get_global_zephyr_fetcher, app_ctx)
+    except Exception as e:
+        logger.warning(f"Prefetch could not create the Zephyr Scale client: {e}")
+        return
+    if fetcher.entity_cache is None:
+        logger.info("Prefetch skipped: the entity cache is disabled")
+        return
+    budget = TokenBucket(server_config.prefetch_rate, 1, name="prefetch")
+    prefetcher = ProjectPrefetcher(fetcher, budget, server_config.prefetch_max_items, ttl=server_config.prefetch_ttl)
+    for project in projects:
+        await prefetcher.run(project)
+
+
+class ProjectPrefetcher:
+    """Pages through one project's listings and stores each item in the fetcher's entity cache.
+
+    Every request first takes a token from budget, so the prefetch leaves the
+    rest of the credential's rate limit to tool calls. Listings stop after
+    max_items items. Items are kept for ttl seconds rather than the entity
+    cache TTL, which a large project's prefetch would outlast, and are stored
+    with the generation taken before their page was requested, so a write
+    made meanwhile is not undone.
+    """
+
+    def __init__(self, fetcher: Any, budget: TokenBucket, max_items: int, ttl: float | None = None) -> None:
+        self.fetcher = fetcher
+        self.budget = budget
+        self.max_items = max_items
+        self.ttl = ttl
+
+    async def run(self, project: str) -> None:
+        started = time.monotonic()
+        logger.info(f"Prefetch of {project} started")
+        try:
+            cases = await self._listing(project, "test cases", "/testcases", "testcase", "key")
+            # The first page of the search tool's default query, so that call is answered from the HTTP cache.
+            await self._call(lambda fetcher: fetcher.search_test_cases(project))
+            cycles = await self._listing(project, "active test cycles", "/testcycles", "testcycle", "key", keep=_is_active)
+            await self._metadata(project)
+        except Exception as e:
+            logger.warning(f"Prefetch of {project} failed after {time.monotonic() - started:.1f}s: {e}")
+            return
+        elapsed = time.monotonic() - started
+        metrics.observe("zephyr_prefetch_seconds", elapsed, labels={"project": project})
+        logger.info(f"Prefetch of {project} done in {elapsed:.1f}s: {cases} test cases, {cycles} active test cycles")
+
+    async def _listing(self, project: str, label: str, endpoint: str, kind: str, id_field: str, keep: Callable[[dict], bool] | None = None) -> int:
+        """Cache the items of a paged listing; returns how many were cached."""
+        cache, scope = self.fetcher.entity_cache, self.fetcher.cache_scope
+        cached = seen = pages = 0
+        while seen < self.max_items:
+            generation = cache.generation()
+            params = {"projectKey": project, "maxResults": PAGE_SIZE, "startAt": seen}
+            page = await self._call(lambda fetcher, params=params: fetcher.client.get(endpoint, params=params))
+            values = (page.get("values") or []) if isinstance(page, dict) else []
+            for value in values[: self.max_items - seen]:
+                if isinstance(value, dict) and value.get(id_field) is not None and (keep is None or keep(value)):
+                    cache.put(scope, kind, str(value[id_field]), dumps(value).encode(), generation=generation, ttl=self.ttl)
+                    cached += 1
+            seen += len(values)
+            pages += 1
+            if not values or page.get("isLast") or len(values) < PAGE_SIZE:
+                break
+            if pages % _LOG_EVERY == 0:
+                total = page.get("total")
+                logger.info(f"Prefetch of {project}: {seen}{f'/{total}' if total else ''} {label} read")
+        metrics.increment("zephyr_prefetch_items_total", cached, labels={"project": project, "kind": kind})
+        return cached
+
+    async def _metadata(self, project: str) -> None:
+        """Load the project's statuses, priorities, environments and folder paths, so tool arguments are checked locally."""
+        if getattr(self.fetcher, "metadata_cache", None) is None:
+            return
+        for category in METADATA_CATEGORIES:
+            await self._call(lambda fetcher, category=category: fetcher.get_metadata(project, category))
+
+    async def _call(self, request: Callable[[Any], Any]) -> Any:
+        """Make one request within the budget, on the fetcher's engine."""
+        await self.budget.acquire_async()
+        if getattr(self.fetcher, "is_async", False) is True:
+            return await request(self.fetcher)
+        return await asyncio.to_thread(request, self.fetcher)
+
+
+def _is_active(cycle: dict) -> bool:
+    """A cycle is active until its planned end date has passed; cycles without one count as active."""
+    end = cycle.get("plannedEndDate")
+    if not isinstance(end, str):
+        return True
+    try:
+        planned_end = datetime.fromisoformat(end.replace("Z", "+00:00"))
+    except ValueError:
+        return True
+    if planned_end.tzinfo is None:
+        planned_end = planned_end.replace(tzinfo=UTC)
+    return planned_end >= datetime.now(UTC)
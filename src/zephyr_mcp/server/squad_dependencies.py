@@ -7,25 +7,58 @@ import logging
 from fastmcp import Context
 
 from zephyr_mcp.server.context import AppContext
-from zephyr_mcp.squad import SquadFetcher, ZephyrSquadConfig
+from zephyr_mcp.server.pool import get_pooled_fetcher
+from zephyr_mcp.squad import AsyncSquadFetcher, SquadFetcher, ZephyrSquadConfig
+from zephyr_mcp.squad.config import AUTH_TYPE_JWT, AUTH_TYPE_PAT, SQUAD_BASE_URL
+from zephyr_mcp.utils.http import HTTP_ENGINE_ASYNC, HTTP_ENGINE_SYNC
 
 logger = logging.getLogger("mcp-zephyr-squad.server.dependencies")
 
+SQUAD_ENV_POOL_KEY = "squad:env"
 
-async def get_squad_fetcher(ctx: Context) -> SquadFetcher:
+
+async def get_squad_fetcher(ctx: Context) -> SquadFetcher | AsyncSquadFetcher:
     """Returns a SquadFetcher instance appropriate for the current request context."""
     logger.debug("get_squad_fetcher: ENTERED.")
 
+    # Try HTTP request context first (for SSE transport with per-tenant credentials)
+    try:
+        from fastmcp.server.dependencies import get_http_request
+        from starlette.requests import Request
+
+        request: Request = get_http_request()
+
+        if hasattr(request.state, "squad_fetcher") and request.state.squad_fetcher:
+            logger.debug("get_squad_fetcher: Returning SquadFetcher from request.state.")
+            return request.state.squad_fetcher
+
+        service_headers = getattr(request.state, "service_headers", None) or {}
+        app_ctx = _get_app_context(ctx)
+        default_engine = app_ctx.squad_config.http_engine if app_ctx and app_ctx.squad_config else HTTP_ENGINE_SYNC
+        tenant_config = _create_tenant_config(service_headers, http_engine=default_engine)
+        if tenant_config is not None:
+            logger.info(f"Using header-based Squad credentials: auth_type={tenant_config.auth_type}")
+            try:
+                tenant_fetcher = await _get_pooled_fetcher(ctx, tenant_config, per_user=True)
+                request.state.squad_fetcher = tenant_fetcher
+                return tenant_fetcher
+            except Exception as e:
+                logger.error(f"get_squad_fetcher: Failed to create header-based SquadFetcher: {e}")
+                raise ValueError(f"Invalid header-based Zephyr Squad credentials or configuration: {e}") from e
+
+    except RuntimeError:
+        logger.debug("Not in an HTTP request context. Attempting global SquadFetcher.")
+
     # Try global config from lifespan context
     app_ctx = _get_app_context(ctx)
     if app_ctx and app_ctx.squad_config:
         logger.debug("get_squad_fetcher: Using squad config from lifespan context.")
-        return SquadFetcher(config=app_ctx.squad_config)
+        return await _get_pooled_fetcher(ctx, app_ctx.squad_config)
 
-    # Try loading from environment as fallback
+    # Try loading from environment as fallback; once it succeeds the pooled fetcher is reused
     try:
-        config = ZephyrSquadConfig.from_env()
-        return SquadFetcher(config=config)
+        pool = app_ctx.fetcher_pool if app_ctx else None
+        return await get_pooled_fetcher(pool, SQUAD_ENV_POOL_KEY, lambda: _new_fetcher(ZephyrSquadConfig.from_env()))
     except ValueError:
         pass
 
@@ -43,3 +76,65 @@ def _get_app_context(ctx: Context) -> AppContext | None:
     if isinstance(lifespan_ctx_dict, dict):
         return lifespan_ctx_dict.get("app_lifespan_context")
     return None
+
+
+def _new_fetcher(config: ZephyrSquadConfig) -> SquadFetcher | AsyncSquadFetcher:
+    """Create a fetcher on the HTTP engine selected by the config."""
+    if config.http_engine == HTTP_ENGINE_ASYNC:
+        return AsyncSquadFetcher(config=config)
+    return SquadFetcher(config=config)
+
+
+async def _get_pooled_fetcher(ctx: Context, config: ZephyrSquadConfig, per_user: bool = False) -> SquadFetcher | AsyncSquadFetcher:
+    """Return the pooled SquadFetcher for config, creating it on first use."""
+    app_ctx = _get_app_context(ctx)
+    pool = None
+    if app_ctx is not None:
+        pool = app_ctx.user_fetcher_pool if per_user else app_ctx.fetcher_pool
+    return await get_pooled_fetcher(pool, _pool_key(config), lambda: _new_fetcher(config))
+
+
+def get_global_squad_fetcher(app_ctx: AppContext) -> SquadFetcher | AsyncSquadFetcher:
+    """Return the pooled fetcher for the lifespan Squad config, creating it on first use."""
+    config = app_ctx.squad_config
+    if app_ctx.fetcher_pool is not None:
+        return app_ctx.fetcher_pool.get_or_create(_pool_key(config), lambda: _new_fetcher(config))
+    return _new_fetcher(config)
+
+
+def _pool_key(config: ZephyrSquadConfig) -> str:
+    return f"squad:{config.fingerprint()}"
+
+
+def _create_tenant_config(service_headers: dict[str, str], http_engine: str = HTTP_ENGINE_SYNC) -> ZephyrSquadConfig | None:
+    """Build a per-tenant Squad config from request headers, or None when no Squad headers are present."""
+    pat_token = service_headers.get("X-Zephyr-Squad-Pat-Token")
+    access_key = service_headers.get("X-Zephyr-Squad-Access-Key")
+
+    if pat_token:
+        jira_base_url = service_headers.get("X-Zephyr-Squad-Jira-Url")
+        if not jira_base_url:
+            raise ValueError("X-Zephyr-Squad-Jira-Url header is required with X-Zephyr-Squad-Pat-Token.")
+        return ZephyrSquadConfig(
+            auth_type=AUTH_TYPE_PAT,
+            jira_base_url=jira_base_url.rstrip("/"),
+            pat_token=pat_token,
+            jira_email=service_headers.get("X-Zephyr-Squad-Jira-Email"),
+            http_engine=http_engine,
+        )
+
+    if access_key:
+        secret_key = service_headers.get("X-Zephyr-Squad-Secret-Key")
+        account_id = service_headers.get("X-Zephyr-Squad-Account-Id")
+        if not secret_key or not account_id:
+            raise ValueError("X-Zephyr-Squad-Secret-Key and X-Zephyr-Squad-Account-Id headers are required with X-Zephyr-Squad-Access-Key.")
+        return ZephyrSquadConfig(
+            auth_type=AUTH_TYPE_JWT,
+            base_url=service_headers.get("X-Zephyr-Squad-Base-Url") or SQUAD_BASE_URL,
+            access_key=access_key,
+            secret_key=secret_key,
+            account_id=account_id,
+            http_engine=http_engine,
+        )
+
+    return None
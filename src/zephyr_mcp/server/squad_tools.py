@@ -5,10 +5,13 @@ from typing import Any
 
 from fastmcp import Context
 
+from zephyr_mcp.cache import StaleJSON
 from zephyr_mcp.exceptions import ZephyrAuthenticationError
+from zephyr_mcp.server.executor import call_fetcher
 from zephyr_mcp.server.squad_dependencies import get_squad_fetcher
 from zephyr_mcp.squad.executions import SQUAD_EXECUTION_STATUSES
 from zephyr_mcp.utils.decorators import check_write_access
+from zephyr_mcp.utils.jsoncodec import RawJSON, dumps, is_pretty_json_from_env
 
 logger = logging.getLogger("mcp-zephyr-squad")
 
@@ -27,7 +30,7 @@ async def squad_get_cycle(ctx: Context, cycle_id: str, project_id: str, version_
     """
     try:
         fetcher = await get_squad_fetcher(ctx)
-        result = fetcher.get_cycle(cycle_id, project_id, version_id)
+        result = await call_fetcher(ctx, fetcher.get_cycle, cycle_id, project_id, version_id)
         return _format_result("Squad Test Cycle", result)
     except ZephyrAuthenticationError as e:
         return f"Authentication error: {e}"
@@ -48,7 +51,7 @@ async def squad_get_cycles(ctx: Context, project_id: str, version_id: str = "-1"
     """
     try:
         fetcher = await get_squad_fetcher(ctx)
-        result = fetcher.get_cycles(project_id, version_id)
+        result = await call_fetcher(ctx, fetcher.get_cycles, project_id, version_id)
         return _format_result("Squad Test Cycles", result)
     except ZephyrAuthenticationError as e:
         return f"Authentication error: {e}"
@@ -84,7 +87,9 @@ async def squad_create_cycle(
     """
     try:
         fetcher = await get_squad_fetcher(ctx)
-        result = fetcher.create_cycle(
+        result = await call_fetcher(
+            ctx,
+            fetcher.create_cycle,
             project_id=project_id,
             name=name,
             version_id=version_id,
@@ -112,7 +117,7 @@ async def squad_get_execution(ctx: Context, execution_id: str) -> str:
     """
     try:
         fetcher = await get_squad_fetcher(ctx)
-        result = fetcher.get_execution(execution_id)
+        result = await call_fetcher(ctx, fetcher.get_execution, execution_id, raw=True)
         return _format_result("Squad Test Execution", result)
     except ZephyrAuthenticationError as e:
         return f"Authentication error: {e}"
@@ -139,7 +144,7 @@ async def squad_get_executions_by_cycle(
     """
     try:
         fetcher = await get_squad_fetcher(ctx)
-        result = fetcher.get_executions_by_cycle(project_id, cycle_id, version_id)
+        result = await call_fetcher(ctx, fetcher.get_executions_by_cycle, project_id, cycle_id, version_id)
         return _format_result("Squad Test Executions", result)
     except ZephyrAuthenticationError as e:
         return f"Authentication error: {e}"
@@ -169,7 +174,7 @@ async def squad_add_test_to_cycle(
     """
     try:
         fetcher = await get_squad_fetcher(ctx)
-        result = fetcher.add_test_to_cycle(cycle_id, project_id, issue_id, version_id)
+        result = await call_fetcher(ctx, fetcher.add_test_to_cycle, cycle_id, project_id, issue_id, version_id)
         return _format_result("Added Test to Squad Cycle", result)
     except ZephyrAuthenticationError as e:
         return f"Authentication error: {e}"
@@ -202,7 +207,9 @@ async def squad_update_execution(
 
     try:
         fetcher = await get_squad_fetcher(ctx)
-        result = fetcher.update_execution(
+        result = await call_fetcher(
+            ctx,
+            fetcher.update_execution,
             execution_id=execution_id,
             status=status,
             comment=comment,
@@ -234,7 +241,7 @@ async def squad_zql_search(
     """
     try:
         fetcher = await get_squad_fetcher(ctx)
-        result = fetcher.get_zql_search(zql_query, max_records, offset)
+        result = await call_fetcher(ctx, fetcher.get_zql_search, zql_query, max_records, offset, raw=True)
         return _format_result("Squad ZQL Search Results", result)
     except ZephyrAuthenticationError as e:
         return f"Authentication error: {e}"
@@ -243,11 +250,9 @@ async def squad_zql_search(
 
 
 def _format_result(title: str, result: Any) -> str:
-    """Format an API result for display."""
-    import json
-
-    if isinstance(result, dict):
-        return f"## {title}\n```json\n{json.dumps(result, indent=2)}\n```"
-    elif isinstance(result, list):
-        return f"## {title}\n```json\n{json.dumps(result, indent=2)}\n```"
+    """Format an API result for display; JSON is compact unless ZEPHYR_JSON_PRETTY is set."""
+    if isinstance(result, StaleJSON):
+        return f"## {title}\n> {result.describe()}\n```json\n{dumps(result, pretty=is_pretty_json_from_env())}\n```"
+    if isinstance(result, dict | list | RawJSON):
+        return f"## {title}\n```json\n{dumps(result, pretty=is_pretty_json_from_env())}\n```"
     return f"## {title}\n{result}"
@@ -5,10 +5,12 @@ from typing import Any
 
 from fastmcp import Context
 
-from zephyr_mcp.exceptions import ZephyrAuthenticationError
+from zephyr_mcp.cache import StaleJSON
+from zephyr_mcp.exceptions import InvalidMetadataError, RequestCancelledError, ZephyrAuthenticationError
 from zephyr_mcp.server.dependencies import get_zephyr_fetcher
+from zephyr_mcp.server.executor import call_fetcher, tool_deadline
 from zephyr_mcp.utils.decorators import check_write_access
-from zephyr_mcp.zephyr.constants import TEST_CASE_PRIORITIES, TEST_CASE_STATUSES, TEST_EXECUTION_STATUSES
+from zephyr_mcp.utils.jsoncodec import RawJSON, dumps, is_pretty_json_from_env
 
 logger = logging.getLogger("mcp-zephyr")
 
@@ -25,7 +27,7 @@ async def zephyr_get_test_case(ctx: Context, test_case_key: str) -> str:
     """
     try:
         fetcher = await get_zephyr_fetcher(ctx)
-        result = fetcher.get_test_case(test_case_key)
+        result = await call_fetcher(ctx, fetcher.get_test_case, test_case_key, raw=True)
         return _format_result("Test Case", result)
     except ZephyrAuthenticationError as e:
         return f"Authentication error: {e}"
@@ -54,7 +56,7 @@ async def zephyr_search_test_cases(
     """
     try:
         fetcher = await get_zephyr_fetcher(ctx)
-        result = fetcher.search_test_cases(project_key, query=query, max_results=max_results, start_at=start_at)
+        result = await call_fetcher(ctx, fetcher.search_test_cases, project_key, query=query, max_results=max_results, start_at=start_at)
         return _format_result("Test Cases Search", result)
     except ZephyrAuthenticationError as e:
         return f"Authentication error: {e}"
@@ -82,32 +84,34 @@ async def zephyr_create_test_case(
         name: Name of the test case.
         objective: Test case objective/description.
         precondition: Test case preconditions.
-        status: Test case status (Approved, Draft, Deprecated).
-        priority: Test case priority (High, Normal, Low).
-        folder: Folder path for the test case.
+        status: Test case status name or ID as defined in the project (e.g., Approved, Draft, Deprecated).
+        priority: Test case priority name or ID as defined in the project (e.g., High, Normal, Low).
+        folder: Folder path, name or ID for the test case.
         labels: List of labels to assign.
 
     Returns:
         Created test case details as a formatted string.
     """
-    if status and status not in TEST_CASE_STATUSES:
-        return f"Invalid status '{status}'. Valid statuses: {', '.join(TEST_CASE_STATUSES)}"
-    if priority and priority not in TEST_CASE_PRIORITIES:
-        return f"Invalid priority '{priority}'. Valid priorities: {', '.join(TEST_CASE_PRIORITIES)}"
-
     try:
         fetcher = await get_zephyr_fetcher(ctx)
-        result = fetcher.create_test_case(
-            project_key=project_key,
-            name=name,
-            objective=objective,
-            precondition=precondition,
-            status=status,
-            priority=priority,
-            folder=folder,
-            labels=labels,
-        )
+        async with tool_deadline(ctx, "zephyr_create_test_case"):
+            folder_entry = await _resolve(ctx, fetcher, project_key, "testcase_folder", folder)
+            result = await call_fetcher(
+                ctx,
+                fetcher.create_test_case,
+                project_key=project_key,
+                name=name,
+                objective=objective,
+                precondition=precondition,
+                status=await _resolve_name(ctx, fetcher, project_key, "testcase_status", status),
+                priority=await _resolve_name(ctx, fetcher, project_key, "priority", priority),
+                folder=folder,
+                labels=labels,
+                folder_id=folder_entry["id"] if folder_entry else None,
+            )
         return _format_result("Created Test Case", result)
+    except InvalidMetadataError as e:
+        return str(e)
     except ZephyrAuthenticationError as e:
         return f"Authentication error: {e}"
     except Exception as e:
@@ -134,32 +138,35 @@ async def zephyr_update_test_case(
         name: New name for the test case.
         objective: New objective/description.
         precondition: New preconditions.
-        status: New status (Approved, Draft, Deprecated).
-        priority: New priority (High, Normal, Low).
-        folder: New folder path.
+        status: New status name or ID as defined in the project (e.g., Approved, Draft, Deprecated).
+        priority: New priority name or ID as defined in the project (e.g., High, Normal, Low).
+        folder: New folder path, name or ID.
         labels: New list of labels.
 
     Returns:
         Updated test case details as a formatted string.
     """
-    if status and status not in TEST_CASE_STATUSES:
-        return f"Invalid status '{status}'. Valid statuses: {', '.join(TEST_CASE_STATUSES)}"
-    if priority and priority not in TEST_CASE_PRIORITIES:
-        return f"Invalid priority '{priority}'. Valid priorities: {', '.join(TEST_CASE_PRIORITIES)}"
-
+    project_key = _project_of(test_case_key)
     try:
         fetcher = await get_zephyr_fetcher(ctx)
-        result = fetcher.update_test_case(
-            test_case_key=test_case_key,
-            name=name,
-            objective=objective,
-            precondition=precondition,
-            status=status,
-            priority=priority,
-            folder=folder,
-            labels=labels,
-        )
+        async with tool_deadline(ctx, "zephyr_update_test_case"):
+            folder_entry = await _resolve(ctx, fetcher, project_key, "testcase_folder", folder)
+            result = await call_fetcher(
+                ctx,
+                fetcher.update_test_case,
+                test_case_key=test_case_key,
+                name=name,
+                objective=objective,
+                precondition=precondition,
+                status=await _resolve_name(ctx, fetcher, project_key, "testcase_status", status),
+                priority=await _resolve_name(ctx, fetcher, project_key, "priority", priority),
+                folder=folder,
+                labels=labels,
+                folder_id=folder_entry["id"] if folder_entry else None,
+            )
         return _format_result("Updated Test Case", result)
+    except InvalidMetadataError as e:
+        return str(e)
     except ZephyrAuthenticationError as e:
         return f"Authentication error: {e}"
     except Exception as e:
@@ -178,7 +185,7 @@ async def zephyr_get_test_cycle(ctx: Context, test_cycle_key: str) -> str:
     """
     try:
         fetcher = await get_zephyr_fetcher(ctx)
-        result = fetcher.get_test_cycle(test_cycle_key)
+        result = await call_fetcher(ctx, fetcher.get_test_cycle, test_cycle_key, raw=True)
         return _format_result("Test Cycle", result)
     except ZephyrAuthenticationError as e:
         return f"Authentication error: {e}"
@@ -206,7 +213,7 @@ async def zephyr_create_test_cycle(
         description: Test cycle description.
         planned_start_date: Planned start date (ISO 8601 format).
         planned_end_date: Planned end date (ISO 8601 format).
-        folder: Folder path for the test cycle.
+        folder: Folder path, name or ID for the test cycle.
         jira_project_version: Jira project version ID.
 
     Returns:
@@ -214,16 +221,23 @@ async def zephyr_create_test_cycle(
     """
     try:
         fetcher = await get_zephyr_fetcher(ctx)
-        result = fetcher.create_test_cycle(
-            project_key=project_key,
-            name=name,
-            description=description,
-            planned_start_date=planned_start_date,
-            planned_end_date=planned_end_date,
-            folder=folder,
-            jira_project_version=jira_project_version,
-        )
+        async with tool_deadline(ctx, "zephyr_create_test_cycle"):
+            folder_entry = await _resolve(ctx, fetcher, project_key, "testcycle_folder", folder)
+            result = await call_fetcher(
+                ctx,
+                fetcher.create_test_cycle,
+                project_key=project_key,
+                name=name,
+                description=description,
+                planned_start_date=planned_start_date,
+                planned_end_date=planned_end_date,
+                folder=folder,
+                jira_project_version=jira_project_version,
+                folder_id=folder_entry["id"] if folder_entry else None,
+            )
         return _format_result("Created Test Cycle", result)
+    except InvalidMetadataError as e:
+        return str(e)
     except ZephyrAuthenticationError as e:
         return f"Authentication error: {e}"
     except Exception as e:
@@ -242,7 +256,7 @@ async def zephyr_get_test_execution(ctx: Context, test_execution_id: str) -> str
     """
     try:
         fetcher = await get_zephyr_fetcher(ctx)
-        result = fetcher.get_test_execution(test_execution_id)
+        result = await call_fetcher(ctx, fetcher.get_test_execution, test_execution_id, raw=True)
         return _format_result("Test Execution", result)
     except ZephyrAuthenticationError as e:
         return f"Authentication error: {e}"
@@ -250,6 +264,26 @@ async def zephyr_get_test_execution(ctx: Context, test_execution_id: str) -> str
         return f"Error getting test execution {test_execution_id}: {e}"
 
 
+async def zephyr_get_project_metadata(ctx: Context, project_key: str) -> str:
+    """Get the statuses, priorities, environments and folders defined in a Zephyr Scale project.
+
+    Args:
+        ctx: The FastMCP context.
+        project_key: The Jira project key (e.g., 'PROJ').
+
+    Returns:
+        The names, IDs and folder paths that other tools accept, as a formatted string.
+    """
+    try:
+        fetcher = await get_zephyr_fetcher(ctx)
+        result = await call_fetcher(ctx, fetcher.get_project_metadata, project_key)
+        return _format_result(f"Project Metadata {project_key}", result)
+    except ZephyrAuthenticationError as e:
+        return f"Authentication error: {e}"
+    except Exception as e:
+        return f"Error getting metadata of project {project_key}: {e}"
+
+
 @check_write_access
 async def zephyr_create_test_execution(
     ctx: Context,
@@ -269,8 +303,8 @@ async def zephyr_create_test_execution(
         project_key: The Jira project key (e.g., 'PROJ').
         test_case_key: The test case key (e.g., 'PROJ-T123').
         test_cycle_key: The test cycle key (e.g., 'PROJ-R123').
-        status_name: Execution status (Pass, Fail, Blocked, Not Executed, In Progress).
-        environment: Execution environment.
+        status_name: Execution status name or ID as defined in the project (e.g., Pass, Fail, Blocked, Not Executed, In Progress).
+        environment: Execution environment name or ID.
         comment: Comment for the execution.
         execution_time: Execution time in milliseconds.
         assigned_to: User assigned to the execution.
@@ -278,22 +312,24 @@ async def zephyr_create_test_execution(
     Returns:
         Created test execution details as a formatted string.
     """
-    if status_name and status_name not in TEST_EXECUTION_STATUSES:
-        return f"Invalid status '{status_name}'. Valid statuses: {', '.join(TEST_EXECUTION_STATUSES)}"
-
     try:
         fetcher = await get_zephyr_fetcher(ctx)
-        result = fetcher.create_test_execution(
-            project_key=project_key,
-            test_case_key=test_case_key,
-            test_cycle_key=test_cycle_key,
-            status_name=status_name,
-            environment=environment,
-            comment=comment,
-            execution_time=execution_time,
-            assigned_to=assigned_to,
-        )
+        async with tool_deadline(ctx, "zephyr_create_test_execution"):
+            result = await call_fetcher(
+                ctx,
+                fetcher.create_test_execution,
+                project_key=project_key,
+                test_case_key=test_case_key,
+                test_cycle_key=test_cycle_key,
+                status_name=await _resolve_name(ctx, fetcher, project_key, "testexecution_status", status_name),
+                environment=await _resolve_name(ctx, fetcher, project_key, "environment", environment),
+                comment=comment,
+                execution_time=execution_time,
+                assigned_to=assigned_to,
+            )
         return _format_result("Created Test Execution", result)
+    except InvalidMetadataError as e:
+        return str(e)
     except ZephyrAuthenticationError as e:
         return f"Authentication error: {e}"
     except Exception as e:
@@ -309,35 +345,41 @@ async def zephyr_update_test_execution(
     comment: str | None = None,
     execution_time: int | None = None,
     assigned_to: str | None = None,
+    project_key: str | None = None,
 ) -> str:
     """Update an existing Zephyr Scale test execution.
 
     Args:
         ctx: The FastMCP context.
         test_execution_id: The test execution ID.
-        status_name: New execution status (Pass, Fail, Blocked, Not Executed, In Progress).
-        environment: New execution environment.
+        status_name: New execution status name or ID as defined in the project (e.g., Pass, Fail, Blocked, Not Executed, In Progress).
+        environment: New execution environment name or ID.
         comment: New comment for the execution.
         execution_time: New execution time in milliseconds.
         assigned_to: New user assigned to the execution.
+        project_key: The execution's Jira project key, used to check status_name and environment
+            (default: ZEPHYR_PROJECT_KEY when it names a single project).
 
     Returns:
         Updated test execution details as a formatted string.
     """
-    if status_name and status_name not in TEST_EXECUTION_STATUSES:
-        return f"Invalid status '{status_name}'. Valid statuses: {', '.join(TEST_EXECUTION_STATUSES)}"
-
     try:
         fetcher = await get_zephyr_fetcher(ctx)
-        result = fetcher.update_test_execution(
-            test_execution_id=test_execution_id,
-            status_name=status_name,
-            environment=environment,
-            comment=comment,
-            execution_time=execution_time,
-            assigned_to=assigned_to,
-        )
+        project_key = project_key or _default_project(fetcher)
+        async with tool_deadline(ctx, "zephyr_update_test_execution"):
+            result = await call_fetcher(
+                ctx,
+                fetcher.update_test_execution,
+                test_execution_id=test_execution_id,
+                status_name=await _resolve_name(ctx, fetcher, project_key, "testexecution_status", status_name),
+                environment=await _resolve_name(ctx, fetcher, project_key, "environment", environment),
+                comment=comment,
+                execution_time=execution_time,
+                assigned_to=assigned_to,
+            )
         return _format_result("Updated Test Execution", result)
+    except InvalidMetadataError as e:
+        return str(e)
     except ZephyrAuthenticationError as e:
         return f"Authentication error: {e}"
     except Exception as e:
@@ -358,7 +400,7 @@ async def zephyr_link_test_case_to_issue(ctx: Context, test_case_key: str, issue
     """
     try:
         fetcher = await get_zephyr_fetcher(ctx)
-        result = fetcher.link_test_case_to_issue(test_case_key, issue_key)
+        result = await call_fetcher(ctx, fetcher.link_test_case_to_issue, test_case_key, issue_key)
         return _format_result("Linked Test Case to Issue", result)
     except ZephyrAuthenticationError as e:
         return f"Authentication error: {e}"
@@ -366,12 +408,46 @@ async def zephyr_link_test_case_to_issue(ctx: Context, test_case_key: str, issue
         return f"Error linking test case {test_case_key} to issue {issue_key}: {e}"
 
 
-def _format_result(title: str, result: Any) -> str:
-    """Format an API result for display."""
-    import json
+async def _resolve(ctx: Context, fetcher: Any, project_key: str | None, category: str, value: str | None) -> dict[str, Any] | None:
+    """Look a tool argument up in the project's metadata; None when it is unset or cannot be checked locally.
+
+    Raises InvalidMetadataError for a value the project does not define. When
+    the metadata cannot be loaded the argument is sent as given and the API
+    has the last word, unless the tool has run out of time.
+    """
+    if not value or not project_key:
+        return None
+    try:
+        return await call_fetcher(ctx, fetcher.resolve_metadata, project_key, category, value)
+    except (InvalidMetadataError, ZephyrAuthenticationError, RequestCancelledError):
+        raise
+    except Exception as e:
+        logger.warning(f"Could not check {category} '{value}' against the metadata of {project_key}: {e}")
+        return None
+
 
-    if isinstance(result, dict):
-        return f"## {title}\n```json\n{json.dumps(result, indent=2)}\n```"
-    elif isinstance(result, list):
-        return f"## {title}\n```json\n{json.dumps(result, indent=2)}\n```"
+async def _resolve_name(ctx: Context, fetcher: Any, project_key: str | None, category: str, value: str | None) -> str | None:
+    """The name the project uses for value (which may be an ID or differ in case), or value itself when it cannot be checked."""
+    entry = await _resolve(ctx, fetcher, project_key, category, value)
+    return entry["name"] if entry else value
+
+
+def _project_of(key: str) -> str | None:
+    """The project key of an entity key such as 'PROJ-T123'."""
+    project, separator, _ = key.rpartition("-")
+    return project if separator and project else None
+
+
+def _default_project(fetcher: Any) -> str | None:
+    """The configured project key, when the server is configured for exactly one."""
+    keys = fetcher.config.project_keys()
+    return keys[0] if len(keys) == 1 else None
+
+
+def _format_result(title: str, result: Any) -> str:
+    """Format an API result for display; JSON is compact unless ZEPHYR_JSON_PRETTY is set."""
+    if isinstance(result, StaleJSON):
+        return f"## {title}\n> {result.describe()}\n```json\n{dumps(result, pretty=is_pretty_json_from_env())}\n```"
+    if isinstance(result, dict | list | RawJSON):
+        return f"## {title}\n```json\n{dumps(result, pretty=is_pretty_json_from_env())}\n```"
     return f"## {title}\n{result}"
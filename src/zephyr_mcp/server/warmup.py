@@ -0,0 +1,96 @@
+"""Optional start-up warm-up of pooled sessions, connections and credentials."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from typing import Any
+
+from zephyr_mcp.server.context import AppContext
+from zephyr_mcp.server.dependencies import get_global_zephyr_fetcher
+from zephyr_mcp.server.squad_dependencies import get_global_squad_fetcher
+from zephyr_mcp.squad.config import AUTH_TYPE_PAT
+from zephyr_mcp.utils.metrics import metrics
+
+logger = logging.getLogger("mcp-zephyr.server.warmup")
+
+# Cheap authenticated calls used to validate credentials, per backend.
+SCALE_PROBE = ("/projects", {"maxResults": 1})
+SQUAD_PROBE = "/serverinfo"
+SQUAD_PAT_PROBE = "/moduleInfo"
+
+
+async def warm_up(app_ctx: AppContext) -> None:
+    """Warm up every backend configured in the lifespan context; failures are logged, never raised."""
+    connections = app_ctx.server_config.warmup_connections if app_ctx.server_config else 0
+    backends: list[tuple[str, Callable[[], Any], Callable[[Any], Any]]] = []
+    if app_ctx.full_zephyr_config is not None:
+        backends.append(("Zephyr Scale", lambda: get_global_zephyr_fetcher(app_ctx), _probe_scale))
+    if app_ctx.squad_config is not None:
+        backends.append(("Zephyr Squad", lambda: get_global_squad_fetcher(app_ctx), _probe_squad))
+    await asyncio.gather(*(_warm_up_backend(name, factory, probe, connections) for name, factory, probe in backends))
+
+
+async def _warm_up_backend(name: str, factory: Callable[[], Any], probe: Callable[[Any], Any], connections: int) -> None:
+    """Create the pooled fetcher, open keep-alive connections and validate credentials, timing each phase."""
+    timings: dict[str, float] = {}
+    try:
+        # Building the fetcher may refresh an OAuth token or look up the Cloud ID, which blocks.
+        fetcher = await _timed(timings, "session", asyncio.to_thread(factory))
+        client = fetcher.client
+        opened = await _timed(timings, "connect", _open_connections(client, connections))
+        await _timed(timings, "auth", _call(fetcher, probe))
+    except Exception as e:
+        logger.warning(f"Warm-up of {name} failed after {_format(timings)}: {e}")
+        return
+    for phase, seconds in timings.items():
+        metrics.observe("zephyr_warmup_seconds", seconds, labels={"backend": name, "phase": phase})
+    logger.info(f"Warm-up of {name} done: {_format(timings)} ({opened}/{connections} connections to {client.base_url})")
+
+
+async def _timed(timings: dict[str, float], phase: str, awaitable: Any) -> Any:
+    started = time.monotonic()
+    try:
+        return await awaitable
+    finally:
+        timings[phase] = time.monotonic() - started
+
+
+async def _open_connections(client: Any, count: int) -> int:
+    """Open up to count pooled keep-alive connections to the client's base URL; returns how many succeeded."""
+    if count <= 0:
+        return 0
+    if getattr(client, "http", None) is not None:
+        results = await asyncio.gather(*(client.http.head(client.base_url) for _ in range(count)), return_exceptions=True)
+    else:
+        # Concurrent requests force the session's pool to hold several connections rather than reuse one.
+        timeout = client.config.http.timeout
+        results = await asyncio.gather(
+            *(asyncio.to_thread(client.session.head, client.base_url, timeout=timeout) for _ in range(count)), return_exceptions=True
+        )
+    failures = [result for result in results if isinstance(result, BaseException)]
+    if failures:
+        logger.debug(f"Warm-up could not open {len(failures)} connections to {client.base_url}: {failures[0]}")
+    return count - len(failures)
+
+
+async def _call(fetcher: Any, probe: Callable[[Any], Any]) -> Any:
+    """Run a probe against a fetcher on its engine."""
+    if getattr(fetcher, "is_async", False) is True:
+        return await probe(fetcher)
+    return await asyncio.to_thread(probe, fetcher)
+
+
+def _probe_scale(fetcher: Any) -> Any:
+    endpoint, params = SCALE_PROBE
+    return fetcher.client.get(endpoint, params=params)
+
+
+def _probe_squad(fetcher: Any) -> Any:
+    return fetcher.client.get(SQUAD_PAT_PROBE if fetcher.config.auth_type == AUTH_TYPE_PAT else SQUAD_PROBE)
+
+
+def _format(timings: dict[str, float]) -> str:
+    return ", ".join(f"{phase} {seconds * 1000:.0f}ms" for phase, seconds in timings.items()) or "0ms"
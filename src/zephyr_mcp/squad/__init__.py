@@ -1,5 +1,8 @@
 """Zephyr Squad API client package."""
 
+from zephyr_mcp.cache.backend import get_cache_backend
+from zephyr_mcp.cache.entity import get_entity_cache
+from zephyr_mcp.squad.async_client import AsyncZephyrSquadClient, AsyncZephyrSquadPatClient
 from zephyr_mcp.squad.client import ZephyrSquadClient
 from zephyr_mcp.squad.config import AUTH_TYPE_PAT, ZephyrSquadConfig
 from zephyr_mcp.squad.cycles import SquadCyclesMixin
@@ -14,23 +17,67 @@ def _create_squad_client(config: ZephyrSquadConfig) -> ZephyrSquadClient | Zephy
     return ZephyrSquadClient(config)
 
 
+def _create_async_squad_client(config: ZephyrSquadConfig) -> AsyncZephyrSquadClient | AsyncZephyrSquadPatClient:
+    """Create the appropriate async Squad client based on auth_type."""
+    if config.auth_type == AUTH_TYPE_PAT:
+        return AsyncZephyrSquadPatClient(config)
+    return AsyncZephyrSquadClient(config)
+
+
 class SquadFetcher(SquadCyclesMixin, SquadExecutionsMixin):
     """Combined Zephyr Squad API client with all operations.
 
     Automatically selects JWT or PAT client based on config.auth_type.
     """
 
+    is_async = False
+
     def __init__(self, config: ZephyrSquadConfig | None = None) -> None:
         if config is None:
             config = ZephyrSquadConfig.from_env()
         self.client = _create_squad_client(config)
         self.config = config
+        self.entity_cache = get_entity_cache("squad", config.entity_cache, store=get_cache_backend(config.cache_backend))
+        self.cache_scope = config.cache_scope()
+
+    def close(self) -> None:
+        """Release the client's HTTP resources."""
+        self.client.close()
+
+
+class AsyncSquadFetcher(SquadCyclesMixin, SquadExecutionsMixin):
+    """Combined Zephyr Squad API client on the asyncio engine.
+
+    The mixins only build requests and return the client's result, so with an
+    async Squad client every operation returns an awaitable.
+    """
+
+    is_async = True
+
+    def __init__(self, config: ZephyrSquadConfig | None = None) -> None:
+        if config is None:
+            config = ZephyrSquadConfig.from_env()
+        self.client = _create_async_squad_client(config)
+        self.config = config
+        self.entity_cache = get_entity_cache("squad", config.entity_cache, store=get_cache_backend(config.cache_backend))
+        self.cache_scope = config.cache_scope()
+
+    async def aclose(self) -> None:
+        """Release the client's HTTP resources."""
+        await self.client.aclose()
+
+    def close(self) -> None:
+        """Release the client's HTTP resources from synchronous code."""
+        self.client.close()
 
 
 __all__ = [
     "SquadFetcher",
+    "AsyncSquadFetcher",
     "ZephyrSquadClient",
     "ZephyrSquadPatClient",
+    "AsyncZephyrSquadClient",
+    "AsyncZephyrSquadPatClient",
     "ZephyrSquadConfig",
     "SquadCyclesMixin",
     "SquadExecutionsMixin",
@@ -0,0 +1,73 @@
+"""Asyncio Zephyr Squad API clients (JWT and PAT)."""
+
+import logging
+from typing import Any
+
+from zephyr_mcp.squad.client import ZephyrSquadClient
+from zephyr_mcp.squad.config import ZephyrSquadConfig
+from zephyr_mcp.squad.pat_client import ZephyrSquadPatClient
+from zephyr_mcp.utils.http import build_async_http_client, close_async_http_client, close_async_http_client_soon
+from zephyr_mcp.utils.jsoncodec import RawJSON
+from zephyr_mcp.utils.singleflight import coalesce_key
+
+logger = logging.getLogger("mcp-zephyr-squad")
+
+
+class _AsyncSquadTransportMixin:
+    """Awaitable request methods shared by the async Squad clients."""
+
+    async def request(
+        self, method: str, endpoint: str, query_params: dict[str, str] | None = None, raw: bool = False, **kwargs: Any
+    ) -> dict[str, Any] | list[dict[str, Any]] | RawJSON:
+        """Make an HTTP request to the Zephyr Squad API; with raw, the JSON body is returned undecoded as RawJSON."""
+        url, kwargs = self._build_request(method, endpoint, query_params, kwargs)
+        response = await self._pipeline.send_async(
+            lambda: self.http.request(method, url, **kwargs),
+            method,
+            headers=kwargs.get("headers"),
+            coalesce_key=coalesce_key(method, url, kwargs),
+            endpoint=endpoint,
+        )
+        return self._handle_response(response, raw=raw)
+
+    async def get(self, endpoint: str, query_params: dict[str, str] | None = None, **kwargs: Any) -> dict[str, Any] | list[dict[str, Any]]:
+        """Make a GET request."""
+        return await self.request("GET", endpoint, query_params=query_params, **kwargs)
+
+    async def post(self, endpoint: str, query_params: dict[str, str] | None = None, **kwargs: Any) -> dict[str, Any] | list[dict[str, Any]]:
+        """Make a POST request."""
+        return await self.request("POST", endpoint, query_params=query_params, **kwargs)
+
+    async def put(self, endpoint: str, query_params: dict[str, str] | None = None, **kwargs: Any) -> dict[str, Any] | list[dict[str, Any]]:
+        """Make a PUT request."""
+        return await self.request("PUT", endpoint, query_params=query_params, **kwargs)
+
+    async def delete(self, endpoint: str, query_params: dict[str, str] | None = None, **kwargs: Any) -> dict[str, Any] | list[dict[str, Any]]:
+        """Make a DELETE request."""
+        return await self.request("DELETE", endpoint, query_params=query_params, **kwargs)
+
+    async def aclose(self) -> None:
+        """Close the async connection pool and the underlying session."""
+        await close_async_http_client(self.http)
+        self.session.close()
+
+    def close(self) -> None:
+        """Close the async connection pool from synchronous code."""
+        close_async_http_client_soon(self.http)
+        self.session.close()
+
+
+class AsyncZephyrSquadClient(_AsyncSquadTransportMixin, ZephyrSquadClient):
+    """Zephyr Squad Cloud API client (JWT) that awaits requests on a pooled httpx.AsyncClient."""
+
+    def __init__(self, config: ZephyrSquadConfig) -> None:
+        super().__init__(config)
+        self.http = build_async_http_client(self.session, settings=config.http)
+
+
+class AsyncZephyrSquadPatClient(_AsyncSquadTransportMixin, ZephyrSquadPatClient):
+    """Zephyr Squad ZAPI client (PAT) that awaits requests on a pooled httpx.AsyncClient."""
+
+    def __init__(self, config: ZephyrSquadConfig) -> None:
+        super().__init__(config)
+        self.http = build_async_http_client(self.session, settings=config.http)
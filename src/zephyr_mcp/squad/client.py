@@ -8,6 +8,10 @@ import requests
 from zephyr_mcp.exceptions import ZephyrAuthenticationError
 from zephyr_mcp.squad.config import ZephyrSquadConfig
 from zephyr_mcp.squad.jwt_auth import generate_jwt_token
+from zephyr_mcp.utils.cancellation import bound_timeout
+from zephyr_mcp.utils.http import build_request_pipeline, configure_http_session
+from zephyr_mcp.utils.jsoncodec import RawJSON, decode_response
+from zephyr_mcp.utils.singleflight import coalesce_key
 
 logger = logging.getLogger("mcp-zephyr-squad")
 
@@ -20,8 +24,10 @@ class ZephyrSquadClient:
     def __init__(self, config: ZephyrSquadConfig) -> None:
         self.config = config
         self.base_url = (config.base_url or "").rstrip("/")
+        self._pipeline = build_request_pipeline(self.base_url, config)
         self.session = requests.Session()
         self.session.headers["Content-Type"] = "application/json"
+        configure_http_session(self.session, config.http)
 
     def _get_auth_headers(self, method: str, relative_path: str, query_params: dict[str, str] | None = None) -> dict[str, str]:
         """Generate JWT auth headers for a specific request."""
@@ -38,20 +44,45 @@ class ZephyrSquadClient:
             "zapiAccessKey": self.config.access_key,
         }
 
-    def request(self, method: str, endpoint: str, query_params: dict[str, str] | None = None, **kwargs: Any) -> dict[str, Any] | list[dict[str, Any]]:
-        """Make an HTTP request to the Zephyr Squad Cloud API."""
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self.session.close()
+
+    def request(
+        self, method: str, endpoint: str, query_params: dict[str, str] | None = None, raw: bool = False, **kwargs: Any
+    ) -> dict[str, Any] | list[dict[str, Any]] | RawJSON:
+        """Make an HTTP request to the Zephyr Squad Cloud API; with raw, the JSON body is returned undecoded as RawJSON."""
+        url, kwargs = self._build_request(method, endpoint, query_params, kwargs)
+        kwargs.setdefault("timeout", self.config.http.timeout)
+        response = self._pipeline.send(
+            lambda: self.session.request(method, url, **{**kwargs, "timeout": bound_timeout(kwargs["timeout"])}),
+            method,
+            headers=kwargs.get("headers"),
+            coalesce_key=coalesce_key(method, url, kwargs),
+            endpoint=endpoint,
+        )
+        return self._handle_response(response, raw=raw)
+
+    def invalidate_cached(self, endpoint: str) -> None:
+        """Forget the cached GET response of endpoint, after a write to it."""
+        self._pipeline.invalidate(coalesce_key("GET", f"{self.base_url}{API_PREFIX}{endpoint}", {}))
+
+    def _build_request(self, method: str, endpoint: str, query_params: dict[str, str] | None, kwargs: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+        """Resolve the URL and signed request arguments for an API call."""
         relative_path = f"{API_PREFIX}{endpoint}"
         url = f"{self.base_url}{relative_path}"
         logger.debug(f"Zephyr Squad API request: {method.upper()} {url}")
 
         auth_headers = self._get_auth_headers(method, relative_path, query_params)
-        headers = {**auth_headers, **kwargs.pop("headers", {})}
+        kwargs["headers"] = {**auth_headers, **kwargs.pop("headers", {})}
 
         if query_params:
             kwargs["params"] = query_params
 
-        response = self.session.request(method, url, headers=headers, **kwargs)
+        return url, kwargs
 
+    def _handle_response(self, response: Any, raw: bool = False) -> dict[str, Any] | list[dict[str, Any]] | RawJSON:
+        """Raise on error statuses and decode the JSON body of a response (or keep it raw)."""
         if response.status_code in (401, 403):
             raise ZephyrAuthenticationError(f"Authentication failed for Zephyr Squad API: {response.status_code} {response.text}")
 
@@ -60,7 +91,7 @@ class ZephyrSquadClient:
         if response.status_code == 204:
             return {}
 
-        return response.json()
+        return decode_response(response, raw=raw)
 
     def get(self, endpoint: str, query_params: dict[str, str] | None = None, **kwargs: Any) -> dict[str, Any] | list[dict[str, Any]]:
         """Make a GET request."""
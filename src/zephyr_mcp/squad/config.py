@@ -1,8 +1,20 @@
 """Configuration for the Zephyr Squad API client."""
 
+import dataclasses
+import hashlib
 import logging
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+from zephyr_mcp.cache.backend import CacheBackendPolicy
+from zephyr_mcp.cache.entity import EntityCachePolicy
+from zephyr_mcp.cache.http import HTTPCachePolicy
+from zephyr_mcp.utils.circuit import CircuitBreakerPolicy
+from zephyr_mcp.utils.concurrency import ConcurrencyPolicy
+from zephyr_mcp.utils.http import HTTP_ENGINE_SYNC, HTTPSettings, get_http_engine_from_env
+from zephyr_mcp.utils.ratelimit import RateLimitPolicy
+from zephyr_mcp.utils.retry import RetryPolicy
+from zephyr_mcp.utils.singleflight import is_coalescing_enabled_from_env
 
 logger = logging.getLogger("mcp-zephyr-squad")
 
@@ -33,6 +45,44 @@ class ZephyrSquadConfig:
     jira_base_url: str | None = None
     pat_token: str | None = None
     jira_email: str | None = None
+    http_engine: str = HTTP_ENGINE_SYNC
+    http: HTTPSettings = field(default_factory=lambda: HTTPSettings.from_env("ZEPHYR_SQUAD", "ZEPHYR"))
+    retry_policy: RetryPolicy = field(default_factory=RetryPolicy.from_env)
+    concurrency: ConcurrencyPolicy = field(default_factory=ConcurrencyPolicy.from_env)
+    rate_limit: RateLimitPolicy = field(default_factory=lambda: RateLimitPolicy.from_env("ZEPHYR_SQUAD_RATE_LIMIT", "ZEPHYR_RATE_LIMIT"))
+    coalesce_gets: bool = field(default_factory=lambda: is_coalescing_enabled_from_env("ZEPHYR_SQUAD_COALESCE_GETS", "ZEPHYR_COALESCE_GETS"))
+    circuit_breaker: CircuitBreakerPolicy = field(default_factory=CircuitBreakerPolicy.from_env)
+    http_cache: HTTPCachePolicy = field(default_factory=lambda: HTTPCachePolicy.from_env("ZEPHYR_SQUAD", "ZEPHYR"))
+    entity_cache: EntityCachePolicy = field(default_factory=EntityCachePolicy.from_env)
+    cache_backend: CacheBackendPolicy = field(default_factory=CacheBackendPolicy.from_env)
+
+    def credential_id(self) -> str:
+        """Return a stable hash of the credential alone, shared by every client that spends the same API quota."""
+        # The access key is sent in the clear; only the secret proves the credential, so it is part of the identity.
+        secret = hashlib.sha256(self.secret_key.encode()).hexdigest() if self.secret_key else None
+        parts = (self.auth_type, self.access_key, secret, self.account_id, self.pat_token, self.jira_email)
+        return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+    def cache_scope(self) -> str:
+        """Return the scope cached API data is partitioned by: the API URL and the credential reading it."""
+        url = self.jira_base_url if self.auth_type == AUTH_TYPE_PAT else self.base_url
+        return f"{(url or '').rstrip('/')}|{self.credential_id()}"
+
+    def fingerprint(self) -> str:
+        """Return a stable hash of the settings that identify a client built from this config."""
+        parts = (
+            self.auth_type,
+            self.base_url,
+            self.access_key,
+            self.secret_key,
+            self.account_id,
+            self.jira_base_url,
+            self.pat_token,
+            self.jira_email,
+            self.http_engine,
+            self.http,
+        )
+        return hashlib.sha256(repr(parts).encode()).hexdigest()
 
     @classmethod
     def from_env(cls) -> "ZephyrSquadConfig":
@@ -51,12 +101,13 @@ class ZephyrSquadConfig:
         account_id = os.getenv("ZEPHYR_SQUAD_ACCOUNT_ID")
         project_id = os.getenv("ZEPHYR_SQUAD_PROJECT_ID")
         base_url = os.getenv("ZEPHYR_SQUAD_BASE_URL", SQUAD_BASE_URL)
+        http_engine = get_http_engine_from_env("ZEPHYR_SQUAD_HTTP_ENGINE", "ZEPHYR_HTTP_ENGINE")
 
         if pat_token:
-            return cls._build_pat_config(pat_token, jira_base_url, jira_email, project_id)
+            return dataclasses.replace(cls._build_pat_config(pat_token, jira_base_url, jira_email, project_id), http_engine=http_engine)
 
         if access_key:
-            return cls._build_jwt_config(access_key, secret_key, account_id, base_url, project_id)
+            return dataclasses.replace(cls._build_jwt_config(access_key, secret_key, account_id, base_url, project_id), http_engine=http_engine)
 
         raise ValueError(
             "Zephyr Squad configuration requires either ZEPHYR_SQUAD_PAT_TOKEN (PAT mode) or ZEPHYR_SQUAD_ACCESS_KEY (JWT mode) to be set."
@@ -3,6 +3,9 @@
 import logging
 from typing import Any
 
+from zephyr_mcp.cache.mixin import EntityCacheMixin
+from zephyr_mcp.utils.jsoncodec import RawJSON
+
 logger = logging.getLogger("mcp-zephyr-squad")
 
 SQUAD_EXECUTION_STATUSES = {
@@ -14,13 +17,13 @@ SQUAD_EXECUTION_STATUSES = {
 }
 
 
-class SquadExecutionsMixin:
+class SquadExecutionsMixin(EntityCacheMixin):
     """Mixin providing test execution operations for the Zephyr Squad Cloud API."""
 
-    def get_execution(self, execution_id: str) -> dict[str, Any]:
+    def get_execution(self, execution_id: str, raw: bool = False) -> dict[str, Any] | RawJSON:
         """Get a test execution by ID."""
         logger.debug(f"Getting Squad execution: {execution_id}")
-        return self.client.get(f"/execution/{execution_id}")
+        return self._cached_get("execution", str(execution_id), f"/execution/{execution_id}", raw=raw)
 
     def get_executions_by_cycle(
         self,
@@ -50,7 +53,7 @@ class SquadExecutionsMixin:
             "versionId": version_id,
             "issueId": issue_id,
         }
-        return self.client.post("/execution", json=payload)
+        return self._create("execution", lambda: self.client.post("/execution", json=payload))
 
     def update_execution(
         self,
@@ -74,15 +77,18 @@ class SquadExecutionsMixin:
         if assigned_to is not None:
             payload["assignedTo"] = assigned_to
 
-        return self.client.put(f"/execution/{execution_id}", json=payload)
+        return self._write(
+            "execution", str(execution_id), f"/execution/{execution_id}", lambda: self.client.put(f"/execution/{execution_id}", json=payload)
+        )
 
     def get_zql_search(
         self,
         zql_query: str,
         max_records: int = 50,
         offset: int = 0,
-    ) -> dict[str, Any]:
-        """Execute a ZQL (Zephyr Query Language) search."""
+        raw: bool = False,
+    ) -> dict[str, Any] | RawJSON:
+        """Execute a ZQL (Zephyr Query Language) search; with raw, the response body is returned undecoded."""
         logger.debug(f"Executing ZQL search: {zql_query}")
         return self.client.get(
             "/zql/executeSearch",
@@ -91,4 +97,5 @@ class SquadExecutionsMixin:
                 "maxRecords": str(max_records),
                 "offset": str(offset),
             },
+            raw=raw,
         )
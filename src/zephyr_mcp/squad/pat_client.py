@@ -11,6 +11,10 @@ import requests
 
 from zephyr_mcp.exceptions import ZephyrAuthenticationError
 from zephyr_mcp.squad.config import ZephyrSquadConfig
+from zephyr_mcp.utils.cancellation import bound_timeout
+from zephyr_mcp.utils.http import build_request_pipeline, configure_http_session
+from zephyr_mcp.utils.jsoncodec import RawJSON, decode_response
+from zephyr_mcp.utils.singleflight import coalesce_key
 
 logger = logging.getLogger("mcp-zephyr-squad")
 
@@ -23,8 +27,10 @@ class ZephyrSquadPatClient:
     def __init__(self, config: ZephyrSquadConfig) -> None:
         self.config = config
         self.base_url = (config.jira_base_url or "").rstrip("/")
+        self._pipeline = build_request_pipeline(self.base_url, config)
         self.session = requests.Session()
         self.session.headers["Content-Type"] = "application/json"
+        configure_http_session(self.session, config.http)
         self._setup_auth()
 
     def _setup_auth(self) -> None:
@@ -36,18 +42,44 @@ class ZephyrSquadPatClient:
             # Server/DC: Bearer token
             self.session.headers["Authorization"] = f"Bearer {self.config.pat_token}"
 
-    def request(self, method: str, endpoint: str, query_params: dict[str, str] | None = None, **kwargs: Any) -> dict[str, Any] | list[dict[str, Any]]:
-        """Make an HTTP request to the Zephyr Squad ZAPI endpoint."""
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self.session.close()
+
+    def request(
+        self, method: str, endpoint: str, query_params: dict[str, str] | None = None, raw: bool = False, **kwargs: Any
+    ) -> dict[str, Any] | list[dict[str, Any]] | RawJSON:
+        """Make an HTTP request to the Zephyr Squad ZAPI endpoint; with raw, the JSON body is returned undecoded as RawJSON."""
+        url, kwargs = self._build_request(method, endpoint, query_params, kwargs)
+        kwargs.setdefault("timeout", self.config.http.timeout)
+        response = self._pipeline.send(
+            lambda: self.session.request(method, url, **{**kwargs, "timeout": bound_timeout(kwargs["timeout"])}),
+            method,
+            headers=kwargs.get("headers"),
+            coalesce_key=coalesce_key(method, url, kwargs),
+            endpoint=endpoint,
+        )
+        return self._handle_response(response, raw=raw)
+
+    def invalidate_cached(self, endpoint: str) -> None:
+        """Forget the cached GET response of endpoint, after a write to it."""
+        self._pipeline.invalidate(coalesce_key("GET", f"{self.base_url}{ZAPI_PREFIX}{endpoint}", {}))
+
+    def _build_request(self, method: str, endpoint: str, query_params: dict[str, str] | None, kwargs: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+        """Resolve the URL and request arguments for an API call."""
         url = f"{self.base_url}{ZAPI_PREFIX}{endpoint}"
         logger.debug(f"Zephyr Squad PAT API request: {method.upper()} {url}")
 
-        headers = kwargs.pop("headers", {})
+        # Our own copy: the request pipeline adds HTTP cache validators to it.
+        kwargs["headers"] = dict(kwargs.pop("headers", None) or {})
 
         if query_params:
             kwargs["params"] = query_params
 
-        response = self.session.request(method, url, headers=headers, **kwargs)
+        return url, kwargs
 
+    def _handle_response(self, response: Any, raw: bool = False) -> dict[str, Any] | list[dict[str, Any]] | RawJSON:
+        """Raise on error statuses and decode the JSON body of a response (or keep it raw)."""
         if response.status_code in (401, 403):
             raise ZephyrAuthenticationError(f"Authentication failed for Zephyr Squad ZAPI: {response.status_code} {response.text}")
 
@@ -56,7 +88,7 @@ class ZephyrSquadPatClient:
         if response.status_code == 204:
             return {}
 
-        return response.json()
+        return decode_response(response, raw=raw)
 
     def get(self, endpoint: str, query_params: dict[str, str] | None = None, **kwargs: Any) -> dict[str, Any] | list[dict[str, Any]]:
         """Make a GET request."""
@@ -13,3 +13,5 @@ class SquadClientProtocol(Protocol):
     def put(self, endpoint: str, query_params: dict[str, str] | None = None, **kwargs: Any) -> dict[str, Any] | list[dict[str, Any]]: ...
 
     def delete(self, endpoint: str, query_params: dict[str, str] | None = None, **kwargs: Any) -> dict[str, Any] | list[dict[str, Any]]: ...
+
+    def close(self) -> None: ...
@@ -0,0 +1,101 @@
+"""Cancellation and deadlines that follow a tool call down to its HTTP requests."""
+
+import contextvars
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from zephyr_mcp.exceptions import RequestCancelledError
+
+
+class CancellationScope:
+    """Cancellation flag and optional deadline shared by everything a tool call does.
+
+    The scope travels in a context variable, which the worker pool copies into
+    its threads, so blocking fetcher code can check it between requests,
+    during backoff and rate-limit waits, and cap socket timeouts at the time
+    left.
+    """
+
+    def __init__(self, timeout: float | None = None) -> None:
+        self.deadline = time.monotonic() + timeout if timeout else None
+        self.reason: str | None = None
+        self._event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        if self._event.is_set():
+            return True
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            self.reason = self.reason or "deadline exceeded"
+            return True
+        return False
+
+    def cancel(self, reason: str = "cancelled by the client") -> None:
+        """Abandon the remaining work; waiting threads wake immediately."""
+        self.reason = self.reason or reason
+        self._event.set()
+
+    def remaining(self) -> float | None:
+        """Seconds left before the deadline, or None without one."""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def check(self) -> None:
+        """Raise RequestCancelledError if the scope was cancelled or its deadline passed."""
+        if self.cancelled:
+            raise RequestCancelledError(f"Request abandoned: {self.reason}.")
+
+    def sleep(self, seconds: float) -> None:
+        """Sleep for up to seconds, raising as soon as the scope is cancelled or the deadline passes."""
+        remaining = self.remaining()
+        if remaining is not None and remaining < seconds:
+            self._event.wait(remaining)
+            self.check()
+            # The deadline passes before the sleep would end; give up now rather than after it.
+            raise RequestCancelledError("Request abandoned: deadline exceeded.")
+        self._event.wait(seconds)
+        self.check()
+
+
+_current_scope: contextvars.ContextVar[CancellationScope | None] = contextvars.ContextVar("zephyr_cancellation_scope", default=None)
+
+
+def current_scope() -> CancellationScope | None:
+    """Return the cancellation scope of the running tool call, if any."""
+    return _current_scope.get()
+
+
+@contextmanager
+def cancellation_scope(timeout: float | None = None) -> Iterator[CancellationScope]:
+    """Run the enclosed code, and any worker it hands off to, under a new cancellation scope."""
+    scope = CancellationScope(timeout)
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_scope.reset(token)
+
+
+def check_cancelled() -> None:
+    """Raise RequestCancelledError if the current tool call was cancelled or ran out of time."""
+    scope = _current_scope.get()
+    if scope is not None:
+        scope.check()
+
+
+def bound_timeout(timeout: Any) -> Any:
+    """Cap a requests-style timeout (seconds or a (connect, read) tuple) at the time left before the deadline."""
+    scope = _current_scope.get()
+    remaining = scope.remaining() if scope is not None else None
+    if remaining is None:
+        return timeout
+    remaining = max(remaining, 0.001)
+    if timeout is None:
+        return remaining
+    if isinstance(timeout, tuple):
+        return tuple(remaining if part is None else min(part, remaining) for part in timeout)
+    return min(timeout, remaining)
@@ -0,0 +1,170 @@
+"""Circuit breaker that fails fast while an API backend is unhealthy."""
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+
+from zephyr_mcp.exceptions import CircuitOpenError
+from zephyr_mcp.utils.env import get_env_float, get_env_int, is_env_truthy
+from zephyr_mcp.utils.metrics import metrics
+
+logger = logging.getLogger("mcp-zephyr")
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_HALF_OPEN = "half_open"
+CIRCUIT_OPEN = "open"
+
+# Values of the zephyr_circuit_state gauge.
+_STATE_GAUGE = {CIRCUIT_CLOSED: 0, CIRCUIT_HALF_OPEN: 1, CIRCUIT_OPEN: 2}
+
+DEFAULT_FAILURE_RATE = 0.5
+DEFAULT_MIN_REQUESTS = 20
+DEFAULT_WINDOW = 30.0
+DEFAULT_OPEN_SECONDS = 30.0
+DEFAULT_HALF_OPEN_PROBES = 1
+
+
+@dataclass(frozen=True)
+class CircuitBreakerPolicy:
+    """When to open the circuit and how long to keep it open before probing."""
+
+    enabled: bool = True
+    failure_rate: float = DEFAULT_FAILURE_RATE
+    min_requests: int = DEFAULT_MIN_REQUESTS
+    window: float = DEFAULT_WINDOW
+    open_seconds: float = DEFAULT_OPEN_SECONDS
+    half_open_probes: int = DEFAULT_HALF_OPEN_PROBES
+
+    @classmethod
+    def from_env(cls) -> "CircuitBreakerPolicy":
+        """Create a circuit breaker policy from environment variables."""
+        return cls(
+            enabled=is_env_truthy("ZEPHYR_CIRCUIT_BREAKER", "true"),
+            failure_rate=min(1.0, max(0.01, get_env_float("ZEPHYR_CIRCUIT_FAILURE_RATE", DEFAULT_FAILURE_RATE))),
+            min_requests=max(1, get_env_int("ZEPHYR_CIRCUIT_MIN_REQUESTS", DEFAULT_MIN_REQUESTS)),
+            window=max(1.0, get_env_float("ZEPHYR_CIRCUIT_WINDOW", DEFAULT_WINDOW)),
+            open_seconds=max(0.1, get_env_float("ZEPHYR_CIRCUIT_OPEN_SECONDS", DEFAULT_OPEN_SECONDS)),
+            half_open_probes=max(1, get_env_int("ZEPHYR_CIRCUIT_HALF_OPEN_PROBES", DEFAULT_HALF_OPEN_PROBES)),
+        )
+
+
+class CircuitBreaker:
+    """Closed / open / half-open breaker driven by the failure rate over a sliding time window.
+
+    While closed, outcomes from the last `window` seconds are kept; once at
+    least min_requests were seen and the failure share reaches failure_rate,
+    the circuit opens and requests fail immediately with CircuitOpenError.
+    After open_seconds up to half_open_probes requests are let through: a
+    successful probe closes the circuit, a failed one opens it again.
+    """
+
+    def __init__(self, policy: CircuitBreakerPolicy, name: str = "") -> None:
+        self.policy = policy
+        self.name = name
+        self._state = CIRCUIT_CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+        self._outcomes: deque[tuple[float, bool]] = deque()
+        self._failures = 0
+        self._lock = threading.Lock()
+        self._publish()
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def allow(self) -> bool:
+        """Admit a request or raise CircuitOpenError. Returns whether the request is a half-open probe."""
+        now = time.monotonic()
+        with self._lock:
+            if self._state == CIRCUIT_OPEN:
+                remaining = self._opened_at + self.policy.open_seconds - now
+                if remaining > 0:
+                    self._reject(f"retry in {remaining:.0f}s")
+                self._transition(CIRCUIT_HALF_OPEN)
+            if self._state == CIRCUIT_HALF_OPEN:
+                if self._probes >= self.policy.half_open_probes:
+                    self._reject("a probe request is in flight")
+                self._probes += 1
+                return True
+            return False
+
+    def record(self, probe: bool, failed: bool | None) -> None:
+        """Report the outcome of an admitted request; failed=None releases it without a verdict."""
+        now = time.monotonic()
+        with self._lock:
+            if probe:
+                if self._state != CIRCUIT_HALF_OPEN:
+                    return
+                self._probes -= 1
+                if failed is None:
+                    return
+                if failed:
+                    self._open(now)
+                else:
+                    self._close()
+                return
+
+            if failed is None or self._state != CIRCUIT_CLOSED:
+                return
+            self._outcomes.append((now, failed))
+            self._failures += failed
+            self._trim(now)
+            total = len(self._outcomes)
+            if total >= self.policy.min_requests and self._failures / total >= self.policy.failure_rate:
+                self._open(now)
+
+    def _trim(self, now: float) -> None:
+        """Drop outcomes older than the window. Caller must hold the lock."""
+        while self._outcomes and now - self._outcomes[0][0] > self.policy.window:
+            self._failures -= self._outcomes.popleft()[1]
+
+    def _open(self, now: float) -> None:
+        """Caller must hold the lock."""
+        self._opened_at = now
+        self._probes = 0
+        self._transition(CIRCUIT_OPEN)
+        logger.warning(f"Circuit for {self.name} opened; failing fast for {self.policy.open_seconds:.0f}s")
+
+    def _close(self) -> None:
+        """Caller must hold the lock."""
+        self._outcomes.clear()
+        self._failures = 0
+        self._transition(CIRCUIT_CLOSED)
+        logger.info(f"Circuit for {self.name} closed")
+
+    def _transition(self, state: str) -> None:
+        """Caller must hold the lock."""
+        self._state = state
+        self._publish()
+
+    def _reject(self, detail: str) -> None:
+        """Count and raise a fast failure. Caller must hold the lock."""
+        metrics.increment("zephyr_circuit_rejected_total", labels={"target": self.name})
+        raise CircuitOpenError(f"{self.name} is unavailable after repeated failures (circuit open, {detail}).")
+
+    def _publish(self) -> None:
+        metrics.set_gauge("zephyr_circuit_state", _STATE_GAUGE[self._state], labels={"target": self.name})
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(key: str, policy: CircuitBreakerPolicy, name: str = "") -> CircuitBreaker | None:
+    """Return the process-wide breaker for key, or None when the policy disables it."""
+    if not policy.enabled:
+        return None
+    with _breakers_lock:
+        breaker = _breakers.get(key)
+        if breaker is None or breaker.policy != policy:
+            breaker = _breakers[key] = CircuitBreaker(policy, name=name)
+        return breaker
+
+
+def reset_circuit_breakers() -> None:
+    """Forget every breaker (used by tests)."""
+    with _breakers_lock:
+        _breakers.clear()
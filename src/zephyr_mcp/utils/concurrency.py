@@ -0,0 +1,199 @@
+"""Adaptive (AIMD) limit on in-flight requests per API host and credential."""
+
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+
+from zephyr_mcp.utils.cancellation import current_scope
+from zephyr_mcp.utils.env import get_env_float, get_env_int, is_env_truthy
+from zephyr_mcp.utils.metrics import metrics
+
+logger = logging.getLogger("mcp-zephyr")
+
+DEFAULT_INITIAL_LIMIT = 10
+DEFAULT_MIN_LIMIT = 1
+DEFAULT_MAX_LIMIT = 100
+DEFAULT_BACKOFF_RATIO = 0.5
+DEFAULT_LATENCY_TOLERANCE = 3.0
+
+# Weight of a new sample in the latency baseline (a slow-moving average).
+_BASELINE_ALPHA = 0.05
+# Samples needed before latency is trusted as an overload signal.
+_BASELINE_WARMUP = 10
+# How often a thread waiting for a slot checks whether its tool call was abandoned.
+_CANCEL_POLL_INTERVAL = 0.1
+
+
+@dataclass(frozen=True)
+class ConcurrencyPolicy:
+    """Bounds and tuning of the adaptive in-flight limit."""
+
+    enabled: bool = True
+    initial_limit: int = DEFAULT_INITIAL_LIMIT
+    min_limit: int = DEFAULT_MIN_LIMIT
+    max_limit: int = DEFAULT_MAX_LIMIT
+    backoff_ratio: float = DEFAULT_BACKOFF_RATIO
+    latency_tolerance: float = DEFAULT_LATENCY_TOLERANCE
+
+    @classmethod
+    def from_env(cls) -> "ConcurrencyPolicy":
+        """Create a concurrency policy from environment variables."""
+        min_limit = max(1, get_env_int("ZEPHYR_CONCURRENCY_MIN", DEFAULT_MIN_LIMIT))
+        max_limit = max(min_limit, get_env_int("ZEPHYR_CONCURRENCY_MAX", DEFAULT_MAX_LIMIT))
+        return cls(
+            enabled=is_env_truthy("ZEPHYR_ADAPTIVE_CONCURRENCY", "true"),
+            initial_limit=min(max_limit, max(min_limit, get_env_int("ZEPHYR_CONCURRENCY_INITIAL", DEFAULT_INITIAL_LIMIT))),
+            min_limit=min_limit,
+            max_limit=max_limit,
+            latency_tolerance=max(1.0, get_env_float("ZEPHYR_CONCURRENCY_LATENCY_TOLERANCE", DEFAULT_LATENCY_TOLERANCE)),
+        )
+
+
+class AdaptiveConcurrencyLimiter:
+    """Additive-increase / multiplicative-decrease limit on concurrent requests.
+
+    Each successful request while the limiter is busy raises the limit by
+    1/limit, i.e. roughly +1 per limit's worth of requests. A 429, a timeout
+    or a latency far above the running baseline of the request's endpoint
+    class cuts the limit by backoff_ratio. Baselines are kept per class
+    because a search page or a long listing is normally far slower than a
+    single-entity GET. Only requests that started after the previous cut can cut
+    it again, so one burst of failures counts as a single congestion event.
+    """
+
+    def __init__(self, policy: ConcurrencyPolicy, name: str = "") -> None:
+        self.policy = policy
+        self.name = name
+        self._limit = float(policy.initial_limit)
+        self._in_flight = 0
+        # Endpoint class -> (latency baseline, samples folded into it).
+        self._baselines: dict[str, tuple[float, int]] = {}
+        self._last_decrease = float("-inf")
+        self._cond = threading.Condition()
+        self._async_waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]] = []
+        self._publish()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def has_capacity(self) -> bool:
+        """Whether a slot is free right now."""
+        with self._cond:
+            return self._in_flight < self.limit
+
+    def acquire(self) -> float:
+        """Block until a slot is free. Returns the start time to pass to release()."""
+        scope = current_scope()
+        with self._cond:
+            while self._in_flight >= self.limit:
+                if scope is None:
+                    self._cond.wait()
+                else:
+                    scope.check()
+                    self._cond.wait(_CANCEL_POLL_INTERVAL)
+            return self._take()
+
+    async def acquire_async(self) -> float:
+        """Wait on the event loop until a slot is free. Returns the start time to pass to release()."""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._cond:
+                if self._in_flight < self.limit:
+                    return self._take()
+                waiter: asyncio.Future[None] = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                with self._cond:
+                    if (loop, waiter) in self._async_waiters:
+                        self._async_waiters.remove((loop, waiter))
+                raise
+
+    def release(self, started: float, overloaded: bool = False, succeeded: bool = True, kind: str = "") -> None:
+        """Free a slot and adapt the limit from the outcome of the request that held it; kind is its endpoint class."""
+        now = time.monotonic()
+        latency = now - started
+        with self._cond:
+            was_busy = self._in_flight * 2 >= self.limit
+            self._in_flight -= 1
+
+            if not overloaded and succeeded and self._latency_spike(kind, latency):
+                overloaded = True
+            if overloaded:
+                if started >= self._last_decrease:
+                    self._limit = max(float(self.policy.min_limit), self._limit * self.policy.backoff_ratio)
+                    self._last_decrease = now
+                    logger.info(f"Concurrency limit for {self.name} cut to {self.limit}")
+            elif succeeded:
+                self._record_latency(kind, latency)
+                if was_busy:
+                    self._limit = min(float(self.policy.max_limit), self._limit + 1 / self._limit)
+
+            self._publish()
+            self._wake()
+
+    def _take(self) -> float:
+        """Claim a slot. Caller must hold the lock."""
+        self._in_flight += 1
+        self._publish()
+        return time.monotonic()
+
+    def _latency_spike(self, kind: str, latency: float) -> bool:
+        """Check a latency sample against the baseline of its endpoint class. Caller must hold the lock."""
+        baseline, samples = self._baselines.get(kind, (0.0, 0))
+        if samples < _BASELINE_WARMUP:
+            return False
+        return latency > baseline * self.policy.latency_tolerance
+
+    def _record_latency(self, kind: str, latency: float) -> None:
+        """Fold a healthy latency sample into the baseline of its endpoint class. Caller must hold the lock."""
+        baseline, samples = self._baselines.get(kind, (latency, 0))
+        self._baselines[kind] = (baseline + _BASELINE_ALPHA * (latency - baseline), samples + 1)
+
+    def _wake(self) -> None:
+        """Let waiting threads and coroutines re-check for a free slot. Caller must hold the lock."""
+        self._cond.notify_all()
+        waiters, self._async_waiters = self._async_waiters, []
+        for loop, waiter in waiters:
+            loop.call_soon_threadsafe(_resolve, waiter)
+
+    def _publish(self) -> None:
+        labels = {"target": self.name}
+        metrics.set_gauge("zephyr_concurrency_limit", self.limit, labels=labels)
+        metrics.set_gauge("zephyr_concurrency_in_flight", self._in_flight, labels=labels)
+
+
+def _resolve(waiter: "asyncio.Future[None]") -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+# Weak, like ratelimit._buckets.
+_limiters: weakref.WeakValueDictionary[str, AdaptiveConcurrencyLimiter] = weakref.WeakValueDictionary()
+_limiters_lock = threading.Lock()
+
+
+def get_concurrency_limiter(key: str, policy: ConcurrencyPolicy, name: str = "") -> AdaptiveConcurrencyLimiter | None:
+    """Return the process-wide limiter for key, or None when adaptive concurrency is disabled."""
+    if not policy.enabled:
+        return None
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None or limiter.policy != policy:
+            limiter = _limiters[key] = AdaptiveConcurrencyLimiter(policy, name=name)
+        return limiter
+
+
+def reset_concurrency_limiters() -> None:
+    """Forget every limiter (used by tests)."""
+    with _limiters_lock:
+        _limiters.clear()
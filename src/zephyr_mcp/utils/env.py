@@ -1,7 +1,10 @@
 """Environment variable utility functions for the Zephyr MCP server."""
 
+import logging
 import os
 
+logger = logging.getLogger("mcp-zephyr")
+
 
 def is_env_truthy(env_var_name: str, default: str = "") -> bool:
     """Check if environment variable is set to a standard truthy value."""
@@ -18,6 +21,30 @@ def is_env_ssl_verify(env_var_name: str, default: str = "true") -> bool:
     return os.getenv(env_var_name, default).lower() not in ("false", "0", "no")
 
 
+def get_env_int(env_var_name: str, default: int) -> int:
+    """Read an integer environment variable, falling back to default when unset or invalid."""
+    value = os.getenv(env_var_name)
+    if value is None or not value.strip():
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(f"Ignoring invalid integer for {env_var_name}: {value!r}. Using default {default}.")
+        return default
+
+
+def get_env_float(env_var_name: str, default: float) -> float:
+    """Read a float environment variable, falling back to default when unset or invalid."""
+    value = os.getenv(env_var_name)
+    if value is None or not value.strip():
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning(f"Ignoring invalid number for {env_var_name}: {value!r}. Using default {default}.")
+        return default
+
+
 def get_custom_headers(env_var_name: str) -> dict[str, str]:
     """Parse custom headers from environment variable containing comma-separated key=value pairs."""
     header_string = os.getenv(env_var_name)
@@ -0,0 +1,264 @@
+"""Hedged requests: a second identical GET when the first is slower than usual, to cut tail latency."""
+
+import asyncio
+import contextvars
+import logging
+import math
+import os
+import threading
+import time
+import weakref
+from collections import deque
+from collections.abc import Awaitable, Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any
+
+from zephyr_mcp.utils.env import get_env_float, get_env_int
+from zephyr_mcp.utils.metrics import metrics
+
+logger = logging.getLogger("mcp-zephyr")
+
+DEFAULT_HEDGE_PERCENTILE = 95.0
+DEFAULT_HEDGE_BUDGET = 0.05
+DEFAULT_HEDGE_MIN_SAMPLES = 20
+
+# Latency samples kept per endpoint class.
+_SAMPLE_WINDOW = 256
+# Unspent hedge credit is capped so a quiet period cannot fund a burst of hedges.
+_MAX_CREDIT = 10.0
+# Threads shared by every hedger for sync requests; a request sent while all are busy is not hedged.
+_HEDGE_WORKERS = 32
+
+
+def endpoint_class(endpoint: str) -> str:
+    """Return the class of an API endpoint: its first path segment, e.g. `testcases` for `/testcases/PROJ-T1`."""
+    return endpoint.strip("/").split("/", 1)[0].split("?", 1)[0]
+
+
+@dataclass(frozen=True)
+class HedgingPolicy:
+    """Which endpoint classes are hedged, after which latency percentile, and within what extra-request budget."""
+
+    endpoints: frozenset[str] = field(default_factory=frozenset)
+    percentile: float = DEFAULT_HEDGE_PERCENTILE
+    budget: float = DEFAULT_HEDGE_BUDGET
+    min_samples: int = DEFAULT_HEDGE_MIN_SAMPLES
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.endpoints) and self.budget > 0
+
+    def applies_to(self, endpoint: str) -> bool:
+        return self.enabled and endpoint_class(endpoint) in self.endpoints
+
+    @classmethod
+    def from_env(cls) -> "HedgingPolicy":
+        """Create a hedging policy from environment variables; hedging is off unless ZEPHYR_HEDGE_ENDPOINTS is set."""
+        endpoints = frozenset(name.strip().strip("/") for name in os.getenv("ZEPHYR_HEDGE_ENDPOINTS", "").split(",") if name.strip())
+        return cls(
+            endpoints=endpoints,
+            percentile=min(99.9, max(50.0, get_env_float("ZEPHYR_HEDGE_PERCENTILE", DEFAULT_HEDGE_PERCENTILE))),
+            budget=min(1.0, max(0.0, get_env_float("ZEPHYR_HEDGE_BUDGET", DEFAULT_HEDGE_BUDGET))),
+            min_samples=max(1, get_env_int("ZEPHYR_HEDGE_MIN_SAMPLES", DEFAULT_HEDGE_MIN_SAMPLES)),
+        )
+
+
+class Hedger:
+    """Sends a backup request once the primary outlives the recent latency percentile of its endpoint class.
+
+    Every request earns `budget` hedge credit and every hedge spends one, so
+    hedges stay within that fraction of extra upstream traffic. A caller can
+    also pass can_hedge to skip the hedge, e.g. while its rate or concurrency
+    limit has no room. Whichever request finishes first wins; the other is
+    cancelled where the transport allows it, or left to finish and discarded.
+    """
+
+    def __init__(self, policy: HedgingPolicy, name: str = "") -> None:
+        self.policy = policy
+        self.name = name
+        self._lock = threading.Lock()
+        self._samples: dict[str, deque[float]] = {}
+        self._credit = 0.0
+
+    def hedge_delay(self, endpoint_class: str) -> float | None:
+        """The latency percentile after which a request to endpoint_class is hedged, or None without enough samples."""
+        with self._lock:
+            samples = self._samples.get(endpoint_class)
+            if samples is None or len(samples) < self.policy.min_samples:
+                return None
+            ordered = sorted(samples)
+        return ordered[max(0, math.ceil(len(ordered) * self.policy.percentile / 100) - 1)]
+
+    def record(self, endpoint_class: str, latency: float) -> None:
+        """Add a latency sample for endpoint_class."""
+        with self._lock:
+            samples = self._samples.get(endpoint_class)
+            if samples is None:
+                samples = self._samples[endpoint_class] = deque(maxlen=_SAMPLE_WINDOW)
+            samples.append(latency)
+
+    def _earn(self) -> None:
+        with self._lock:
+            self._credit = min(_MAX_CREDIT, self._credit + self.policy.budget)
+
+    def _spend(self) -> bool:
+        with self._lock:
+            if self._credit < 1:
+                return False
+            self._credit -= 1
+            return True
+
+    def _refund(self) -> None:
+        with self._lock:
+            self._credit += 1
+
+    def _timed(self, endpoint_class: str, send: Callable[[], Any]) -> Any:
+        started = time.monotonic()
+        response = send()
+        self.record(endpoint_class, time.monotonic() - started)
+        return response
+
+    async def _timed_async(self, endpoint_class: str, send: Callable[[], Awaitable[Any]]) -> Any:
+        started = time.monotonic()
+        response = await send()
+        self.record(endpoint_class, time.monotonic() - started)
+        return response
+
+    def send(self, endpoint: str, send: Callable[[], Any], can_hedge: Callable[[], bool] | None = None) -> Any:
+        """Call send, racing a second call against it once the primary is slower than the hedge delay."""
+        cls = endpoint_class(endpoint)
+        self._earn()
+        delay = self.hedge_delay(cls)
+        if delay is None:
+            return self._timed(cls, send)
+
+        primary = _submit(self._timed, cls, send)
+        if primary is None:
+            return self._timed(cls, send)
+        done, _ = wait([primary], timeout=delay)
+        if done or (can_hedge is not None and not can_hedge()) or not self._spend():
+            return primary.result()
+        hedge = _submit(self._timed, cls, send)
+        if hedge is None:
+            self._refund()
+            return primary.result()
+
+        logger.debug(f"Hedging {cls} request to {self.name} after {delay:.3f}s")
+        labels = {"target": self.name, "endpoint": cls}
+        metrics.increment("zephyr_hedge_sent_total", labels=labels)
+        winner = _first_success([primary, hedge])
+        if winner is hedge:
+            metrics.increment("zephyr_hedge_won_total", labels=labels)
+        loser = primary if winner is hedge else hedge
+        loser.add_done_callback(_discard)
+        return winner.result()
+
+    async def send_async(self, endpoint: str, send: Callable[[], Awaitable[Any]], can_hedge: Callable[[], bool] | None = None) -> Any:
+        """Await send, racing a second call against it once the primary is slower than the hedge delay."""
+        cls = endpoint_class(endpoint)
+        self._earn()
+        delay = self.hedge_delay(cls)
+        if delay is None:
+            return await self._timed_async(cls, send)
+
+        primary = asyncio.ensure_future(self._timed_async(cls, send))
+        hedge: asyncio.Future[Any] | None = None
+        try:
+            done, _ = await asyncio.wait([primary], timeout=delay)
+            if done or (can_hedge is not None and not can_hedge()) or not self._spend():
+                return await primary
+
+            logger.debug(f"Hedging {cls} request to {self.name} after {delay:.3f}s")
+            labels = {"target": self.name, "endpoint": cls}
+            metrics.increment("zephyr_hedge_sent_total", labels=labels)
+            hedge = asyncio.ensure_future(self._timed_async(cls, send))
+            pending = {primary, hedge}
+            first_error: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            metrics.increment("zephyr_hedge_won_total", labels=labels)
+                        return task.result()
+                    first_error = first_error or task.exception()
+            raise first_error
+        finally:
+            for task in (primary, hedge):
+                if task is not None and not task.done():
+                    task.cancel()
+
+
+_executor: ThreadPoolExecutor | None = None
+_busy = 0
+_executor_lock = threading.Lock()
+
+
+def _submit(func: Callable[..., Any], *args: Any) -> Future | None:
+    """Run func on the shared hedge pool in the caller's context, or return None when every worker is busy."""
+    global _executor, _busy
+    with _executor_lock:
+        if _busy >= _HEDGE_WORKERS:
+            return None
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=_HEDGE_WORKERS, thread_name_prefix="zephyr-hedge")
+        _busy += 1
+        executor = _executor
+    future = executor.submit(contextvars.copy_context().run, func, *args)
+    future.add_done_callback(_worker_done)
+    return future
+
+
+def _worker_done(_: Future) -> None:
+    global _busy
+    with _executor_lock:
+        _busy -= 1
+
+
+def _first_success(futures: list[Future]) -> Future:
+    """Wait for the first future to succeed, or for all of them when every one fails."""
+    pending = set(futures)
+    failed: Future | None = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                return future
+            failed = failed or future
+    return failed
+
+
+def _discard(future: Future) -> None:
+    """Release the connection held by a losing response."""
+    if future.cancelled() or future.exception() is not None:
+        return
+    close = getattr(future.result(), "close", None)
+    if callable(close):
+        close()
+
+
+# Weak, like ratelimit._buckets.
+_hedgers: weakref.WeakValueDictionary[str, Hedger] = weakref.WeakValueDictionary()
+_hedgers_lock = threading.Lock()
+
+
+def get_hedger(key: str, policy: HedgingPolicy, name: str = "") -> Hedger | None:
+    """Return the process-wide hedger for key, or None when hedging is disabled.
+
+    Clients key it by API host, so every credential talking to one host shares
+    its latency samples and its hedge budget.
+    """
+    if not policy.enabled:
+        return None
+    with _hedgers_lock:
+        hedger = _hedgers.get(key)
+        if hedger is None or hedger.policy != policy:
+            hedger = _hedgers[key] = Hedger(policy, name=name)
+        return hedger
+
+
+def reset_hedgers() -> None:
+    """Forget every hedger (used by tests)."""
+    with _hedgers_lock:
+        _hedgers.clear()
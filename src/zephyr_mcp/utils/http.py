@@ -0,0 +1,408 @@
+"""HTTP transport helpers shared by the Zephyr Scale and Squad clients."""
+
+import asyncio
+import logging
+import os
+import ssl
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+from dataclasses import dataclass
+from functools import partial
+from typing import Any
+
+import httpx
+import requests
+from requests.sessions import Session
+
+from zephyr_mcp.cache.backend import get_cache_backend
+from zephyr_mcp.cache.http import HTTPCache, get_http_cache
+from zephyr_mcp.utils.cancellation import check_cancelled
+from zephyr_mcp.utils.circuit import CircuitBreaker, get_circuit_breaker
+from zephyr_mcp.utils.concurrency import AdaptiveConcurrencyLimiter, get_concurrency_limiter
+from zephyr_mcp.utils.env import get_env_float, get_env_int, is_env_truthy
+from zephyr_mcp.utils.hedging import Hedger, HedgingPolicy, endpoint_class, get_hedger
+from zephyr_mcp.utils.ratelimit import TokenBucket, get_rate_limiter
+from zephyr_mcp.utils.retry import RetryPolicy, is_transient_error, send_with_retry, send_with_retry_async
+from zephyr_mcp.utils.singleflight import SingleFlight, get_singleflight
+from zephyr_mcp.utils.ssl import SSLContextAdapter, get_ssl_context, session_verify
+from zephyr_mcp.utils.urls import get_url_host
+
+logger = logging.getLogger("mcp-zephyr")
+
+HTTP_ENGINE_SYNC = "sync"
+HTTP_ENGINE_ASYNC = "async"
+HTTP_ENGINES = (HTTP_ENGINE_SYNC, HTTP_ENGINE_ASYNC)
+
+DEFAULT_CONNECT_TIMEOUT = 10.0
+DEFAULT_READ_TIMEOUT = 60.0
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 32
+
+# Headers requests adds to every session that httpx manages itself.
+_TRANSPORT_MANAGED_HEADERS = {"connection", "accept-encoding"}
+
+
+def get_http_engine_from_env(*env_var_names: str) -> str:
+    """Read the HTTP engine from the first set environment variable, validating its value."""
+    for env_var_name in env_var_names:
+        value = os.getenv(env_var_name)
+        if value:
+            engine = value.strip().lower()
+            if engine not in HTTP_ENGINES:
+                raise ValueError(f"{env_var_name} must be one of {', '.join(HTTP_ENGINES)}, got '{value}'.")
+            return engine
+    return HTTP_ENGINE_SYNC
+
+
+def _is_timeout(error: BaseException) -> bool:
+    return isinstance(error, requests.exceptions.Timeout | httpx.TimeoutException)
+
+
+@dataclass(frozen=True)
+class HTTPSettings:
+    """Timeouts and connection-pool sizing applied to every HTTP session a client opens.
+
+    pool_connections is the number of per-host pools kept, pool_maxsize the
+    connections kept per host. With pool_block, callers wait for a free
+    connection instead of opening a throwaway one beyond pool_maxsize.
+    """
+
+    connect_timeout: float = DEFAULT_CONNECT_TIMEOUT
+    read_timeout: float = DEFAULT_READ_TIMEOUT
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE
+    pool_block: bool = False
+
+    @property
+    def timeout(self) -> tuple[float, float]:
+        """The (connect, read) timeout tuple understood by requests."""
+        return (self.connect_timeout, self.read_timeout)
+
+    @classmethod
+    def from_env(cls, *prefixes: str) -> "HTTPSettings":
+        """Read `<PREFIX>_CONNECT_TIMEOUT`, `_READ_TIMEOUT`, `_POOL_CONNECTIONS`, `_POOL_MAXSIZE` and `_POOL_BLOCK`.
+
+        Each setting is taken from the first prefix that sets it.
+        """
+        prefixes = prefixes or ("ZEPHYR",)
+
+        def _name(suffix: str) -> str:
+            return next((f"{prefix}_{suffix}" for prefix in prefixes if os.getenv(f"{prefix}_{suffix}")), f"{prefixes[-1]}_{suffix}")
+
+        return cls(
+            connect_timeout=max(0.1, get_env_float(_name("CONNECT_TIMEOUT"), DEFAULT_CONNECT_TIMEOUT)),
+            read_timeout=max(0.1, get_env_float(_name("READ_TIMEOUT"), DEFAULT_READ_TIMEOUT)),
+            pool_connections=max(1, get_env_int(_name("POOL_CONNECTIONS"), DEFAULT_POOL_CONNECTIONS)),
+            pool_maxsize=max(1, get_env_int(_name("POOL_MAXSIZE"), DEFAULT_POOL_MAXSIZE)),
+            pool_block=is_env_truthy(_name("POOL_BLOCK")),
+        )
+
+    def adapter_kwargs(self) -> dict[str, Any]:
+        """Keyword arguments for a requests HTTPAdapter (or SSLIgnoreAdapter) honouring these settings."""
+        return {"pool_connections": self.pool_connections, "pool_maxsize": self.pool_maxsize, "pool_block": self.pool_block}
+
+
+def configure_http_session(session: Session, settings: HTTPSettings) -> None:
+    """Mount connection pools sized by settings, using the shared SSL contexts, on a requests session."""
+    adapter = SSLContextAdapter(**settings.adapter_kwargs())
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+
+class RequestPipeline:
+    """Outbound policies applied around every request a client sends.
+
+    Each attempt first passes the backend's circuit breaker, then waits for a
+    rate-limit token and a slot under the adaptive concurrency limit, and the
+    whole exchange is retried according to the retry policy. Clients build one pipeline and pass it a zero-argument
+    callable that performs a single HTTP attempt.
+
+    Requests sent with a coalesce_key share one upstream call, retries
+    included, with identical requests already in flight under the same scope.
+    With an HTTP cache, such GETs are also answered from a fresh stored
+    response, or revalidated: the cache adds its validators to the headers
+    dict, which must be the one send() sends.
+
+    The endpoint a request is sent to picks the latency baseline the
+    concurrency limiter judges it against. With a hedger, a send with hedge
+    set may race a second attempt against a slow one. Each of the two takes its own rate-limit
+    token and concurrency slot, and no hedge is sent while either limit has
+    no room.
+    """
+
+    def __init__(
+        self,
+        target: str,
+        retry_policy: RetryPolicy,
+        rate_limiter: TokenBucket | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        singleflight: SingleFlight | None = None,
+        scope: str = "",
+        circuit_breaker: CircuitBreaker | None = None,
+        http_cache: HTTPCache | None = None,
+        hedger: Hedger | None = None,
+    ) -> None:
+        self.target = target
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.concurrency_limiter = concurrency_limiter
+        self.singleflight = singleflight
+        self.scope = scope
+        self.circuit_breaker = circuit_breaker
+        self.http_cache = http_cache
+        self.hedger = hedger
+
+    def send(
+        self,
+        send: Callable[[], Any],
+        method: str,
+        headers: Mapping[str, str] | None = None,
+        coalesce_key: Hashable | None = None,
+        endpoint: str = "",
+        hedge: bool = False,
+    ) -> Any:
+        """Send a request from synchronous code, blocking while rate limited or backing off."""
+        if coalesce_key is None:
+            return self._send(send, method, headers, endpoint, hedge)
+        key = (self.scope, coalesce_key)
+        if self.http_cache is not None:
+            cached = self.http_cache.fresh(key)
+            if cached is not None:
+                return cached
+            send_once = partial(self._send_cached, key, send, method, headers, endpoint, hedge)
+        else:
+            send_once = partial(self._send, send, method, headers, endpoint, hedge)
+        if self.singleflight is not None:
+            return self.singleflight.do(key, send_once)
+        return send_once()
+
+    def invalidate(self, coalesce_key: Hashable | None) -> None:
+        """Drop the HTTP cache entry of a GET, after a write changed what it returns."""
+        if self.http_cache is not None and coalesce_key is not None:
+            self.http_cache.invalidate((self.scope, coalesce_key))
+
+    def _send_cached(self, key: Hashable, send: Callable[[], Any], method: str, headers: dict[str, str] | None, endpoint: str, hedge: bool) -> Any:
+        entry = self.http_cache.prepare(key, headers)
+        return self.http_cache.complete(key, entry, self._send(send, method, headers, endpoint, hedge))
+
+    def _send(self, send: Callable[[], Any], method: str, headers: Mapping[str, str] | None, endpoint: str = "", hedge: bool = False) -> Any:
+
+        kind = endpoint_class(endpoint)
+
+        def limited() -> Any:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            if self.concurrency_limiter is None:
+                return send()
+            started = self.concurrency_limiter.acquire()
+            try:
+                response = send()
+            except BaseException as e:
+                self._release(started, kind, error=e)
+                raise
+            self._release(started, kind, response=response)
+            return response
+
+        def hedged() -> Any:
+            if not hedge or self.hedger is None:
+                return limited()
+            return self.hedger.send(endpoint, limited, can_hedge=self._has_room)
+
+        def attempt() -> Any:
+            check_cancelled()
+            if self.circuit_breaker is None:
+                return hedged()
+            probe = self.circuit_breaker.allow()
+            try:
+                response = hedged()
+            except BaseException as e:
+                self._record_outcome(probe, error=e)
+                raise
+            self._record_outcome(probe, response=response)
+            return response
+
+        return send_with_retry(attempt, method, self.retry_policy, headers=headers, target=self.target)
+
+    async def send_async(
+        self,
+        send: Callable[[], Awaitable[Any]],
+        method: str,
+        headers: Mapping[str, str] | None = None,
+        coalesce_key: Hashable | None = None,
+        endpoint: str = "",
+        hedge: bool = False,
+    ) -> Any:
+        """Send a request from a coroutine, yielding to the event loop while rate limited or backing off."""
+        if coalesce_key is None:
+            return await self._send_async(send, method, headers, endpoint, hedge)
+        key = (self.scope, coalesce_key)
+        if self.http_cache is not None:
+            cached = self.http_cache.fresh(key)
+            if cached is not None:
+                return cached
+            send_once = partial(self._send_cached_async, key, send, method, headers, endpoint, hedge)
+        else:
+            send_once = partial(self._send_async, send, method, headers, endpoint, hedge)
+        if self.singleflight is not None:
+            return await self.singleflight.do_async(key, send_once)
+        return await send_once()
+
+    async def _send_cached_async(
+        self, key: Hashable, send: Callable[[], Awaitable[Any]], method: str, headers: dict[str, str] | None, endpoint: str, hedge: bool
+    ) -> Any:
+        entry = self.http_cache.prepare(key, headers)
+        return self.http_cache.complete(key, entry, await self._send_async(send, method, headers, endpoint, hedge))
+
+    async def _send_async(
+        self, send: Callable[[], Awaitable[Any]], method: str, headers: Mapping[str, str] | None, endpoint: str = "", hedge: bool = False
+    ) -> Any:
+
+        kind = endpoint_class(endpoint)
+
+        async def limited() -> Any:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+            if self.concurrency_limiter is None:
+                return await send()
+            started = await self.concurrency_limiter.acquire_async()
+            try:
+                response = await send()
+            except BaseException as e:
+                self._release(started, kind, error=e)
+                raise
+            self._release(started, kind, response=response)
+            return response
+
+        async def hedged() -> Any:
+            if not hedge or self.hedger is None:
+                return await limited()
+            return await self.hedger.send_async(endpoint, limited, can_hedge=self._has_room)
+
+        async def attempt() -> Any:
+            if self.circuit_breaker is None:
+                return await hedged()
+            probe = self.circuit_breaker.allow()
+            try:
+                response = await hedged()
+            except BaseException as e:
+                self._record_outcome(probe, error=e)
+                raise
+            self._record_outcome(probe, response=response)
+            return response
+
+        return await send_with_retry_async(attempt, method, self.retry_policy, headers=headers, target=self.target)
+
+    def _has_room(self) -> bool:
+        """Whether a hedge could start now without waiting for a rate-limit token or a concurrency slot."""
+        if self.rate_limiter is not None and not self.rate_limiter.has_token():
+            return False
+        return self.concurrency_limiter is None or self.concurrency_limiter.has_capacity()
+
+    def _release(self, started: float, kind: str, response: Any = None, error: BaseException | None = None) -> None:
+        """Return a concurrency slot, reporting 429s and timeouts as overload."""
+        if response is not None:
+            self.concurrency_limiter.release(started, overloaded=response.status_code == 429, succeeded=response.status_code < 500, kind=kind)
+        else:
+            self.concurrency_limiter.release(started, overloaded=error is not None and _is_timeout(error), succeeded=False, kind=kind)
+
+    def _record_outcome(self, probe: bool, response: Any = None, error: BaseException | None = None) -> None:
+        """Report an attempt to the circuit breaker: 5xx responses and transport errors count as failures."""
+        if response is not None:
+            failed: bool | None = response.status_code >= 500
+        elif error is not None and is_transient_error(error):
+            failed = True
+        else:
+            # Cancellation or a local error says nothing about the backend's health.
+            failed = None
+        self.circuit_breaker.record(probe, failed)
+
+
+def build_request_pipeline(base_url: str, config: Any, hedging: HedgingPolicy | None = None) -> RequestPipeline:
+    """Build the pipeline for a client from its Scale or Squad config, hedging GETs as the hedging policy says.
+
+    Limiters are keyed by host and credential, so every client spending the
+    same API quota in this process shares one bucket and one concurrency limit.
+    The same key scopes request coalescing and the HTTP cache, so only callers
+    with the same credential ever share a response. The circuit breaker is keyed by base URL
+    alone: an unhealthy backend is unhealthy for every credential. The hedger
+    is keyed by host, so the hedge budget caps extra traffic to the host
+    however many credentials use it.
+    """
+    target = get_url_host(base_url)
+    key = f"{target}|{config.credential_id()}"
+    return RequestPipeline(
+        target,
+        config.retry_policy,
+        rate_limiter=get_rate_limiter(key, config.rate_limit, name=target),
+        concurrency_limiter=get_concurrency_limiter(key, config.concurrency, name=target),
+        singleflight=get_singleflight(target) if config.coalesce_gets else None,
+        scope=key,
+        circuit_breaker=get_circuit_breaker(base_url, config.circuit_breaker, name=target),
+        http_cache=get_http_cache(target, config.http_cache, name=target, store=get_cache_backend(config.cache_backend)),
+        hedger=get_hedger(target, hedging, name=target) if hedging is not None else None,
+    )
+
+
+def build_async_http_client(
+    session: Session, verify: bool | str | ssl.SSLContext | None = None, settings: HTTPSettings | None = None
+) -> httpx.AsyncClient:
+    """Create a pooled httpx.AsyncClient mirroring the headers, auth and proxies of a configured requests session.
+
+    Without verify, the client verifies as the session would, including a CA bundle from REQUESTS_CA_BUNDLE.
+    A boolean or path verify is turned into the matching shared SSL context, so clients do not each load the CA bundle.
+    """
+    if settings is None:
+        settings = HTTPSettings()
+    if verify is None:
+        verify = session_verify(session)
+    if not isinstance(verify, ssl.SSLContext):
+        verify = get_ssl_context(verify)
+    limits = httpx.Limits(
+        max_connections=settings.pool_maxsize if settings.pool_block else None,
+        max_keepalive_connections=settings.pool_maxsize,
+    )
+    timeout = httpx.Timeout(settings.read_timeout, connect=settings.connect_timeout, pool=settings.connect_timeout)
+
+    headers = {key: value for key, value in session.headers.items() if key.lower() not in _TRANSPORT_MANAGED_HEADERS}
+
+    mounts: dict[str, httpx.AsyncBaseTransport] = {}
+    for scheme in ("http", "https"):
+        proxy = session.proxies.get(scheme)
+        if proxy:
+            mounts[f"{scheme}://"] = httpx.AsyncHTTPTransport(proxy=proxy, verify=verify, limits=limits)
+
+    return httpx.AsyncClient(
+        headers=headers,
+        auth=session.auth,
+        verify=verify,
+        limits=limits,
+        mounts=mounts or None,
+        timeout=timeout,
+        follow_redirects=True,
+    )
+
+
+async def close_async_http_client(client: httpx.AsyncClient) -> None:
+    """Close an httpx.AsyncClient, logging rather than raising on failure."""
+    try:
+        await client.aclose()
+    except Exception as e:
+        logger.warning(f"Failed to close async HTTP client: {e}")
+
+
+def close_async_http_client_soon(client: httpx.AsyncClient) -> None:
+    """Close an httpx.AsyncClient from synchronous code.
+
+    On a running event loop the close is scheduled as a task; otherwise it runs to completion on a fresh loop.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        asyncio.run(close_async_http_client(client))
+        return
+
+    task = loop.create_task(close_async_http_client(client))
+    _PENDING_CLOSES.add(task)
+    task.add_done_callback(_PENDING_CLOSES.discard)
+
+
+_PENDING_CLOSES: set[asyncio.Task[None]] = set()
@@ -0,0 +1,77 @@
+"""JSON encoding and decoding, using orjson when it is installed and the standard library otherwise."""
+
+import json
+from functools import cached_property
+from typing import Any
+
+from zephyr_mcp.utils.env import is_env_truthy
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when the "fast" extra is not installed
+    orjson = None
+
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+
+
+class RawJSON:
+    """An undecoded JSON response body, passed through to tool results as is.
+
+    The body is only parsed when something reads `value`.
+    """
+
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    @cached_property
+    def value(self) -> Any:
+        return loads(self.content)
+
+    def __repr__(self) -> str:
+        return f"RawJSON({len(self.content)} bytes)"
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """Decode a JSON document straight from response bytes (or text)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def dumps(obj: Any, pretty: bool = False) -> str:
+    """Encode obj as compact JSON, or indented by two spaces when pretty.
+
+    Non-ASCII text is kept as is. Values orjson cannot encode, such as
+    non-string keys or integers beyond 64 bits, go through the standard library.
+    A RawJSON body is returned untouched unless it has to be pretty-printed.
+    """
+    if isinstance(obj, RawJSON):
+        if not pretty:
+            return obj.text
+        obj = obj.value
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0).decode()
+        except TypeError:
+            pass
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def decode_response(response: Any, raw: bool = False) -> Any:
+    """Decode the JSON body of a requests or httpx response, or wrap it undecoded in RawJSON when raw."""
+    if raw:
+        return RawJSON(response.content)
+    return loads(response.content)
+
+
+def is_pretty_json_from_env() -> bool:
+    """Whether tool results are pretty-printed (ZEPHYR_JSON_PRETTY); compact by default."""
+    return is_env_truthy("ZEPHYR_JSON_PRETTY")
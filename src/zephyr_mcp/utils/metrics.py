@@ -0,0 +1,107 @@
+"""In-process metrics registry exposed on the server's /metrics endpoint."""
+
+import threading
+from typing import Any
+
+Labels = tuple[tuple[str, str], ...]
+
+
+def _labels(labels: dict[str, str] | None) -> Labels:
+    return tuple(sorted((labels or {}).items()))
+
+
+def _format_series(name: str, labels: Labels) -> str:
+    if not labels:
+        return name
+    rendered = ",".join(f'{key}="{_escape(value)}"' for key, value in labels)
+    return f"{name}{{{rendered}}}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsRegistry:
+    """Thread-safe counters, gauges and summaries keyed by name and labels."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: dict[str, dict[Labels, float]] = {}
+        self._gauges: dict[str, dict[Labels, float]] = {}
+        self._summaries: dict[str, dict[Labels, list[float]]] = {}
+
+    def increment(self, name: str, value: float = 1.0, labels: dict[str, str] | None = None) -> None:
+        """Add value to a monotonically increasing counter."""
+        key = _labels(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + value
+
+    def set_gauge(self, name: str, value: float, labels: dict[str, str] | None = None) -> None:
+        """Set a gauge to its current value."""
+        with self._lock:
+            self._gauges.setdefault(name, {})[_labels(labels)] = value
+
+    def add_gauge(self, name: str, delta: float, labels: dict[str, str] | None = None) -> None:
+        """Adjust a gauge by delta."""
+        key = _labels(labels)
+        with self._lock:
+            series = self._gauges.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + delta
+
+    def observe(self, name: str, value: float, labels: dict[str, str] | None = None) -> None:
+        """Record one observation (count, sum and max) in a summary."""
+        key = _labels(labels)
+        with self._lock:
+            summary = self._summaries.setdefault(name, {}).setdefault(key, [0.0, 0.0, 0.0])
+            summary[0] += 1
+            summary[1] += value
+            summary[2] = max(summary[2], value)
+
+    def get(self, name: str, labels: dict[str, str] | None = None) -> float | None:
+        """Return the current value of a counter or gauge, or None when it was never recorded."""
+        key = _labels(labels)
+        with self._lock:
+            for store in (self._counters, self._gauges):
+                if name in store and key in store[name]:
+                    return store[name][key]
+        return None
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a copy of every metric, keyed by series name."""
+        with self._lock:
+            return {
+                "counters": {_format_series(n, k): v for n, s in self._counters.items() for k, v in s.items()},
+                "gauges": {_format_series(n, k): v for n, s in self._gauges.items() for k, v in s.items()},
+                "summaries": {
+                    _format_series(n, k): {"count": v[0], "sum": v[1], "max": v[2]} for n, s in self._summaries.items() for k, v in s.items()
+                },
+            }
+
+    def render_prometheus(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        lines: list[str] = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                lines.append(f"# TYPE {name} counter")
+                lines.extend(f"{_format_series(name, key)} {value}" for key, value in series.items())
+            for name, series in sorted(self._gauges.items()):
+                lines.append(f"# TYPE {name} gauge")
+                lines.extend(f"{_format_series(name, key)} {value}" for key, value in series.items())
+            for name, series in sorted(self._summaries.items()):
+                lines.append(f"# TYPE {name} summary")
+                for key, (count, total, maximum) in series.items():
+                    lines.append(f"{_format_series(name + '_count', key)} {count}")
+                    lines.append(f"{_format_series(name + '_sum', key)} {total}")
+                    lines.append(f"{_format_series(name + '_max', key)} {maximum}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Drop every recorded metric."""
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._summaries.clear()
+
+
+metrics = MetricsRegistry()
@@ -0,0 +1,127 @@
+"""Client-side token-bucket rate limiting shared by every client talking to the same API with the same credential."""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+
+from zephyr_mcp.utils.cancellation import current_scope
+from zephyr_mcp.utils.env import get_env_float, get_env_int
+from zephyr_mcp.utils.metrics import metrics
+
+logger = logging.getLogger("mcp-zephyr")
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    """Sustained requests per second and burst size; a rate of 0 disables limiting."""
+
+    rate: float = 0.0
+    burst: int = 1
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate > 0
+
+    @classmethod
+    def from_env(cls, *env_var_names: str) -> "RateLimitPolicy":
+        """Read `<NAME>` (requests/second) and `<NAME>_BURST` from the first variable that is set."""
+        for env_var_name in env_var_names or ("ZEPHYR_RATE_LIMIT",):
+            if os.getenv(env_var_name):
+                rate = max(0.0, get_env_float(env_var_name, 0.0))
+                burst = get_env_int(f"{env_var_name}_BURST", max(1, int(rate)))
+                return cls(rate=rate, burst=max(1, burst))
+        return cls()
+
+
+class TokenBucket:
+    """Token bucket that makes callers wait for a token instead of rejecting them.
+
+    Tokens are reserved up front, so the balance may go negative; each caller
+    sleeps for its own slot without holding the lock, which works the same for
+    worker threads and event-loop coroutines.
+    """
+
+    def __init__(self, rate: float, burst: int, name: str = "") -> None:
+        self.rate = rate
+        self.burst = burst
+        self.name = name
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how many seconds the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def has_token(self) -> bool:
+        """Whether a token could be taken right now without waiting."""
+        with self._lock:
+            return self._tokens + (time.monotonic() - self._updated) * self.rate >= 1
+
+    def acquire(self) -> float:
+        """Block until a token is available. Returns the time waited."""
+        wait = self.reserve()
+        if wait > 0:
+            self._record_wait(wait)
+            scope = current_scope()
+            if scope is None:
+                time.sleep(wait)
+            else:
+                scope.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """Wait on the event loop until a token is available. Returns the time waited."""
+        wait = self.reserve()
+        if wait > 0:
+            self._record_wait(wait)
+            await asyncio.sleep(wait)
+        return wait
+
+    def update(self, rate: float, burst: int) -> None:
+        """Apply a new rate and burst size without losing the current balance."""
+        with self._lock:
+            self.rate = rate
+            self.burst = burst
+            self._tokens = min(self._tokens, float(burst))
+
+    def _record_wait(self, wait: float) -> None:
+        metrics.observe("zephyr_ratelimit_wait_seconds", wait, labels={"target": self.name})
+        logger.debug(f"Rate limit reached for {self.name}; waiting {wait:.3f}s")
+
+
+# The per-credential registries (these buckets, the concurrency limiters and the hedgers) hold their
+# entries weakly. An entry lives as long as a pipeline or client uses it, so credentials that are gone
+# do not pile up. Its state starts over once the last fetcher using it is evicted.
+_buckets: weakref.WeakValueDictionary[str, TokenBucket] = weakref.WeakValueDictionary()
+_buckets_lock = threading.Lock()
+
+
+def get_rate_limiter(key: str, policy: RateLimitPolicy, name: str = "") -> TokenBucket | None:
+    """Return the process-wide bucket for key, or None when the policy disables limiting."""
+    if not policy.enabled:
+        return None
+    with _buckets_lock:
+        bucket = _buckets.get(key)
+        if bucket is None:
+            bucket = _buckets[key] = TokenBucket(policy.rate, policy.burst, name=name)
+        elif (bucket.rate, bucket.burst) != (policy.rate, policy.burst):
+            bucket.update(policy.rate, policy.burst)
+        return bucket
+
+
+def reset_rate_limiters() -> None:
+    """Forget every bucket (used by tests)."""
+    with _buckets_lock:
+        _buckets.clear()
@@ -0,0 +1,154 @@
+"""Retry with exponential backoff, jitter and Retry-After for transient HTTP failures."""
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import httpx
+import requests
+
+from zephyr_mcp.utils.cancellation import current_scope
+from zephyr_mcp.utils.env import get_env_float, get_env_int
+from zephyr_mcp.utils.metrics import metrics
+
+logger = logging.getLogger("mcp-zephyr")
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_BACKOFF_BASE = 0.5
+DEFAULT_BACKOFF_MAX = 30.0
+
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """Connection failures and timeouts are worth retrying; TLS failures are not."""
+    if isinstance(error, requests.exceptions.SSLError):
+        return False
+    return isinstance(error, requests.exceptions.ConnectionError | requests.exceptions.Timeout | httpx.TransportError)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given as delta-seconds or an HTTP date."""
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How often and how long to back off before re-sending a failed request."""
+
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    backoff_base: float = DEFAULT_BACKOFF_BASE
+    backoff_max: float = DEFAULT_BACKOFF_MAX
+    retry_statuses: frozenset[int] = RETRYABLE_STATUSES
+
+    @classmethod
+    def from_env(cls) -> "RetryPolicy":
+        """Create a retry policy from environment variables."""
+        return cls(
+            max_attempts=max(1, get_env_int("ZEPHYR_RETRY_MAX_ATTEMPTS", DEFAULT_MAX_ATTEMPTS)),
+            backoff_base=max(0.0, get_env_float("ZEPHYR_RETRY_BACKOFF_BASE", DEFAULT_BACKOFF_BASE)),
+            backoff_max=max(0.0, get_env_float("ZEPHYR_RETRY_BACKOFF_MAX", DEFAULT_BACKOFF_MAX)),
+        )
+
+    def allows_retry(self, method: str, headers: Mapping[str, str] | None = None) -> bool:
+        """Only idempotent requests, or those carrying an idempotency key, may be sent twice."""
+        if method.upper() in IDEMPOTENT_METHODS:
+            return True
+        return any(key.lower() == IDEMPOTENCY_KEY_HEADER.lower() for key in headers or {})
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff after the given (1-based) attempt."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))  # noqa: S311
+
+    def delay_for(self, attempt: int, response: Any | None = None) -> float:
+        """Seconds to wait before the next attempt, honouring the server's Retry-After up to backoff_max."""
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.backoff_max)
+        return self.backoff(attempt)
+
+
+def _next_delay(
+    policy: RetryPolicy, attempt: int, retryable: bool, target: str, response: Any = None, error: BaseException | None = None
+) -> float | None:
+    """Record one attempt and return how long to wait before retrying, or None to stop."""
+    outcome = str(response.status_code) if response is not None else type(error).__name__
+    metrics.increment("zephyr_http_attempts_total", labels={"target": target, "outcome": outcome})
+
+    if error is not None and not is_transient_error(error):
+        return None
+    if response is not None and response.status_code not in policy.retry_statuses:
+        return None
+    if not retryable or attempt >= policy.max_attempts:
+        return None
+
+    delay = policy.delay_for(attempt, response)
+    metrics.increment("zephyr_http_retries_total", labels={"target": target})
+    logger.warning(f"Retrying request to {target} after {outcome} (attempt {attempt}/{policy.max_attempts}, waiting {delay:.2f}s)")
+    return delay
+
+
+def send_with_retry(send: Callable[[], Any], method: str, policy: RetryPolicy, headers: Mapping[str, str] | None = None, target: str = "") -> Any:
+    """Call send until it returns a non-retryable response or the policy gives up."""
+    retryable = policy.allows_retry(method, headers)
+    attempt = 1
+    while True:
+        try:
+            response = send()
+        except Exception as e:
+            delay = _next_delay(policy, attempt, retryable, target, error=e)
+            if delay is None:
+                raise
+        else:
+            delay = _next_delay(policy, attempt, retryable, target, response=response)
+            if delay is None:
+                return response
+        scope = current_scope()
+        if scope is None:
+            time.sleep(delay)
+        else:
+            scope.sleep(delay)
+        attempt += 1
+
+
+async def send_with_retry_async(
+    send: Callable[[], Awaitable[Any]], method: str, policy: RetryPolicy, headers: Mapping[str, str] | None = None, target: str = ""
+) -> Any:
+    """Await send until it returns a non-retryable response or the policy gives up."""
+    retryable = policy.allows_retry(method, headers)
+    attempt = 1
+    while True:
+        try:
+            response = await send()
+        except Exception as e:
+            delay = _next_delay(policy, attempt, retryable, target, error=e)
+            if delay is None:
+                raise
+        else:
+            delay = _next_delay(policy, attempt, retryable, target, response=response)
+            if delay is None:
+                return response
+        await asyncio.sleep(delay)
+        attempt += 1
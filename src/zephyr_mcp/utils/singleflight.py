@@ -0,0 +1,126 @@
+"""Coalescing of identical in-flight requests so concurrent callers share one upstream call."""
+
+import asyncio
+import os
+import threading
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+from typing import Any
+
+from zephyr_mcp.exceptions import RequestCancelledError
+from zephyr_mcp.utils.env import is_env_truthy
+from zephyr_mcp.utils.metrics import metrics
+
+
+def is_coalescing_enabled_from_env(*env_var_names: str) -> bool:
+    """Read the coalescing switch from the first set environment variable; enabled by default."""
+    for env_var_name in env_var_names or ("ZEPHYR_COALESCE_GETS",):
+        if os.getenv(env_var_name):
+            return is_env_truthy(env_var_name)
+    return True
+
+
+def coalesce_key(method: str, url: str, request_kwargs: Mapping[str, Any]) -> tuple[str, str, str] | None:
+    """Return the key identical requests share, or None when the request must not be coalesced.
+
+    Only bodiless GETs are coalesced; the key is built from the method, URL and query parameters.
+    """
+    if method.upper() != "GET" or request_kwargs.get("json") is not None or request_kwargs.get("data") is not None:
+        return None
+    params = request_kwargs.get("params")
+    if isinstance(params, Mapping):
+        params = sorted((str(name), repr(value)) for name, value in params.items())
+    return ("GET", url, repr(params) if params else "")
+
+
+class _Call:
+    """A call in flight on a worker thread, and the outcome its followers will receive."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Run at most one call per key at a time; callers arriving meanwhile wait for and share its outcome.
+
+    Threads wait on the leader's call; coroutines await a shielded task, so a
+    cancelled caller does not cancel the upstream call for the others.
+    Nothing is cached: once the call finishes the next caller starts a new one.
+    """
+
+    def __init__(self, name: str = "") -> None:
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self._tasks: dict[tuple[int, Hashable], asyncio.Task[Any]] = {}
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """Call func, or wait for the identical call already running on another thread."""
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                leader = call is None
+                if leader:
+                    call = self._calls[key] = _Call()
+            if leader:
+                break
+
+            self._record_coalesced()
+            call.done.wait()
+            # A leader abandoned by its own caller says nothing about this one; take over instead.
+            if isinstance(call.error, RequestCancelledError):
+                continue
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def do_async(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Await func, or the identical call already running on this event loop."""
+        loop = asyncio.get_running_loop()
+        task_key = (id(loop), key)
+        with self._lock:
+            task = self._tasks.get(task_key)
+            if task is None:
+                task = self._tasks[task_key] = loop.create_task(func())
+                task.add_done_callback(lambda _: self._forget(task_key))
+            else:
+                self._record_coalesced()
+        return await asyncio.shield(task)
+
+    def _forget(self, task_key: tuple[int, Hashable]) -> None:
+        with self._lock:
+            self._tasks.pop(task_key, None)
+
+    def _record_coalesced(self) -> None:
+        metrics.increment("zephyr_http_coalesced_total", labels={"target": self.name})
+
+
+_groups: dict[str, SingleFlight] = {}
+_groups_lock = threading.Lock()
+
+
+def get_singleflight(name: str = "") -> SingleFlight:
+    """Return the process-wide group for name, so every client talking to the same API shares it."""
+    with _groups_lock:
+        group = _groups.get(name)
+        if group is None:
+            group = _groups[name] = SingleFlight(name=name)
+        return group
+
+
+def reset_singleflight_groups() -> None:
+    """Forget every group (used by tests)."""
+    with _groups_lock:
+        _groups.clear()
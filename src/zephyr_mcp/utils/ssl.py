@@ -1,33 +1,208 @@
 """SSL-related utility functions for the Zephyr MCP server."""
 
 import logging
+import os
 import ssl
+import threading
 from typing import Any
 from urllib.parse import urlparse
 
-from requests.adapters import HTTPAdapter
+from requests.adapters import DEFAULT_CA_BUNDLE_PATH, HTTPAdapter
 from requests.sessions import Session
-from urllib3.poolmanager import PoolManager
+
+from zephyr_mcp.utils.metrics import metrics
 
 logger = logging.getLogger("mcp-zephyr")
 
 
-class SSLIgnoreAdapter(HTTPAdapter):
-    """HTTP adapter that ignores SSL verification."""
+class _ResumableSSLSocket(ssl.SSLSocket):
+    """SSLSocket that hands its TLS session to its context once the first response bytes arrive.
+
+    TLS 1.3 servers send session tickets after the handshake, so the session
+    only becomes resumable once something has been read.
+    """
+
+    _session_saved = False
+
+    def recv_into(self, buffer: Any, nbytes: int | None = None, flags: int = 0) -> int:
+        received = super().recv_into(buffer, nbytes, flags)
+        if not self._session_saved:
+            self._session_saved = True
+            self.context._save_session(self.server_hostname, self.session)
+        return received
+
+
+class _ResumableSSLObject(ssl.SSLObject):
+    """SSLObject doing the same session hand-off, for the httpx clients of the async engine (anyio wraps sockets with wrap_bio).
+
+    The handshake runs after wrap_bio() returns, so it is counted here once it completes.
+    """
+
+    _session_saved = False
+
+    def do_handshake(self) -> None:
+        super().do_handshake()
+        if self.server_hostname:
+            metrics.increment("zephyr_tls_handshakes_total", labels={"host": self.server_hostname, "resumed": str(self.session_reused).lower()})
+
+    def read(self, len: int = 1024, buffer: Any = None) -> Any:
+        received = super().read(len, buffer)
+        if not self._session_saved:
+            self._session_saved = True
+            self.context._save_session(self.server_hostname, self.session)
+        return received
+
+
+class _ResumingSSLContext(ssl.SSLContext):
+    """Client SSLContext that resumes the TLS session of an earlier connection to the same host, over sockets or memory BIOs."""
+
+    sslsocket_class = _ResumableSSLSocket
+    sslobject_class = _ResumableSSLObject
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__()
+        self._session_lock = threading.Lock()
+        self._sessions: dict[str, ssl.SSLSession] = {}
+
+    def wrap_socket(
+        self, sock: Any, *args: Any, server_hostname: str | None = None, session: ssl.SSLSession | None = None, **kwargs: Any
+    ) -> ssl.SSLSocket:
+        ssl_sock = super().wrap_socket(sock, *args, server_hostname=server_hostname, session=session or self._session(server_hostname), **kwargs)
+        if server_hostname:
+            metrics.increment("zephyr_tls_handshakes_total", labels={"host": server_hostname, "resumed": str(ssl_sock.session_reused).lower()})
+        return ssl_sock
+
+    def wrap_bio(
+        self,
+        incoming: ssl.MemoryBIO,
+        outgoing: ssl.MemoryBIO,
+        server_side: bool = False,
+        server_hostname: str | bytes | None = None,
+        session: ssl.SSLSession | None = None,
+    ) -> ssl.SSLObject:
+        if not server_side:
+            session = session or self._session(server_hostname)
+        return super().wrap_bio(incoming, outgoing, server_side=server_side, server_hostname=server_hostname, session=session)
+
+    def _session(self, server_hostname: str | bytes | None) -> ssl.SSLSession | None:
+        if not server_hostname:
+            return None
+        # anyio passes the IDNA-encoded name, sessions are saved under the decoded one
+        if isinstance(server_hostname, bytes):
+            server_hostname = server_hostname.decode("idna")
+        with self._session_lock:
+            return self._sessions.get(server_hostname)
+
+    def _save_session(self, server_hostname: str | None, session: ssl.SSLSession | None) -> None:
+        if server_hostname and session is not None and (session.has_ticket or session.id):
+            with self._session_lock:
+                self._sessions[server_hostname] = session
+
+
+_contexts: dict[tuple[Any, ...], ssl.SSLContext] = {}
+_contexts_lock = threading.Lock()
+
+
+def get_ssl_context(
+    verify: bool | str = True,
+    client_cert: str | None = None,
+    client_key: str | None = None,
+) -> ssl.SSLContext:
+    """Return the process-wide client SSLContext for these settings, building it on first use.
+
+    verify is True (the requests CA bundle), False (no verification) or the
+    path of a CA bundle file or directory. Sharing contexts means the CA bundle
+    and client certificate are loaded once, and TLS sessions can be resumed
+    across connections and clients.
+    """
+    key = (verify, client_cert, client_key)
+    with _contexts_lock:
+        context = _contexts.get(key)
+        if context is None:
+            context = _contexts[key] = _build_ssl_context(verify, client_cert, client_key)
+        return context
+
+
+def session_verify(session: Session) -> bool | str:
+    """What requests verifies a session's requests against: False, a CA bundle path, or True for its default bundle.
+
+    Like requests, a session that trusts the environment takes the bundle
+    named by REQUESTS_CA_BUNDLE or CURL_CA_BUNDLE over its own.
+    """
+    if session.verify is False:
+        return False
+    if session.trust_env:
+        ca_bundle = os.environ.get("REQUESTS_CA_BUNDLE") or os.environ.get("CURL_CA_BUNDLE")
+        if ca_bundle:
+            return ca_bundle
+    return session.verify
 
-    def init_poolmanager(self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any) -> None:
-        """Initialize the connection pool manager with SSL verification disabled."""
-        context = ssl.create_default_context()
+
+def reset_ssl_contexts() -> None:
+    """Forget every cached SSL context (used by tests)."""
+    with _contexts_lock:
+        _contexts.clear()
+
+
+def _build_ssl_context(verify: bool | str, client_cert: str | None, client_key: str | None) -> ssl.SSLContext:
+    context = _ResumingSSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    context.minimum_version = ssl.TLSVersion.TLSv1_2
+    context.post_handshake_auth = True
+    if verify is False:
         context.check_hostname = False
         context.verify_mode = ssl.CERT_NONE
+    else:
+        ca_bundle = DEFAULT_CA_BUNDLE_PATH if verify is True else verify
+        if os.path.isdir(ca_bundle):
+            context.load_verify_locations(capath=ca_bundle)
+        else:
+            context.load_verify_locations(cafile=ca_bundle)
+    if client_cert:
+        context.load_cert_chain(client_cert, client_key)
+    return context
+
+
+class SSLContextAdapter(HTTPAdapter):
+    """HTTP adapter whose HTTPS connections use the shared SSL context for the request's verify and cert settings.
+
+    requests otherwise has urllib3 load the CA bundle (and client certificate)
+    into a fresh context for every new connection. A ca_bundle given here
+    replaces the default bundle for verified requests, whatever
+    REQUESTS_CA_BUNDLE says.
+    """
 
-        self.poolmanager = PoolManager(
-            num_pools=connections,
-            maxsize=maxsize,
-            block=block,
-            ssl_context=context,
-            **pool_kwargs,
-        )
+    def __init__(self, ca_bundle: str | None = None, **kwargs: Any) -> None:
+        self.ca_bundle = ca_bundle
+        super().__init__(**kwargs)
+
+    def _verify(self, verify: Any) -> Any:
+        return self.ca_bundle if verify is not False and self.ca_bundle else verify
+
+    def build_connection_pool_key_attributes(self, request: Any, verify: Any, cert: Any = None) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Select the connection pool by shared SSL context instead of CA and certificate paths."""
+        verify = self._verify(verify)
+        host_params, pool_kwargs = super().build_connection_pool_key_attributes(request, verify, cert)
+        if host_params["scheme"] != "https":
+            return host_params, pool_kwargs
+        client_cert, client_key = cert if isinstance(cert, tuple) else (cert, None)
+        context = get_ssl_context(verify if isinstance(verify, str) else verify is not False, client_cert, client_key)
+        return host_params, {"ssl_context": context, "cert_reqs": "CERT_NONE" if context.verify_mode == ssl.CERT_NONE else "CERT_REQUIRED"}
+
+    def cert_verify(self, conn: Any, url: str, verify: Any, cert: Any | None) -> None:
+        """Validate the verify and cert settings, leaving their loading to the shared context."""
+        super().cert_verify(conn, url, verify=self._verify(verify), cert=cert)
+        if url.lower().startswith("https"):
+            conn.ca_certs = None
+            conn.ca_cert_dir = None
+            conn.cert_file = None
+            conn.key_file = None
+
+
+class SSLIgnoreAdapter(SSLContextAdapter):
+    """HTTP adapter that ignores SSL verification."""
+
+    def _verify(self, verify: Any) -> Any:
+        return False
 
     def cert_verify(self, conn: Any, url: str, verify: bool, cert: Any | None) -> None:
         """Override cert verification to disable SSL verification."""
@@ -42,8 +217,14 @@ def configure_ssl_verification(
     client_cert: str | None = None,
     client_key: str | None = None,
     client_key_password: str | None = None,
+    adapter_kwargs: dict[str, Any] | None = None,
+    ca_bundle: str | None = None,
 ) -> None:
-    """Configure SSL verification and client certificates for a service."""
+    """Configure SSL verification, a custom CA bundle and client certificates for a service.
+
+    adapter_kwargs (pool sizing) are passed to the adapter mounted for the service's host when verification
+    is disabled or a CA bundle is given.
+    """
     if isinstance(client_cert, str) and isinstance(client_key, str):
         if isinstance(client_key_password, str) and client_key_password:
             raise ValueError(
@@ -54,11 +235,19 @@ def configure_ssl_verification(
 
         session.cert = (client_cert, client_key)
         logger.info(f"{service_name} client certificate authentication configured with cert: {client_cert}")
+    elif isinstance(client_cert, str):
+        session.cert = client_cert
+        logger.info(f"{service_name} client certificate authentication configured with cert: {client_cert}")
+
+    domain = urlparse(url).netloc
+    if ssl_verify and ca_bundle:
+        logger.info(f"{service_name} SSL verification uses CA bundle: {ca_bundle}")
+        adapter = SSLContextAdapter(ca_bundle=ca_bundle, **(adapter_kwargs or {}))
+        session.mount(f"https://{domain}", adapter)
 
     if not ssl_verify:
         logger.warning(f"{service_name} SSL verification disabled. This is insecure and should only be used in testing environments.")
 
-        domain = urlparse(url).netloc
-        adapter = SSLIgnoreAdapter()
+        adapter = SSLIgnoreAdapter(**(adapter_kwargs or {}))
         session.mount(f"https://{domain}", adapter)
         session.mount(f"http://{domain}", adapter)
@@ -33,3 +33,10 @@ def is_atlassian_cloud_url(url: str | None) -> bool:
         or ".atlassian-us-gov.net" in hostname
         or "zephyrscale.smartbear.com" in hostname
     )
+
+
+def get_url_host(url: str | None) -> str:
+    """Return the host[:port] of a URL for use as a low-cardinality metrics label or limiter key."""
+    if not url:
+        return ""
+    return urlparse(url).netloc or url
@@ -1,27 +1,73 @@
 """Zephyr Scale API client package."""
 
+from zephyr_mcp.cache.backend import get_cache_backend
+from zephyr_mcp.cache.entity import get_entity_cache
+from zephyr_mcp.cache.metadata import get_metadata_cache
+from zephyr_mcp.zephyr.async_client import AsyncZephyrClient
 from zephyr_mcp.zephyr.client import ZephyrClient
 from zephyr_mcp.zephyr.config import ZephyrConfig
+from zephyr_mcp.zephyr.metadata import MetadataMixin
 from zephyr_mcp.zephyr.testcases import TestCasesMixin
 from zephyr_mcp.zephyr.testcycles import TestCyclesMixin
 from zephyr_mcp.zephyr.testexecutions import TestExecutionsMixin
 
 
-class ZephyrFetcher(TestCasesMixin, TestCyclesMixin, TestExecutionsMixin):
+class ZephyrFetcher(TestCasesMixin, TestCyclesMixin, TestExecutionsMixin, MetadataMixin):
     """Combined Zephyr Scale API client with all operations."""
 
+    is_async = False
+
     def __init__(self, config: ZephyrConfig | None = None) -> None:
         if config is None:
             config = ZephyrConfig.from_env()
         self.client = ZephyrClient(config)
         self.config = config
+        store = get_cache_backend(config.cache_backend)
+        self.entity_cache = get_entity_cache("zephyr", config.entity_cache, store=store)
+        self.metadata_cache = get_metadata_cache("zephyr", config.metadata_cache, store=store)
+        self.cache_scope = config.cache_scope()
+
+    def close(self) -> None:
+        """Release the client's HTTP resources."""
+        self.client.close()
+
+
+class AsyncZephyrFetcher(TestCasesMixin, TestCyclesMixin, TestExecutionsMixin, MetadataMixin):
+    """Combined Zephyr Scale API client on the asyncio engine.
+
+    The mixins only build requests and return the client's result, so with
+    AsyncZephyrClient every operation returns an awaitable.
+    """
+
+    is_async = True
+
+    def __init__(self, config: ZephyrConfig | None = None) -> None:
+        if config is None:
+            config = ZephyrConfig.from_env()
+        self.client = AsyncZephyrClient(config)
+        self.config = config
+        store = get_cache_backend(config.cache_backend)
+        self.entity_cache = get_entity_cache("zephyr", config.entity_cache, store=store)
+        self.metadata_cache = get_metadata_cache("zephyr", config.metadata_cache, store=store)
+        self.cache_scope = config.cache_scope()
+
+    async def aclose(self) -> None:
+        """Release the client's HTTP resources."""
+        await self.client.aclose()
+
+    def close(self) -> None:
+        """Release the client's HTTP resources from synchronous code."""
+        self.client.close()
 
 
 __all__ = [
     "ZephyrFetcher",
+    "AsyncZephyrFetcher",
     "ZephyrClient",
+    "AsyncZephyrClient",
     "ZephyrConfig",
     "TestCasesMixin",
     "TestCyclesMixin",
     "TestExecutionsMixin",
+    "MetadataMixin",
 ]
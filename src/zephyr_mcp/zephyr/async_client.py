@@ -0,0 +1,80 @@
+"""Asyncio Zephyr Scale API client."""
+
+import asyncio
+import logging
+from typing import Any
+
+from zephyr_mcp.utils.http import build_async_http_client, close_async_http_client, close_async_http_client_soon
+from zephyr_mcp.utils.jsoncodec import RawJSON
+from zephyr_mcp.utils.singleflight import coalesce_key
+from zephyr_mcp.utils.ssl import get_ssl_context, session_verify
+from zephyr_mcp.zephyr.client import ZephyrClient
+from zephyr_mcp.zephyr.config import ZephyrConfig
+
+logger = logging.getLogger("mcp-zephyr")
+
+
+class AsyncZephyrClient(ZephyrClient):
+    """Zephyr Scale API client that awaits requests on a pooled httpx.AsyncClient.
+
+    Authentication, proxy, SSL and header setup is inherited from ZephyrClient;
+    only the transport differs, so concurrent tool calls overlap on the event loop.
+    """
+
+    def __init__(self, config: ZephyrConfig) -> None:
+        super().__init__(config)
+        verify = (config.ca_bundle or session_verify(self.session)) if config.ssl_verify else False
+        ssl_context = get_ssl_context(verify, config.client_cert, config.client_key)
+        self.http = build_async_http_client(self.session, verify=ssl_context, settings=config.http)
+
+    async def request(self, method: str, endpoint: str, raw: bool = False, **kwargs: Any) -> dict[str, Any] | list[dict[str, Any]] | RawJSON:
+        """Make an HTTP request to the Zephyr Scale API; with raw, the JSON body is returned undecoded as RawJSON."""
+        url = f"{self.base_url}{endpoint}"
+        logger.debug(f"Zephyr API async request: {method.upper()} {url}")
+
+        if self._oauth_refresh_due():
+            # Token refresh uses requests; keep it off the event loop.
+            await asyncio.to_thread(self._refresh_oauth_token)
+            self.http.headers["Authorization"] = self.session.headers["Authorization"]
+
+        # Our own copy: the request pipeline adds HTTP cache validators to it.
+        kwargs["headers"] = dict(kwargs.get("headers") or {})
+
+        def send() -> Any:
+            return self.http.request(method, url, **kwargs)
+
+        response = await self._pipeline.send_async(
+            send,
+            method,
+            headers=kwargs.get("headers"),
+            coalesce_key=coalesce_key(method, url, kwargs),
+            endpoint=endpoint,
+            hedge=self._hedged(method, endpoint),
+        )
+        return self._handle_response(response, raw=raw)
+
+    async def get(self, endpoint: str, **kwargs: Any) -> dict[str, Any] | list[dict[str, Any]]:
+        """Make a GET request."""
+        return await self.request("GET", endpoint, **kwargs)
+
+    async def post(self, endpoint: str, **kwargs: Any) -> dict[str, Any] | list[dict[str, Any]]:
+        """Make a POST request."""
+        return await self.request("POST", endpoint, **kwargs)
+
+    async def put(self, endpoint: str, **kwargs: Any) -> dict[str, Any] | list[dict[str, Any]]:
+        """Make a PUT request."""
+        return await self.request("PUT", endpoint, **kwargs)
+
+    async def delete(self, endpoint: str, **kwargs: Any) -> dict[str, Any] | list[dict[str, Any]]:
+        """Make a DELETE request."""
+        return await self.request("DELETE", endpoint, **kwargs)
+
+    async def aclose(self) -> None:
+        """Close the async connection pool and the underlying session."""
+        await close_async_http_client(self.http)
+        self.session.close()
+
+    def close(self) -> None:
+        """Close the async connection pool from synchronous code."""
+        close_async_http_client_soon(self.http)
+        self.session.close()
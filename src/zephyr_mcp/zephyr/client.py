@@ -2,13 +2,18 @@
 
 import base64
 import logging
+import threading
 from typing import Any
 
 import requests
 
 from zephyr_mcp.exceptions import ZephyrAuthenticationError
+from zephyr_mcp.utils.cancellation import bound_timeout
+from zephyr_mcp.utils.http import build_request_pipeline, configure_http_session
+from zephyr_mcp.utils.jsoncodec import RawJSON, decode_response
 from zephyr_mcp.utils.logging import get_masked_session_headers, mask_sensitive
-from zephyr_mcp.utils.oauth import configure_oauth_session
+from zephyr_mcp.utils.oauth import OAuthConfig, configure_oauth_session
+from zephyr_mcp.utils.singleflight import coalesce_key
 from zephyr_mcp.utils.ssl import configure_ssl_verification
 from zephyr_mcp.zephyr.config import ZephyrConfig
 
@@ -21,8 +26,11 @@ class ZephyrClient:
     def __init__(self, config: ZephyrConfig) -> None:
         self.config = config
         self.base_url = (config.url or "").rstrip("/")
+        self._pipeline = build_request_pipeline(self.base_url, config, hedging=config.hedging)
         self.session = requests.Session()
+        self._auth_lock = threading.Lock()
 
+        configure_http_session(self.session, config.http)
         self._configure_proxies()
         self._configure_auth()
 
@@ -31,6 +39,11 @@ class ZephyrClient:
             url=self.base_url,
             session=self.session,
             ssl_verify=config.ssl_verify,
+            client_cert=config.client_cert,
+            client_key=config.client_key,
+            client_key_password=config.client_key_password,
+            adapter_kwargs=config.http.adapter_kwargs(),
+            ca_bundle=config.ca_bundle,
         )
 
         if config.custom_headers:
@@ -80,13 +93,63 @@ class ZephyrClient:
         else:
             raise ZephyrAuthenticationError(f"Unable to configure Zephyr authentication with auth_type='{auth_type}'")
 
-    def request(self, method: str, endpoint: str, **kwargs: Any) -> dict[str, Any] | list[dict[str, Any]]:
-        """Make an HTTP request to the Zephyr Scale API."""
+    def _oauth_refresh_due(self) -> bool:
+        """Check whether the session uses a refreshable OAuth token that is about to expire."""
+        oauth_config = self.config.oauth_config
+        if self.config.auth_type != "oauth" or not isinstance(oauth_config, OAuthConfig) or not oauth_config.refresh_token:
+            return False
+        return oauth_config.is_token_expired
+
+    def _refresh_oauth_token(self) -> None:
+        """Refresh the OAuth bearer token of a long-lived session before it expires."""
+        if not self._oauth_refresh_due():
+            return
+
+        oauth_config = self.config.oauth_config
+        with self._auth_lock:
+            if not oauth_config.is_token_expired:
+                return
+            if not configure_oauth_session(self.session, oauth_config):
+                raise ZephyrAuthenticationError("Failed to refresh OAuth session for Zephyr")
+            logger.info("OAuth access token refreshed for Zephyr")
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self.session.close()
+
+    def request(self, method: str, endpoint: str, raw: bool = False, **kwargs: Any) -> dict[str, Any] | list[dict[str, Any]] | RawJSON:
+        """Make an HTTP request to the Zephyr Scale API; with raw, the JSON body is returned undecoded as RawJSON."""
         url = f"{self.base_url}{endpoint}"
         logger.debug(f"Zephyr API request: {method.upper()} {url}")
 
-        response = self.session.request(method, url, **kwargs)
+        self._refresh_oauth_token()
+        kwargs.setdefault("timeout", self.config.http.timeout)
+        # Our own copy: the request pipeline adds HTTP cache validators to it.
+        kwargs["headers"] = dict(kwargs.get("headers") or {})
+
+        def send() -> Any:
+            return self.session.request(method, url, **{**kwargs, "timeout": bound_timeout(kwargs["timeout"])})
+
+        response = self._pipeline.send(
+            send,
+            method,
+            headers=kwargs.get("headers"),
+            coalesce_key=coalesce_key(method, url, kwargs),
+            endpoint=endpoint,
+            hedge=self._hedged(method, endpoint),
+        )
+        return self._handle_response(response, raw=raw)
+
+    def invalidate_cached(self, endpoint: str) -> None:
+        """Forget the cached GET response of endpoint, after a write to it."""
+        self._pipeline.invalidate(coalesce_key("GET", f"{self.base_url}{endpoint}", {}))
+
+    def _hedged(self, method: str, endpoint: str) -> bool:
+        """Only GETs to endpoint classes listed in the hedging policy are hedged."""
+        return method.upper() == "GET" and self.config.hedging.applies_to(endpoint)
 
+    def _handle_response(self, response: Any, raw: bool = False) -> dict[str, Any] | list[dict[str, Any]] | RawJSON:
+        """Raise on error statuses and decode the JSON body of a response (or keep it raw)."""
         if response.status_code in (401, 403):
             raise ZephyrAuthenticationError(f"Authentication failed for Zephyr API: {response.status_code} {response.text}")
 
@@ -95,7 +158,7 @@ class ZephyrClient:
         if response.status_code == 204:
             return {}
 
-        return response.json()
+        return decode_response(response, raw=raw)
 
     def get(self, endpoint: str, **kwargs: Any) -> dict[str, Any] | list[dict[str, Any]]:
         """Make a GET request."""
@@ -1,11 +1,23 @@
 """Configuration for the Zephyr Scale API client."""
 
+import hashlib
 import logging
 import os
-from dataclasses import dataclass
-
+from dataclasses import dataclass, field
+
+from zephyr_mcp.cache.backend import CacheBackendPolicy
+from zephyr_mcp.cache.entity import EntityCachePolicy
+from zephyr_mcp.cache.http import HTTPCachePolicy
+from zephyr_mcp.cache.metadata import MetadataCachePolicy
+from zephyr_mcp.utils.circuit import CircuitBreakerPolicy
+from zephyr_mcp.utils.concurrency import ConcurrencyPolicy
 from zephyr_mcp.utils.env import get_custom_headers, is_env_ssl_verify
+from zephyr_mcp.utils.hedging import HedgingPolicy
+from zephyr_mcp.utils.http import HTTP_ENGINE_SYNC, HTTPSettings, get_http_engine_from_env
 from zephyr_mcp.utils.oauth import OAuthConfig, get_oauth_config_from_env
+from zephyr_mcp.utils.ratelimit import RateLimitPolicy
+from zephyr_mcp.utils.retry import RetryPolicy
+from zephyr_mcp.utils.singleflight import is_coalescing_enabled_from_env
 from zephyr_mcp.utils.urls import is_atlassian_cloud_url
 
 logger = logging.getLogger("mcp-zephyr")
@@ -22,18 +34,78 @@ class ZephyrConfig:
     api_token: str | None = None
     oauth_config: OAuthConfig | None = None
     ssl_verify: bool = True
+    ca_bundle: str | None = None
+    client_cert: str | None = None
+    client_key: str | None = None
+    client_key_password: str | None = None
     project_key: str | None = None
     http_proxy: str | None = None
     https_proxy: str | None = None
     no_proxy: str | None = None
     socks_proxy: str | None = None
     custom_headers: dict[str, str] | None = None
+    http_engine: str = HTTP_ENGINE_SYNC
+    http: HTTPSettings = field(default_factory=HTTPSettings.from_env)
+    retry_policy: RetryPolicy = field(default_factory=RetryPolicy.from_env)
+    concurrency: ConcurrencyPolicy = field(default_factory=ConcurrencyPolicy.from_env)
+    rate_limit: RateLimitPolicy = field(default_factory=RateLimitPolicy.from_env)
+    coalesce_gets: bool = field(default_factory=is_coalescing_enabled_from_env)
+    circuit_breaker: CircuitBreakerPolicy = field(default_factory=CircuitBreakerPolicy.from_env)
+    hedging: HedgingPolicy = field(default_factory=HedgingPolicy.from_env)
+    http_cache: HTTPCachePolicy = field(default_factory=HTTPCachePolicy.from_env)
+    entity_cache: EntityCachePolicy = field(default_factory=EntityCachePolicy.from_env)
+    cache_backend: CacheBackendPolicy = field(default_factory=CacheBackendPolicy.from_env)
+    metadata_cache: MetadataCachePolicy = field(default_factory=MetadataCachePolicy.from_env)
 
     @property
     def is_cloud(self) -> bool:
         """Check if the Zephyr URL is an Atlassian Cloud URL."""
         return is_atlassian_cloud_url(self.url)
 
+    def project_keys(self) -> tuple[str, ...]:
+        """The project keys in project_key, which may list several separated by commas."""
+        return tuple(key.strip() for key in (self.project_key or "").split(",") if key.strip())
+
+    def _oauth_identity(self) -> tuple[str | None, ...]:
+        """Identify the OAuth credential; refreshable tokens rotate, so they are identified by client rather than token."""
+        if self.oauth_config is None:
+            return ()
+        if getattr(self.oauth_config, "refresh_token", None):
+            return (getattr(self.oauth_config, "client_id", None), self.oauth_config.cloud_id, self.oauth_config.base_url)
+        return (self.oauth_config.access_token, self.oauth_config.cloud_id, self.oauth_config.base_url)
+
+    def credential_id(self) -> str:
+        """Return a stable hash of the credential alone, shared by every client that spends the same API quota."""
+        parts = (self.auth_type, self.personal_token, self.email, self.api_token, self._oauth_identity())
+        return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+    def cache_scope(self) -> str:
+        """Return the scope cached API data is partitioned by: the API URL and the credential reading it."""
+        return f"{(self.url or '').rstrip('/')}|{self.credential_id()}"
+
+    def fingerprint(self) -> str:
+        """Return a stable hash of the settings that identify a client built from this config."""
+        parts = (
+            self.url,
+            self.auth_type,
+            self.personal_token,
+            self.email,
+            self.api_token,
+            self._oauth_identity(),
+            self.ssl_verify,
+            self.ca_bundle,
+            self.client_cert,
+            self.client_key,
+            self.http_proxy,
+            self.https_proxy,
+            self.no_proxy,
+            self.socks_proxy,
+            tuple(sorted((self.custom_headers or {}).items())),
+            self.http_engine,
+            self.http,
+        )
+        return hashlib.sha256(repr(parts).encode()).hexdigest()
+
     @classmethod
     def from_env(cls) -> "ZephyrConfig":
         """Create configuration from environment variables."""
@@ -49,7 +121,12 @@ class ZephyrConfig:
         socks_proxy = os.getenv("ZEPHYR_SOCKS_PROXY") or os.getenv("SOCKS_PROXY")
 
         ssl_verify = is_env_ssl_verify("ZEPHYR_SSL_VERIFY")
+        ca_bundle = os.getenv("ZEPHYR_CA_BUNDLE")
+        client_cert = os.getenv("ZEPHYR_CLIENT_CERT")
+        client_key = os.getenv("ZEPHYR_CLIENT_KEY")
+        client_key_password = os.getenv("ZEPHYR_CLIENT_KEY_PASSWORD")
         custom_headers = get_custom_headers("ZEPHYR_CUSTOM_HEADERS")
+        http_engine = get_http_engine_from_env("ZEPHYR_HTTP_ENGINE")
 
         oauth_config = None
         auth_type = "pat"
@@ -90,10 +167,15 @@ class ZephyrConfig:
             api_token=api_token,
             oauth_config=oauth_config,
             ssl_verify=ssl_verify,
+            ca_bundle=ca_bundle,
+            client_cert=client_cert,
+            client_key=client_key,
+            client_key_password=client_key_password,
             project_key=project_key,
             http_proxy=http_proxy,
             https_proxy=https_proxy,
             no_proxy=no_proxy,
             socks_proxy=socks_proxy,
             custom_headers=custom_headers or None,
+            http_engine=http_engine,
         )
@@ -2,6 +2,8 @@
 
 DEFAULT_TEST_CASE_FIELDS = ["key", "name", "objective", "precondition", "status", "priority", "folder", "labels", "component", "customFields"]
 
+# Zephyr Scale's built-in values. Projects can define their own, so tools check
+# arguments against the project's metadata (zephyr_mcp.zephyr.metadata) instead.
 TEST_EXECUTION_STATUSES = ["Pass", "Fail", "Blocked", "Not Executed", "In Progress"]
 
 TEST_CASE_PRIORITIES = ["High", "Normal", "Low"]
@@ -0,0 +1,212 @@
+"""Zephyr Scale project metadata mixin: statuses, priorities, environments and folders."""
+
+import logging
+from typing import Any
+
+from zephyr_mcp.cache.metadata import MetadataCache
+from zephyr_mcp.exceptions import InvalidMetadataError
+
+logger = logging.getLogger("mcp-zephyr")
+
+# Category -> (endpoint, extra query parameters, label used in messages).
+METADATA_CATEGORIES: dict[str, tuple[str, dict[str, str], str]] = {
+    "testcase_status": ("/statuses", {"statusType": "TEST_CASE"}, "status"),
+    "testcycle_status": ("/statuses", {"statusType": "TEST_CYCLE"}, "status"),
+    "testexecution_status": ("/statuses", {"statusType": "TEST_EXECUTION"}, "status"),
+    "priority": ("/priorities", {}, "priority"),
+    "environment": ("/environments", {}, "environment"),
+    "testcase_folder": ("/folders", {"folderType": "TEST_CASE"}, "folder"),
+    "testcycle_folder": ("/folders", {"folderType": "TEST_CYCLE"}, "folder"),
+}
+
+_PLURALS = {"status": "statuses", "priority": "priorities", "environment": "environments", "folder": "folders"}
+
+PAGE_SIZE = 1000
+# Valid values listed in an error message before the rest are summarised.
+_MAX_LISTED = 20
+
+
+class MetadataMixin:
+    """Mixin loading a project's metadata through the fetcher's MetadataCache and resolving tool arguments against it.
+
+    Each category is one list per project, loaded on first use and kept for
+    the cache TTL. resolve_metadata() accepts a name (case-insensitively), an
+    ID or, for folders, a path, so tools can send the canonical name or ID
+    and reject a typo without a round trip. A value missing from a list
+    older than the policy's refresh_after reloads it once, so values added in
+    Zephyr since are still accepted. On the async engine these methods return
+    awaitables.
+    """
+
+    metadata_cache: MetadataCache | None = None
+    cache_scope: str = ""
+
+    def get_metadata(self, project_key: str, category: str) -> list[dict[str, Any]]:
+        """The entries of one category for a project, from the cache or loaded from the API."""
+        _check_category(category)
+        if getattr(self, "is_async", False):
+            return self._get_metadata_async(project_key, category)
+        cached = self._cached_metadata(project_key, category)
+        if cached is not None:
+            return cached[0]
+        return self._store_metadata(project_key, category, self._load_metadata(project_key, category))
+
+    async def _get_metadata_async(self, project_key: str, category: str) -> list[dict[str, Any]]:
+        cached = self._cached_metadata(project_key, category)
+        if cached is not None:
+            return cached[0]
+        return self._store_metadata(project_key, category, await self._load_metadata_async(project_key, category))
+
+    def get_project_metadata(self, project_key: str) -> dict[str, list[dict[str, Any]]]:
+        """Every metadata category of a project."""
+        if getattr(self, "is_async", False):
+            return self._get_project_metadata_async(project_key)
+        logger.debug(f"Getting metadata of project {project_key}")
+        return {category: self.get_metadata(project_key, category) for category in METADATA_CATEGORIES}
+
+    async def _get_project_metadata_async(self, project_key: str) -> dict[str, list[dict[str, Any]]]:
+        logger.debug(f"Getting metadata of project {project_key}")
+        return {category: await self._get_metadata_async(project_key, category) for category in METADATA_CATEGORIES}
+
+    def resolve_metadata(self, project_key: str, category: str, value: str) -> dict[str, Any] | None:
+        """Return the entry value refers to, or None when there is no metadata cache or the project defines no such values.
+
+        Raises InvalidMetadataError for a value the project does not define.
+        """
+        _check_category(category)
+        if getattr(self, "is_async", False):
+            return self._resolve_metadata_async(project_key, category, value)
+        if self.metadata_cache is None:
+            return None
+        entries, age = self._cached_metadata(project_key, category) or (None, 0.0)
+        if entries is None:
+            entries = self._store_metadata(project_key, category, self._load_metadata(project_key, category))
+        entry = find_metadata_entry(category, entries, value)
+        if entry is None and age >= self.metadata_cache.policy.refresh_after:
+            entries = self._store_metadata(project_key, category, self._load_metadata(project_key, category))
+            entry = find_metadata_entry(category, entries, value)
+        return _resolved(project_key, category, value, entries, entry)
+
+    async def _resolve_metadata_async(self, project_key: str, category: str, value: str) -> dict[str, Any] | None:
+        if self.metadata_cache is None:
+            return None
+        entries, age = self._cached_metadata(project_key, category) or (None, 0.0)
+        if entries is None:
+            entries = self._store_metadata(project_key, category, await self._load_metadata_async(project_key, category))
+        entry = find_metadata_entry(category, entries, value)
+        if entry is None and age >= self.metadata_cache.policy.refresh_after:
+            entries = self._store_metadata(project_key, category, await self._load_metadata_async(project_key, category))
+            entry = find_metadata_entry(category, entries, value)
+        return _resolved(project_key, category, value, entries, entry)
+
+    def _cached_metadata(self, project_key: str, category: str) -> tuple[list[dict[str, Any]], float] | None:
+        if self.metadata_cache is None:
+            return None
+        return self.metadata_cache.get(self.cache_scope, project_key, category)
+
+    def _store_metadata(self, project_key: str, category: str, entries: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        if self.metadata_cache is not None:
+            self.metadata_cache.put(self.cache_scope, project_key, category, entries)
+        return entries
+
+    def _load_metadata(self, project_key: str, category: str) -> list[dict[str, Any]]:
+        logger.debug(f"Loading {category} metadata of project {project_key}")
+        values: list[Any] = []
+        start: int | None = 0
+        while start is not None:
+            page = self.client.get(METADATA_CATEGORIES[category][0], params=_page_params(project_key, category, start))
+            start = _next_page(page, values)
+        return _entries(category, values)
+
+    async def _load_metadata_async(self, project_key: str, category: str) -> list[dict[str, Any]]:
+        logger.debug(f"Loading {category} metadata of project {project_key}")
+        values: list[Any] = []
+        start: int | None = 0
+        while start is not None:
+            page = await self.client.get(METADATA_CATEGORIES[category][0], params=_page_params(project_key, category, start))
+            start = _next_page(page, values)
+        return _entries(category, values)
+
+
+def find_metadata_entry(category: str, entries: list[dict[str, Any]], value: str) -> dict[str, Any] | None:
+    """Match value against the entries by exact name, then name ignoring case, then ID; folders also match by path.
+
+    A name shared by several entries is only accepted when exactly one of them
+    matches it case-sensitively; otherwise InvalidMetadataError lists the
+    candidates so the caller can send a path or an ID instead.
+    """
+    wanted = str(value).strip()
+    if category.endswith("_folder"):
+        path = "/" + wanted.strip("/")
+        for entry in entries:
+            if entry.get("path", "").casefold() == path.casefold():
+                return entry
+    for matches in (
+        [entry for entry in entries if entry["name"] == wanted],
+        [entry for entry in entries if entry["name"].casefold() == wanted.casefold()],
+    ):
+        if len(matches) == 1:
+            return matches[0]
+        if matches:
+            _ambiguous(category, value, matches)
+    return next((entry for entry in entries if str(entry["id"]) == wanted), None)
+
+
+def _ambiguous(category: str, value: str, matches: list[dict[str, Any]]) -> None:
+    label = METADATA_CATEGORIES[category][2]
+    if "path" in matches[0]:
+        raise InvalidMetadataError(f"{label.capitalize()} name '{value}' is ambiguous, use the full path: {', '.join(m['path'] for m in matches)}")
+    candidates = ", ".join(f"{m['name']} (ID {m['id']})" for m in matches)
+    raise InvalidMetadataError(f"{label.capitalize()} name '{value}' is ambiguous, use the ID: {candidates}")
+
+
+def _resolved(project_key: str, category: str, value: str, entries: list[dict[str, Any]], entry: dict[str, Any] | None) -> dict[str, Any] | None:
+    if entry is not None or not entries:
+        return entry
+    label = METADATA_CATEGORIES[category][2]
+    names = [entry.get("path", entry["name"]) for entry in entries]
+    listed = ", ".join(names[:_MAX_LISTED]) + (f" and {len(names) - _MAX_LISTED} more" if len(names) > _MAX_LISTED else "")
+    raise InvalidMetadataError(f"Invalid {label} '{value}' for project {project_key}. Valid {_PLURALS[label]}: {listed}")
+
+
+def _check_category(category: str) -> None:
+    if category not in METADATA_CATEGORIES:
+        raise ValueError(f"Unknown metadata category {category!r}. Valid categories: {', '.join(METADATA_CATEGORIES)}")
+
+
+def _page_params(project_key: str, category: str, start: int) -> dict[str, Any]:
+    return {"projectKey": project_key, **METADATA_CATEGORIES[category][1], "maxResults": PAGE_SIZE, "startAt": start}
+
+
+def _next_page(page: Any, values: list[Any]) -> int | None:
+    """Collect a page's values; returns the start of the next page, or None after the last."""
+    batch = (page.get("values") or []) if isinstance(page, dict) else []
+    values.extend(batch)
+    if not batch or page.get("isLast") or len(batch) < PAGE_SIZE:
+        return None
+    return len(values)
+
+
+def _entries(category: str, values: list[Any]) -> list[dict[str, Any]]:
+    """Keep the ID and name of the entries that are not archived; folders also get their full path."""
+    entries = [
+        {"id": value["id"], "name": str(value["name"])}
+        for value in values
+        if isinstance(value, dict) and value.get("id") is not None and value.get("name") and not value.get("archived")
+    ]
+    if category.endswith("_folder"):
+        parents = {value["id"]: value.get("parentId") for value in values if isinstance(value, dict) and value.get("id") is not None}
+        names = {entry["id"]: entry["name"] for entry in entries}
+        for entry in entries:
+            entry["path"] = _folder_path(entry["id"], names, parents)
+    return entries
+
+
+def _folder_path(folder_id: Any, names: dict[Any, str], parents: dict[Any, Any]) -> str:
+    parts: list[str] = []
+    seen: set[Any] = set()
+    while folder_id is not None and folder_id in names and folder_id not in seen:
+        seen.add(folder_id)
+        parts.append(names[folder_id])
+        folder_id = parents.get(folder_id)
+    return "/" + "/".join(reversed(parts))
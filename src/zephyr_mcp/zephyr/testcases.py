@@ -3,18 +3,20 @@
 import logging
 from typing import Any
 
+from zephyr_mcp.cache.mixin import EntityCacheMixin
+from zephyr_mcp.utils.jsoncodec import RawJSON
 from zephyr_mcp.zephyr.constants import DEFAULT_TEST_CASE_FIELDS
 
 logger = logging.getLogger("mcp-zephyr")
 
 
-class TestCasesMixin:
+class TestCasesMixin(EntityCacheMixin):
     """Mixin providing test case operations for the Zephyr Scale API."""
 
-    def get_test_case(self, test_case_key: str) -> dict[str, Any]:
-        """Get a test case by key."""
+    def get_test_case(self, test_case_key: str, raw: bool = False) -> dict[str, Any] | RawJSON:
+        """Get a test case by key; with raw, the response body is returned undecoded."""
         logger.debug(f"Getting test case: {test_case_key}")
-        return self.client.get(f"/testcases/{test_case_key}")
+        return self._cached_get("testcase", test_case_key, f"/testcases/{test_case_key}", raw=raw)
 
     def search_test_cases(
         self,
@@ -54,8 +56,9 @@ class TestCasesMixin:
         folder: str | None = None,
         labels: list[str] | None = None,
         custom_fields: dict[str, Any] | None = None,
+        folder_id: int | None = None,
     ) -> dict[str, Any]:
-        """Create a new test case."""
+        """Create a new test case; folder_id, when known, is sent instead of the folder path."""
         logger.debug(f"Creating test case in project {project_key}: name={name}")
 
         payload: dict[str, Any] = {
@@ -71,14 +74,16 @@ class TestCasesMixin:
             payload["status"] = status
         if priority:
             payload["priority"] = priority
-        if folder:
+        if folder_id is not None:
+            payload["folderId"] = folder_id
+        elif folder:
             payload["folder"] = folder
         if labels:
             payload["labels"] = labels
         if custom_fields:
             payload["customFields"] = custom_fields
 
-        return self.client.post("/testcases", json=payload)
+        return self._create("testcase", lambda: self.client.post("/testcases", json=payload))
 
     def update_test_case(
         self,
@@ -91,8 +96,9 @@ class TestCasesMixin:
         folder: str | None = None,
         labels: list[str] | None = None,
         custom_fields: dict[str, Any] | None = None,
+        folder_id: int | None = None,
     ) -> dict[str, Any]:
-        """Update an existing test case."""
+        """Update an existing test case; folder_id, when known, is sent instead of the folder path."""
         logger.debug(f"Updating test case: {test_case_key}")
 
         payload: dict[str, Any] = {}
@@ -107,22 +113,31 @@ class TestCasesMixin:
             payload["status"] = status
         if priority is not None:
             payload["priority"] = priority
-        if folder is not None:
+        if folder_id is not None:
+            payload["folderId"] = folder_id
+        elif folder is not None:
             payload["folder"] = folder
         if labels is not None:
             payload["labels"] = labels
         if custom_fields is not None:
             payload["customFields"] = custom_fields
 
-        return self.client.put(f"/testcases/{test_case_key}", json=payload)
+        return self._write(
+            "testcase", test_case_key, f"/testcases/{test_case_key}", lambda: self.client.put(f"/testcases/{test_case_key}", json=payload)
+        )
 
     def delete_test_case(self, test_case_key: str) -> dict[str, Any]:
         """Delete a test case."""
         logger.debug(f"Deleting test case: {test_case_key}")
-        return self.client.delete(f"/testcases/{test_case_key}")
+        return self._write("testcase", test_case_key, f"/testcases/{test_case_key}", lambda: self.client.delete(f"/testcases/{test_case_key}"))
 
     def link_test_case_to_issue(self, test_case_key: str, issue_key: str) -> dict[str, Any]:
         """Link a test case to a Jira issue."""
         logger.debug(f"Linking test case {test_case_key} to issue {issue_key}")
         payload = {"issueKey": issue_key}
-        return self.client.post(f"/testcases/{test_case_key}/links/issues", json=payload)
+        return self._write(
+            "testcase",
+            test_case_key,
+            f"/testcases/{test_case_key}",
+            lambda: self.client.post(f"/testcases/{test_case_key}/links/issues", json=payload),
+        )
@@ -3,16 +3,19 @@
 import logging
 from typing import Any
 
+from zephyr_mcp.cache.mixin import EntityCacheMixin
+from zephyr_mcp.utils.jsoncodec import RawJSON
+
 logger = logging.getLogger("mcp-zephyr")
 
 
-class TestCyclesMixin:
+class TestCyclesMixin(EntityCacheMixin):
     """Mixin providing test cycle operations for the Zephyr Scale API."""
 
-    def get_test_cycle(self, test_cycle_key: str) -> dict[str, Any]:
-        """Get a test cycle by key."""
+    def get_test_cycle(self, test_cycle_key: str, raw: bool = False) -> dict[str, Any] | RawJSON:
+        """Get a test cycle by key; with raw, the response body is returned undecoded."""
         logger.debug(f"Getting test cycle: {test_cycle_key}")
-        return self.client.get(f"/testcycles/{test_cycle_key}")
+        return self._cached_get("testcycle", test_cycle_key, f"/testcycles/{test_cycle_key}", raw=raw)
 
     def search_test_cycles(
         self,
@@ -45,8 +48,9 @@ class TestCyclesMixin:
         folder: str | None = None,
         jira_project_version: int | None = None,
         custom_fields: dict[str, Any] | None = None,
+        folder_id: int | None = None,
     ) -> dict[str, Any]:
-        """Create a new test cycle."""
+        """Create a new test cycle; folder_id, when known, is sent instead of the folder path."""
         logger.debug(f"Creating test cycle in project {project_key}: name={name}")
 
         payload: dict[str, Any] = {
@@ -60,14 +64,16 @@ class TestCyclesMixin:
             payload["plannedStartDate"] = planned_start_date
         if planned_end_date:
             payload["plannedEndDate"] = planned_end_date
-        if folder:
+        if folder_id is not None:
+            payload["folderId"] = folder_id
+        elif folder:
             payload["folder"] = folder
         if jira_project_version is not None:
             payload["jiraProjectVersion"] = jira_project_version
         if custom_fields:
             payload["customFields"] = custom_fields
 
-        return self.client.post("/testcycles", json=payload)
+        return self._create("testcycle", lambda: self.client.post("/testcycles", json=payload))
 
     def update_test_cycle(
         self,
@@ -100,15 +106,22 @@ class TestCyclesMixin:
         if custom_fields is not None:
             payload["customFields"] = custom_fields
 
-        return self.client.put(f"/testcycles/{test_cycle_key}", json=payload)
+        return self._write(
+            "testcycle", test_cycle_key, f"/testcycles/{test_cycle_key}", lambda: self.client.put(f"/testcycles/{test_cycle_key}", json=payload)
+        )
 
     def delete_test_cycle(self, test_cycle_key: str) -> dict[str, Any]:
         """Delete a test cycle."""
         logger.debug(f"Deleting test cycle: {test_cycle_key}")
-        return self.client.delete(f"/testcycles/{test_cycle_key}")
+        return self._write("testcycle", test_cycle_key, f"/testcycles/{test_cycle_key}", lambda: self.client.delete(f"/testcycles/{test_cycle_key}"))
 
     def link_test_cycle_to_issue(self, test_cycle_key: str, issue_key: str) -> dict[str, Any]:
         """Link a test cycle to a Jira issue."""
         logger.debug(f"Linking test cycle {test_cycle_key} to issue {issue_key}")
         payload = {"issueKey": issue_key}
-        return self.client.post(f"/testcycles/{test_cycle_key}/links/issues", json=payload)
+        return self._write(
+            "testcycle",
+            test_cycle_key,
+            f"/testcycles/{test_cycle_key}",
+            lambda: self.client.post(f"/testcycles/{test_cycle_key}/links/issues", json=payload),
+        )
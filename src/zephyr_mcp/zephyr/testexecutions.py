@@ -3,16 +3,19 @@
 import logging
 from typing import Any
 
+from zephyr_mcp.cache.mixin import EntityCacheMixin
+from zephyr_mcp.utils.jsoncodec import RawJSON
+
 logger = logging.getLogger("mcp-zephyr")
 
 
-class TestExecutionsMixin:
+class TestExecutionsMixin(EntityCacheMixin):
     """Mixin providing test execution operations for the Zephyr Scale API."""
 
-    def get_test_execution(self, test_execution_id: str) -> dict[str, Any]:
-        """Get a test execution by ID."""
+    def get_test_execution(self, test_execution_id: str, raw: bool = False) -> dict[str, Any] | RawJSON:
+        """Get a test execution by ID; with raw, the response body is returned undecoded."""
         logger.debug(f"Getting test execution: {test_execution_id}")
-        return self.client.get(f"/testexecutions/{test_execution_id}")
+        return self._cached_get("testexecution", str(test_execution_id), f"/testexecutions/{test_execution_id}", raw=raw)
 
     def search_test_executions(
         self,
@@ -72,7 +75,7 @@ class TestExecutionsMixin:
         if custom_fields:
             payload["customFields"] = custom_fields
 
-        return self.client.post("/testexecutions", json=payload)
+        return self._create("testexecution", lambda: self.client.post("/testexecutions", json=payload))
 
     def update_test_execution(
         self,
@@ -102,12 +105,22 @@ class TestExecutionsMixin:
         if custom_fields is not None:
             payload["customFields"] = custom_fields
 
-        return self.client.put(f"/testexecutions/{test_execution_id}", json=payload)
+        return self._write(
+            "testexecution",
+            str(test_execution_id),
+            f"/testexecutions/{test_execution_id}",
+            lambda: self.client.put(f"/testexecutions/{test_execution_id}", json=payload),
+        )
 
     def delete_test_execution(self, test_execution_id: str) -> dict[str, Any]:
         """Delete a test execution."""
         logger.debug(f"Deleting test execution: {test_execution_id}")
-        return self.client.delete(f"/testexecutions/{test_execution_id}")
+        return self._write(
+            "testexecution",
+            str(test_execution_id),
+            f"/testexecutions/{test_execution_id}",
+            lambda: self.client.delete(f"/testexecutions/{test_execution_id}"),
+        )
 
     def get_test_execution_results(
         self,
@@ -0,0 +1,21 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from zephyr_mcp.cache import reset_entity_caches, reset_http_caches, reset_metadata_caches, reset_persistent_caches, reset_redis_caches
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches():
+    """Caches are process-wide; start every test without entries cached by another."""
+    reset_entity_caches()
+    reset_http_caches()
+    reset_metadata_caches()
+    reset_persistent_caches()
+    reset_redis_caches()
+    yield
+    reset_entity_caches()
+    reset_http_caches()
+    reset_metadata_caches()
+    reset_persistent_caches()
+    reset_redis_caches()
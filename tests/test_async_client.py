@@ -0,0 +1,136 @@
+"""Tests for zephyr_mcp.zephyr.async_client module."""
+
+import json
+
+import httpx
+import pytest
+
+from zephyr_mcp.exceptions import ZephyrAuthenticationError
+from zephyr_mcp.utils.jsoncodec import RawJSON
+from zephyr_mcp.utils.retry import RetryPolicy
+from zephyr_mcp.zephyr import AsyncZephyrFetcher
+from zephyr_mcp.zephyr.async_client import AsyncZephyrClient
+from zephyr_mcp.zephyr.config import ZephyrConfig
+
+
+def _make_config(**overrides) -> ZephyrConfig:
+    defaults = {
+        "url": "https://api.zephyrscale.smartbear.com/v2",
+        "auth_type": "pat",
+        "personal_token": "test-token-123",
+        "ssl_verify": True,
+        "http_engine": "async",
+    }
+    defaults.update(overrides)
+    return ZephyrConfig(**defaults)
+
+
+def _mock_transport(client: AsyncZephyrClient, handler) -> list[httpx.Request]:
+    """Route the client's async HTTP traffic through a mock handler, recording requests."""
+    seen: list[httpx.Request] = []
+
+    def _record(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return handler(request)
+
+    client.http = httpx.AsyncClient(transport=httpx.MockTransport(_record), headers=client.http.headers)
+    return seen
+
+
+class TestAsyncZephyrClientInit:
+    def test_copies_session_auth_headers(self):
+        client = AsyncZephyrClient(_make_config())
+        assert client.http.headers["Authorization"] == "Bearer test-token-123"
+        assert client.http.headers["Accept"] == client.session.headers["Accept"]
+
+    def test_custom_headers_copied(self):
+        client = AsyncZephyrClient(_make_config(custom_headers={"X-Trace": "abc"}))
+        assert client.http.headers["X-Trace"] == "abc"
+
+
+class TestAsyncZephyrClientRequest:
+    @pytest.mark.asyncio
+    async def test_get_success(self):
+        client = AsyncZephyrClient(_make_config())
+        seen = _mock_transport(client, lambda request: httpx.Response(200, json={"key": "PROJ-T1"}))
+
+        result = await client.get("/testcases/PROJ-T1", params={"projectKey": "PROJ"})
+
+        assert result == {"key": "PROJ-T1"}
+        assert str(seen[0].url) == "https://api.zephyrscale.smartbear.com/v2/testcases/PROJ-T1?projectKey=PROJ"
+        assert seen[0].headers["Authorization"] == "Bearer test-token-123"
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_get_raw_returns_body_undecoded(self):
+        client = AsyncZephyrClient(_make_config())
+        body = b'{"key": "PROJ-T1", "name": "Login"}'
+        _mock_transport(client, lambda request: httpx.Response(200, content=body))
+
+        result = await client.get("/testcases/PROJ-T1", raw=True)
+
+        assert isinstance(result, RawJSON)
+        assert result.content == body
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_post_sends_json(self):
+        client = AsyncZephyrClient(_make_config())
+        seen = _mock_transport(client, lambda request: httpx.Response(201, json={"id": 1}))
+
+        result = await client.post("/testcases", json={"name": "TC"})
+
+        assert result == {"id": 1}
+        assert seen[0].method == "POST"
+        assert json.loads(seen[0].content) == {"name": "TC"}
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_delete_204_returns_empty(self):
+        client = AsyncZephyrClient(_make_config())
+        _mock_transport(client, lambda request: httpx.Response(204))
+        assert await client.delete("/testcases/PROJ-T1") == {}
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_auth_error_401(self):
+        client = AsyncZephyrClient(_make_config())
+        _mock_transport(client, lambda request: httpx.Response(401, text="Unauthorized"))
+        with pytest.raises(ZephyrAuthenticationError):
+            await client.get("/testcases/PROJ-T1")
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_http_error_raises(self):
+        client = AsyncZephyrClient(_make_config(retry_policy=RetryPolicy(max_attempts=1)))
+        _mock_transport(client, lambda request: httpx.Response(500, text="boom"))
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get("/testcases/PROJ-T1")
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_retries_503_then_succeeds(self):
+        client = AsyncZephyrClient(_make_config(retry_policy=RetryPolicy(backoff_base=0.0)))
+        responses = iter([httpx.Response(503), httpx.Response(200, json={"key": "PROJ-T1"})])
+        seen = _mock_transport(client, lambda request: next(responses))
+
+        assert await client.get("/testcases/PROJ-T1") == {"key": "PROJ-T1"}
+        assert len(seen) == 2
+        await client.aclose()
+
+
+class TestAsyncZephyrFetcher:
+    @pytest.mark.asyncio
+    async def test_mixin_methods_are_awaitable(self):
+        fetcher = AsyncZephyrFetcher(config=_make_config())
+        _mock_transport(fetcher.client, lambda request: httpx.Response(200, json={"key": "PROJ-T1"}))
+
+        assert fetcher.is_async is True
+        assert await fetcher.get_test_case("PROJ-T1") == {"key": "PROJ-T1"}
+        await fetcher.aclose()
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_http_client(self):
+        fetcher = AsyncZephyrFetcher(config=_make_config())
+        await fetcher.aclose()
+        assert fetcher.client.http.is_closed
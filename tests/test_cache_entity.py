@@ -0,0 +1,469 @@
+"""Tests for zephyr_mcp.cache entity cache and read-through mixin."""
+
+import asyncio
+import os
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+import requests
+
+from zephyr_mcp.cache import EntityCache, EntityCacheMixin, EntityCachePolicy, StaleJSON, get_entity_cache, reset_entity_caches
+from zephyr_mcp.exceptions import CircuitOpenError, EntityNotFoundError
+from zephyr_mcp.server.tools import _format_result
+from zephyr_mcp.squad import SquadFetcher
+from zephyr_mcp.squad.config import ZephyrSquadConfig
+from zephyr_mcp.utils.jsoncodec import RawJSON
+from zephyr_mcp.utils.metrics import metrics
+from zephyr_mcp.zephyr import ZephyrFetcher
+from zephyr_mcp.zephyr.config import ZephyrConfig
+
+SCOPE = "https://zephyr.example|pat:abc"
+
+
+def _cache(
+    ttl: float = 60.0,
+    max_bytes: int = 1024 * 1024,
+    negative_ttl: float = 30.0,
+    stale_while_revalidate: float = 0.0,
+    stale_if_error: float = 0.0,
+    max_stale: tuple[tuple[str, float], ...] = (),
+) -> EntityCache:
+    policy = EntityCachePolicy(
+        ttl=ttl,
+        max_bytes=max_bytes,
+        negative_ttl=negative_ttl,
+        stale_while_revalidate=stale_while_revalidate,
+        stale_if_error=stale_if_error,
+        max_stale=max_stale,
+    )
+    return EntityCache(policy, name="test")
+
+
+def _not_found(url: str = "https://zephyr.example/v2/testcases/PROJ-T999") -> requests.HTTPError:
+    return requests.HTTPError(f"404 Client Error: Not Found for url: {url}", response=MagicMock(status_code=404))
+
+
+class _Fetcher(EntityCacheMixin):
+    def __init__(self, cache: EntityCache | None, client: MagicMock, is_async: bool = False) -> None:
+        self.entity_cache = cache
+        self.cache_scope = SCOPE
+        self.client = client
+        self.is_async = is_async
+
+
+class TestEntityCachePolicy:
+    def test_defaults(self):
+        with patch.dict(os.environ, {}, clear=True):
+            policy = EntityCachePolicy.from_env()
+        assert policy.enabled
+        assert policy.ttl == 60.0
+        assert policy.max_bytes == 64 * 1024 * 1024
+
+    def test_from_env(self):
+        env = {"ZEPHYR_ENTITY_CACHE_TTL": "5", "ZEPHYR_ENTITY_CACHE_MAX_MB": "0.5", "ZEPHYR_ENTITY_CACHE_NEGATIVE_TTL": "2"}
+        with patch.dict(os.environ, env, clear=True):
+            policy = EntityCachePolicy.from_env()
+        assert policy.ttl == 5.0
+        assert policy.max_bytes == 512 * 1024
+        assert policy.negative_ttl == 2.0
+
+    @pytest.mark.parametrize("env", [{"ZEPHYR_ENTITY_CACHE": "false"}, {"ZEPHYR_ENTITY_CACHE_TTL": "0"}, {"ZEPHYR_ENTITY_CACHE_MAX_MB": "0"}])
+    def test_disabled(self, env):
+        with patch.dict(os.environ, env, clear=True):
+            policy = EntityCachePolicy.from_env()
+        assert not policy.enabled
+        assert get_entity_cache("zephyr", policy) is None
+
+
+class TestEntityCache:
+    def test_hit_and_miss(self):
+        cache = _cache()
+        assert cache.get(SCOPE, "testcase", "PROJ-T1") is None
+        cache.put(SCOPE, "testcase", "PROJ-T1", b'{"key":"PROJ-T1"}')
+        assert cache.get(SCOPE, "testcase", "PROJ-T1") == b'{"key":"PROJ-T1"}'
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_entries_are_scoped(self):
+        cache = _cache()
+        cache.put(SCOPE, "testcase", "PROJ-T1", b"{}")
+        assert cache.get("https://zephyr.example|pat:other", "testcase", "PROJ-T1") is None
+        assert cache.get(SCOPE, "testcycle", "PROJ-T1") is None
+
+    def test_expires_after_ttl(self):
+        cache = _cache(ttl=10.0)
+        with patch("zephyr_mcp.cache.entity.time.monotonic", return_value=100.0):
+            cache.put(SCOPE, "testcase", "PROJ-T1", b"{}")
+        with patch("zephyr_mcp.cache.entity.time.monotonic", return_value=109.0):
+            assert cache.get(SCOPE, "testcase", "PROJ-T1") == b"{}"
+        with patch("zephyr_mcp.cache.entity.time.monotonic", return_value=110.0):
+            assert cache.get(SCOPE, "testcase", "PROJ-T1") is None
+        assert cache.stats()["entries"] == 0
+
+    def test_evicts_least_recently_used_past_max_bytes(self):
+        body = b"x" * 300
+        cache = _cache(max_bytes=1100)
+        cache.put(SCOPE, "testcase", "T1", body)
+        cache.put(SCOPE, "testcase", "T2", body)
+        cache.get(SCOPE, "testcase", "T1")
+        cache.put(SCOPE, "testcase", "T3", body)
+
+        assert cache.get(SCOPE, "testcase", "T2") is None
+        assert cache.get(SCOPE, "testcase", "T1") == body
+        assert cache.get(SCOPE, "testcase", "T3") == body
+        stats = cache.stats()
+        assert stats["evictions"] == 1
+        assert stats["entries"] == 2
+        assert stats["bytes"] <= 1100
+        assert metrics.get("zephyr_entity_cache_evictions_total", labels={"cache": "test"}) >= 1
+
+    def test_skips_bodies_larger_than_the_cache(self):
+        cache = _cache(max_bytes=1000)
+        cache.put(SCOPE, "testcase", "T1", b"x" * 1000)
+        assert cache.stats()["entries"] == 0
+
+    def test_put_after_invalidation_is_skipped(self):
+        cache = _cache()
+        generation = cache.generation()
+        cache.invalidate(SCOPE, "testcase", "PROJ-T1")
+        cache.put(SCOPE, "testcase", "PROJ-T1", b'{"stale":true}', generation=generation)
+        assert cache.get(SCOPE, "testcase", "PROJ-T1") is None
+
+    def test_clear(self):
+        cache = _cache()
+        cache.put(SCOPE, "testcase", "PROJ-T1", b"{}")
+        cache.clear()
+        assert cache.stats()["entries"] == 0
+        assert cache.stats()["bytes"] == 0
+
+
+class TestGetEntityCache:
+    def test_shared_per_key(self):
+        policy = EntityCachePolicy()
+        assert get_entity_cache("zephyr", policy) is get_entity_cache("zephyr", policy)
+        assert get_entity_cache("zephyr", policy) is not get_entity_cache("squad", policy)
+
+    def test_rebuilt_when_policy_changes(self):
+        cache = get_entity_cache("zephyr", EntityCachePolicy())
+        assert get_entity_cache("zephyr", EntityCachePolicy(ttl=5.0)) is not cache
+
+    def test_reset(self):
+        cache = get_entity_cache("zephyr", EntityCachePolicy())
+        reset_entity_caches()
+        assert get_entity_cache("zephyr", EntityCachePolicy()) is not cache
+
+
+class TestEntityCacheMixin:
+    def test_without_cache_calls_client(self):
+        client = MagicMock()
+        fetcher = _Fetcher(None, client)
+        assert fetcher._cached_get("testcase", "PROJ-T1", "/testcases/PROJ-T1") is client.get.return_value
+        client.get.assert_called_once_with("/testcases/PROJ-T1", raw=False)
+
+    def test_second_read_is_served_from_cache(self):
+        client = MagicMock()
+        client.get.return_value = RawJSON(b'{"key":"PROJ-T1"}')
+        fetcher = _Fetcher(_cache(), client)
+
+        assert fetcher._cached_get("testcase", "PROJ-T1", "/testcases/PROJ-T1") == {"key": "PROJ-T1"}
+        assert fetcher._cached_get("testcase", "PROJ-T1", "/testcases/PROJ-T1") == {"key": "PROJ-T1"}
+        client.get.assert_called_once_with("/testcases/PROJ-T1", raw=True)
+
+    def test_decoded_results_are_independent_copies(self):
+        client = MagicMock()
+        client.get.return_value = RawJSON(b'{"key":"PROJ-T1"}')
+        fetcher = _Fetcher(_cache(), client)
+
+        fetcher._cached_get("testcase", "PROJ-T1", "/testcases/PROJ-T1")["key"] = "changed"
+        assert fetcher._cached_get("testcase", "PROJ-T1", "/testcases/PROJ-T1") == {"key": "PROJ-T1"}
+
+    def test_raw_read_returns_raw_json(self):
+        client = MagicMock()
+        client.get.return_value = RawJSON(b'{"key":"PROJ-T1"}')
+        fetcher = _Fetcher(_cache(), client)
+
+        fetcher._cached_get("testcase", "PROJ-T1", "/testcases/PROJ-T1")
+        result = fetcher._cached_get("testcase", "PROJ-T1", "/testcases/PROJ-T1", raw=True)
+        assert isinstance(result, RawJSON)
+        assert result.content == b'{"key":"PROJ-T1"}'
+
+    def test_write_invalidates(self):
+        client = MagicMock()
+        client.get.return_value = RawJSON(b"{}")
+        fetcher = _Fetcher(_cache(), client)
+
+        fetcher._cached_get("testcase", "PROJ-T1", "/testcases/PROJ-T1")
+        assert fetcher._write("testcase", "PROJ-T1", "/testcases/PROJ-T1", lambda: "sent") == "sent"
+        fetcher._cached_get("testcase", "PROJ-T1", "/testcases/PROJ-T1")
+        assert client.get.call_count == 2
+        client.invalidate_cached.assert_called_once_with("/testcases/PROJ-T1")
+
+    def test_failed_write_still_invalidates(self):
+        cache = _cache()
+        cache.put(SCOPE, "testcase", "PROJ-T1", b"{}")
+        fetcher = _Fetcher(cache, MagicMock())
+
+        def send():
+            raise RuntimeError("timed out")
+
+        with pytest.raises(RuntimeError):
+            fetcher._write("testcase", "PROJ-T1", "/testcases/PROJ-T1", send)
+        assert cache.get(SCOPE, "testcase", "PROJ-T1") is None
+
+    @pytest.mark.asyncio
+    async def test_async_read_through_and_write(self):
+        client = MagicMock()
+        client.get = AsyncMock(return_value=RawJSON(b'{"id":1}'))
+        fetcher = _Fetcher(_cache(), client, is_async=True)
+
+        assert await fetcher._cached_get("testexecution", "1", "/testexecutions/1") == {"id": 1}
+        assert await fetcher._cached_get("testexecution", "1", "/testexecutions/1") == {"id": 1}
+        assert client.get.await_count == 1
+
+        assert await fetcher._write("testexecution", "1", "/testexecutions/1", AsyncMock(return_value=None)) is None
+        await fetcher._cached_get("testexecution", "1", "/testexecutions/1")
+        assert client.get.await_count == 2
+
+
+class TestNegativeCaching:
+    def test_repeated_404_is_served_from_cache(self):
+        client = MagicMock()
+        client.get.side_effect = _not_found()
+        cache = _cache()
+        fetcher = _Fetcher(cache, client)
+
+        with pytest.raises(requests.HTTPError):
+            fetcher._cached_get("testcase", "PROJ-T999", "/testcases/PROJ-T999")
+        with pytest.raises(EntityNotFoundError, match="404 Client Error: Not Found"):
+            fetcher._cached_get("testcase", "PROJ-T999", "/testcases/PROJ-T999")
+
+        client.get.assert_called_once()
+        assert cache.stats()["negative_hits"] == 1
+        assert metrics.get("zephyr_entity_cache_negative_hits_total", labels={"cache": "test", "kind": "testcase"}) >= 1
+
+    def test_other_errors_are_not_cached(self):
+        client = MagicMock()
+        client.get.side_effect = requests.HTTPError("500 Server Error", response=MagicMock(status_code=500))
+        fetcher = _Fetcher(_cache(), client)
+
+        for _ in range(2):
+            with pytest.raises(requests.HTTPError):
+                fetcher._cached_get("testcase", "PROJ-T1", "/testcases/PROJ-T1")
+        assert client.get.call_count == 2
+
+    def test_expires_after_negative_ttl(self):
+        cache = _cache(negative_ttl=5.0)
+        with patch("zephyr_mcp.cache.entity.time.monotonic", return_value=100.0):
+            cache.put_missing(SCOPE, "testcase", "PROJ-T999", "404")
+        with patch("zephyr_mcp.cache.entity.time.monotonic", return_value=104.0):
+            assert cache.missing(SCOPE, "testcase", "PROJ-T999") == "404"
+        with patch("zephyr_mcp.cache.entity.time.monotonic", return_value=105.0):
+            assert cache.missing(SCOPE, "testcase", "PROJ-T999") is None
+
+    def test_zero_negative_ttl_disables(self):
+        cache = _cache(negative_ttl=0)
+        cache.put_missing(SCOPE, "testcase", "PROJ-T999", "404")
+        assert cache.missing(SCOPE, "testcase", "PROJ-T999") is None
+
+    def test_create_of_the_key_invalidates(self):
+        client = MagicMock()
+        client.get.side_effect = [_not_found(), RawJSON(b'{"key":"PROJ-T999"}')]
+        client.post.return_value = {"id": 999, "key": "PROJ-T999"}
+        fetcher = _Fetcher(_cache(), client)
+
+        with pytest.raises(requests.HTTPError):
+            fetcher._cached_get("testcase", "PROJ-T999", "/testcases/PROJ-T999")
+        assert fetcher._create("testcase", lambda: client.post("/testcases")) == {"id": 999, "key": "PROJ-T999"}
+        assert fetcher._cached_get("testcase", "PROJ-T999", "/testcases/PROJ-T999") == {"key": "PROJ-T999"}
+
+    def test_404_racing_a_create_is_not_remembered(self):
+        cache = _cache()
+        generation = cache.generation()
+        cache.invalidate(SCOPE, "testcase", "PROJ-T999")
+        cache.put_missing(SCOPE, "testcase", "PROJ-T999", "404", generation=generation)
+        assert cache.missing(SCOPE, "testcase", "PROJ-T999") is None
+
+    @pytest.mark.asyncio
+    async def test_async_404_is_served_from_cache(self):
+        request = httpx.Request("GET", "https://zephyr.example/v2/testcycles/PROJ-R9")
+        error = httpx.HTTPStatusError("Client error '404 Not Found'", request=request, response=httpx.Response(404, request=request))
+        client = MagicMock()
+        client.get = AsyncMock(side_effect=error)
+        fetcher = _Fetcher(_cache(), client, is_async=True)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await fetcher._cached_get("testcycle", "PROJ-R9", "/testcycles/PROJ-R9")
+        with pytest.raises(EntityNotFoundError):
+            await fetcher._cached_get("testcycle", "PROJ-R9", "/testcycles/PROJ-R9")
+        assert client.get.await_count == 1
+
+    def test_squad_get_execution(self):
+        config = ZephyrSquadConfig(auth_type="pat", jira_base_url="https://jira.example", pat_token="tok")
+        response = requests.Response()
+        response.status_code = 404
+        response.url = "https://jira.example/rest/zapi/latest/execution/42"
+        with patch("requests.Session.request", return_value=response) as request:
+            fetcher = SquadFetcher(config)
+            for _ in range(3):
+                with pytest.raises((requests.HTTPError, EntityNotFoundError), match="404"):
+                    fetcher.get_execution("42")
+        assert request.call_count == 1
+
+
+class TestStaleReads:
+    @staticmethod
+    def _read_then_wait(fetcher: _Fetcher, seconds: float) -> Any:
+        """Read the cycle into the cache at t=100 and return a clock patch for `seconds` later."""
+        with patch("zephyr_mcp.cache.entity.time.monotonic", return_value=100.0):
+            fetcher._cached_get("testcycle", "PROJ-R1", "/testcycles/PROJ-R1")
+        return patch("zephyr_mcp.cache.entity.time.monotonic", return_value=100.0 + seconds)
+
+    def test_policy_from_env(self):
+        env = {
+            "ZEPHYR_ENTITY_CACHE_STALE_WHILE_REVALIDATE": "10",
+            "ZEPHYR_ENTITY_CACHE_STALE_IF_ERROR": "300",
+            "ZEPHYR_ENTITY_CACHE_MAX_STALE": "testexecution=5, execution=bad",
+        }
+        with patch.dict(os.environ, env, clear=True):
+            policy = EntityCachePolicy.from_env()
+        assert policy.max_stale == (("testexecution", 5.0),)
+        assert policy.stale_window("testcycle", on_error=False) == 10.0
+        assert policy.stale_window("testcycle", on_error=True) == 300.0
+        assert policy.stale_window("testexecution", on_error=True) == 5.0
+        assert policy.retention("testcycle") == 300.0
+
+    def test_stale_entry_is_served_while_it_refreshes(self):
+        client = MagicMock()
+        client.get.side_effect = [RawJSON(b'{"v":1}'), RawJSON(b'{"v":2}')]
+        cache = _cache(ttl=10.0, stale_while_revalidate=30.0)
+        fetcher = _Fetcher(cache, client)
+        later = self._read_then_wait(fetcher, 15.0)
+
+        with later, patch("zephyr_mcp.cache.mixin._refresh_pool") as pool:
+            result = fetcher._cached_get("testcycle", "PROJ-R1", "/testcycles/PROJ-R1", raw=True)
+            again = fetcher._cached_get("testcycle", "PROJ-R1", "/testcycles/PROJ-R1", raw=True)
+            assert isinstance(result, StaleJSON)
+            assert result.content == b'{"v":1}'
+            assert result.age == 15.0
+            assert result.error is None
+            assert isinstance(again, StaleJSON)
+            pool.return_value.submit.assert_called_once()
+            pool.return_value.submit.call_args.args[0](*pool.return_value.submit.call_args.args[1:])
+            assert fetcher._cached_get("testcycle", "PROJ-R1", "/testcycles/PROJ-R1") == {"v": 2}
+
+        assert client.get.call_count == 2
+        assert cache.stats()["stale_served"] == 2
+        assert metrics.get("zephyr_entity_cache_stale_total", labels={"cache": "test", "kind": "testcycle", "reason": "revalidate"}) >= 2
+
+    def test_past_the_window_the_read_waits_for_the_api(self):
+        client = MagicMock()
+        client.get.side_effect = [RawJSON(b'{"v":1}'), RawJSON(b'{"v":2}')]
+        cache = _cache(ttl=10.0, stale_while_revalidate=30.0)
+        fetcher = _Fetcher(cache, client)
+        later = self._read_then_wait(fetcher, 41.0)
+
+        with later:
+            assert fetcher._cached_get("testcycle", "PROJ-R1", "/testcycles/PROJ-R1") == {"v": 2}
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            CircuitOpenError("circuit open"),
+            requests.ConnectionError("connection refused"),
+            requests.HTTPError("503 Server Error", response=MagicMock(status_code=503)),
+        ],
+    )
+    def test_stale_entry_is_served_when_the_api_fails(self, error):
+        client = MagicMock()
+        client.get.side_effect = [RawJSON(b'{"v":1}'), error]
+        cache = _cache(ttl=10.0, stale_if_error=600.0)
+        fetcher = _Fetcher(cache, client)
+        later = self._read_then_wait(fetcher, 300.0)
+
+        with later:
+            result = fetcher._cached_get("testcycle", "PROJ-R1", "/testcycles/PROJ-R1", raw=True)
+        assert isinstance(result, StaleJSON)
+        assert result.error == str(error)
+        assert "STALE" in result.describe()
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            requests.HTTPError("403 Client Error", response=MagicMock(status_code=403)),
+            requests.HTTPError("400 Client Error", response=MagicMock(status_code=400)),
+        ],
+    )
+    def test_client_errors_are_raised(self, error):
+        client = MagicMock()
+        client.get.side_effect = [RawJSON(b'{"v":1}'), error]
+        fetcher = _Fetcher(_cache(ttl=10.0, stale_if_error=600.0), client)
+        later = self._read_then_wait(fetcher, 300.0)
+
+        with later, pytest.raises(requests.HTTPError):
+            fetcher._cached_get("testcycle", "PROJ-R1", "/testcycles/PROJ-R1")
+
+    def test_per_kind_bound_limits_staleness(self):
+        client = MagicMock()
+        client.get.side_effect = [RawJSON(b'{"v":1}'), CircuitOpenError("circuit open")]
+        fetcher = _Fetcher(_cache(ttl=10.0, stale_if_error=600.0, max_stale=(("testcycle", 60.0),)), client)
+        later = self._read_then_wait(fetcher, 100.0)
+
+        with later, pytest.raises(CircuitOpenError):
+            fetcher._cached_get("testcycle", "PROJ-R1", "/testcycles/PROJ-R1")
+
+    def test_404_drops_the_stale_entry(self):
+        cache = _cache(ttl=10.0, stale_if_error=600.0)
+        with patch("zephyr_mcp.cache.entity.time.monotonic", return_value=100.0):
+            cache.put(SCOPE, "testcycle", "PROJ-R1", b"{}")
+        cache.put_missing(SCOPE, "testcycle", "PROJ-R1", "404")
+        with patch("zephyr_mcp.cache.entity.time.monotonic", return_value=150.0):
+            assert cache.stale(SCOPE, "testcycle", "PROJ-R1", error="down") is None
+
+    @pytest.mark.asyncio
+    async def test_async_refresh_runs_in_the_background(self):
+        client = MagicMock()
+        client.get = AsyncMock(side_effect=[RawJSON(b'{"v":1}'), RawJSON(b'{"v":2}')])
+        cache = _cache(ttl=10.0, stale_while_revalidate=30.0)
+        fetcher = _Fetcher(cache, client, is_async=True)
+        with patch("zephyr_mcp.cache.entity.time.monotonic", return_value=100.0):
+            await fetcher._cached_get("testcycle", "PROJ-R1", "/testcycles/PROJ-R1")
+
+        with patch("zephyr_mcp.cache.entity.time.monotonic", return_value=115.0):
+            assert isinstance(await fetcher._cached_get("testcycle", "PROJ-R1", "/testcycles/PROJ-R1", raw=True), StaleJSON)
+            await asyncio.sleep(0)
+            assert await fetcher._cached_get("testcycle", "PROJ-R1", "/testcycles/PROJ-R1") == {"v": 2}
+        assert client.get.await_count == 2
+
+    def test_tool_result_is_marked(self):
+        result = _format_result("Test Cycle", StaleJSON(b'{"key":"PROJ-R1"}', 42.0, "circuit open"))
+        assert result.startswith("## Test Cycle\n> STALE: cached copy from 42s ago")
+        assert '{"key":"PROJ-R1"}' in result
+
+
+class TestZephyrFetcherCaching:
+    def test_repeated_get_test_case_hits_the_api_once(self):
+        config = ZephyrConfig(url="https://api.zephyrscale.smartbear.com/v2", auth_type="pat", personal_token="tok")
+        response = MagicMock(status_code=200, content=b'{"key":"PROJ-T1"}', headers={})
+        with patch("requests.Session.request", return_value=response) as request:
+            fetcher = ZephyrFetcher(config)
+            assert fetcher.get_test_case("PROJ-T1") == {"key": "PROJ-T1"}
+            assert fetcher.get_test_case("PROJ-T1") == {"key": "PROJ-T1"}
+            fetcher.update_test_case("PROJ-T1", {"name": "Renamed"})
+            assert fetcher.get_test_case("PROJ-T1") == {"key": "PROJ-T1"}
+
+        gets = [call for call in request.call_args_list if call.args[0] == "GET"]
+        assert len(gets) == 2
+
+    def test_credentials_do_not_share_entries(self):
+        first = ZephyrConfig(url="https://api.zephyrscale.smartbear.com/v2", auth_type="pat", personal_token="tok")
+        second = ZephyrConfig(url="https://api.zephyrscale.smartbear.com/v2", auth_type="pat", personal_token="other")
+        assert first.cache_scope() != second.cache_scope()
+
+    def test_squad_secrets_do_not_share_entries(self):
+        response = MagicMock(status_code=200, content=b'{"id":42}', headers={})
+        with patch("requests.Session.request", return_value=response) as request:
+            SquadFetcher(ZephyrSquadConfig(access_key="ak", secret_key="sk", account_id="aid")).get_execution("42")
+            SquadFetcher(ZephyrSquadConfig(access_key="ak", secret_key="wrong", account_id="aid")).get_execution("42")
+        assert request.call_count == 2
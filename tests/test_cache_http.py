@@ -0,0 +1,249 @@
+"""Tests for zephyr_mcp.cache.http conditional request cache."""
+
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+from requests.structures import CaseInsensitiveDict
+
+from zephyr_mcp.cache import CachedResponse, HTTPCache, HTTPCachePolicy, PersistentCache, PersistentCachePolicy, get_http_cache
+from zephyr_mcp.squad.client import ZephyrSquadClient
+from zephyr_mcp.squad.config import ZephyrSquadConfig
+from zephyr_mcp.squad.pat_client import ZephyrSquadPatClient
+from zephyr_mcp.utils.http import RequestPipeline
+from zephyr_mcp.utils.metrics import metrics
+from zephyr_mcp.utils.retry import RetryPolicy
+from zephyr_mcp.zephyr import ZephyrFetcher
+from zephyr_mcp.zephyr.client import ZephyrClient
+from zephyr_mcp.zephyr.config import ZephyrConfig
+
+KEY = ("GET", "https://zephyr.example/v2/testcycles", "[('projectKey', \"'PROJ'\")]")
+
+
+def _response(status_code: int = 200, content: bytes = b'{"values":[]}', **headers: str) -> MagicMock:
+    return MagicMock(status_code=status_code, content=content, headers=CaseInsensitiveDict({k.replace("_", "-"): v for k, v in headers.items()}))
+
+
+def _pipeline(cache: HTTPCache, scope: str = "zephyr.example|cred") -> RequestPipeline:
+    return RequestPipeline("zephyr.example", RetryPolicy(max_attempts=1), scope=scope, http_cache=cache)
+
+
+def _cache(max_bytes: int = 1024 * 1024) -> HTTPCache:
+    return HTTPCache(HTTPCachePolicy(max_bytes=max_bytes), name="zephyr.example")
+
+
+class TestHTTPCachePolicy:
+    def test_enabled_by_default(self):
+        with patch.dict(os.environ, {}, clear=True):
+            policy = HTTPCachePolicy.from_env()
+        assert policy.enabled
+        assert policy.max_bytes == 32 * 1024 * 1024
+
+    def test_squad_prefix_falls_back(self):
+        with patch.dict(os.environ, {"ZEPHYR_HTTP_CACHE_MAX_MB": "8", "ZEPHYR_SQUAD_HTTP_CACHE": "false"}, clear=True):
+            squad = HTTPCachePolicy.from_env("ZEPHYR_SQUAD", "ZEPHYR")
+            scale = HTTPCachePolicy.from_env()
+        assert not squad.enabled
+        assert scale.enabled
+        assert scale.max_bytes == 8 * 1024 * 1024
+
+    def test_disabled_policy_has_no_cache(self):
+        assert get_http_cache("zephyr.example", HTTPCachePolicy(enabled=False)) is None
+
+
+class TestConditionalRevalidation:
+    def test_etag_is_sent_and_304_reuses_body(self):
+        pipeline = _pipeline(_cache())
+        first = _response(content=b'{"values":[1]}', ETag='"v1"')
+        send = MagicMock(side_effect=[first, _response(304, b"", ETag='"v1"')])
+        headers: dict[str, str] = {}
+
+        assert pipeline.send(send, "GET", headers=headers, coalesce_key=KEY) is first
+        assert headers == {}
+        result = pipeline.send(send, "GET", headers=headers, coalesce_key=KEY)
+
+        assert headers["If-None-Match"] == '"v1"'
+        assert isinstance(result, CachedResponse)
+        assert result.status_code == 200
+        assert result.content == b'{"values":[1]}'
+        assert metrics.get("zephyr_http_cache_total", labels={"target": "zephyr.example", "result": "revalidated"}) >= 1
+
+    def test_last_modified_is_sent(self):
+        pipeline = _pipeline(_cache())
+        send = MagicMock(side_effect=[_response(Last_Modified="Tue, 01 Sep 2026 10:00:00 GMT"), _response()])
+        pipeline.send(send, "GET", headers={}, coalesce_key=KEY)
+        headers: dict[str, str] = {}
+        pipeline.send(send, "GET", headers=headers, coalesce_key=KEY)
+        assert headers == {"If-Modified-Since": "Tue, 01 Sep 2026 10:00:00 GMT"}
+
+    def test_changed_response_replaces_entry(self):
+        pipeline = _pipeline(_cache())
+        send = MagicMock(side_effect=[_response(content=b"[1]", ETag='"v1"'), _response(content=b"[2]", ETag='"v2"'), _response(304, b"")])
+        pipeline.send(send, "GET", headers={}, coalesce_key=KEY)
+        assert pipeline.send(send, "GET", headers={}, coalesce_key=KEY).content == b"[2]"
+        headers: dict[str, str] = {}
+        assert pipeline.send(send, "GET", headers=headers, coalesce_key=KEY).content == b"[2]"
+        assert headers["If-None-Match"] == '"v2"'
+
+    def test_without_validators_nothing_is_stored(self):
+        pipeline = _pipeline(_cache())
+        send = MagicMock(return_value=_response())
+        pipeline.send(send, "GET", headers={}, coalesce_key=KEY)
+        headers: dict[str, str] = {}
+        pipeline.send(send, "GET", headers=headers, coalesce_key=KEY)
+        assert headers == {}
+
+    def test_requests_without_key_are_not_cached(self):
+        pipeline = _pipeline(_cache())
+        send = MagicMock(return_value=_response(ETag='"v1"'))
+        pipeline.send(send, "POST", headers={})
+        headers: dict[str, str] = {}
+        pipeline.send(send, "POST", headers=headers)
+        assert headers == {}
+
+    def test_scopes_do_not_share_entries(self):
+        cache = _cache()
+        send = MagicMock(return_value=_response(ETag='"v1"'))
+        _pipeline(cache, scope="zephyr.example|a").send(send, "GET", headers={}, coalesce_key=KEY)
+        headers: dict[str, str] = {}
+        _pipeline(cache, scope="zephyr.example|b").send(send, "GET", headers=headers, coalesce_key=KEY)
+        assert headers == {}
+
+    @pytest.mark.asyncio
+    async def test_async_revalidation(self):
+        pipeline = _pipeline(_cache())
+        responses = iter([_response(content=b"[1]", ETag='"v1"'), _response(304, b"")])
+
+        async def send():
+            return next(responses)
+
+        await pipeline.send_async(send, "GET", headers={}, coalesce_key=KEY)
+        headers: dict[str, str] = {}
+        result = await pipeline.send_async(send, "GET", headers=headers, coalesce_key=KEY)
+        assert headers["If-None-Match"] == '"v1"'
+        assert result.content == b"[1]"
+
+
+class TestCacheControl:
+    def test_max_age_serves_without_request(self):
+        pipeline = _pipeline(_cache())
+        send = MagicMock(return_value=_response(content=b"[1]", Cache_Control="private, max-age=30"))
+        pipeline.send(send, "GET", headers={}, coalesce_key=KEY)
+        result = pipeline.send(send, "GET", headers={}, coalesce_key=KEY)
+        assert send.call_count == 1
+        assert result.content == b"[1]"
+
+    def test_age_counts_against_max_age(self):
+        pipeline = _pipeline(_cache())
+        send = MagicMock(return_value=_response(Cache_Control="max-age=30", Age="30", ETag='"v1"'))
+        pipeline.send(send, "GET", headers={}, coalesce_key=KEY)
+        pipeline.send(send, "GET", headers={}, coalesce_key=KEY)
+        assert send.call_count == 2
+
+    def test_expired_entry_is_revalidated(self):
+        pipeline = _pipeline(_cache())
+        send = MagicMock(side_effect=[_response(Cache_Control="max-age=30", ETag='"v1"'), _response(304, b"")])
+        with patch("zephyr_mcp.cache.http.time.monotonic", return_value=100.0):
+            pipeline.send(send, "GET", headers={}, coalesce_key=KEY)
+        headers: dict[str, str] = {}
+        with patch("zephyr_mcp.cache.http.time.monotonic", return_value=131.0):
+            pipeline.send(send, "GET", headers=headers, coalesce_key=KEY)
+        assert send.call_count == 2
+        assert headers["If-None-Match"] == '"v1"'
+
+    def test_no_cache_always_revalidates(self):
+        pipeline = _pipeline(_cache())
+        send = MagicMock(side_effect=[_response(Cache_Control="no-cache, max-age=60", ETag='"v1"'), _response(304, b"")])
+        pipeline.send(send, "GET", headers={}, coalesce_key=KEY)
+        pipeline.send(send, "GET", headers={}, coalesce_key=KEY)
+        assert send.call_count == 2
+
+    def test_no_store_is_not_stored(self):
+        pipeline = _pipeline(_cache())
+        send = MagicMock(return_value=_response(Cache_Control="no-store", ETag='"v1"'))
+        pipeline.send(send, "GET", headers={}, coalesce_key=KEY)
+        headers: dict[str, str] = {}
+        pipeline.send(send, "GET", headers=headers, coalesce_key=KEY)
+        assert headers == {}
+
+
+class TestHTTPCacheBounds:
+    def test_evicts_least_recently_used(self):
+        cache = _cache(max_bytes=1000)
+        for key in ("a", "b", "c"):
+            cache.complete(key, None, _response(content=b"x" * 300, ETag='"v"'))
+        assert cache.prepare("a", {}) is None
+        assert cache.prepare("c", {}) is not None
+
+    def test_skips_oversized_bodies(self):
+        cache = _cache(max_bytes=100)
+        cache.complete("a", None, _response(content=b"x" * 200, ETag='"v"'))
+        assert cache.prepare("a", {}) is None
+
+
+class TestClientIntegration:
+    def test_zephyr_client_revalidates_listing(self):
+        config = ZephyrConfig(url="https://zephyr.example/v2", auth_type="pat", personal_token="tok")
+        client = ZephyrClient(config)
+        listing = MagicMock(status_code=200, content=b'{"values":[{"key":"PROJ-R1"}]}', headers=CaseInsensitiveDict({"ETag": '"abc"'}))
+        not_modified = MagicMock(status_code=304, content=b"", headers=CaseInsensitiveDict({"ETag": '"abc"'}))
+        with patch.object(client.session, "request", side_effect=[listing, not_modified]) as request:
+            assert client.get("/testcycles", params={"projectKey": "PROJ"}) == {"values": [{"key": "PROJ-R1"}]}
+            assert client.get("/testcycles", params={"projectKey": "PROJ"}) == {"values": [{"key": "PROJ-R1"}]}
+
+        assert "If-None-Match" not in request.call_args_list[0].kwargs["headers"]
+        assert request.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"abc"'
+
+    def test_caller_headers_are_not_modified(self):
+        config = ZephyrConfig(url="https://zephyr.example/v2", auth_type="pat", personal_token="tok")
+        client = ZephyrClient(config)
+        response = MagicMock(status_code=200, content=b"{}", headers=CaseInsensitiveDict({"ETag": '"abc"'}))
+        headers = {"X-Trace": "1"}
+        with patch.object(client.session, "request", return_value=response):
+            client.get("/testcycles", headers=headers)
+            client.get("/testcycles", headers=headers)
+        assert headers == {"X-Trace": "1"}
+
+    def test_squad_pat_client_does_not_modify_caller_headers(self):
+        config = ZephyrSquadConfig(auth_type="pat", jira_base_url="https://jira.example", pat_token="tok")
+        client = ZephyrSquadPatClient(config)
+        response = MagicMock(status_code=200, content=b"{}", headers=CaseInsensitiveDict({"ETag": '"abc"'}))
+        headers = {"X-Trace": "1"}
+        with patch.object(client.session, "request", return_value=response) as request:
+            client.get("/execution/1", headers=headers)
+            client.get("/execution/1", headers=headers)
+        assert request.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"abc"'
+        assert headers == {"X-Trace": "1"}
+
+    def test_squad_client_revalidates(self):
+        config = ZephyrSquadConfig(access_key="ak", secret_key="sk", account_id="acc")
+        client = ZephyrSquadClient(config)
+        body = MagicMock(status_code=200, content=b'{"executions":[]}', headers=CaseInsensitiveDict({"ETag": '"e1"'}))
+        not_modified = MagicMock(status_code=304, content=b"", headers=CaseInsensitiveDict())
+        with patch.object(client.session, "request", side_effect=[body, not_modified]) as request:
+            client.get("/executions/search/cycle/1", query_params={"projectId": "10"})
+            assert client.get("/executions/search/cycle/1", query_params={"projectId": "10"}) == {"executions": []}
+        assert request.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"e1"'
+
+    def test_write_drops_a_fresh_response(self):
+        config = ZephyrConfig(url="https://zephyr.example/v2", auth_type="pat", personal_token="tok")
+        fetcher = ZephyrFetcher(config)
+        headers = CaseInsensitiveDict({"Cache-Control": "max-age=300"})
+        before = MagicMock(status_code=200, content=b'{"key":"PROJ-T1","name":"Old"}', headers=headers)
+        updated = MagicMock(status_code=200, content=b'{"key":"PROJ-T1","name":"New"}', headers=CaseInsensitiveDict())
+        after = MagicMock(status_code=200, content=b'{"key":"PROJ-T1","name":"New"}', headers=headers)
+        with patch.object(fetcher.client.session, "request", side_effect=[before, updated, after]) as request:
+            assert fetcher.get_test_case("PROJ-T1")["name"] == "Old"
+            fetcher.update_test_case("PROJ-T1", name="New")
+            assert fetcher.get_test_case("PROJ-T1")["name"] == "New"
+        assert [c.args[0] for c in request.call_args_list] == ["GET", "PUT", "GET"]
+
+    def test_invalidate_drops_the_stored_row(self, tmp_path):
+        store = PersistentCache(PersistentCachePolicy(enabled=True, directory=str(tmp_path)))
+        cache = HTTPCache(HTTPCachePolicy(), store=store)
+        send = MagicMock(return_value=_response(Cache_Control="max-age=300"))
+        _pipeline(cache).send(send, "GET", headers={}, coalesce_key=KEY)
+
+        _pipeline(cache).invalidate(KEY)
+
+        assert HTTPCache(HTTPCachePolicy(), store=store).fresh(("zephyr.example|cred", KEY)) is None
@@ -0,0 +1,69 @@
+"""Tests for zephyr_mcp.cache.metadata project metadata cache."""
+
+import os
+import time
+from unittest.mock import patch
+
+from zephyr_mcp.cache import MetadataCache, MetadataCachePolicy, PersistentCache, PersistentCachePolicy, get_metadata_cache
+from zephyr_mcp.utils.metrics import metrics
+
+SCOPE = "https://zephyr.example|pat:abc"
+STATUSES = [{"id": 1, "name": "Approved"}, {"id": 2, "name": "Draft"}]
+
+
+class TestMetadataCachePolicy:
+    def test_defaults(self):
+        with patch.dict(os.environ, {}, clear=True):
+            policy = MetadataCachePolicy.from_env()
+        assert policy.enabled
+        assert policy.ttl == 3600.0
+        assert policy.refresh_after == 60.0
+
+    def test_zero_ttl_disables(self):
+        with patch.dict(os.environ, {"ZEPHYR_METADATA_CACHE_TTL": "0", "ZEPHYR_METADATA_REFRESH_AFTER": "5"}, clear=True):
+            policy = MetadataCachePolicy.from_env()
+        assert not policy.enabled
+        assert policy.refresh_after == 5.0
+        assert get_metadata_cache("zephyr", policy) is None
+
+
+class TestMetadataCache:
+    def setup_method(self):
+        metrics.reset()
+
+    def test_round_trip_with_age(self):
+        cache = MetadataCache(MetadataCachePolicy())
+        cache.put(SCOPE, "PROJ", "testcase_status", STATUSES)
+
+        with patch("zephyr_mcp.cache.metadata.time.time", return_value=time.time() + 30):
+            entries, age = cache.get(SCOPE, "PROJ", "testcase_status")
+
+        assert entries == STATUSES
+        assert 29 < age < 31
+        assert cache.get(SCOPE, "OTHER", "testcase_status") is None
+        assert cache.get("https://zephyr.example|pat:other", "PROJ", "testcase_status") is None
+        assert metrics.get("zephyr_metadata_cache_hits_total", labels={"category": "testcase_status"}) == 1
+
+    def test_expires_after_ttl(self):
+        cache = MetadataCache(MetadataCachePolicy(ttl=10.0))
+        cache.put(SCOPE, "PROJ", "priority", [{"id": 1, "name": "High"}])
+
+        with patch("zephyr_mcp.cache.metadata.time.time", return_value=time.time() + 11):
+            assert cache.get(SCOPE, "PROJ", "priority") is None
+        assert cache.stats() == {"lists": 0, "entries": 0}
+
+    def test_store_shares_lists_between_processes(self, tmp_path):
+        store = PersistentCache(PersistentCachePolicy(enabled=True, directory=str(tmp_path)))
+        MetadataCache(MetadataCachePolicy(), store=store).put(SCOPE, "PROJ", "testcase_status", STATUSES)
+
+        entries, age = MetadataCache(MetadataCachePolicy(), store=store).get(SCOPE, "PROJ", "testcase_status")
+
+        assert entries == STATUSES
+        assert age < 5
+
+
+class TestGetMetadataCache:
+    def test_shared_per_key_and_policy(self):
+        policy = MetadataCachePolicy()
+        assert get_metadata_cache("zephyr", policy) is get_metadata_cache("zephyr", policy)
+        assert get_metadata_cache("zephyr", MetadataCachePolicy(ttl=60.0)).policy.ttl == 60.0
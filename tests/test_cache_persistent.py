@@ -0,0 +1,184 @@
+"""Tests for zephyr_mcp.cache.persistent SQLite-backed cache."""
+
+import os
+import sqlite3
+import time
+from unittest.mock import MagicMock, patch
+
+from requests.structures import CaseInsensitiveDict
+
+from zephyr_mcp.cache import (
+    EntityCache,
+    EntityCachePolicy,
+    HTTPCache,
+    HTTPCachePolicy,
+    PersistentCache,
+    PersistentCachePolicy,
+    get_persistent_cache,
+)
+
+SCOPE = "https://zephyr.example|cred-a"
+
+
+def _policy(tmp_path, **kwargs) -> PersistentCachePolicy:
+    return PersistentCachePolicy(enabled=True, directory=str(tmp_path), **kwargs)
+
+
+class TestPersistentCachePolicy:
+    def test_disabled_by_default(self):
+        with patch.dict(os.environ, {}, clear=True):
+            policy = PersistentCachePolicy.from_env()
+        assert not policy.enabled
+        assert policy.path.name == "cache.sqlite3"
+        assert policy.path.parent.name == ".zephyr-mcp"
+
+    def test_from_env(self, tmp_path):
+        env = {
+            "ZEPHYR_PERSISTENT_CACHE": "true",
+            "ZEPHYR_CACHE_DIR": str(tmp_path),
+            "ZEPHYR_PERSISTENT_CACHE_TTL": "600",
+            "ZEPHYR_PERSISTENT_CACHE_MAX_MB": "16",
+        }
+        with patch.dict(os.environ, env, clear=True):
+            policy = PersistentCachePolicy.from_env()
+        assert policy.enabled
+        assert policy.path == tmp_path / "cache.sqlite3"
+        assert policy.ttl == 600.0
+        assert policy.max_bytes == 16 * 1024 * 1024
+
+
+class TestPersistentCache:
+    def test_round_trip_is_compressed(self, tmp_path):
+        store = PersistentCache(_policy(tmp_path))
+        body = b'{"key":"PROJ-T1","description":"' + b"x" * 1000 + b'"}'
+        store.put(SCOPE, "entity", "testcase/PROJ-T1", body, meta={"etag": '"v1"'})
+
+        found, meta, expires_at = store.get(SCOPE, "entity", "testcase/PROJ-T1")
+        assert found == body
+        assert meta == {"etag": '"v1"'}
+        assert expires_at > time.time()
+        stored = sqlite3.connect(store.path).execute("SELECT body FROM entries").fetchone()[0]
+        assert len(stored) < len(body)
+
+    def test_uses_wal_and_private_file(self, tmp_path):
+        store = PersistentCache(_policy(tmp_path))
+        assert sqlite3.connect(store.path).execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert os.stat(store.path).st_mode & 0o077 == 0
+
+    def test_partitions_are_separate(self, tmp_path):
+        store = PersistentCache(_policy(tmp_path))
+        store.put(SCOPE, "entity", "k", b"{}")
+        assert store.get("https://zephyr.example|cred-b", "entity", "k") is None
+        assert store.get(SCOPE, "http", "k") is None
+
+    def test_rows_expire(self, tmp_path):
+        store = PersistentCache(_policy(tmp_path, ttl=100.0))
+        with patch("zephyr_mcp.cache.persistent.time.time", return_value=1000.0):
+            store.put(SCOPE, "entity", "short", b"{}", ttl=10.0)
+            store.put(SCOPE, "entity", "capped", b"{}", ttl=1000.0)
+        with patch("zephyr_mcp.cache.persistent.time.time", return_value=1050.0):
+            assert store.get(SCOPE, "entity", "short") is None
+            assert store.get(SCOPE, "entity", "capped") is not None
+        with patch("zephyr_mcp.cache.persistent.time.time", return_value=1100.0):
+            assert store.get(SCOPE, "entity", "capped") is None
+
+    def test_size_bound_evicts_least_recently_read(self, tmp_path):
+        store = PersistentCache(_policy(tmp_path, max_bytes=700))
+        now = time.time() - 10
+        with patch("zephyr_mcp.cache.persistent.time.time", side_effect=[now + step for step in range(7)]):
+            for name in ("a", "b", "c"):
+                store.put(SCOPE, "entity", name, os.urandom(150))
+            store.get(SCOPE, "entity", "a")
+            store._prune()
+        assert store.get(SCOPE, "entity", "b") is None
+        assert store.get(SCOPE, "entity", "a") is not None
+        assert store.stats()["bytes"] <= 700
+
+    def test_shared_between_processes(self, tmp_path):
+        first = PersistentCache(_policy(tmp_path))
+        second = PersistentCache(_policy(tmp_path))
+        first.put(SCOPE, "entity", "k", b"[1]")
+        assert second.get(SCOPE, "entity", "k")[0] == b"[1]"
+        second.delete(SCOPE, "entity", "k")
+        assert first.get(SCOPE, "entity", "k") is None
+
+    def test_clear_partition(self, tmp_path):
+        store = PersistentCache(_policy(tmp_path))
+        store.put(SCOPE, "entity", "k", b"{}")
+        store.put("other", "entity", "k", b"{}")
+        store.clear(SCOPE)
+        assert store.get(SCOPE, "entity", "k") is None
+        assert store.get("other", "entity", "k") is not None
+
+    def test_unusable_directory_disables_cache(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        assert get_persistent_cache(_policy(blocker)) is None
+
+    def test_registry_shares_store_per_directory(self, tmp_path):
+        assert get_persistent_cache(_policy(tmp_path)) is get_persistent_cache(_policy(tmp_path))
+        assert get_persistent_cache(PersistentCachePolicy(enabled=False, directory=str(tmp_path))) is None
+
+
+class TestWarmStart:
+    def test_entity_cache_reads_entries_of_an_earlier_process(self, tmp_path):
+        earlier = EntityCache(EntityCachePolicy(), store=PersistentCache(_policy(tmp_path)))
+        earlier.put(SCOPE, "testcase", "PROJ-T1", b'{"key":"PROJ-T1"}')
+
+        later = EntityCache(EntityCachePolicy(), store=PersistentCache(_policy(tmp_path)))
+        assert later.get(SCOPE, "testcase", "PROJ-T1") == b'{"key":"PROJ-T1"}'
+        assert later.stats()["entries"] == 1
+
+    def test_entity_invalidation_reaches_disk(self, tmp_path):
+        store = PersistentCache(_policy(tmp_path))
+        cache = EntityCache(EntityCachePolicy(), store=store)
+        cache.put(SCOPE, "testcase", "PROJ-T1", b"{}")
+        cache.invalidate(SCOPE, "testcase", "PROJ-T1")
+        assert store.get(SCOPE, "entity", "testcase/PROJ-T1") is None
+
+    def test_entity_rows_outlive_the_entity_ttl(self, tmp_path):
+        store = PersistentCache(_policy(tmp_path))
+        EntityCache(EntityCachePolicy(ttl=30.0), store=store).put(SCOPE, "testcase", "PROJ-T1", b"{}")
+        _, meta, expires_at = store.get(SCOPE, "entity", "testcase/PROJ-T1")
+        assert expires_at > time.time() + 3600
+        assert meta["ttl"] == 30.0
+
+    def test_old_entity_row_is_served_stale_to_a_new_process(self, tmp_path):
+        EntityCache(EntityCachePolicy(ttl=30.0), store=PersistentCache(_policy(tmp_path))).put(SCOPE, "testcase", "PROJ-T1", b"{}")
+
+        later = EntityCache(EntityCachePolicy(ttl=30.0), store=PersistentCache(_policy(tmp_path)))
+        with patch("zephyr_mcp.cache.entity.time.time", return_value=time.time() + 3600):
+            assert later.get(SCOPE, "testcase", "PROJ-T1") is None
+        stale = later.stale(SCOPE, "testcase", "PROJ-T1")
+        assert stale.content == b"{}"
+        assert 3590 < stale.age < 3610
+        assert later.stale(SCOPE, "testcase", "PROJ-T1") is not None
+
+    def test_old_entity_row_respects_max_stale(self, tmp_path):
+        policy = EntityCachePolicy(ttl=30.0, max_stale=(("testexecution", 60.0),))
+        EntityCache(policy, store=PersistentCache(_policy(tmp_path))).put(SCOPE, "testexecution", "1", b"{}")
+
+        later = EntityCache(policy, store=PersistentCache(_policy(tmp_path)))
+        with patch("zephyr_mcp.cache.entity.time.time", return_value=time.time() + 3600):
+            assert later.get(SCOPE, "testexecution", "1") is None
+        assert later.stale(SCOPE, "testexecution", "1") is None
+
+    def test_http_cache_revalidates_what_an_earlier_process_fetched(self, tmp_path):
+        key = (SCOPE, ("GET", "https://zephyr.example/v2/testcycles", ""))
+        response = MagicMock(status_code=200, content=b'{"values":[]}', headers=CaseInsensitiveDict({"ETag": '"v1"'}))
+        HTTPCache(HTTPCachePolicy(), store=PersistentCache(_policy(tmp_path))).complete(key, None, response)
+
+        later = HTTPCache(HTTPCachePolicy(), store=PersistentCache(_policy(tmp_path)))
+        headers: dict[str, str] = {}
+        entry = later.prepare(key, headers)
+        assert headers == {"If-None-Match": '"v1"'}
+        result = later.complete(key, entry, MagicMock(status_code=304, content=b"", headers=CaseInsensitiveDict()))
+        assert result.content == b'{"values":[]}'
+
+    def test_http_cache_keeps_max_age_across_processes(self, tmp_path):
+        key = (SCOPE, ("GET", "https://zephyr.example/v2/statuses", ""))
+        response = MagicMock(status_code=200, content=b"[]", headers=CaseInsensitiveDict({"Cache-Control": "max-age=300"}))
+        HTTPCache(HTTPCachePolicy(), store=PersistentCache(_policy(tmp_path))).complete(key, None, response)
+
+        later = HTTPCache(HTTPCachePolicy(), store=PersistentCache(_policy(tmp_path)))
+        assert later.fresh(key).content == b"[]"
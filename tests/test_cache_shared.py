@@ -0,0 +1,222 @@
+"""Tests for zephyr_mcp.cache.shared Redis-backed cache and cache backend selection."""
+
+import os
+import time
+from unittest.mock import MagicMock, patch
+
+import fakeredis
+import pytest
+import redis
+from requests.structures import CaseInsensitiveDict
+
+from zephyr_mcp.cache import (
+    CacheBackendPolicy,
+    EntityCache,
+    EntityCachePolicy,
+    HTTPCache,
+    HTTPCachePolicy,
+    PersistentCache,
+    RedisCache,
+    RedisCachePolicy,
+    get_cache_backend,
+)
+from zephyr_mcp.cache.shared import _redact
+from zephyr_mcp.zephyr import ZephyrFetcher
+from zephyr_mcp.zephyr.config import ZephyrConfig
+
+SCOPE = "https://zephyr.example|cred-a"
+POLICY = RedisCachePolicy(url="redis://cache.example:6379/0")
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def replica(server):
+    """Build caches as separate replicas on one server; their invalidation listeners are stopped afterwards."""
+    made: list[RedisCache] = []
+
+    def _make(policy: RedisCachePolicy = POLICY) -> RedisCache:
+        made.append(RedisCache(policy, client=fakeredis.FakeRedis(server=server)))
+        return made[-1]
+
+    yield _make
+    for cache in made:
+        cache.close()
+
+
+def _wait_for(condition) -> bool:
+    deadline = time.monotonic() + 3.0
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+class TestCacheBackendPolicy:
+    def test_memory_by_default(self):
+        with patch.dict(os.environ, {}, clear=True):
+            policy = CacheBackendPolicy.from_env()
+        assert policy.backend == "memory"
+        assert get_cache_backend(policy) is None
+
+    def test_redis_url_selects_redis(self):
+        env = {"ZEPHYR_CACHE_REDIS_URL": "redis://cache:6379/1", "ZEPHYR_CACHE_REDIS_PREFIX": "team-a", "ZEPHYR_CACHE_REDIS_TTL": "600"}
+        with patch.dict(os.environ, env, clear=True):
+            policy = CacheBackendPolicy.from_env()
+        assert policy.backend == "redis"
+        assert policy.redis == RedisCachePolicy(url="redis://cache:6379/1", prefix="team-a", ttl=600.0)
+
+    def test_persistent_cache_selects_sqlite(self, tmp_path):
+        with patch.dict(os.environ, {"ZEPHYR_PERSISTENT_CACHE": "true", "ZEPHYR_CACHE_DIR": str(tmp_path)}, clear=True):
+            policy = CacheBackendPolicy.from_env()
+        assert policy.backend == "sqlite"
+        assert isinstance(get_cache_backend(policy), PersistentCache)
+
+    def test_explicit_sqlite_enables_the_file(self, tmp_path):
+        with patch.dict(os.environ, {"ZEPHYR_CACHE_BACKEND": "sqlite", "ZEPHYR_CACHE_DIR": str(tmp_path)}, clear=True):
+            policy = CacheBackendPolicy.from_env()
+        assert policy.persistent.enabled
+
+    def test_explicit_memory_wins_over_redis_url(self):
+        with patch.dict(os.environ, {"ZEPHYR_CACHE_BACKEND": "memory", "ZEPHYR_CACHE_REDIS_URL": "redis://cache"}, clear=True):
+            assert CacheBackendPolicy.from_env().backend == "memory"
+
+    def test_unknown_backend_falls_back(self):
+        with patch.dict(os.environ, {"ZEPHYR_CACHE_BACKEND": "memcached"}, clear=True):
+            assert CacheBackendPolicy.from_env().backend == "memory"
+
+    def test_unreachable_server_is_retried_later(self):
+        policy = CacheBackendPolicy(backend="redis", redis=RedisCachePolicy(url="redis://127.0.0.1:1/0", timeout=0.2))
+        cache = get_cache_backend(policy)
+        assert isinstance(cache, RedisCache)
+        assert not cache.healthy
+        assert get_cache_backend(policy) is cache
+
+
+class TestRedisCache:
+    def test_round_trip(self, server, replica):
+        cache = replica()
+        cache.put(SCOPE, "http", "GET /statuses", b"[1,2,3]", meta={"headers": {"ETag": '"v1"'}}, ttl=60.0)
+
+        body, meta, expires_at = cache.get(SCOPE, "http", "GET /statuses")
+        assert body == b"[1,2,3]"
+        assert meta == {"headers": {"ETag": '"v1"'}}
+        assert time.time() < expires_at <= time.time() + 60.0
+        assert 0 < fakeredis.FakeRedis(server=server).pttl(f"zephyr-mcp:{SCOPE}:http:GET /statuses") <= 60_000
+
+    def test_ttl_is_capped_by_policy(self, server, replica):
+        cache = replica(RedisCachePolicy(url=POLICY.url, ttl=30.0))
+        cache.put(SCOPE, "entity", "testcase/PROJ-T1", b"{}", ttl=3600.0)
+        assert fakeredis.FakeRedis(server=server).pttl(f"zephyr-mcp:{SCOPE}:entity:testcase/PROJ-T1") <= 30_000
+
+    def test_partitions_and_prefixes_are_separate(self, replica):
+        cache = replica()
+        cache.put(SCOPE, "entity", "k", b"{}")
+        assert cache.get("https://zephyr.example|cred-b", "entity", "k") is None
+        assert replica(RedisCachePolicy(url=POLICY.url, prefix="other")).get(SCOPE, "entity", "k") is None
+
+    def test_clear_partition(self, replica):
+        cache = replica()
+        cache.put(SCOPE, "entity", "k", b"{}")
+        cache.put("https://other.example|cred", "entity", "k", b"{}")
+        cache.clear(SCOPE)
+        assert cache.get(SCOPE, "entity", "k") is None
+        assert cache.stats()["entries"] == 1
+
+    def test_server_errors_are_misses(self):
+        client = MagicMock()
+        client.hmget.side_effect = redis.ConnectionError("connection reset")
+        cache = RedisCache(POLICY, client=client)
+        assert cache.get(SCOPE, "entity", "k") is None
+        cache.put(SCOPE, "entity", "k", b"{}")
+
+    def test_failures_open_a_backoff_window(self):
+        client = MagicMock()
+        reset = redis.ConnectionError("connection reset")
+        client.hmget.side_effect = [reset, reset, [None, None, None], [None, None, None]]
+        cache = RedisCache(POLICY, client=client)
+        now = time.monotonic()
+
+        with patch("zephyr_mcp.cache.shared.time.monotonic", return_value=now):
+            assert cache.get(SCOPE, "entity", "k") is None
+            assert cache.get(SCOPE, "entity", "k") is None
+        assert client.hmget.call_count == 1
+        with patch("zephyr_mcp.cache.shared.time.monotonic", return_value=now + 1.5):
+            cache.get(SCOPE, "entity", "k")
+        with patch("zephyr_mcp.cache.shared.time.monotonic", return_value=now + 2.5):
+            # The second failure doubled the window to 2s.
+            cache.get(SCOPE, "entity", "k")
+            assert client.hmget.call_count == 2
+        with patch("zephyr_mcp.cache.shared.time.monotonic", return_value=now + 4.0):
+            cache.get(SCOPE, "entity", "k")
+            cache.get(SCOPE, "entity", "k")
+        assert client.hmget.call_count == 4
+        assert cache.healthy
+
+    def test_server_down_at_start_is_used_once_it_answers(self, server):
+        client = fakeredis.FakeRedis(server=server)
+        with patch.object(client, "ping", side_effect=redis.ConnectionError("connection refused")):
+            cache = RedisCache(POLICY, client=client)
+        try:
+            assert not cache.healthy
+            entities = EntityCache(EntityCachePolicy(), store=cache)
+            assert cache._listener is None
+            with patch("zephyr_mcp.cache.shared.time.monotonic", return_value=time.monotonic() + 1.5):
+                cache.put(SCOPE, "entity", "k", b"{}")
+            assert cache.healthy
+            assert cache._listener is not None
+            assert cache.get(SCOPE, "entity", "k")[0] == b"{}"
+            assert entities.store is cache
+        finally:
+            cache.close()
+
+    def test_password_is_not_logged(self):
+        assert _redact("redis://:s3cret@cache.example:6379/0") == "redis://***@cache.example:6379/0"
+
+
+class TestSharedBetweenReplicas:
+    def test_replicas_share_entities(self, replica):
+        first = EntityCache(EntityCachePolicy(), name="a", store=replica())
+        second = EntityCache(EntityCachePolicy(), name="b", store=replica())
+        first.put(SCOPE, "testcase", "PROJ-T1", b'{"key":"PROJ-T1"}')
+        assert second.get(SCOPE, "testcase", "PROJ-T1") == b'{"key":"PROJ-T1"}'
+
+    def test_write_on_one_replica_drops_copies_on_the_others(self, replica):
+        first = EntityCache(EntityCachePolicy(), name="a", store=replica())
+        second = EntityCache(EntityCachePolicy(), name="b", store=replica())
+        first.put(SCOPE, "testcase", "PROJ-T1", b'{"v":1}')
+        second.get(SCOPE, "testcase", "PROJ-T1")
+        assert second.stats()["entries"] == 1
+
+        first.invalidate(SCOPE, "testcase", "PROJ-T1")
+
+        assert _wait_for(lambda: second.stats()["entries"] == 0)
+        assert second.get(SCOPE, "testcase", "PROJ-T1") is None
+
+    def test_write_on_one_replica_drops_http_copies_on_the_others(self, replica):
+        first = HTTPCache(HTTPCachePolicy(), name="a", store=replica())
+        second = HTTPCache(HTTPCachePolicy(), name="b", store=replica())
+        key = (SCOPE, ("GET", "https://zephyr.example/v2/statuses", "[]"))
+        response = MagicMock(status_code=200, content=b'{"values":[]}', headers=CaseInsensitiveDict({"Cache-Control": "max-age=300"}))
+        first.complete(key, None, response)
+        assert second.fresh(key) is not None
+
+        first.invalidate(key)
+
+        assert _wait_for(lambda: second.fresh(key) is None)
+
+    def test_fetcher_uses_configured_backend(self, server):
+        config = ZephyrConfig(
+            url="https://zephyr.example/v2",
+            auth_type="pat",
+            personal_token="tok",
+            cache_backend=CacheBackendPolicy(backend="redis", redis=POLICY),
+        )
+        with patch("zephyr_mcp.cache.shared.redis.Redis.from_url", return_value=fakeredis.FakeRedis(server=server)):
+            fetcher = ZephyrFetcher(config)
+        assert isinstance(fetcher.entity_cache.store, RedisCache)
+        assert fetcher.client._pipeline.http_cache.store is fetcher.entity_cache.store
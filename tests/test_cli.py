@@ -17,7 +17,7 @@ class TestMain:
 class TestCliCallback:
     """Test the _cli callback function by importing and calling it with mocked dependencies."""
 
-    def _invoke(self, transport="stdio", port=8000, host="0.0.0.0", read_only=False, verbose=0):
+    def _invoke(self, transport="stdio", port=8000, host="0.0.0.0", read_only=False, workers=None, verbose=0):
         """Call the CLI callback with mocked server creation."""
         mock_server = MagicMock()
         with (
@@ -31,23 +31,28 @@ class TestCliCallback:
                 port=port,
                 host=host,
                 read_only=read_only,
+                workers=workers,
                 verbose=verbose,
             )
         return mock_server, mock_create, mock_log_config
 
     def test_stdio_transport(self):
         mock_server, mock_create, _ = self._invoke(transport="stdio")
-        mock_create.assert_called_once_with(read_only=False)
+        mock_create.assert_called_once_with(read_only=False, worker_threads=None)
         mock_server.run.assert_called_once_with(transport="stdio")
 
     def test_sse_transport(self):
         mock_server, mock_create, _ = self._invoke(transport="sse", port=9000, host="127.0.0.1")
-        mock_create.assert_called_once_with(read_only=False)
+        mock_create.assert_called_once_with(read_only=False, worker_threads=None)
         mock_server.run.assert_called_once_with(transport="sse", host="127.0.0.1", port=9000)
 
     def test_read_only_flag(self):
         _, mock_create, _ = self._invoke(read_only=True)
-        mock_create.assert_called_once_with(read_only=True)
+        mock_create.assert_called_once_with(read_only=True, worker_threads=None)
+
+    def test_workers_flag(self):
+        _, mock_create, _ = self._invoke(workers=4)
+        mock_create.assert_called_once_with(read_only=False, worker_threads=4)
 
     def test_verbose_info(self):
         _, _, mock_log = self._invoke(verbose=1)
@@ -1,11 +1,18 @@
 """Tests for zephyr_mcp.zephyr.client module."""
 
+import json
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 import requests
 
 from zephyr_mcp.exceptions import ZephyrAuthenticationError
+from zephyr_mcp.utils.hedging import HedgingPolicy
+from zephyr_mcp.utils.http import HTTPSettings
+from zephyr_mcp.utils.jsoncodec import RawJSON
+from zephyr_mcp.utils.metrics import metrics
 from zephyr_mcp.zephyr.client import ZephyrClient
 from zephyr_mcp.zephyr.config import ZephyrConfig
 
@@ -99,7 +106,7 @@ class TestZephyrClientRequest:
     def test_get(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"key": "T123"}
+        mock_response.content = json.dumps({"key": "T123"}).encode()
         mock_response.raise_for_status = MagicMock()
         mock_request.return_value = mock_response
 
@@ -108,11 +115,25 @@ class TestZephyrClientRequest:
         assert result == {"key": "T123"}
         mock_request.assert_called_once()
 
+    @patch.object(requests.Session, "request")
+    def test_get_raw_returns_body_undecoded(self, mock_request):
+        body = b'{"key": "T123"}'
+        mock_request.return_value = MagicMock(status_code=200, headers={}, content=body)
+
+        client = self._make_client()
+        with patch("zephyr_mcp.utils.jsoncodec.loads") as mock_loads:
+            result = client.get("/testcases/T123", raw=True)
+            mock_loads.assert_not_called()
+
+        assert isinstance(result, RawJSON)
+        assert result.content is body
+        assert "raw" not in mock_request.call_args.kwargs
+
     @patch.object(requests.Session, "request")
     def test_post(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 201
-        mock_response.json.return_value = {"key": "T124"}
+        mock_response.content = json.dumps({"key": "T124"}).encode()
         mock_response.raise_for_status = MagicMock()
         mock_request.return_value = mock_response
 
@@ -124,7 +145,7 @@ class TestZephyrClientRequest:
     def test_put(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"key": "T123", "name": "Updated"}
+        mock_response.content = json.dumps({"key": "T123", "name": "Updated"}).encode()
         mock_response.raise_for_status = MagicMock()
         mock_request.return_value = mock_response
 
@@ -165,22 +186,107 @@ class TestZephyrClientRequest:
         with pytest.raises(ZephyrAuthenticationError, match="403"):
             client.get("/testcases/T123")
 
+    @patch("zephyr_mcp.utils.retry.time.sleep")
     @patch.object(requests.Session, "request")
-    def test_http_error_raises(self, mock_request):
+    def test_http_error_raises(self, mock_request, mock_sleep):
         mock_response = MagicMock()
         mock_response.status_code = 500
+        mock_response.headers = {}
         mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("500 Server Error")
         mock_request.return_value = mock_response
 
         client = self._make_client()
         with pytest.raises(requests.exceptions.HTTPError):
             client.get("/testcases/T123")
+        assert mock_request.call_count == client.config.retry_policy.max_attempts
+
+    @patch.object(requests.Session, "request")
+    def test_request_applies_configured_timeout(self, mock_request):
+        mock_request.return_value = MagicMock(status_code=200, headers={}, content=b"{}")
+        client = ZephyrClient(_make_config(http=HTTPSettings(connect_timeout=2.0, read_timeout=15.0)))
+
+        client.get("/testcases/T123")
+        assert mock_request.call_args.kwargs["timeout"] == (2.0, 15.0)
+
+    @patch.object(requests.Session, "request")
+    def test_concurrent_identical_gets_coalesced(self, mock_request):
+        release = threading.Event()
+        mock_request.side_effect = lambda *args, **kwargs: (
+            release.wait(timeout=5) and MagicMock(status_code=200, headers={}, content=b'{"key": "T1"}')
+        )
+        client = ZephyrClient(_make_config())
+        metrics.reset()
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(client.get("/testcases/T1", params={"a": 1}))) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        deadline = time.monotonic() + 5
+        while (
+            metrics.get("zephyr_http_coalesced_total", labels={"target": "api.zephyrscale.smartbear.com"}) or 0
+        ) < 2 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert mock_request.call_count == 1
+        assert results == [{"key": "T1"}] * 3
+
+    @patch.object(requests.Session, "request")
+    def test_gets_not_coalesced_when_disabled(self, mock_request):
+        mock_request.return_value = MagicMock(status_code=200, headers={}, content=b"{}")
+        client = ZephyrClient(_make_config(coalesce_gets=False))
+
+        assert client._pipeline.singleflight is None
+
+    @patch("zephyr_mcp.utils.hedging.Hedger.send")
+    @patch.object(requests.Session, "request")
+    def test_configured_endpoint_gets_are_hedged(self, mock_request, mock_hedge):
+        mock_hedge.return_value = mock_request.return_value = MagicMock(status_code=200, headers={}, content=b"{}")
+        client = ZephyrClient(_make_config(hedging=HedgingPolicy(endpoints=frozenset({"testcases"}))))
+
+        client.get("/testcases/PROJ-T1")
+        client.get("/testcycles/PROJ-R1")
+        client.post("/testcases", json={})
+
+        assert mock_hedge.call_count == 1
+        assert mock_hedge.call_args.args[0] == "/testcases/PROJ-T1"
+
+    def test_session_pool_sized_from_config(self):
+        client = ZephyrClient(_make_config(http=HTTPSettings(pool_maxsize=48)))
+        assert client.session.get_adapter("https://api.zephyrscale.smartbear.com/v2")._pool_maxsize == 48
+
+    @patch("zephyr_mcp.utils.retry.time.sleep")
+    @patch.object(requests.Session, "request")
+    def test_retries_429_honouring_retry_after(self, mock_request, mock_sleep):
+        throttled = MagicMock(status_code=429, headers={"Retry-After": "2"})
+        ok = MagicMock(status_code=200, headers={})
+        ok.content = json.dumps({"key": "T123"}).encode()
+        mock_request.side_effect = [throttled, ok]
+
+        client = self._make_client()
+        assert client.get("/testcases/T123") == {"key": "T123"}
+        mock_sleep.assert_called_once_with(2.0)
+
+    @patch("zephyr_mcp.utils.retry.time.sleep")
+    @patch.object(requests.Session, "request")
+    def test_post_not_retried_without_idempotency_key(self, mock_request, mock_sleep):
+        mock_response = MagicMock(status_code=503, headers={})
+        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("503 Service Unavailable")
+        mock_request.return_value = mock_response
+
+        client = self._make_client()
+        with pytest.raises(requests.exceptions.HTTPError):
+            client.post("/testcases", json={"name": "TC"})
+        mock_request.assert_called_once()
+        mock_sleep.assert_not_called()
 
     @patch.object(requests.Session, "request")
     def test_request_builds_url(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {}
+        mock_response.content = json.dumps({}).encode()
         mock_response.raise_for_status = MagicMock()
         mock_request.return_value = mock_response
 
@@ -189,3 +295,42 @@ class TestZephyrClientRequest:
 
         call_args = mock_request.call_args
         assert call_args[0][1] == "https://api.zephyrscale.smartbear.com/v2/testcases/T123"
+
+
+class TestZephyrClientLifecycle:
+    def test_close_closes_session(self):
+        client = ZephyrClient(_make_config())
+        with patch.object(client.session, "close") as mock_close:
+            client.close()
+        mock_close.assert_called_once()
+
+    @patch.object(requests.Session, "request")
+    def test_expired_oauth_token_refreshed_before_request(self, mock_request):
+        from zephyr_mcp.utils.oauth import OAuthConfig
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({}).encode()
+        mock_request.return_value = mock_response
+
+        oauth = OAuthConfig(
+            client_id="cid", client_secret="sec", redirect_uri="http://localhost", scope="read", refresh_token="r", access_token="old", expires_at=1
+        )
+        with patch("zephyr_mcp.zephyr.client.configure_oauth_session", return_value=True) as mock_configure:
+            client = ZephyrClient(_make_config(auth_type="oauth", personal_token=None, oauth_config=oauth))
+            client.get("/testcases/T1")
+
+        assert mock_configure.call_count == 2
+
+    @patch.object(requests.Session, "request")
+    def test_oauth_refresh_failure_raises(self, mock_request):
+        from zephyr_mcp.utils.oauth import OAuthConfig
+
+        oauth = OAuthConfig(
+            client_id="cid", client_secret="sec", redirect_uri="http://localhost", scope="read", refresh_token="r", access_token="old", expires_at=1
+        )
+        with patch("zephyr_mcp.zephyr.client.configure_oauth_session", side_effect=[True, False]):
+            client = ZephyrClient(_make_config(auth_type="oauth", personal_token=None, oauth_config=oauth))
+            with pytest.raises(ZephyrAuthenticationError, match="refresh"):
+                client.get("/testcases/T1")
+        mock_request.assert_not_called()
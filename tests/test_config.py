@@ -29,6 +29,44 @@ class TestZephyrConfig:
         assert config.is_cloud is False
 
 
+class TestZephyrConfigFingerprint:
+    def test_equal_configs_share_fingerprint(self):
+        a = ZephyrConfig(url="https://api.zephyrscale.smartbear.com/v2", personal_token="tok")
+        b = ZephyrConfig(url="https://api.zephyrscale.smartbear.com/v2", personal_token="tok")
+        assert a.fingerprint() == b.fingerprint()
+
+    def test_token_changes_fingerprint(self):
+        a = ZephyrConfig(url="https://api.zephyrscale.smartbear.com/v2", personal_token="tok-a")
+        b = ZephyrConfig(url="https://api.zephyrscale.smartbear.com/v2", personal_token="tok-b")
+        assert a.fingerprint() != b.fingerprint()
+
+    def test_url_changes_fingerprint(self):
+        a = ZephyrConfig(url="https://a.example.com", personal_token="tok")
+        b = ZephyrConfig(url="https://b.example.com", personal_token="tok")
+        assert a.fingerprint() != b.fingerprint()
+
+    def test_refreshable_oauth_ignores_rotating_access_token(self):
+        from zephyr_mcp.utils.oauth import OAuthConfig
+
+        oauth = OAuthConfig(client_id="cid", client_secret="sec", redirect_uri="http://localhost", scope="read", refresh_token="r")
+        config = ZephyrConfig(url="https://api.zephyrscale.smartbear.com/v2", auth_type="oauth", oauth_config=oauth)
+        before = config.fingerprint()
+        oauth.access_token = "rotated"
+        assert config.fingerprint() == before
+
+
+class TestZephyrConfigCredentialId:
+    def test_ignores_transport_settings(self):
+        a = ZephyrConfig(url="https://a.example", personal_token="tok", ssl_verify=True)
+        b = ZephyrConfig(url="https://b.example", personal_token="tok", ssl_verify=False, http_engine="async")
+        assert a.credential_id() == b.credential_id()
+
+    def test_differs_by_token(self):
+        a = ZephyrConfig(url="https://a.example", personal_token="tok")
+        b = ZephyrConfig(url="https://a.example", personal_token="other")
+        assert a.credential_id() != b.credential_id()
+
+
 class TestZephyrConfigFromEnv:
     def test_no_url_raises(self):
         with patch.dict(os.environ, {}, clear=True):
@@ -83,6 +121,12 @@ class TestZephyrConfigFromEnv:
         with patch.dict(os.environ, env, clear=True):
             config = ZephyrConfig.from_env()
             assert config.project_key == "PROJ"
+            assert config.project_keys() == ("PROJ",)
+
+    def test_project_key_list(self):
+        config = ZephyrConfig(url="https://api.zephyrscale.smartbear.com/v2", personal_token="tok", project_key="PROJ, OTHER,")
+        assert config.project_keys() == ("PROJ", "OTHER")
+        assert ZephyrConfig(url="https://api.zephyrscale.smartbear.com/v2", personal_token="tok").project_keys() == ()
 
     def test_ssl_verify_false(self):
         env = {
@@ -94,6 +138,21 @@ class TestZephyrConfigFromEnv:
             config = ZephyrConfig.from_env()
             assert config.ssl_verify is False
 
+    def test_tls_settings(self):
+        env = {
+            "ZEPHYR_URL": "https://api.zephyrscale.smartbear.com/v2",
+            "ZEPHYR_PERSONAL_TOKEN": "tok",
+            "ZEPHYR_CA_BUNDLE": "/etc/zephyr/ca.pem",
+            "ZEPHYR_CLIENT_CERT": "/etc/zephyr/client.pem",
+            "ZEPHYR_CLIENT_KEY": "/etc/zephyr/client.key",
+        }
+        with patch.dict(os.environ, env, clear=True):
+            config = ZephyrConfig.from_env()
+        assert config.ca_bundle == "/etc/zephyr/ca.pem"
+        assert config.client_cert == "/etc/zephyr/client.pem"
+        assert config.client_key == "/etc/zephyr/client.key"
+        assert config.fingerprint() != ZephyrConfig(url=config.url, personal_token="tok").fingerprint()
+
     def test_proxy_settings(self):
         env = {
             "ZEPHYR_URL": "https://api.zephyrscale.smartbear.com/v2",
@@ -142,3 +201,19 @@ class TestZephyrConfigFromEnv:
             config = ZephyrConfig.from_env()
             assert config.auth_type == "bearer"
             assert config.personal_token == "oauth-tok"
+
+    def test_http_engine_defaults_to_sync(self):
+        env = {"ZEPHYR_URL": "https://api.zephyrscale.smartbear.com/v2", "ZEPHYR_PERSONAL_TOKEN": "tok"}
+        with patch.dict(os.environ, env, clear=True):
+            assert ZephyrConfig.from_env().http_engine == "sync"
+
+    def test_http_engine_from_env(self):
+        env = {"ZEPHYR_URL": "https://api.zephyrscale.smartbear.com/v2", "ZEPHYR_PERSONAL_TOKEN": "tok", "ZEPHYR_HTTP_ENGINE": "Async"}
+        with patch.dict(os.environ, env, clear=True):
+            assert ZephyrConfig.from_env().http_engine == "async"
+
+    def test_invalid_http_engine_raises(self):
+        env = {"ZEPHYR_URL": "https://api.zephyrscale.smartbear.com/v2", "ZEPHYR_PERSONAL_TOKEN": "tok", "ZEPHYR_HTTP_ENGINE": "gevent"}
+        with patch.dict(os.environ, env, clear=True):
+            with pytest.raises(ValueError, match="ZEPHYR_HTTP_ENGINE"):
+                ZephyrConfig.from_env()
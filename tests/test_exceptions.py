@@ -1,6 +1,6 @@
 """Tests for zephyr_mcp.exceptions module."""
 
-from zephyr_mcp.exceptions import ZephyrAuthenticationError
+from zephyr_mcp.exceptions import CircuitOpenError, ZephyrAuthenticationError
 
 
 class TestZephyrAuthenticationError:
@@ -17,3 +17,8 @@ class TestZephyrAuthenticationError:
             raise ZephyrAuthenticationError("test")
         except ZephyrAuthenticationError as e:
             assert str(e) == "test"
+
+
+class TestCircuitOpenError:
+    def test_is_not_authentication_error(self):
+        assert not isinstance(CircuitOpenError("open"), ZephyrAuthenticationError)
@@ -1,15 +1,25 @@
 """Tests for _format_result helper in zephyr_mcp.server.tools."""
 
 from zephyr_mcp.server.tools import _format_result
+from zephyr_mcp.utils.jsoncodec import RawJSON
 
 
 class TestFormatResult:
     def test_dict_result(self):
         result = _format_result("Title", {"key": "value"})
         assert "## Title" in result
-        assert '"key": "value"' in result
+        assert '{"key":"value"}' in result
         assert "```json" in result
 
+    def test_pretty_result(self, monkeypatch):
+        monkeypatch.setenv("ZEPHYR_JSON_PRETTY", "true")
+        result = _format_result("Title", {"key": "value"})
+        assert '{\n  "key": "value"\n}' in result
+
+    def test_raw_result_passed_through(self):
+        result = _format_result("Title", RawJSON(b'{"key": "value",\n "n": 1}'))
+        assert result == '## Title\n```json\n{"key": "value",\n "n": 1}\n```'
+
     def test_list_result(self):
         result = _format_result("Title", [{"a": 1}, {"b": 2}])
         assert "## Title" in result
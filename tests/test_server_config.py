@@ -0,0 +1,72 @@
+"""Tests for zephyr_mcp.server.config module."""
+
+import os
+from unittest.mock import patch
+
+from zephyr_mcp.server.config import ServerConfig
+
+
+class TestServerConfigFromEnv:
+    def test_defaults(self):
+        with patch.dict(os.environ, {}, clear=True):
+            config = ServerConfig.from_env()
+        assert config.user_fetcher_cache_size == 256
+        assert config.user_fetcher_cache_ttl == 900.0
+        assert config.worker_threads == 16
+
+    def test_user_fetcher_cache_settings(self):
+        env = {"ZEPHYR_USER_FETCHER_CACHE_SIZE": "32", "ZEPHYR_USER_FETCHER_CACHE_TTL": "60"}
+        with patch.dict(os.environ, env, clear=True):
+            config = ServerConfig.from_env()
+        assert config.user_fetcher_cache_size == 32
+        assert config.user_fetcher_cache_ttl == 60.0
+
+    def test_cache_size_has_floor_of_one(self):
+        with patch.dict(os.environ, {"ZEPHYR_USER_FETCHER_CACHE_SIZE": "0"}, clear=True):
+            config = ServerConfig.from_env()
+        assert config.user_fetcher_cache_size == 1
+
+    def test_worker_threads(self):
+        with patch.dict(os.environ, {"ZEPHYR_WORKER_THREADS": "4"}, clear=True):
+            assert ServerConfig.from_env().worker_threads == 4
+
+    def test_worker_threads_has_floor_of_one(self):
+        with patch.dict(os.environ, {"ZEPHYR_WORKER_THREADS": "-2"}, clear=True):
+            assert ServerConfig.from_env().worker_threads == 1
+
+    def test_tool_timeout(self):
+        with patch.dict(os.environ, {}, clear=True):
+            assert ServerConfig.from_env().tool_timeout == 120.0
+        with patch.dict(os.environ, {"ZEPHYR_TOOL_TIMEOUT": "0"}, clear=True):
+            assert ServerConfig.from_env().tool_timeout == 0.0
+
+    def test_warmup(self):
+        with patch.dict(os.environ, {}, clear=True):
+            config = ServerConfig.from_env()
+        assert config.warmup is False
+        assert config.warmup_connections == 2
+        with patch.dict(os.environ, {"ZEPHYR_WARMUP": "true", "ZEPHYR_WARMUP_CONNECTIONS": "4"}, clear=True):
+            config = ServerConfig.from_env()
+        assert config.warmup is True
+        assert config.warmup_connections == 4
+
+    def test_prefetch(self):
+        with patch.dict(os.environ, {}, clear=True):
+            config = ServerConfig.from_env()
+        assert config.prefetch is False
+        assert config.prefetch_projects == ()
+        assert config.prefetch_ttl == 900.0
+        env = {
+            "ZEPHYR_PREFETCH": "true",
+            "ZEPHYR_PREFETCH_PROJECTS": "PROJ, OTHER,",
+            "ZEPHYR_PREFETCH_RATE": "5",
+            "ZEPHYR_PREFETCH_MAX_ITEMS": "200",
+            "ZEPHYR_PREFETCH_TTL": "3600",
+        }
+        with patch.dict(os.environ, env, clear=True):
+            config = ServerConfig.from_env()
+        assert config.prefetch is True
+        assert config.prefetch_projects == ("PROJ", "OTHER")
+        assert config.prefetch_rate == 5.0
+        assert config.prefetch_max_items == 200
+        assert config.prefetch_ttl == 3600.0
@@ -6,13 +6,14 @@ import pytest
 
 from zephyr_mcp.server.context import AppContext
 from zephyr_mcp.server.dependencies import get_zephyr_fetcher
-from zephyr_mcp.zephyr import ZephyrFetcher
+from zephyr_mcp.server.pool import FetcherPool
+from zephyr_mcp.zephyr import AsyncZephyrFetcher, ZephyrFetcher
 from zephyr_mcp.zephyr.config import ZephyrConfig
 
 
-def _make_ctx(config=None, read_only=False):
+def _make_ctx(config=None, read_only=False, fetcher_pool=None):
     ctx = MagicMock()
-    app_context = AppContext(full_zephyr_config=config, read_only=read_only)
+    app_context = AppContext(full_zephyr_config=config, read_only=read_only, fetcher_pool=fetcher_pool)
     ctx.request_context.lifespan_context = {"app_lifespan_context": app_context}
     return ctx
 
@@ -52,3 +53,37 @@ class TestGetZephyrFetcher:
 
         result = await get_zephyr_fetcher(ctx)
         assert result is not None
+
+    @pytest.mark.asyncio
+    @patch("zephyr_mcp.server.dependencies.ZephyrFetcher")
+    async def test_global_fetcher_reused_from_pool(self, mock_fetcher_cls):
+        config = ZephyrConfig(
+            url="https://api.zephyrscale.smartbear.com/v2",
+            auth_type="pat",
+            personal_token="tok",
+        )
+        ctx = _make_ctx(config=config, fetcher_pool=FetcherPool())
+        mock_fetcher_cls.side_effect = lambda config: MagicMock(spec=ZephyrFetcher)
+
+        first = await get_zephyr_fetcher(ctx)
+        second = await get_zephyr_fetcher(ctx)
+        assert first is second
+        mock_fetcher_cls.assert_called_once_with(config=config)
+
+    @pytest.mark.asyncio
+    @patch("zephyr_mcp.server.dependencies.ZephyrFetcher")
+    @patch("zephyr_mcp.server.dependencies.AsyncZephyrFetcher")
+    async def test_async_engine_returns_async_fetcher(self, mock_async_cls, mock_sync_cls):
+        config = ZephyrConfig(
+            url="https://api.zephyrscale.smartbear.com/v2",
+            auth_type="pat",
+            personal_token="tok",
+            http_engine="async",
+        )
+        ctx = _make_ctx(config=config)
+        mock_async_cls.return_value = MagicMock(spec=AsyncZephyrFetcher)
+
+        result = await get_zephyr_fetcher(ctx)
+        assert result is mock_async_cls.return_value
+        mock_async_cls.assert_called_once_with(config=config)
+        mock_sync_cls.assert_not_called()
@@ -5,14 +5,15 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from zephyr_mcp.server.context import AppContext
-from zephyr_mcp.server.dependencies import _create_user_config, _get_app_context, get_zephyr_fetcher
+from zephyr_mcp.server.dependencies import _create_user_config, _get_app_context, _user_fetcher_key, get_zephyr_fetcher
+from zephyr_mcp.server.pool import FetcherPool
 from zephyr_mcp.zephyr import ZephyrFetcher
 from zephyr_mcp.zephyr.config import ZephyrConfig
 
 
-def _make_ctx(config=None, read_only=False):
+def _make_ctx(config=None, read_only=False, user_fetcher_pool=None):
     ctx = MagicMock()
-    app_context = AppContext(full_zephyr_config=config, read_only=read_only)
+    app_context = AppContext(full_zephyr_config=config, read_only=read_only, user_fetcher_pool=user_fetcher_pool)
     ctx.request_context.lifespan_context = {"app_lifespan_context": app_context}
     return ctx
 
@@ -255,3 +256,76 @@ class TestGetZephyrFetcherHttpContext:
             mock_fetcher_cls.return_value = mock_fetcher
             result = await get_zephyr_fetcher(ctx)
             assert result is mock_fetcher
+
+
+def _header_request(token):
+    mock_request = MagicMock()
+    mock_request.state.zephyr_fetcher = None
+    mock_request.state.user_auth_type = "pat"
+    mock_request.state.service_headers = {
+        "X-Zephyr-Url": "https://api.zephyrscale.smartbear.com/v2",
+        "X-Zephyr-Personal-Token": token,
+    }
+    del mock_request.state.user_token
+    return mock_request
+
+
+class TestUserFetcherPooling:
+    def test_key_depends_on_token(self):
+        url = "https://api.zephyrscale.smartbear.com/v2"
+        assert _user_fetcher_key(url, "pat", "a") == _user_fetcher_key(url, "pat", "a")
+        assert _user_fetcher_key(url, "pat", "a") != _user_fetcher_key(url, "pat", "b")
+        assert "a-secret-token" not in _user_fetcher_key(url, "pat", "a-secret-token")
+
+    @pytest.mark.asyncio
+    @patch("fastmcp.server.dependencies.get_http_request")
+    @patch("zephyr_mcp.server.dependencies.ZephyrFetcher")
+    async def test_header_fetcher_reused_across_requests(self, mock_fetcher_cls, mock_get_request):
+        mock_fetcher_cls.side_effect = lambda config: MagicMock(spec=ZephyrFetcher)
+        ctx = _make_ctx(user_fetcher_pool=FetcherPool(max_entries=8))
+
+        mock_get_request.return_value = _header_request("header-token")
+        first = await get_zephyr_fetcher(ctx)
+        mock_get_request.return_value = _header_request("header-token")
+        second = await get_zephyr_fetcher(ctx)
+
+        assert first is second
+        mock_fetcher_cls.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch("fastmcp.server.dependencies.get_http_request")
+    @patch("zephyr_mcp.server.dependencies.ZephyrFetcher")
+    async def test_different_tokens_get_different_fetchers(self, mock_fetcher_cls, mock_get_request):
+        mock_fetcher_cls.side_effect = lambda config: MagicMock(spec=ZephyrFetcher)
+        ctx = _make_ctx(user_fetcher_pool=FetcherPool(max_entries=8))
+
+        mock_get_request.return_value = _header_request("token-a")
+        first = await get_zephyr_fetcher(ctx)
+        mock_get_request.return_value = _header_request("token-b")
+        second = await get_zephyr_fetcher(ctx)
+
+        assert first is not second
+
+    @pytest.mark.asyncio
+    @patch("fastmcp.server.dependencies.get_http_request")
+    @patch("zephyr_mcp.server.dependencies.ZephyrFetcher")
+    async def test_user_token_fetcher_reused_across_requests(self, mock_fetcher_cls, mock_get_request):
+        base_config = ZephyrConfig(url="https://api.zephyrscale.smartbear.com/v2", auth_type="pat", personal_token="global-token")
+        mock_fetcher_cls.side_effect = lambda config: MagicMock(spec=ZephyrFetcher)
+        ctx = _make_ctx(config=base_config, user_fetcher_pool=FetcherPool(max_entries=8))
+
+        def _user_request():
+            mock_request = MagicMock()
+            mock_request.state.zephyr_fetcher = None
+            mock_request.state.user_auth_type = "oauth"
+            mock_request.state.user_token = "user-access-token"
+            mock_request.state.service_headers = {}
+            return mock_request
+
+        mock_get_request.return_value = _user_request()
+        first = await get_zephyr_fetcher(ctx)
+        mock_get_request.return_value = _user_request()
+        second = await get_zephyr_fetcher(ctx)
+
+        assert first is second
+        mock_fetcher_cls.assert_called_once()
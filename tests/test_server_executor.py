@@ -0,0 +1,222 @@
+"""Tests for zephyr_mcp.server.executor module."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from zephyr_mcp.exceptions import RequestCancelledError
+from zephyr_mcp.server.config import ServerConfig
+from zephyr_mcp.server.context import AppContext
+from zephyr_mcp.server.executor import FetcherExecutor, call_fetcher, tool_deadline
+from zephyr_mcp.server.pool import FetcherPool
+from zephyr_mcp.utils.cancellation import check_cancelled, current_scope
+from zephyr_mcp.utils.metrics import metrics
+
+
+def _make_ctx(executor=None, tool_timeout=None):
+    ctx = MagicMock()
+    server_config = ServerConfig(tool_timeout=tool_timeout) if tool_timeout is not None else None
+    ctx.request_context.lifespan_context = {"app_lifespan_context": AppContext(executor=executor, server_config=server_config)}
+    return ctx
+
+
+class _AsyncFetcher:
+    is_async = True
+
+    def __init__(self):
+        self.get_test_case = AsyncMock(return_value={"key": "PROJ-T1"})
+
+    async def get_test_cycle(self, key):
+        return {"key": key}
+
+
+class TestFetcherExecutor:
+    @pytest.mark.asyncio
+    async def test_runs_on_worker_thread(self):
+        executor = FetcherExecutor(max_workers=2)
+        try:
+            thread_name = await executor.run(lambda: threading.current_thread().name)
+            assert thread_name.startswith("zephyr-fetcher")
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_propagates_errors(self):
+        executor = FetcherExecutor(max_workers=1)
+        try:
+            with pytest.raises(RuntimeError, match="boom"):
+                await executor.run(MagicMock(side_effect=RuntimeError("boom")))
+            assert executor.active == 0
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_queue_depth_tracks_waiting_calls(self):
+        executor = FetcherExecutor(max_workers=1)
+        release = threading.Event()
+        started = threading.Event()
+
+        def _blocking():
+            started.set()
+            release.wait(5)
+            return "done"
+
+        try:
+            first = asyncio.ensure_future(executor.run(_blocking))
+            await asyncio.to_thread(started.wait, 5)
+            second = asyncio.ensure_future(executor.run(lambda: "next"))
+            await asyncio.sleep(0)
+
+            assert executor.active == 1
+            assert executor.queue_depth == 1
+            assert metrics.get("zephyr_worker_queue_depth") == 1
+
+            release.set()
+            assert await first == "done"
+            assert await second == "next"
+            assert executor.queue_depth == 0
+        finally:
+            release.set()
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_responsive(self):
+        executor = FetcherExecutor(max_workers=1)
+        release = threading.Event()
+        try:
+            blocked = asyncio.ensure_future(executor.run(release.wait, 5))
+            # The loop keeps serving other coroutines while the worker is busy.
+            assert await asyncio.wait_for(asyncio.sleep(0, result="pong"), timeout=1) == "pong"
+            release.set()
+            assert await blocked is True
+        finally:
+            release.set()
+            executor.shutdown()
+
+
+class TestCallFetcher:
+    @pytest.mark.asyncio
+    async def test_sync_method_uses_executor(self):
+        executor = FetcherExecutor(max_workers=1)
+        method = MagicMock(return_value={"key": "PROJ-T1"})
+        try:
+            assert await call_fetcher(_make_ctx(executor), method, "PROJ-T1", expand=True) == {"key": "PROJ-T1"}
+            method.assert_called_once_with("PROJ-T1", expand=True)
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_sync_method_without_executor_uses_thread(self):
+        method = MagicMock(return_value={"key": "PROJ-T1"})
+        assert await call_fetcher(_make_ctx(), method, "PROJ-T1") == {"key": "PROJ-T1"}
+
+    @pytest.mark.asyncio
+    async def test_async_fetcher_is_awaited_on_loop(self):
+        fetcher = _AsyncFetcher()
+        assert await call_fetcher(_make_ctx(), fetcher.get_test_cycle, "PROJ-R1") == {"key": "PROJ-R1"}
+
+    @pytest.mark.asyncio
+    async def test_propagates_errors(self):
+        method = MagicMock(side_effect=RuntimeError("boom"))
+        with pytest.raises(RuntimeError, match="boom"):
+            await call_fetcher(_make_ctx(), method)
+
+
+class TestCallFetcherCancellation:
+    @pytest.mark.asyncio
+    async def test_blocking_call_sees_cancellation_scope(self):
+        scopes = []
+        await call_fetcher(_make_ctx(tool_timeout=30.0), lambda: scopes.append(current_scope()))
+        assert scopes[0] is not None
+        assert scopes[0].remaining() <= 30.0
+        assert current_scope() is None
+
+    @pytest.mark.asyncio
+    async def test_deadline_abandons_blocking_call(self):
+        executor = FetcherExecutor(max_workers=1)
+        stopped = threading.Event()
+
+        def _paginate():
+            while True:
+                try:
+                    check_cancelled()
+                except RequestCancelledError:
+                    stopped.set()
+                    raise
+                time.sleep(0.01)
+
+        try:
+            with pytest.raises(RequestCancelledError, match="0.05s tool timeout"):
+                await call_fetcher(_make_ctx(executor, tool_timeout=0.05), _paginate)
+            assert stopped.wait(5)
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_client_cancellation_reaches_worker(self):
+        executor = FetcherExecutor(max_workers=1)
+        started = threading.Event()
+        stopped = threading.Event()
+
+        def _paginate():
+            started.set()
+            scope = current_scope()
+            while not scope.cancelled:
+                time.sleep(0.01)
+            stopped.set()
+
+        try:
+            task = asyncio.create_task(call_fetcher(_make_ctx(executor), _paginate))
+            await asyncio.to_thread(started.wait, 5)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            assert await asyncio.to_thread(stopped.wait, 5)
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_deadline_cancels_async_fetcher(self):
+        class _SlowFetcher:
+            is_async = True
+
+            async def get_test_case(self, key):
+                await asyncio.sleep(5)
+
+        with pytest.raises(RequestCancelledError):
+            await call_fetcher(_make_ctx(tool_timeout=0.05), _SlowFetcher().get_test_case, "PROJ-T1")
+
+    @pytest.mark.asyncio
+    async def test_fetcher_timeout_errors_not_reported_as_deadline(self):
+        with pytest.raises(TimeoutError):
+            await call_fetcher(_make_ctx(tool_timeout=30.0), MagicMock(side_effect=TimeoutError("socket")))
+
+    @pytest.mark.asyncio
+    async def test_calls_in_a_tool_deadline_share_it(self):
+        ctx = _make_ctx(tool_timeout=0.3)
+
+        def _slow():
+            time.sleep(0.2)
+            check_cancelled()
+
+        with pytest.raises(RequestCancelledError, match="0.3s tool timeout"):
+            async with tool_deadline(ctx, "zephyr_create_test_case"):
+                await call_fetcher(ctx, _slow)
+                await call_fetcher(ctx, _slow)
+        assert current_scope() is None
+
+    @pytest.mark.asyncio
+    async def test_evicted_fetcher_is_closed_after_the_tool_call(self):
+        pool = FetcherPool(max_entries=1)
+        fetcher = pool.get_or_create("a", _AsyncFetcher)
+        fetcher.close = MagicMock()
+
+        async with tool_deadline(_make_ctx(), "zephyr_create_test_case"):
+            await call_fetcher(_make_ctx(), fetcher.get_test_cycle, "PROJ-R1")
+            pool.get_or_create("b", _AsyncFetcher)
+            fetcher.close.assert_not_called()
+            await call_fetcher(_make_ctx(), fetcher.get_test_cycle, "PROJ-R1")
+        fetcher.close.assert_called_once()
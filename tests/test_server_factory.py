@@ -1,12 +1,15 @@
 """Tests for zephyr_mcp.server.factory module."""
 
-from unittest.mock import patch
+import asyncio
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastmcp import FastMCP
 
 from zephyr_mcp.server.context import AppContext
 from zephyr_mcp.server.factory import create_server
+from zephyr_mcp.server.pool import FetcherPool
 from zephyr_mcp.squad.config import ZephyrSquadConfig
 from zephyr_mcp.zephyr.config import ZephyrConfig
 
@@ -121,3 +124,88 @@ class TestLifespan:
             app_ctx = result["app_lifespan_context"]
             assert app_ctx.full_zephyr_config is fake_scale
             assert app_ctx.squad_config is fake_squad
+
+    @pytest.mark.asyncio
+    @patch("zephyr_mcp.server.factory.ZephyrSquadConfig.from_env")
+    @patch("zephyr_mcp.server.factory.ZephyrConfig.from_env")
+    async def test_lifespan_closes_fetcher_pool(self, mock_from_env, mock_squad_from_env):
+        """Test lifespan provides a fetcher pool and closes pooled fetchers on shutdown."""
+        mock_from_env.side_effect = Exception("no scale")
+        mock_squad_from_env.side_effect = Exception("no squad")
+        pooled = MagicMock()
+
+        server = create_server(read_only=False)
+        async with server._lifespan_manager():
+            pool = server._lifespan_result["app_lifespan_context"].fetcher_pool
+            assert isinstance(pool, FetcherPool)
+            pool.get_or_create("key", lambda: pooled)
+            user_pool = server._lifespan_result["app_lifespan_context"].user_fetcher_pool
+            assert user_pool.max_entries == 256
+
+        pooled.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch("zephyr_mcp.server.factory.ZephyrSquadConfig.from_env")
+    @patch("zephyr_mcp.server.factory.ZephyrConfig.from_env")
+    async def test_lifespan_worker_threads_override(self, mock_from_env, mock_squad_from_env):
+        """Test the worker_threads argument sizes the fetcher executor."""
+        mock_from_env.side_effect = Exception("no scale")
+        mock_squad_from_env.side_effect = Exception("no squad")
+
+        server = create_server(worker_threads=3)
+        async with server._lifespan_manager():
+            app_ctx = server._lifespan_result["app_lifespan_context"]
+            assert app_ctx.server_config.worker_threads == 3
+            assert app_ctx.executor.max_workers == 3
+
+    @pytest.mark.asyncio
+    @patch("zephyr_mcp.server.factory.warm_up", new_callable=AsyncMock)
+    @patch("zephyr_mcp.server.factory.ZephyrSquadConfig.from_env")
+    @patch("zephyr_mcp.server.factory.ZephyrConfig.from_env")
+    async def test_lifespan_warmup_enabled(self, mock_from_env, mock_squad_from_env, mock_warm_up):
+        """Test ZEPHYR_WARMUP starts the warm-up in the background."""
+        mock_from_env.side_effect = Exception("no scale")
+        mock_squad_from_env.side_effect = Exception("no squad")
+
+        server = create_server()
+        with patch.dict(os.environ, {"ZEPHYR_WARMUP": "true"}):
+            async with server._lifespan_manager():
+                await asyncio.sleep(0)
+                app_ctx = server._lifespan_result["app_lifespan_context"]
+        mock_warm_up.assert_awaited_once_with(app_ctx)
+
+    @pytest.mark.asyncio
+    @patch("zephyr_mcp.server.factory.warm_up", new_callable=AsyncMock)
+    @patch("zephyr_mcp.server.factory.ZephyrSquadConfig.from_env")
+    @patch("zephyr_mcp.server.factory.ZephyrConfig.from_env")
+    async def test_lifespan_warmup_disabled_by_default(self, mock_from_env, mock_squad_from_env, mock_warm_up):
+        mock_from_env.side_effect = Exception("no scale")
+        mock_squad_from_env.side_effect = Exception("no squad")
+
+        server = create_server()
+        with patch.dict(os.environ, {}, clear=True):
+            async with server._lifespan_manager():
+                await asyncio.sleep(0)
+        mock_warm_up.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("zephyr_mcp.server.factory.prefetch", new_callable=AsyncMock)
+    @patch("zephyr_mcp.server.factory.ZephyrSquadConfig.from_env")
+    @patch("zephyr_mcp.server.factory.ZephyrConfig.from_env")
+    async def test_lifespan_prefetch_enabled(self, mock_from_env, mock_squad_from_env, mock_prefetch):
+        """Test ZEPHYR_PREFETCH starts the prefetch in the background."""
+        mock_from_env.side_effect = Exception("no scale")
+        mock_squad_from_env.side_effect = Exception("no squad")
+
+        server = create_server()
+        with patch.dict(os.environ, {"ZEPHYR_PREFETCH": "true"}):
+            async with server._lifespan_manager():
+                await asyncio.sleep(0)
+                app_ctx = server._lifespan_result["app_lifespan_context"]
+        mock_prefetch.assert_awaited_once_with(app_ctx)
+
+
+class TestMetricsRoute:
+    def test_metrics_route_registered(self):
+        server = create_server()
+        assert any(getattr(route, "path", None) == "/metrics" for route in server._get_additional_http_routes())
@@ -0,0 +1,235 @@
+"""Tests for zephyr_mcp.server.pool module."""
+
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from zephyr_mcp.server.pool import FetcherPool, fetcher_in_use, get_pooled_fetcher
+
+
+class TestFetcherPool:
+    def test_creates_once_per_key(self):
+        pool = FetcherPool()
+        factory = MagicMock(side_effect=lambda: MagicMock())
+
+        first = pool.get_or_create("a", factory)
+        second = pool.get_or_create("a", factory)
+        assert first is second
+        factory.assert_called_once()
+        assert len(pool) == 1
+        assert "a" in pool
+
+    def test_distinct_keys_get_distinct_fetchers(self):
+        pool = FetcherPool()
+        first = pool.get_or_create("a", MagicMock)
+        second = pool.get_or_create("b", MagicMock)
+        assert first is not second
+        assert len(pool) == 2
+
+    def test_factory_error_not_cached(self):
+        pool = FetcherPool()
+        with pytest.raises(ValueError):
+            pool.get_or_create("a", MagicMock(side_effect=ValueError("bad config")))
+        assert "a" not in pool
+
+        fetcher = pool.get_or_create("a", MagicMock)
+        assert fetcher is not None
+
+    def test_close_releases_fetchers(self):
+        pool = FetcherPool()
+        fetcher = pool.get_or_create("a", MagicMock)
+
+        pool.close()
+        fetcher.close.assert_called_once()
+        assert len(pool) == 0
+
+    def test_close_ignores_fetcher_errors(self):
+        pool = FetcherPool()
+        failing = pool.get_or_create("a", MagicMock)
+        failing.close.side_effect = RuntimeError("boom")
+        healthy = pool.get_or_create("b", MagicMock)
+
+        pool.close()
+        healthy.close.assert_called_once()
+
+    def test_get_after_close_raises(self):
+        pool = FetcherPool()
+        pool.close()
+        with pytest.raises(RuntimeError, match="closed"):
+            pool.get_or_create("a", MagicMock)
+
+    def test_concurrent_first_use_creates_single_fetcher(self):
+        pool = FetcherPool()
+        factory = MagicMock(side_effect=lambda: MagicMock())
+        results = []
+
+        def worker():
+            results.append(pool.get_or_create("a", factory))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        factory.assert_called_once()
+        assert all(result is results[0] for result in results)
+
+    def test_build_does_not_block_other_keys(self):
+        pool = FetcherPool()
+        building, release = threading.Event(), threading.Event()
+
+        def slow_factory():
+            building.set()
+            release.wait(5)
+            return MagicMock()
+
+        thread = threading.Thread(target=pool.get_or_create, args=("slow", slow_factory))
+        thread.start()
+        assert building.wait(5)
+        assert pool.get_or_create("fast", MagicMock) is not None
+        release.set()
+        thread.join()
+        assert "slow" in pool
+
+    def test_waiters_share_a_failed_build(self):
+        pool = FetcherPool()
+        building, release = threading.Event(), threading.Event()
+        errors = []
+
+        def failing_factory():
+            building.set()
+            release.wait(5)
+            raise ValueError("bad config")
+
+        def first():
+            with pytest.raises(ValueError):
+                pool.get_or_create("a", failing_factory)
+
+        def second():
+            try:
+                pool.get_or_create("a", MagicMock)
+            except ValueError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=first)]
+        threads[0].start()
+        assert building.wait(5)
+        threads.append(threading.Thread(target=second))
+        threads[1].start()
+        release.set()
+        for thread in threads:
+            thread.join()
+        assert len(errors) == 1
+        assert "a" not in pool
+
+
+class TestFetcherPoolBounds:
+    def test_lru_eviction_closes_oldest(self):
+        pool = FetcherPool(max_entries=2)
+        first = pool.get_or_create("a", MagicMock)
+        pool.get_or_create("b", MagicMock)
+        pool.get_or_create("a", MagicMock)  # refresh "a" so "b" becomes least recently used
+        pool.get_or_create("c", MagicMock)
+
+        assert "a" in pool
+        assert "b" not in pool
+        assert "c" in pool
+        first.close.assert_not_called()
+
+    def test_full_pool_closes_evicted_fetcher(self):
+        pool = FetcherPool(max_entries=1)
+        first = pool.get_or_create("a", MagicMock)
+        pool.get_or_create("b", MagicMock)
+        first.close.assert_called_once()
+        assert len(pool) == 1
+
+    @patch("zephyr_mcp.server.pool.time.monotonic")
+    def test_idle_entries_expire(self, mock_monotonic):
+        pool = FetcherPool(idle_ttl=60)
+        mock_monotonic.return_value = 0.0
+        stale = pool.get_or_create("a", MagicMock)
+
+        mock_monotonic.return_value = 61.0
+        fresh = pool.get_or_create("a", MagicMock)
+        assert fresh is not stale
+        stale.close.assert_called_once()
+
+    @patch("zephyr_mcp.server.pool.time.monotonic")
+    def test_use_resets_idle_timer(self, mock_monotonic):
+        pool = FetcherPool(idle_ttl=60)
+        mock_monotonic.return_value = 0.0
+        fetcher = pool.get_or_create("a", MagicMock)
+        mock_monotonic.return_value = 50.0
+        pool.get_or_create("a", MagicMock)
+        mock_monotonic.return_value = 100.0
+        assert pool.get_or_create("a", MagicMock) is fetcher
+
+    def test_fetcher_in_use_is_closed_on_release(self):
+        pool = FetcherPool(max_entries=1)
+        first = pool.get_or_create("a", MagicMock)
+        with fetcher_in_use(first):
+            pool.get_or_create("b", MagicMock)
+            assert "a" not in pool
+            first.close.assert_not_called()
+        first.close.assert_called_once()
+
+    def test_explicit_evict(self):
+        pool = FetcherPool()
+        fetcher = pool.get_or_create("a", MagicMock)
+        assert pool.evict("a") is True
+        fetcher.close.assert_called_once()
+        assert pool.evict("a") is False
+
+
+class TestFetcherPoolAclose:
+    @pytest.mark.asyncio
+    async def test_awaits_async_fetchers_and_closes_sync_ones(self):
+        pool = FetcherPool()
+        async_fetcher = MagicMock(is_async=True)
+        async_fetcher.aclose = AsyncMock()
+        sync_fetcher = pool.get_or_create("sync", MagicMock)
+        pool.get_or_create("async", lambda: async_fetcher)
+
+        await pool.aclose()
+
+        async_fetcher.aclose.assert_awaited_once()
+        async_fetcher.close.assert_not_called()
+        sync_fetcher.close.assert_called_once()
+        assert len(pool) == 0
+
+    @pytest.mark.asyncio
+    async def test_aclose_ignores_fetcher_errors(self):
+        pool = FetcherPool()
+        failing = MagicMock(is_async=True)
+        failing.aclose = AsyncMock(side_effect=RuntimeError("boom"))
+        pool.get_or_create("a", lambda: failing)
+        healthy = pool.get_or_create("b", MagicMock)
+
+        await pool.aclose()
+        healthy.close.assert_called_once()
+        with pytest.raises(RuntimeError, match="closed"):
+            pool.get_or_create("c", MagicMock)
+
+
+class TestGetPooledFetcher:
+    @pytest.mark.asyncio
+    async def test_builds_on_a_worker_thread_once(self):
+        pool = FetcherPool()
+        threads = []
+
+        def factory():
+            threads.append(threading.current_thread())
+            return MagicMock()
+
+        first = await get_pooled_fetcher(pool, "a", factory)
+        assert await get_pooled_fetcher(pool, "a", factory) is first
+        assert threads != [threading.main_thread()]
+        assert len(threads) == 1
+
+    @pytest.mark.asyncio
+    async def test_without_pool_builds_every_time(self):
+        factory = MagicMock(side_effect=lambda: MagicMock())
+        assert await get_pooled_fetcher(None, "a", factory) is not await get_pooled_fetcher(None, "a", factory)
+        assert factory.call_count == 2
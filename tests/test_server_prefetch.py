@@ -0,0 +1,188 @@
+"""Tests for zephyr_mcp.server.prefetch module."""
+
+import logging
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from zephyr_mcp.cache import EntityCache, EntityCachePolicy
+from zephyr_mcp.server.config import ServerConfig
+from zephyr_mcp.server.context import AppContext
+from zephyr_mcp.server.pool import FetcherPool
+from zephyr_mcp.server.prefetch import PAGE_SIZE, ProjectPrefetcher, _is_active, prefetch
+from zephyr_mcp.utils.metrics import metrics
+from zephyr_mcp.utils.ratelimit import TokenBucket
+from zephyr_mcp.zephyr.config import ZephyrConfig
+from zephyr_mcp.zephyr.metadata import METADATA_CATEGORIES
+
+SCOPE = "https://api.zephyrscale.smartbear.com/v2|cred"
+
+
+def _listings(cases: int = 0, cycles: list[dict] | None = None):
+    """A client.get side effect serving paged /testcases and /testcycles listings."""
+    items = {
+        "/testcases": [{"key": f"PROJ-T{n}", "name": f"Case {n}"} for n in range(cases)],
+        "/testcycles": cycles or [],
+    }
+
+    def get(endpoint, params=None, **kwargs):
+        if endpoint not in items:
+            return {"values": []}
+        start, size = params["startAt"], params["maxResults"]
+        values = items[endpoint][start : start + size]
+        return {"values": values, "startAt": start, "total": len(items[endpoint]), "isLast": start + size >= len(items[endpoint])}
+
+    return get
+
+
+def _fetcher(get, is_async: bool = False):
+    fetcher = MagicMock(is_async=is_async)
+    fetcher.entity_cache = EntityCache(EntityCachePolicy(), name="zephyr")
+    fetcher.cache_scope = SCOPE
+    fetcher.metadata_cache = None
+    if is_async:
+        fetcher.client.get = AsyncMock(side_effect=get)
+        fetcher.search_test_cases = AsyncMock(return_value={"values": []})
+    else:
+        fetcher.client.get = MagicMock(side_effect=get)
+    return fetcher
+
+
+def _prefetcher(fetcher, max_items: int = 5000, ttl: float | None = None) -> ProjectPrefetcher:
+    return ProjectPrefetcher(fetcher, TokenBucket(1000.0, 1000), max_items, ttl=ttl)
+
+
+class TestProjectPrefetcher:
+    def setup_method(self):
+        metrics.reset()
+
+    @pytest.mark.asyncio
+    async def test_pages_test_cases_into_entity_cache(self):
+        fetcher = _fetcher(_listings(cases=PAGE_SIZE + 20))
+        await _prefetcher(fetcher).run("PROJ")
+
+        cache = fetcher.entity_cache
+        assert cache.get(SCOPE, "testcase", "PROJ-T0") == b'{"key":"PROJ-T0","name":"Case 0"}'
+        assert cache.get(SCOPE, "testcase", f"PROJ-T{PAGE_SIZE + 19}") is not None
+        starts = [c.kwargs["params"]["startAt"] for c in fetcher.client.get.call_args_list if c.args[0] == "/testcases"]
+        assert starts == [0, PAGE_SIZE]
+        fetcher.search_test_cases.assert_called_once_with("PROJ")
+        assert metrics.get("zephyr_prefetch_items_total", labels={"project": "PROJ", "kind": "testcase"}) == PAGE_SIZE + 20
+
+    @pytest.mark.asyncio
+    async def test_only_active_cycles(self):
+        cycles = [{"key": "PROJ-R1", "plannedEndDate": "2999-01-01T00:00:00Z"}, {"key": "PROJ-R2", "plannedEndDate": "2001-01-01T00:00:00Z"}]
+        fetcher = _fetcher(_listings(cycles=cycles))
+        await _prefetcher(fetcher).run("PROJ")
+
+        cache = fetcher.entity_cache
+        assert cache.get(SCOPE, "testcycle", "PROJ-R1") is not None
+        assert cache.get(SCOPE, "testcycle", "PROJ-R2") is None
+        # Folders come from the metadata catalog, not from entity entries nothing reads.
+        assert "/folders" not in [c.args[0] for c in fetcher.client.get.call_args_list]
+
+    @pytest.mark.asyncio
+    async def test_entries_outlive_the_entity_cache_ttl(self):
+        fetcher = _fetcher(_listings(cases=1))
+        await _prefetcher(fetcher, ttl=900.0).run("PROJ")
+
+        with patch("zephyr_mcp.cache.entity.time.monotonic", return_value=time.monotonic() + 120):
+            assert fetcher.entity_cache.get(SCOPE, "testcase", "PROJ-T0") is not None
+        with patch("zephyr_mcp.cache.entity.time.monotonic", return_value=time.monotonic() + 901):
+            assert fetcher.entity_cache.get(SCOPE, "testcase", "PROJ-T0") is None
+
+    @pytest.mark.asyncio
+    async def test_loads_project_metadata(self):
+        fetcher = _fetcher(_listings())
+        fetcher.metadata_cache = MagicMock()
+        await _prefetcher(fetcher).run("PROJ")
+        assert [c.args for c in fetcher.get_metadata.call_args_list] == [("PROJ", category) for category in METADATA_CATEGORIES]
+
+    @pytest.mark.asyncio
+    async def test_stops_at_max_items(self):
+        fetcher = _fetcher(_listings(cases=3 * PAGE_SIZE))
+        await _prefetcher(fetcher, max_items=PAGE_SIZE + 5).run("PROJ")
+
+        assert fetcher.entity_cache.get(SCOPE, "testcase", f"PROJ-T{PAGE_SIZE + 4}") is not None
+        assert fetcher.entity_cache.get(SCOPE, "testcase", f"PROJ-T{PAGE_SIZE + 5}") is None
+        assert len([c for c in fetcher.client.get.call_args_list if c.args[0] == "/testcases"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_every_request_takes_a_token(self):
+        fetcher = _fetcher(_listings(cases=PAGE_SIZE + 1))
+        budget = MagicMock(acquire_async=AsyncMock(return_value=0.0))
+        await ProjectPrefetcher(fetcher, budget, 5000).run("PROJ")
+        assert budget.acquire_async.await_count == fetcher.client.get.call_count + fetcher.search_test_cases.call_count
+
+    @pytest.mark.asyncio
+    async def test_write_during_prefetch_is_not_undone(self):
+        fetcher = _fetcher(None)
+
+        def get(endpoint, params=None, **kwargs):
+            fetcher.entity_cache.invalidate(SCOPE, "testcase", "PROJ-T1")
+            return {"values": [{"key": "PROJ-T1", "name": "old"}], "isLast": True}
+
+        fetcher.client.get.side_effect = get
+        await _prefetcher(fetcher).run("PROJ")
+        assert fetcher.entity_cache.get(SCOPE, "testcase", "PROJ-T1") is None
+
+    @pytest.mark.asyncio
+    async def test_async_fetcher(self):
+        fetcher = _fetcher(_listings(cases=2), is_async=True)
+        await _prefetcher(fetcher).run("PROJ")
+        assert fetcher.entity_cache.get(SCOPE, "testcase", "PROJ-T1") is not None
+        fetcher.search_test_cases.assert_awaited_once_with("PROJ")
+
+    @pytest.mark.asyncio
+    async def test_failure_is_logged(self, caplog):
+        fetcher = _fetcher(None)
+        fetcher.client.get.side_effect = RuntimeError("boom")
+        with caplog.at_level(logging.WARNING, logger="mcp-zephyr.server.prefetch"):
+            await _prefetcher(fetcher).run("PROJ")
+        assert "Prefetch of PROJ failed" in caplog.text
+
+
+class TestPrefetch:
+    def _app_ctx(self, project_key: str | None = "PROJ, OTHER", **server):
+        config = ZephyrConfig(url="https://api.zephyrscale.smartbear.com/v2", personal_token="tok", project_key=project_key)
+        return AppContext(
+            full_zephyr_config=config, fetcher_pool=FetcherPool(), server_config=ServerConfig(prefetch=True, prefetch_rate=1000.0, **server)
+        )
+
+    @pytest.mark.asyncio
+    async def test_prefetches_each_project_key(self):
+        fetcher = _fetcher(_listings(cases=1))
+        with patch("zephyr_mcp.server.dependencies._new_fetcher", return_value=fetcher):
+            await prefetch(self._app_ctx())
+        projects = {c.kwargs["params"]["projectKey"] for c in fetcher.client.get.call_args_list}
+        assert projects == {"PROJ", "OTHER"}
+
+    @pytest.mark.asyncio
+    async def test_prefetch_projects_override_project_key(self):
+        fetcher = _fetcher(_listings())
+        with patch("zephyr_mcp.server.dependencies._new_fetcher", return_value=fetcher):
+            await prefetch(self._app_ctx(prefetch_projects=("ONLY",)))
+        assert {c.kwargs["params"]["projectKey"] for c in fetcher.client.get.call_args_list} == {"ONLY"}
+
+    @pytest.mark.asyncio
+    async def test_skipped_without_project_keys(self, caplog):
+        with patch("zephyr_mcp.server.dependencies._new_fetcher") as new_fetcher, caplog.at_level(logging.INFO):
+            await prefetch(self._app_ctx(project_key=None))
+        new_fetcher.assert_not_called()
+        assert "Prefetch skipped" in caplog.text
+
+
+class TestIsActive:
+    @pytest.mark.parametrize(
+        ("cycle", "active"),
+        [
+            ({}, True),
+            ({"plannedEndDate": "2999-12-31T00:00:00Z"}, True),
+            ({"plannedEndDate": "2000-01-01T00:00:00Z"}, False),
+            ({"plannedEndDate": "2000-01-01"}, False),
+            ({"plannedEndDate": "soon"}, True),
+        ],
+    )
+    def test_is_active(self, cycle, active):
+        assert _is_active(cycle) is active
@@ -11,6 +11,7 @@ from zephyr_mcp.server.tools import (
     zephyr_create_test_case,
     zephyr_create_test_cycle,
     zephyr_create_test_execution,
+    zephyr_get_project_metadata,
     zephyr_get_test_case,
     zephyr_get_test_cycle,
     zephyr_get_test_execution,
@@ -19,6 +20,33 @@ from zephyr_mcp.server.tools import (
     zephyr_update_test_case,
     zephyr_update_test_execution,
 )
+from zephyr_mcp.utils.cancellation import current_scope
+from zephyr_mcp.zephyr.metadata import _resolved, find_metadata_entry
+
+METADATA = {
+    "testcase_status": [
+        {"id": 1, "name": "Approved"},
+        {"id": 2, "name": "Draft"},
+        {"id": 3, "name": "Deprecated"},
+        {"id": 4, "name": "Needs Review"},
+    ],
+    "testcycle_status": [],
+    "testexecution_status": [
+        {"id": 10, "name": "Pass"},
+        {"id": 11, "name": "Fail"},
+        {"id": 12, "name": "Blocked"},
+        {"id": 13, "name": "Not Executed"},
+    ],
+    "priority": [{"id": 20, "name": "High"}, {"id": 21, "name": "Normal"}, {"id": 22, "name": "Low"}],
+    "environment": [{"id": 30, "name": "Chrome"}],
+    "testcase_folder": [{"id": 40, "name": "Regression", "path": "/Regression"}, {"id": 41, "name": "Login", "path": "/Regression/Login"}],
+    "testcycle_folder": [{"id": 50, "name": "Sprint 1", "path": "/Sprint 1"}],
+}
+
+
+def _resolve_metadata(project_key, category, value):
+    entries = METADATA[category]
+    return _resolved(project_key, category, value, entries, find_metadata_entry(category, entries, value))
 
 
 def _make_ctx(read_only=False):
@@ -40,6 +68,9 @@ def _make_fetcher():
     fetcher.create_test_execution.return_value = {"id": "12346"}
     fetcher.update_test_execution.return_value = {"id": "12345", "statusName": "Fail"}
     fetcher.link_test_case_to_issue.return_value = {}
+    fetcher.resolve_metadata.side_effect = _resolve_metadata
+    fetcher.get_project_metadata.return_value = METADATA
+    fetcher.config.project_keys.return_value = ("PROJ",)
     return fetcher
 
 
@@ -70,7 +101,7 @@ class TestZephyrGetTestCase:
 
         result = await zephyr_get_test_case(ctx, "PROJ-T1")
         assert "PROJ-T1" in result
-        fetcher.get_test_case.assert_called_once_with("PROJ-T1")
+        fetcher.get_test_case.assert_called_once_with("PROJ-T1", raw=True)
 
     @pytest.mark.asyncio
     @patch("zephyr_mcp.server.tools.get_zephyr_fetcher", new_callable=AsyncMock)
@@ -133,6 +164,7 @@ class TestZephyrCreateTestCase:
     @pytest.mark.asyncio
     @patch("zephyr_mcp.server.tools.get_zephyr_fetcher", new_callable=AsyncMock)
     async def test_invalid_status(self, mock_get_fetcher):
+        mock_get_fetcher.return_value = _make_fetcher()
         ctx = _make_ctx(read_only=False)
         result = await zephyr_create_test_case(ctx, "PROJ", "Test", status="InvalidStatus")
         assert "Invalid status" in result
@@ -140,6 +172,7 @@ class TestZephyrCreateTestCase:
     @pytest.mark.asyncio
     @patch("zephyr_mcp.server.tools.get_zephyr_fetcher", new_callable=AsyncMock)
     async def test_invalid_priority(self, mock_get_fetcher):
+        mock_get_fetcher.return_value = _make_fetcher()
         ctx = _make_ctx(read_only=False)
         result = await zephyr_create_test_case(ctx, "PROJ", "Test", priority="InvalidPriority")
         assert "Invalid priority" in result
@@ -153,6 +186,71 @@ class TestZephyrCreateTestCase:
         result = await zephyr_create_test_case(ctx, "PROJ", "Test")
         assert "Authentication error" in result
 
+    @pytest.mark.asyncio
+    @patch("zephyr_mcp.server.tools.get_zephyr_fetcher", new_callable=AsyncMock)
+    async def test_custom_values_sent_by_canonical_name(self, mock_get_fetcher):
+        fetcher = _make_fetcher()
+        mock_get_fetcher.return_value = fetcher
+        ctx = _make_ctx(read_only=False)
+
+        await zephyr_create_test_case(ctx, "PROJ", "Test", status="needs review", priority="20")
+
+        kwargs = fetcher.create_test_case.call_args.kwargs
+        assert kwargs["status"] == "Needs Review"
+        assert kwargs["priority"] == "High"
+        fetcher.resolve_metadata.assert_any_call("PROJ", "testcase_status", "needs review")
+
+    @pytest.mark.asyncio
+    @patch("zephyr_mcp.server.tools.get_zephyr_fetcher", new_callable=AsyncMock)
+    async def test_checks_and_write_share_one_deadline(self, mock_get_fetcher):
+        fetcher = _make_fetcher()
+        scopes = []
+        fetcher.resolve_metadata.side_effect = lambda *args: scopes.append(current_scope()) or _resolve_metadata(*args)
+        fetcher.create_test_case.side_effect = lambda **kwargs: scopes.append(current_scope()) or {"key": "PROJ-T2"}
+        mock_get_fetcher.return_value = fetcher
+
+        await zephyr_create_test_case(_make_ctx(read_only=False), "PROJ", "Test", status="Draft", priority="High", folder="/Regression")
+
+        assert len(scopes) == 4
+        assert scopes[0] is not None
+        assert all(scope is scopes[0] for scope in scopes)
+
+    @pytest.mark.asyncio
+    @patch("zephyr_mcp.server.tools.get_zephyr_fetcher", new_callable=AsyncMock)
+    async def test_folder_path_sent_as_id(self, mock_get_fetcher):
+        fetcher = _make_fetcher()
+        mock_get_fetcher.return_value = fetcher
+        ctx = _make_ctx(read_only=False)
+
+        await zephyr_create_test_case(ctx, "PROJ", "Test", folder="/Regression/Login")
+        assert fetcher.create_test_case.call_args.kwargs["folder_id"] == 41
+
+    @pytest.mark.asyncio
+    @patch("zephyr_mcp.server.tools.get_zephyr_fetcher", new_callable=AsyncMock)
+    async def test_invalid_folder_is_not_sent(self, mock_get_fetcher):
+        fetcher = _make_fetcher()
+        mock_get_fetcher.return_value = fetcher
+        ctx = _make_ctx(read_only=False)
+
+        result = await zephyr_create_test_case(ctx, "PROJ", "Test", folder="/Regresion")
+
+        assert result == "Invalid folder '/Regresion' for project PROJ. Valid folders: /Regression, /Regression/Login"
+        fetcher.create_test_case.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("zephyr_mcp.server.tools.get_zephyr_fetcher", new_callable=AsyncMock)
+    async def test_values_sent_as_given_when_metadata_unavailable(self, mock_get_fetcher):
+        fetcher = _make_fetcher()
+        fetcher.resolve_metadata.side_effect = ConnectionError("connection reset")
+        mock_get_fetcher.return_value = fetcher
+        ctx = _make_ctx(read_only=False)
+
+        result = await zephyr_create_test_case(ctx, "PROJ", "Test", status="Custom", folder="/New")
+
+        assert "PROJ-T2" in result
+        kwargs = fetcher.create_test_case.call_args.kwargs
+        assert (kwargs["status"], kwargs["folder"], kwargs["folder_id"]) == ("Custom", "/New", None)
+
 
 class TestZephyrUpdateTestCase:
     @pytest.mark.asyncio
@@ -174,6 +272,7 @@ class TestZephyrUpdateTestCase:
     @pytest.mark.asyncio
     @patch("zephyr_mcp.server.tools.get_zephyr_fetcher", new_callable=AsyncMock)
     async def test_invalid_status(self, mock_get_fetcher):
+        mock_get_fetcher.return_value = _make_fetcher()
         ctx = _make_ctx(read_only=False)
         result = await zephyr_update_test_case(ctx, "PROJ-T1", status="Bad")
         assert "Invalid status" in result
@@ -181,10 +280,21 @@ class TestZephyrUpdateTestCase:
     @pytest.mark.asyncio
     @patch("zephyr_mcp.server.tools.get_zephyr_fetcher", new_callable=AsyncMock)
     async def test_invalid_priority(self, mock_get_fetcher):
+        mock_get_fetcher.return_value = _make_fetcher()
         ctx = _make_ctx(read_only=False)
         result = await zephyr_update_test_case(ctx, "PROJ-T1", priority="Bad")
         assert "Invalid priority" in result
 
+    @pytest.mark.asyncio
+    @patch("zephyr_mcp.server.tools.get_zephyr_fetcher", new_callable=AsyncMock)
+    async def test_project_taken_from_key(self, mock_get_fetcher):
+        fetcher = _make_fetcher()
+        mock_get_fetcher.return_value = fetcher
+        ctx = _make_ctx(read_only=False)
+
+        await zephyr_update_test_case(ctx, "MY_PROJ-T1", status="Draft")
+        fetcher.resolve_metadata.assert_called_once_with("MY_PROJ", "testcase_status", "Draft")
+
 
 class TestZephyrGetTestCycle:
     @pytest.mark.asyncio
@@ -196,7 +306,7 @@ class TestZephyrGetTestCycle:
 
         result = await zephyr_get_test_cycle(ctx, "PROJ-R1")
         assert "PROJ-R1" in result
-        fetcher.get_test_cycle.assert_called_once_with("PROJ-R1")
+        fetcher.get_test_cycle.assert_called_once_with("PROJ-R1", raw=True)
 
     @pytest.mark.asyncio
     @patch("zephyr_mcp.server.tools.get_zephyr_fetcher", new_callable=AsyncMock)
@@ -234,6 +344,16 @@ class TestZephyrCreateTestCycle:
         result = await zephyr_create_test_cycle(ctx, "PROJ", "Cycle")
         assert "Authentication error" in result
 
+    @pytest.mark.asyncio
+    @patch("zephyr_mcp.server.tools.get_zephyr_fetcher", new_callable=AsyncMock)
+    async def test_folder_name_sent_as_id(self, mock_get_fetcher):
+        fetcher = _make_fetcher()
+        mock_get_fetcher.return_value = fetcher
+        ctx = _make_ctx(read_only=False)
+
+        await zephyr_create_test_cycle(ctx, "PROJ", "Cycle", folder="sprint 1")
+        assert fetcher.create_test_cycle.call_args.kwargs["folder_id"] == 50
+
 
 class TestZephyrGetTestExecution:
     @pytest.mark.asyncio
@@ -245,7 +365,7 @@ class TestZephyrGetTestExecution:
 
         result = await zephyr_get_test_execution(ctx, "12345")
         assert "12345" in result
-        fetcher.get_test_execution.assert_called_once_with("12345")
+        fetcher.get_test_execution.assert_called_once_with("12345", raw=True)
 
     @pytest.mark.asyncio
     @patch("zephyr_mcp.server.tools.get_zephyr_fetcher", new_callable=AsyncMock)
@@ -277,6 +397,7 @@ class TestZephyrCreateTestExecution:
     @pytest.mark.asyncio
     @patch("zephyr_mcp.server.tools.get_zephyr_fetcher", new_callable=AsyncMock)
     async def test_invalid_status(self, mock_get_fetcher):
+        mock_get_fetcher.return_value = _make_fetcher()
         ctx = _make_ctx(read_only=False)
         result = await zephyr_create_test_execution(ctx, "PROJ", "PROJ-T1", "PROJ-R1", status_name="BadStatus")
         assert "Invalid status" in result
@@ -290,6 +411,14 @@ class TestZephyrCreateTestExecution:
         result = await zephyr_create_test_execution(ctx, "PROJ", "PROJ-T1", "PROJ-R1")
         assert "Authentication error" in result
 
+    @pytest.mark.asyncio
+    @patch("zephyr_mcp.server.tools.get_zephyr_fetcher", new_callable=AsyncMock)
+    async def test_invalid_environment(self, mock_get_fetcher):
+        mock_get_fetcher.return_value = _make_fetcher()
+        ctx = _make_ctx(read_only=False)
+        result = await zephyr_create_test_execution(ctx, "PROJ", "PROJ-T1", "PROJ-R1", environment="Chorme")
+        assert result == "Invalid environment 'Chorme' for project PROJ. Valid environments: Chrome"
+
 
 class TestZephyrUpdateTestExecution:
     @pytest.mark.asyncio
@@ -311,10 +440,60 @@ class TestZephyrUpdateTestExecution:
     @pytest.mark.asyncio
     @patch("zephyr_mcp.server.tools.get_zephyr_fetcher", new_callable=AsyncMock)
     async def test_invalid_status(self, mock_get_fetcher):
+        mock_get_fetcher.return_value = _make_fetcher()
         ctx = _make_ctx(read_only=False)
         result = await zephyr_update_test_execution(ctx, "12345", status_name="BadStatus")
         assert "Invalid status" in result
 
+    @pytest.mark.asyncio
+    @patch("zephyr_mcp.server.tools.get_zephyr_fetcher", new_callable=AsyncMock)
+    async def test_checked_against_configured_project(self, mock_get_fetcher):
+        fetcher = _make_fetcher()
+        mock_get_fetcher.return_value = fetcher
+        ctx = _make_ctx(read_only=False)
+
+        await zephyr_update_test_execution(ctx, "12345", status_name="fail")
+
+        fetcher.resolve_metadata.assert_called_once_with("PROJ", "testexecution_status", "fail")
+        assert fetcher.update_test_execution.call_args.kwargs["status_name"] == "Fail"
+
+    @pytest.mark.asyncio
+    @patch("zephyr_mcp.server.tools.get_zephyr_fetcher", new_callable=AsyncMock)
+    async def test_not_checked_without_a_project(self, mock_get_fetcher):
+        fetcher = _make_fetcher()
+        fetcher.config.project_keys.return_value = ("PROJ", "OTHER")
+        mock_get_fetcher.return_value = fetcher
+        ctx = _make_ctx(read_only=False)
+
+        await zephyr_update_test_execution(ctx, "12345", status_name="Custom")
+
+        fetcher.resolve_metadata.assert_not_called()
+        assert fetcher.update_test_execution.call_args.kwargs["status_name"] == "Custom"
+
+
+class TestZephyrGetProjectMetadata:
+    @pytest.mark.asyncio
+    @patch("zephyr_mcp.server.tools.get_zephyr_fetcher", new_callable=AsyncMock)
+    async def test_success(self, mock_get_fetcher):
+        fetcher = _make_fetcher()
+        mock_get_fetcher.return_value = fetcher
+        ctx = _make_ctx()
+
+        result = await zephyr_get_project_metadata(ctx, "PROJ")
+
+        assert "## Project Metadata PROJ" in result
+        assert "/Regression/Login" in result
+        fetcher.get_project_metadata.assert_called_once_with("PROJ")
+
+    @pytest.mark.asyncio
+    @patch("zephyr_mcp.server.tools.get_zephyr_fetcher", new_callable=AsyncMock)
+    async def test_auth_error(self, mock_get_fetcher):
+        mock_get_fetcher.side_effect = ZephyrAuthenticationError("denied")
+        ctx = _make_ctx()
+
+        result = await zephyr_get_project_metadata(ctx, "PROJ")
+        assert "Authentication error" in result
+
 
 class TestZephyrLinkTestCaseToIssue:
     @pytest.mark.asyncio
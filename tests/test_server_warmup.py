@@ -0,0 +1,98 @@
+"""Tests for zephyr_mcp.server.warmup module."""
+
+import logging
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from zephyr_mcp.server.config import ServerConfig
+from zephyr_mcp.server.context import AppContext
+from zephyr_mcp.server.pool import FetcherPool
+from zephyr_mcp.server.warmup import warm_up
+from zephyr_mcp.squad.config import AUTH_TYPE_PAT, ZephyrSquadConfig
+from zephyr_mcp.utils.metrics import metrics
+from zephyr_mcp.zephyr.config import ZephyrConfig
+
+
+def _sync_fetcher():
+    fetcher = MagicMock(is_async=False)
+    fetcher.client.http = None
+    fetcher.client.base_url = "https://api.zephyrscale.smartbear.com/v2"
+    fetcher.client.config.http.timeout = (10.0, 60.0)
+    return fetcher
+
+
+def _app_ctx(**kwargs):
+    return AppContext(fetcher_pool=FetcherPool(), server_config=ServerConfig(warmup=True, warmup_connections=3), **kwargs)
+
+
+class TestWarmUp:
+    def setup_method(self):
+        metrics.reset()
+
+    @pytest.mark.asyncio
+    async def test_scale_backend_warmed(self):
+        fetcher = _sync_fetcher()
+        app_ctx = _app_ctx(full_zephyr_config=ZephyrConfig(url="https://api.zephyrscale.smartbear.com/v2", personal_token="tok"))
+
+        with patch("zephyr_mcp.server.dependencies._new_fetcher", return_value=fetcher) as mock_new:
+            await warm_up(app_ctx)
+
+        mock_new.assert_called_once()
+        assert fetcher.client.session.head.call_count == 3
+        fetcher.client.get.assert_called_once_with("/projects", params={"maxResults": 1})
+        # The warmed fetcher is the one tool calls will get from the pool.
+        assert len(app_ctx.fetcher_pool) == 1
+        assert metrics.snapshot()["summaries"]
+
+    @pytest.mark.asyncio
+    async def test_async_fetcher_uses_httpx_client(self):
+        fetcher = MagicMock(is_async=True)
+        fetcher.client.base_url = "https://api.zephyrscale.smartbear.com/v2"
+        fetcher.client.http.head = AsyncMock()
+        fetcher.client.get = AsyncMock(return_value={})
+        app_ctx = _app_ctx(full_zephyr_config=ZephyrConfig(url="https://api.zephyrscale.smartbear.com/v2", personal_token="tok"))
+
+        with patch("zephyr_mcp.server.dependencies._new_fetcher", return_value=fetcher):
+            await warm_up(app_ctx)
+
+        assert fetcher.client.http.head.await_count == 3
+        fetcher.client.get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_squad_pat_probe(self):
+        fetcher = _sync_fetcher()
+        fetcher.config.auth_type = AUTH_TYPE_PAT
+        config = ZephyrSquadConfig(auth_type=AUTH_TYPE_PAT, jira_base_url="https://jira.example.com", pat_token="pat")
+
+        with patch("zephyr_mcp.server.squad_dependencies._new_fetcher", return_value=fetcher):
+            await warm_up(_app_ctx(squad_config=config))
+
+        fetcher.client.get.assert_called_once_with("/moduleInfo")
+
+    @pytest.mark.asyncio
+    async def test_failures_logged_not_raised(self, caplog):
+        app_ctx = _app_ctx(full_zephyr_config=ZephyrConfig(url="https://api.zephyrscale.smartbear.com/v2", personal_token="tok"))
+
+        with (
+            patch("zephyr_mcp.server.dependencies._new_fetcher", side_effect=RuntimeError("bad credentials")),
+            caplog.at_level(logging.WARNING, logger="mcp-zephyr.server.warmup"),
+        ):
+            await warm_up(app_ctx)
+
+        assert "Warm-up of Zephyr Scale failed" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_connection_failures_do_not_stop_validation(self):
+        fetcher = _sync_fetcher()
+        fetcher.client.session.head.side_effect = ConnectionError("refused")
+        app_ctx = _app_ctx(full_zephyr_config=ZephyrConfig(url="https://api.zephyrscale.smartbear.com/v2", personal_token="tok"))
+
+        with patch("zephyr_mcp.server.dependencies._new_fetcher", return_value=fetcher):
+            await warm_up(app_ctx)
+
+        fetcher.client.get.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_nothing_configured(self):
+        await warm_up(_app_ctx())
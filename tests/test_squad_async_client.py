@@ -0,0 +1,102 @@
+"""Tests for zephyr_mcp.squad.async_client module."""
+
+import httpx
+import pytest
+
+from zephyr_mcp.exceptions import ZephyrAuthenticationError
+from zephyr_mcp.squad import AsyncSquadFetcher
+from zephyr_mcp.squad.async_client import AsyncZephyrSquadClient, AsyncZephyrSquadPatClient
+from zephyr_mcp.squad.config import AUTH_TYPE_PAT, ZephyrSquadConfig
+
+
+def _make_jwt_config() -> ZephyrSquadConfig:
+    return ZephyrSquadConfig(
+        access_key="test-access-key",
+        secret_key="test-secret-key",
+        account_id="test-account-id",
+        base_url="https://prod-api.zephyr4jiracloud.com/connect",
+        http_engine="async",
+    )
+
+
+def _make_pat_config() -> ZephyrSquadConfig:
+    return ZephyrSquadConfig(
+        auth_type=AUTH_TYPE_PAT,
+        jira_base_url="https://jira.example.com",
+        pat_token="my-pat-token",
+        http_engine="async",
+    )
+
+
+def _mock_transport(client, handler) -> list[httpx.Request]:
+    """Route the client's async HTTP traffic through a mock handler, recording requests."""
+    seen: list[httpx.Request] = []
+
+    def _record(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return handler(request)
+
+    client.http = httpx.AsyncClient(transport=httpx.MockTransport(_record), headers=client.http.headers)
+    return seen
+
+
+class TestAsyncZephyrSquadClient:
+    @pytest.mark.asyncio
+    async def test_get_sends_jwt_headers(self):
+        client = AsyncZephyrSquadClient(_make_jwt_config())
+        seen = _mock_transport(client, lambda request: httpx.Response(200, json={"id": "c1"}))
+
+        result = await client.get("/cycle/c1", query_params={"projectId": "10000"})
+
+        assert result == {"id": "c1"}
+        assert seen[0].headers["Authorization"].startswith("JWT ")
+        assert seen[0].headers["zapiAccessKey"] == "test-access-key"
+        assert seen[0].url.params["projectId"] == "10000"
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_auth_error_403(self):
+        client = AsyncZephyrSquadClient(_make_jwt_config())
+        _mock_transport(client, lambda request: httpx.Response(403, text="Forbidden"))
+        with pytest.raises(ZephyrAuthenticationError):
+            await client.get("/cycle/c1")
+        await client.aclose()
+
+
+class TestAsyncZephyrSquadPatClient:
+    @pytest.mark.asyncio
+    async def test_get_uses_bearer_token(self):
+        client = AsyncZephyrSquadPatClient(_make_pat_config())
+        seen = _mock_transport(client, lambda request: httpx.Response(200, json=[{"id": 1}]))
+
+        result = await client.get("/cycle", query_params={"projectId": "10000"})
+
+        assert result == [{"id": 1}]
+        assert seen[0].headers["Authorization"] == "Bearer my-pat-token"
+        assert str(seen[0].url).startswith("https://jira.example.com/rest/zapi/latest/cycle")
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_delete_204_returns_empty(self):
+        client = AsyncZephyrSquadPatClient(_make_pat_config())
+        _mock_transport(client, lambda request: httpx.Response(204))
+        assert await client.delete("/execution/1") == {}
+        await client.aclose()
+
+
+class TestAsyncSquadFetcher:
+    @pytest.mark.asyncio
+    async def test_uses_pat_client_for_pat_config(self):
+        fetcher = AsyncSquadFetcher(config=_make_pat_config())
+        assert isinstance(fetcher.client, AsyncZephyrSquadPatClient)
+        assert fetcher.is_async is True
+        await fetcher.aclose()
+
+    @pytest.mark.asyncio
+    async def test_mixin_methods_are_awaitable(self):
+        fetcher = AsyncSquadFetcher(config=_make_jwt_config())
+        _mock_transport(fetcher.client, lambda request: httpx.Response(200, json={"id": "e1"}))
+
+        assert await fetcher.get_execution("e1") == {"id": "e1"}
+        await fetcher.aclose()
+        assert fetcher.client.http.is_closed
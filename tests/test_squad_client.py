@@ -1,5 +1,6 @@
 """Tests for zephyr_mcp.squad.client module."""
 
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -40,6 +41,12 @@ class TestZephyrSquadClientInit:
         client = ZephyrSquadClient(_make_config())
         assert client.session.headers["Content-Type"] == "application/json"
 
+    def test_close_closes_session(self):
+        client = ZephyrSquadClient(_make_config())
+        client.session = MagicMock()
+        client.close()
+        client.session.close.assert_called_once()
+
 
 class TestGetAuthHeaders:
     def test_returns_jwt_and_access_key(self):
@@ -63,7 +70,7 @@ class TestRequest:
         client = ZephyrSquadClient(_make_config())
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"id": "123"}
+        mock_response.content = json.dumps({"id": "123"}).encode()
         client.session.request = MagicMock(return_value=mock_response)
 
         result = client.get("/cycle/123")
@@ -78,7 +85,7 @@ class TestRequest:
         client = ZephyrSquadClient(_make_config())
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"id": "new-cycle"}
+        mock_response.content = json.dumps({"id": "new-cycle"}).encode()
         client.session.request = MagicMock(return_value=mock_response)
 
         result = client.post("/cycle", json={"name": "Test Cycle"})
@@ -91,7 +98,7 @@ class TestRequest:
         client = ZephyrSquadClient(_make_config())
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"updated": True}
+        mock_response.content = json.dumps({"updated": True}).encode()
         client.session.request = MagicMock(return_value=mock_response)
 
         result = client.put("/cycle/123", json={"name": "Updated"})
@@ -129,23 +136,26 @@ class TestRequest:
         with pytest.raises(ZephyrAuthenticationError, match="403"):
             client.post("/cycle")
 
+    @patch("zephyr_mcp.utils.retry.time.sleep")
     @patch("zephyr_mcp.squad.client.generate_jwt_token", return_value="fake-jwt")
-    def test_http_error_raises(self, mock_jwt):
+    def test_http_error_raises(self, mock_jwt, mock_sleep):
         client = ZephyrSquadClient(_make_config())
         mock_response = MagicMock()
         mock_response.status_code = 500
+        mock_response.headers = {}
         mock_response.raise_for_status.side_effect = requests.HTTPError("Internal Server Error")
         client.session.request = MagicMock(return_value=mock_response)
 
         with pytest.raises(requests.HTTPError):
             client.get("/cycle/123")
+        assert client.session.request.call_count == client.config.retry_policy.max_attempts
 
     @patch("zephyr_mcp.squad.client.generate_jwt_token", return_value="fake-jwt")
     def test_query_params_passed(self, mock_jwt):
         client = ZephyrSquadClient(_make_config())
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = []
+        mock_response.content = json.dumps([]).encode()
         client.session.request = MagicMock(return_value=mock_response)
 
         client.get("/cycles/search", query_params={"projectId": "10200", "versionId": "-1"})
@@ -157,7 +167,7 @@ class TestRequest:
         client = ZephyrSquadClient(_make_config())
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {}
+        mock_response.content = json.dumps({}).encode()
         client.session.request = MagicMock(return_value=mock_response)
 
         client.get("/cycle/1", headers={"X-Custom": "value"})
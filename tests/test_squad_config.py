@@ -168,3 +168,55 @@ class TestFromEnvPat:
     def test_pat_takes_precedence_over_jwt(self):
         config = ZephyrSquadConfig.from_env()
         assert config.auth_type == AUTH_TYPE_PAT
+
+    @patch.dict(
+        os.environ,
+        {"ZEPHYR_SQUAD_PAT_TOKEN": "my-pat-token", "ZEPHYR_SQUAD_JIRA_BASE_URL": "https://jira.example.com", "ZEPHYR_HTTP_ENGINE": "async"},
+        clear=True,
+    )
+    def test_http_engine_falls_back_to_scale_setting(self):
+        assert ZephyrSquadConfig.from_env().http_engine == "async"
+
+    @patch.dict(
+        os.environ,
+        {
+            "ZEPHYR_SQUAD_PAT_TOKEN": "my-pat-token",
+            "ZEPHYR_SQUAD_JIRA_BASE_URL": "https://jira.example.com",
+            "ZEPHYR_HTTP_ENGINE": "async",
+            "ZEPHYR_SQUAD_HTTP_ENGINE": "sync",
+        },
+        clear=True,
+    )
+    def test_squad_http_engine_overrides_scale_setting(self):
+        assert ZephyrSquadConfig.from_env().http_engine == "sync"
+
+
+class TestZephyrSquadConfigFingerprint:
+    def test_same_credentials_same_fingerprint(self):
+        a = ZephyrSquadConfig(access_key="ak", secret_key="sk", account_id="aid")
+        b = ZephyrSquadConfig(access_key="ak", secret_key="sk", account_id="aid", project_id="10200")
+        assert a.fingerprint() == b.fingerprint()
+
+    def test_different_credentials_differ(self):
+        a = ZephyrSquadConfig(access_key="ak", secret_key="sk", account_id="aid")
+        b = ZephyrSquadConfig(auth_type=AUTH_TYPE_PAT, jira_base_url="https://jira.example.com", pat_token="pat")
+        assert a.fingerprint() != b.fingerprint()
+
+    def test_credential_id_ignores_project(self):
+        a = ZephyrSquadConfig(access_key="ak", secret_key="sk", account_id="aid")
+        b = ZephyrSquadConfig(access_key="ak", secret_key="sk", account_id="aid", project_id="10200")
+        assert a.credential_id() == b.credential_id()
+
+    def test_secret_key_is_part_of_the_cache_scope(self):
+        a = ZephyrSquadConfig(access_key="ak", secret_key="sk", account_id="aid")
+        b = ZephyrSquadConfig(access_key="ak", secret_key="wrong", account_id="aid")
+        assert a.credential_id() != b.credential_id()
+        assert a.cache_scope() != b.cache_scope()
+
+    @patch.dict(os.environ, {"ZEPHYR_RATE_LIMIT": "10", "ZEPHYR_SQUAD_RATE_LIMIT": "3"}, clear=True)
+    def test_squad_rate_limit_overrides_scale_setting(self):
+        assert ZephyrSquadConfig(access_key="ak").rate_limit.rate == 3.0
+
+    @patch.dict(os.environ, {"ZEPHYR_COALESCE_GETS": "true", "ZEPHYR_SQUAD_COALESCE_GETS": "false"}, clear=True)
+    def test_squad_coalescing_overrides_scale_setting(self):
+        assert ZephyrSquadConfig(access_key="ak").coalesce_gets is False
@@ -1,13 +1,15 @@
 """Tests for zephyr_mcp.server.squad_dependencies module."""
 
+import dataclasses
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from zephyr_mcp.server.context import AppContext
-from zephyr_mcp.server.squad_dependencies import get_squad_fetcher
-from zephyr_mcp.squad import SquadFetcher
-from zephyr_mcp.squad.config import ZephyrSquadConfig
+from zephyr_mcp.server.pool import FetcherPool
+from zephyr_mcp.server.squad_dependencies import _create_tenant_config, get_squad_fetcher
+from zephyr_mcp.squad import AsyncSquadFetcher, SquadFetcher
+from zephyr_mcp.squad.config import AUTH_TYPE_JWT, AUTH_TYPE_PAT, SQUAD_BASE_URL, ZephyrSquadConfig
 
 
 def _make_squad_config():
@@ -19,9 +21,15 @@ def _make_squad_config():
     )
 
 
-def _make_ctx(squad_config=None, zephyr_config=None, read_only=False):
+def _make_ctx(squad_config=None, zephyr_config=None, read_only=False, fetcher_pool=None, user_fetcher_pool=None):
     ctx = MagicMock()
-    app_context = AppContext(full_zephyr_config=zephyr_config, squad_config=squad_config, read_only=read_only)
+    app_context = AppContext(
+        full_zephyr_config=zephyr_config,
+        squad_config=squad_config,
+        read_only=read_only,
+        fetcher_pool=fetcher_pool,
+        user_fetcher_pool=user_fetcher_pool,
+    )
     ctx.request_context.lifespan_context = {"app_lifespan_context": app_context}
     return ctx
 
@@ -70,3 +78,144 @@ class TestGetSquadFetcher:
 
         with pytest.raises(ValueError):
             await get_squad_fetcher(ctx)
+
+
+class TestSquadFetcherPooling:
+    @pytest.mark.asyncio
+    async def test_lifespan_fetcher_reused(self):
+        ctx = _make_ctx(squad_config=_make_squad_config(), fetcher_pool=FetcherPool())
+
+        first = await get_squad_fetcher(ctx)
+        second = await get_squad_fetcher(ctx)
+        assert first is second
+
+    @pytest.mark.asyncio
+    async def test_async_engine_returns_async_fetcher(self):
+        config = dataclasses.replace(_make_squad_config(), http_engine="async")
+        ctx = _make_ctx(squad_config=config, fetcher_pool=FetcherPool())
+
+        fetcher = await get_squad_fetcher(ctx)
+        assert isinstance(fetcher, AsyncSquadFetcher)
+        await fetcher.aclose()
+
+    @pytest.mark.asyncio
+    @patch("zephyr_mcp.server.squad_dependencies.ZephyrSquadConfig.from_env")
+    async def test_env_fallback_parsed_once(self, mock_from_env):
+        mock_from_env.return_value = _make_squad_config()
+        ctx = _make_ctx(squad_config=None, fetcher_pool=FetcherPool())
+
+        first = await get_squad_fetcher(ctx)
+        second = await get_squad_fetcher(ctx)
+        assert first is second
+        mock_from_env.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch("zephyr_mcp.server.squad_dependencies.ZephyrSquadConfig.from_env")
+    async def test_env_fallback_failure_with_pool_raises(self, mock_from_env):
+        mock_from_env.side_effect = ValueError("missing env")
+        ctx = _make_ctx(squad_config=None, fetcher_pool=FetcherPool())
+
+        with pytest.raises(ValueError, match="Zephyr Squad client not available"):
+            await get_squad_fetcher(ctx)
+
+
+def _tenant_request(headers):
+    mock_request = MagicMock()
+    mock_request.state.squad_fetcher = None
+    mock_request.state.service_headers = headers
+    return mock_request
+
+
+JWT_HEADERS = {
+    "X-Zephyr-Squad-Access-Key": "tenant-ak",
+    "X-Zephyr-Squad-Secret-Key": "tenant-sk",
+    "X-Zephyr-Squad-Account-Id": "tenant-aid",
+}
+
+
+class TestTenantCredentials:
+    def test_no_squad_headers(self):
+        assert _create_tenant_config({"X-Zephyr-Url": "https://example.com"}) is None
+
+    def test_jwt_headers(self):
+        config = _create_tenant_config(JWT_HEADERS)
+        assert config.auth_type == AUTH_TYPE_JWT
+        assert config.access_key == "tenant-ak"
+        assert config.base_url == SQUAD_BASE_URL
+
+    def test_jwt_headers_missing_secret_raises(self):
+        with pytest.raises(ValueError, match="Secret-Key"):
+            _create_tenant_config({"X-Zephyr-Squad-Access-Key": "ak"})
+
+    def test_pat_headers(self):
+        config = _create_tenant_config(
+            {
+                "X-Zephyr-Squad-Pat-Token": "pat",
+                "X-Zephyr-Squad-Jira-Url": "https://jira.example.com/",
+                "X-Zephyr-Squad-Jira-Email": "me@example.com",
+            }
+        )
+        assert config.auth_type == AUTH_TYPE_PAT
+        assert config.jira_base_url == "https://jira.example.com"
+        assert config.jira_email == "me@example.com"
+
+    def test_pat_headers_missing_url_raises(self):
+        with pytest.raises(ValueError, match="Jira-Url"):
+            _create_tenant_config({"X-Zephyr-Squad-Pat-Token": "pat"})
+
+    def test_tenant_config_uses_given_http_engine(self):
+        assert _create_tenant_config(JWT_HEADERS, http_engine="async").http_engine == "async"
+
+    @pytest.mark.asyncio
+    @patch("fastmcp.server.dependencies.get_http_request")
+    async def test_tenant_inherits_async_engine_from_lifespan_config(self, mock_get_request):
+        squad_config = dataclasses.replace(_make_squad_config(), http_engine="async")
+        ctx = _make_ctx(squad_config=squad_config, user_fetcher_pool=FetcherPool(max_entries=8))
+        mock_get_request.return_value = _tenant_request(JWT_HEADERS)
+
+        fetcher = await get_squad_fetcher(ctx)
+        assert isinstance(fetcher, AsyncSquadFetcher)
+        await fetcher.aclose()
+
+    @pytest.mark.asyncio
+    @patch("fastmcp.server.dependencies.get_http_request")
+    async def test_tenant_fetcher_pooled_per_tenant(self, mock_get_request):
+        ctx = _make_ctx(squad_config=_make_squad_config(), fetcher_pool=FetcherPool(), user_fetcher_pool=FetcherPool(max_entries=8))
+
+        mock_get_request.return_value = _tenant_request(JWT_HEADERS)
+        first = await get_squad_fetcher(ctx)
+        mock_get_request.return_value = _tenant_request(JWT_HEADERS)
+        second = await get_squad_fetcher(ctx)
+        mock_get_request.return_value = _tenant_request({**JWT_HEADERS, "X-Zephyr-Squad-Access-Key": "other-ak"})
+        other = await get_squad_fetcher(ctx)
+
+        assert first is second
+        assert first is not other
+        assert first.config.access_key == "tenant-ak"
+
+    @pytest.mark.asyncio
+    @patch("fastmcp.server.dependencies.get_http_request")
+    async def test_returns_fetcher_from_request_state(self, mock_get_request):
+        mock_request = MagicMock()
+        mock_request.state.squad_fetcher = MagicMock(spec=SquadFetcher)
+        mock_get_request.return_value = mock_request
+
+        result = await get_squad_fetcher(_make_ctx())
+        assert result is mock_request.state.squad_fetcher
+
+    @pytest.mark.asyncio
+    @patch("fastmcp.server.dependencies.get_http_request")
+    async def test_invalid_tenant_headers_raise(self, mock_get_request):
+        mock_get_request.return_value = _tenant_request({"X-Zephyr-Squad-Access-Key": "ak"})
+
+        with pytest.raises(ValueError, match="Secret-Key"):
+            await get_squad_fetcher(_make_ctx(squad_config=_make_squad_config()))
+
+    @pytest.mark.asyncio
+    @patch("fastmcp.server.dependencies.get_http_request")
+    async def test_http_request_without_squad_headers_uses_global(self, mock_get_request):
+        mock_get_request.return_value = _tenant_request({})
+        config = _make_squad_config()
+
+        fetcher = await get_squad_fetcher(_make_ctx(squad_config=config))
+        assert fetcher.config is config
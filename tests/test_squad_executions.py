@@ -28,7 +28,7 @@ class TestGetExecution:
         mixin.client.get.return_value = {"id": "100", "status": {"id": 1}}
 
         result = mixin.get_execution("100")
-        mixin.client.get.assert_called_once_with("/execution/100")
+        mixin.client.get.assert_called_once_with("/execution/100", raw=False)
         assert result["id"] == "100"
 
 
@@ -148,6 +148,7 @@ class TestGetZqlSearch:
         mixin.client.get.assert_called_once_with(
             "/zql/executeSearch",
             query_params={"zqlQuery": 'project = "PROJ"', "maxRecords": "50", "offset": "0"},
+            raw=False,
         )
         assert "totalCount" in result
 
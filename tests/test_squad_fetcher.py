@@ -1,6 +1,6 @@
 """Tests for zephyr_mcp.squad SquadFetcher module."""
 
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from zephyr_mcp.squad import SquadFetcher, _create_squad_client
 from zephyr_mcp.squad.client import ZephyrSquadClient
@@ -71,3 +71,9 @@ class TestSquadFetcher:
         assert hasattr(fetcher, "add_test_to_cycle")
         assert hasattr(fetcher, "update_execution")
         assert hasattr(fetcher, "get_zql_search")
+
+    def test_close_closes_client(self):
+        fetcher = SquadFetcher(config=_make_pat_config())
+        fetcher.client = MagicMock()
+        fetcher.close()
+        fetcher.client.close.assert_called_once()
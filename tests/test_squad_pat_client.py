@@ -1,6 +1,7 @@
 """Tests for zephyr_mcp.squad.pat_client module."""
 
-from unittest.mock import MagicMock
+import json
+from unittest.mock import MagicMock, patch
 
 import pytest
 import requests
@@ -39,6 +40,12 @@ class TestZephyrSquadPatClientInit:
         client = ZephyrSquadPatClient(_make_pat_config())
         assert client.session.headers["Content-Type"] == "application/json"
 
+    def test_close_closes_session(self):
+        client = ZephyrSquadPatClient(_make_pat_config())
+        client.session = MagicMock()
+        client.close()
+        client.session.close.assert_called_once()
+
 
 class TestPatAuthSetup:
     def test_bearer_auth_when_no_email(self):
@@ -57,7 +64,7 @@ class TestPatRequest:
         client = ZephyrSquadPatClient(_make_pat_config())
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"id": "123"}
+        mock_response.content = json.dumps({"id": "123"}).encode()
         client.session.request = MagicMock(return_value=mock_response)
 
         result = client.get("/cycle/123")
@@ -72,7 +79,7 @@ class TestPatRequest:
         client = ZephyrSquadPatClient(_make_pat_config())
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"id": "new-cycle"}
+        mock_response.content = json.dumps({"id": "new-cycle"}).encode()
         client.session.request = MagicMock(return_value=mock_response)
 
         result = client.post("/cycle", json={"name": "Test Cycle"})
@@ -84,7 +91,7 @@ class TestPatRequest:
         client = ZephyrSquadPatClient(_make_pat_config())
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"updated": True}
+        mock_response.content = json.dumps({"updated": True}).encode()
         client.session.request = MagicMock(return_value=mock_response)
 
         result = client.put("/cycle/123", json={"name": "Updated"})
@@ -119,21 +126,24 @@ class TestPatRequest:
         with pytest.raises(ZephyrAuthenticationError, match="403"):
             client.post("/cycle")
 
-    def test_http_error_raises(self):
+    @patch("zephyr_mcp.utils.retry.time.sleep")
+    def test_http_error_raises(self, mock_sleep):
         client = ZephyrSquadPatClient(_make_pat_config())
         mock_response = MagicMock()
         mock_response.status_code = 500
+        mock_response.headers = {}
         mock_response.raise_for_status.side_effect = requests.HTTPError("Internal Server Error")
         client.session.request = MagicMock(return_value=mock_response)
 
         with pytest.raises(requests.HTTPError):
             client.get("/cycle/123")
+        assert client.session.request.call_count == client.config.retry_policy.max_attempts
 
     def test_query_params_passed(self):
         client = ZephyrSquadPatClient(_make_pat_config())
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = []
+        mock_response.content = json.dumps([]).encode()
         client.session.request = MagicMock(return_value=mock_response)
 
         client.get("/cycles/search", query_params={"projectId": "10200", "versionId": "-1"})
@@ -144,7 +154,7 @@ class TestPatRequest:
         client = ZephyrSquadPatClient(_make_pat_config())
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {}
+        mock_response.content = json.dumps({}).encode()
         client.session.request = MagicMock(return_value=mock_response)
 
         client.get("/cycle/1", headers={"X-Custom": "value"})
@@ -156,7 +166,7 @@ class TestPatRequest:
         client = ZephyrSquadPatClient(_make_pat_config())
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {}
+        mock_response.content = json.dumps({}).encode()
         client.session.request = MagicMock(return_value=mock_response)
 
         client.get("/cycle/1")
@@ -163,7 +163,7 @@ class TestSquadGetExecution:
 
         result = await squad_get_execution(ctx, "100")
         assert "100" in result
-        fetcher.get_execution.assert_called_once_with("100")
+        fetcher.get_execution.assert_called_once_with("100", raw=True)
 
     @pytest.mark.asyncio
     @patch("zephyr_mcp.server.squad_tools.get_squad_fetcher", new_callable=AsyncMock)
@@ -305,7 +305,7 @@ class TestSquadZqlSearch:
 
         result = await squad_zql_search(ctx, 'project = "PROJ"')
         assert "Squad ZQL Search Results" in result
-        fetcher.get_zql_search.assert_called_once_with('project = "PROJ"', 50, 0)
+        fetcher.get_zql_search.assert_called_once_with('project = "PROJ"', 50, 0, raw=True)
 
     @pytest.mark.asyncio
     @patch("zephyr_mcp.server.squad_tools.get_squad_fetcher", new_callable=AsyncMock)
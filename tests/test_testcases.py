@@ -16,7 +16,7 @@ class TestGetTestCase:
         mixin = _make_mixin()
         mixin.client.get.return_value = {"key": "PROJ-T1", "name": "Test Case 1"}
         result = mixin.get_test_case("PROJ-T1")
-        mixin.client.get.assert_called_once_with("/testcases/PROJ-T1")
+        mixin.client.get.assert_called_once_with("/testcases/PROJ-T1", raw=False)
         assert result["key"] == "PROJ-T1"
 
 
@@ -16,7 +16,7 @@ class TestGetTestCycle:
         mixin = _make_mixin()
         mixin.client.get.return_value = {"key": "PROJ-R1", "name": "Cycle 1"}
         result = mixin.get_test_cycle("PROJ-R1")
-        mixin.client.get.assert_called_once_with("/testcycles/PROJ-R1")
+        mixin.client.get.assert_called_once_with("/testcycles/PROJ-R1", raw=False)
         assert result["key"] == "PROJ-R1"
 
 
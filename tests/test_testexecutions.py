@@ -16,7 +16,7 @@ class TestGetTestExecution:
         mixin = _make_mixin()
         mixin.client.get.return_value = {"id": "12345", "statusName": "Pass"}
         result = mixin.get_test_execution("12345")
-        mixin.client.get.assert_called_once_with("/testexecutions/12345")
+        mixin.client.get.assert_called_once_with("/testexecutions/12345", raw=False)
         assert result["id"] == "12345"
 
 
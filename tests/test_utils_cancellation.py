@@ -0,0 +1,74 @@
+"""Tests for zephyr_mcp.utils.cancellation module."""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from zephyr_mcp.exceptions import RequestCancelledError
+from zephyr_mcp.utils.cancellation import CancellationScope, bound_timeout, cancellation_scope, check_cancelled, current_scope
+
+
+class TestCancellationScope:
+    def test_not_cancelled_initially(self):
+        scope = CancellationScope()
+        assert not scope.cancelled
+        assert scope.remaining() is None
+        scope.check()
+
+    def test_cancel(self):
+        scope = CancellationScope()
+        scope.cancel()
+        with pytest.raises(RequestCancelledError, match="cancelled by the client"):
+            scope.check()
+
+    @patch("zephyr_mcp.utils.cancellation.time.monotonic")
+    def test_deadline(self, mock_monotonic):
+        mock_monotonic.return_value = 100.0
+        scope = CancellationScope(timeout=5.0)
+        assert scope.remaining() == 5.0
+        mock_monotonic.return_value = 105.0
+        with pytest.raises(RequestCancelledError, match="deadline exceeded"):
+            scope.check()
+
+    def test_sleep_wakes_on_cancel(self):
+        scope = CancellationScope()
+        threading.Timer(0.05, scope.cancel).start()
+        started = time.monotonic()
+        with pytest.raises(RequestCancelledError):
+            scope.sleep(5)
+        assert time.monotonic() - started < 2
+
+    def test_sleep_past_deadline_gives_up_early(self):
+        scope = CancellationScope(timeout=0.05)
+        started = time.monotonic()
+        with pytest.raises(RequestCancelledError, match="deadline exceeded"):
+            scope.sleep(5)
+        assert time.monotonic() - started < 2
+
+
+class TestCancellationContext:
+    def test_scope_is_current_inside_block(self):
+        assert current_scope() is None
+        with cancellation_scope() as scope:
+            assert current_scope() is scope
+            scope.cancel()
+            with pytest.raises(RequestCancelledError):
+                check_cancelled()
+        assert current_scope() is None
+        check_cancelled()
+
+
+class TestBoundTimeout:
+    def test_unchanged_without_deadline(self):
+        assert bound_timeout((10.0, 60.0)) == (10.0, 60.0)
+        with cancellation_scope():
+            assert bound_timeout((10.0, 60.0)) == (10.0, 60.0)
+
+    @patch("zephyr_mcp.utils.cancellation.time.monotonic", return_value=100.0)
+    def test_capped_at_time_left(self, mock_monotonic):
+        with cancellation_scope(timeout=20.0):
+            assert bound_timeout((10.0, 60.0)) == (10.0, 20.0)
+            assert bound_timeout(30.0) == 20.0
+            assert bound_timeout(None) == 20.0
@@ -0,0 +1,127 @@
+"""Tests for zephyr_mcp.utils.circuit module."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from zephyr_mcp.exceptions import CircuitOpenError
+from zephyr_mcp.utils.circuit import (
+    CIRCUIT_CLOSED,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
+    CircuitBreaker,
+    CircuitBreakerPolicy,
+    get_circuit_breaker,
+    reset_circuit_breakers,
+)
+from zephyr_mcp.utils.metrics import metrics
+
+
+def _tripped(now: float = 100.0, **policy) -> CircuitBreaker:
+    breaker = CircuitBreaker(CircuitBreakerPolicy(min_requests=4, **policy), name="zephyr.example")
+    with patch("zephyr_mcp.utils.circuit.time.monotonic", return_value=now):
+        for _ in range(4):
+            breaker.record(breaker.allow(), failed=True)
+    return breaker
+
+
+class TestCircuitBreakerPolicy:
+    def test_defaults(self):
+        with patch.dict(os.environ, {}, clear=True):
+            assert CircuitBreakerPolicy.from_env() == CircuitBreakerPolicy()
+
+    def test_from_env(self):
+        env = {
+            "ZEPHYR_CIRCUIT_BREAKER": "false",
+            "ZEPHYR_CIRCUIT_FAILURE_RATE": "0.25",
+            "ZEPHYR_CIRCUIT_MIN_REQUESTS": "5",
+            "ZEPHYR_CIRCUIT_WINDOW": "10",
+            "ZEPHYR_CIRCUIT_OPEN_SECONDS": "15",
+            "ZEPHYR_CIRCUIT_HALF_OPEN_PROBES": "2",
+        }
+        with patch.dict(os.environ, env, clear=True):
+            policy = CircuitBreakerPolicy.from_env()
+        assert policy == CircuitBreakerPolicy(enabled=False, failure_rate=0.25, min_requests=5, window=10.0, open_seconds=15.0, half_open_probes=2)
+
+
+class TestCircuitBreaker:
+    def setup_method(self):
+        metrics.reset()
+
+    def test_opens_at_failure_rate(self):
+        breaker = _tripped()
+        assert breaker.state == CIRCUIT_OPEN
+        assert metrics.get("zephyr_circuit_state", labels={"target": "zephyr.example"}) == 2
+
+    def test_stays_closed_below_min_requests(self):
+        breaker = CircuitBreaker(CircuitBreakerPolicy(min_requests=10))
+        for _ in range(9):
+            breaker.record(breaker.allow(), failed=True)
+        assert breaker.state == CIRCUIT_CLOSED
+
+    def test_stays_closed_below_failure_rate(self):
+        breaker = CircuitBreaker(CircuitBreakerPolicy(min_requests=4, failure_rate=0.5))
+        for failed in (True, False, False, False, True, False):
+            breaker.record(breaker.allow(), failed=failed)
+        assert breaker.state == CIRCUIT_CLOSED
+
+    @patch("zephyr_mcp.utils.circuit.time.monotonic")
+    def test_old_failures_leave_the_window(self, mock_monotonic):
+        breaker = CircuitBreaker(CircuitBreakerPolicy(min_requests=4, window=10.0))
+        mock_monotonic.return_value = 100.0
+        for _ in range(3):
+            breaker.record(breaker.allow(), failed=True)
+        mock_monotonic.return_value = 111.0
+        breaker.record(breaker.allow(), failed=True)
+        assert breaker.state == CIRCUIT_CLOSED
+
+    @patch("zephyr_mcp.utils.circuit.time.monotonic", return_value=105.0)
+    def test_open_circuit_fails_fast(self, mock_monotonic):
+        breaker = _tripped(open_seconds=30.0)
+        with pytest.raises(CircuitOpenError, match="zephyr.example is unavailable"):
+            breaker.allow()
+        assert metrics.get("zephyr_circuit_rejected_total", labels={"target": "zephyr.example"}) == 1
+
+    @patch("zephyr_mcp.utils.circuit.time.monotonic", return_value=131.0)
+    def test_half_open_admits_one_probe(self, mock_monotonic):
+        breaker = _tripped(open_seconds=30.0)
+        assert breaker.allow() is True
+        assert breaker.state == CIRCUIT_HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.allow()
+
+    @patch("zephyr_mcp.utils.circuit.time.monotonic", return_value=131.0)
+    def test_successful_probe_closes(self, mock_monotonic):
+        breaker = _tripped(open_seconds=30.0)
+        breaker.record(breaker.allow(), failed=False)
+        assert breaker.state == CIRCUIT_CLOSED
+        assert breaker.allow() is False
+
+    @patch("zephyr_mcp.utils.circuit.time.monotonic", return_value=131.0)
+    def test_failed_probe_reopens(self, mock_monotonic):
+        breaker = _tripped(open_seconds=30.0)
+        breaker.record(breaker.allow(), failed=True)
+        assert breaker.state == CIRCUIT_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.allow()
+
+    @patch("zephyr_mcp.utils.circuit.time.monotonic", return_value=131.0)
+    def test_probe_without_verdict_frees_slot(self, mock_monotonic):
+        breaker = _tripped(open_seconds=30.0)
+        breaker.record(breaker.allow(), failed=None)
+        assert breaker.state == CIRCUIT_HALF_OPEN
+        assert breaker.allow() is True
+
+
+class TestGetCircuitBreaker:
+    def setup_method(self):
+        reset_circuit_breakers()
+
+    def test_disabled_policy_returns_none(self):
+        assert get_circuit_breaker("https://a", CircuitBreakerPolicy(enabled=False)) is None
+
+    def test_shared_per_key(self):
+        policy = CircuitBreakerPolicy()
+        assert get_circuit_breaker("https://a", policy) is get_circuit_breaker("https://a", policy)
+        assert get_circuit_breaker("https://a", policy) is not get_circuit_breaker("https://b", policy)
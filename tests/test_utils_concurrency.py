@@ -0,0 +1,170 @@
+"""Tests for zephyr_mcp.utils.concurrency module."""
+
+import asyncio
+import itertools
+import os
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from zephyr_mcp.utils.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    ConcurrencyPolicy,
+    get_concurrency_limiter,
+    reset_concurrency_limiters,
+)
+from zephyr_mcp.utils.metrics import metrics
+
+
+def _fill(limiter: AdaptiveConcurrencyLimiter, count: int) -> list[float]:
+    return [limiter.acquire() for _ in range(count)]
+
+
+class TestConcurrencyPolicy:
+    def test_defaults(self):
+        with patch.dict(os.environ, {}, clear=True):
+            policy = ConcurrencyPolicy.from_env()
+        assert policy.enabled
+        assert (policy.initial_limit, policy.min_limit, policy.max_limit) == (10, 1, 100)
+
+    def test_from_env(self):
+        env = {"ZEPHYR_CONCURRENCY_INITIAL": "4", "ZEPHYR_CONCURRENCY_MIN": "2", "ZEPHYR_CONCURRENCY_MAX": "8"}
+        with patch.dict(os.environ, env, clear=True):
+            policy = ConcurrencyPolicy.from_env()
+        assert (policy.initial_limit, policy.min_limit, policy.max_limit) == (4, 2, 8)
+
+    def test_initial_clamped_to_bounds(self):
+        with patch.dict(os.environ, {"ZEPHYR_CONCURRENCY_INITIAL": "500", "ZEPHYR_CONCURRENCY_MAX": "20"}, clear=True):
+            assert ConcurrencyPolicy.from_env().initial_limit == 20
+
+    def test_can_be_disabled(self):
+        with patch.dict(os.environ, {"ZEPHYR_ADAPTIVE_CONCURRENCY": "false"}, clear=True):
+            assert get_concurrency_limiter("key", ConcurrencyPolicy.from_env()) is None
+
+
+class TestAdaptiveConcurrencyLimiter:
+    def test_additive_increase_when_busy(self):
+        limiter = AdaptiveConcurrencyLimiter(ConcurrencyPolicy(initial_limit=4))
+        starts = _fill(limiter, 4)
+        for started in starts:
+            limiter.release(started)
+        assert limiter.limit == 4
+        assert limiter._limit > 4
+
+    def test_no_increase_when_idle(self):
+        limiter = AdaptiveConcurrencyLimiter(ConcurrencyPolicy(initial_limit=10))
+        # Steady 10ms requests; real sub-microsecond timings make scheduler noise look like latency spikes.
+        with patch("zephyr_mcp.utils.concurrency.time.monotonic", side_effect=itertools.count(step=0.01)):
+            for _ in range(50):
+                limiter.release(limiter.acquire())
+        assert limiter._limit == 10
+
+    def test_multiplicative_decrease_on_overload(self):
+        limiter = AdaptiveConcurrencyLimiter(ConcurrencyPolicy(initial_limit=8))
+        limiter.release(limiter.acquire(), overloaded=True)
+        assert limiter.limit == 4
+
+    def test_one_cut_per_congestion_event(self):
+        limiter = AdaptiveConcurrencyLimiter(ConcurrencyPolicy(initial_limit=8))
+        starts = _fill(limiter, 3)
+        for started in starts:
+            limiter.release(started, overloaded=True)
+        assert limiter.limit == 4
+
+    def test_limit_never_below_min(self):
+        limiter = AdaptiveConcurrencyLimiter(ConcurrencyPolicy(initial_limit=2, min_limit=2))
+        for _ in range(5):
+            limiter.release(limiter.acquire(), overloaded=True)
+        assert limiter.limit == 2
+
+    def test_latency_spike_cuts_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(ConcurrencyPolicy(initial_limit=10, latency_tolerance=3.0))
+        with patch("zephyr_mcp.utils.concurrency.time.monotonic") as mock_monotonic:
+            for i in range(20):
+                mock_monotonic.return_value = i * 10.0
+                started = limiter.acquire()
+                mock_monotonic.return_value = i * 10.0 + 0.1
+                limiter.release(started)
+            mock_monotonic.return_value = 1000.0
+            started = limiter.acquire()
+            mock_monotonic.return_value = 1001.0
+            limiter.release(started)
+        assert limiter.limit == 5
+
+    def test_slow_endpoint_class_has_its_own_baseline(self):
+        limiter = AdaptiveConcurrencyLimiter(ConcurrencyPolicy(initial_limit=10, latency_tolerance=3.0))
+        with patch("zephyr_mcp.utils.concurrency.time.monotonic") as mock_monotonic:
+            for i in range(20):
+                for kind, latency in (("testcases", 0.1), ("testexecutions", 2.0)):
+                    mock_monotonic.return_value = i * 10.0
+                    started = limiter.acquire()
+                    mock_monotonic.return_value = i * 10.0 + latency
+                    limiter.release(started, kind=kind)
+            mock_monotonic.return_value = 1000.0
+            started = limiter.acquire()
+            mock_monotonic.return_value = 1002.5
+            limiter.release(started, kind="testexecutions")
+        assert limiter.limit == 10
+
+    def test_failures_do_not_grow_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(ConcurrencyPolicy(initial_limit=2))
+        starts = _fill(limiter, 2)
+        for started in starts:
+            limiter.release(started, succeeded=False)
+        assert limiter._limit == 2
+
+    def test_publishes_limit_metric(self):
+        limiter = AdaptiveConcurrencyLimiter(ConcurrencyPolicy(initial_limit=6), name="metric.example")
+        limiter.release(limiter.acquire(), overloaded=True)
+        assert metrics.get("zephyr_concurrency_limit", {"target": "metric.example"}) == 3
+
+    def test_thread_waits_for_free_slot(self):
+        limiter = AdaptiveConcurrencyLimiter(ConcurrencyPolicy(initial_limit=1))
+        held = limiter.acquire()
+        acquired = threading.Event()
+
+        def _worker():
+            limiter.release(limiter.acquire())
+            acquired.set()
+
+        thread = threading.Thread(target=_worker)
+        thread.start()
+        assert not acquired.wait(0.05)
+        limiter.release(held)
+        assert acquired.wait(2)
+        thread.join()
+
+    @pytest.mark.asyncio
+    async def test_coroutine_waits_for_free_slot(self):
+        limiter = AdaptiveConcurrencyLimiter(ConcurrencyPolicy(initial_limit=1))
+        held = await limiter.acquire_async()
+        waiter = asyncio.ensure_future(limiter.acquire_async())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        limiter.release(held)
+        limiter.release(await asyncio.wait_for(waiter, timeout=1))
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_is_forgotten(self):
+        limiter = AdaptiveConcurrencyLimiter(ConcurrencyPolicy(initial_limit=1))
+        held = await limiter.acquire_async()
+        waiter = asyncio.ensure_future(limiter.acquire_async())
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert limiter._async_waiters == []
+        limiter.release(held)
+
+
+class TestGetConcurrencyLimiter:
+    def setup_method(self):
+        reset_concurrency_limiters()
+
+    def test_same_key_shares_limiter(self):
+        policy = ConcurrencyPolicy()
+        assert get_concurrency_limiter("a", policy) is get_concurrency_limiter("a", policy)
+        assert get_concurrency_limiter("a", policy) is not get_concurrency_limiter("b", policy)
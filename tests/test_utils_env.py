@@ -3,7 +3,7 @@
 import os
 from unittest.mock import patch
 
-from zephyr_mcp.utils.env import get_custom_headers, is_env_extended_truthy, is_env_ssl_verify, is_env_truthy
+from zephyr_mcp.utils.env import get_custom_headers, get_env_float, get_env_int, is_env_extended_truthy, is_env_ssl_verify, is_env_truthy
 
 
 class TestIsEnvTruthy:
@@ -105,3 +105,25 @@ class TestGetCustomHeaders:
         with patch.dict(os.environ, {"ZEPHYR_CUSTOM_HEADERS": "X-Custom=value1,,X-Other=value2"}):
             result = get_custom_headers("ZEPHYR_CUSTOM_HEADERS")
             assert result == {"X-Custom": "value1", "X-Other": "value2"}
+
+
+class TestGetEnvNumbers:
+    def test_int_value(self):
+        with patch.dict(os.environ, {"TEST_VAR": "42"}):
+            assert get_env_int("TEST_VAR", 1) == 42
+
+    def test_int_missing_uses_default(self):
+        with patch.dict(os.environ, {}, clear=True):
+            assert get_env_int("TEST_VAR", 7) == 7
+
+    def test_int_invalid_uses_default(self):
+        with patch.dict(os.environ, {"TEST_VAR": "many"}):
+            assert get_env_int("TEST_VAR", 7) == 7
+
+    def test_float_value(self):
+        with patch.dict(os.environ, {"TEST_VAR": "2.5"}):
+            assert get_env_float("TEST_VAR", 1.0) == 2.5
+
+    def test_float_invalid_uses_default(self):
+        with patch.dict(os.environ, {"TEST_VAR": "fast"}):
+            assert get_env_float("TEST_VAR", 1.5) == 1.5
@@ -0,0 +1,160 @@
+"""Tests for zephyr_mcp.utils.hedging module."""
+
+import asyncio
+import os
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from zephyr_mcp.utils import hedging
+from zephyr_mcp.utils.hedging import Hedger, HedgingPolicy, endpoint_class, get_hedger, reset_hedgers
+from zephyr_mcp.utils.metrics import metrics
+
+LABELS = {"target": "zephyr.example", "endpoint": "testcases"}
+
+
+def _warm_hedger(budget: float = 1.0, latency: float = 0.01) -> Hedger:
+    hedger = Hedger(HedgingPolicy(endpoints=frozenset({"testcases"}), budget=budget, min_samples=5), name="zephyr.example")
+    for _ in range(5):
+        hedger.record("testcases", latency)
+    return hedger
+
+
+class TestHedgingPolicy:
+    def test_disabled_by_default(self):
+        with patch.dict(os.environ, {}, clear=True):
+            assert not HedgingPolicy.from_env().enabled
+
+    def test_from_env(self):
+        env = {"ZEPHYR_HEDGE_ENDPOINTS": "testcases, /testcycles", "ZEPHYR_HEDGE_PERCENTILE": "90", "ZEPHYR_HEDGE_BUDGET": "0.1"}
+        with patch.dict(os.environ, env, clear=True):
+            policy = HedgingPolicy.from_env()
+        assert policy.endpoints == frozenset({"testcases", "testcycles"})
+        assert policy.percentile == 90.0
+        assert policy.budget == 0.1
+
+    def test_applies_to_listed_endpoint_classes(self):
+        policy = HedgingPolicy(endpoints=frozenset({"testcases"}))
+        assert policy.applies_to("/testcases/PROJ-T1")
+        assert not policy.applies_to("/testcycles/PROJ-R1")
+
+
+class TestEndpointClass:
+    def test_first_path_segment(self):
+        assert endpoint_class("/testcases/PROJ-T1") == "testcases"
+        assert endpoint_class("/testexecutions") == "testexecutions"
+
+
+class TestHedger:
+    def setup_method(self):
+        metrics.reset()
+
+    def test_no_delay_until_enough_samples(self):
+        hedger = Hedger(HedgingPolicy(endpoints=frozenset({"testcases"}), min_samples=3))
+        hedger.record("testcases", 0.1)
+        assert hedger.hedge_delay("testcases") is None
+
+    def test_delay_is_latency_percentile(self):
+        hedger = Hedger(HedgingPolicy(endpoints=frozenset({"testcases"}), percentile=90.0, min_samples=1))
+        for latency in range(1, 11):
+            hedger.record("testcases", latency / 10)
+        assert hedger.hedge_delay("testcases") == pytest.approx(0.9)
+
+    def test_fast_primary_not_hedged(self):
+        hedger = _warm_hedger(latency=1.0)
+        send = MagicMock(return_value="response")
+
+        assert hedger.send("/testcases/PROJ-T1", send) == "response"
+        assert send.call_count == 1
+        assert metrics.get("zephyr_hedge_sent_total", labels=LABELS) is None
+
+    def test_slow_primary_hedged_and_hedge_wins(self):
+        hedger = _warm_hedger()
+        release = threading.Event()
+        calls = []
+
+        def send():
+            calls.append(1)
+            if len(calls) == 1:
+                release.wait(timeout=5)
+                return "slow"
+            return "fast"
+
+        assert hedger.send("/testcases/PROJ-T1", send) == "fast"
+        release.set()
+        assert metrics.get("zephyr_hedge_sent_total", labels=LABELS) == 1
+        assert metrics.get("zephyr_hedge_won_total", labels=LABELS) == 1
+
+    def test_budget_limits_hedges(self):
+        hedger = _warm_hedger(budget=0.05)
+        send = MagicMock(side_effect=lambda: time.sleep(0.05) or "response")
+
+        assert hedger.send("/testcases/PROJ-T1", send) == "response"
+        assert send.call_count == 1
+        assert metrics.get("zephyr_hedge_sent_total", labels=LABELS) is None
+
+    def test_can_hedge_vetoes_the_hedge(self):
+        hedger = _warm_hedger()
+        send = MagicMock(side_effect=lambda: time.sleep(0.05) or "response")
+
+        assert hedger.send("/testcases/PROJ-T1", send, can_hedge=lambda: False) == "response"
+        assert send.call_count == 1
+
+    def test_busy_pool_sends_without_hedging(self):
+        hedger = _warm_hedger()
+        send = MagicMock(side_effect=lambda: time.sleep(0.05) or "response")
+
+        with patch.object(hedging, "_busy", hedging._HEDGE_WORKERS):
+            assert hedger.send("/testcases/PROJ-T1", send) == "response"
+        assert send.call_count == 1
+        assert metrics.get("zephyr_hedge_sent_total", labels=LABELS) is None
+
+    def test_hedge_used_when_primary_fails(self):
+        hedger = _warm_hedger()
+        calls = []
+
+        def send():
+            calls.append(1)
+            if len(calls) == 1:
+                time.sleep(0.05)
+                raise ConnectionError("reset")
+            time.sleep(0.1)
+            return "hedged"
+
+        assert hedger.send("/testcases/PROJ-T1", send) == "hedged"
+
+    @pytest.mark.asyncio
+    async def test_async_slow_primary_cancelled_when_hedge_wins(self):
+        hedger = _warm_hedger()
+        calls = []
+        cancelled = []
+
+        async def send():
+            calls.append(1)
+            if len(calls) == 1:
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled.append(1)
+                    raise
+                return "slow"
+            return "fast"
+
+        assert await hedger.send_async("/testcases/PROJ-T1", send) == "fast"
+        await asyncio.sleep(0)
+        assert cancelled == [1]
+        assert metrics.get("zephyr_hedge_won_total", labels=LABELS) == 1
+
+
+class TestGetHedger:
+    def setup_method(self):
+        reset_hedgers()
+
+    def test_disabled_policy_returns_none(self):
+        assert get_hedger("key", HedgingPolicy()) is None
+
+    def test_shared_per_key(self):
+        policy = HedgingPolicy(endpoints=frozenset({"testcases"}))
+        assert get_hedger("key", policy) is get_hedger("key", policy)
@@ -0,0 +1,374 @@
+"""Tests for zephyr_mcp.utils.http module."""
+
+import asyncio
+import gc
+import os
+import ssl
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import requests
+
+from zephyr_mcp.exceptions import CircuitOpenError, RequestCancelledError
+from zephyr_mcp.utils import concurrency, hedging, ratelimit
+from zephyr_mcp.utils.cancellation import cancellation_scope
+from zephyr_mcp.utils.circuit import CircuitBreaker, CircuitBreakerPolicy, reset_circuit_breakers
+from zephyr_mcp.utils.concurrency import ConcurrencyPolicy
+from zephyr_mcp.utils.hedging import Hedger, HedgingPolicy
+from zephyr_mcp.utils.http import (
+    HTTPSettings,
+    RequestPipeline,
+    build_async_http_client,
+    build_request_pipeline,
+    configure_http_session,
+    get_http_engine_from_env,
+)
+from zephyr_mcp.utils.metrics import metrics
+from zephyr_mcp.utils.ratelimit import RateLimitPolicy, reset_rate_limiters
+from zephyr_mcp.utils.retry import RetryPolicy
+from zephyr_mcp.utils.singleflight import SingleFlight
+from zephyr_mcp.zephyr.config import ZephyrConfig
+
+
+class TestGetHttpEngineFromEnv:
+    def test_defaults_to_sync(self):
+        with patch.dict(os.environ, {}, clear=True):
+            assert get_http_engine_from_env("ZEPHYR_HTTP_ENGINE") == "sync"
+
+    def test_first_set_variable_wins(self):
+        with patch.dict(os.environ, {"A": "", "B": " ASYNC "}, clear=True):
+            assert get_http_engine_from_env("A", "B") == "async"
+
+    def test_invalid_value_raises(self):
+        with patch.dict(os.environ, {"A": "threads"}, clear=True):
+            with pytest.raises(ValueError, match="A must be one of"):
+                get_http_engine_from_env("A")
+
+
+class TestBuildAsyncHttpClient:
+    @pytest.mark.asyncio
+    async def test_mirrors_session_headers(self):
+        session = requests.Session()
+        session.headers.update({"Authorization": "Bearer tok", "X-Custom": "1"})
+
+        client = build_async_http_client(session)
+        assert client.headers["Authorization"] == "Bearer tok"
+        assert client.headers["X-Custom"] == "1"
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_mounts_session_proxies(self):
+        session = requests.Session()
+        session.proxies = {"https": "http://proxy.example.com:8080"}
+
+        client = build_async_http_client(session)
+        assert any(pattern.scheme == "https" for pattern in client._mounts)
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_uses_ca_bundle_from_environment(self):
+        with (
+            patch.dict(os.environ, {"REQUESTS_CA_BUNDLE": "/etc/corp-ca.pem"}),
+            patch("zephyr_mcp.utils.http.get_ssl_context", return_value=ssl.create_default_context()) as get_context,
+        ):
+            client = build_async_http_client(requests.Session())
+        get_context.assert_called_once_with("/etc/corp-ca.pem")
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_follows_unverified_session(self):
+        session = requests.Session()
+        session.verify = False
+        with (
+            patch.dict(os.environ, {"REQUESTS_CA_BUNDLE": "/etc/corp-ca.pem"}),
+            patch("zephyr_mcp.utils.http.get_ssl_context", return_value=ssl.create_default_context()) as get_context,
+        ):
+            client = build_async_http_client(session)
+        get_context.assert_called_once_with(False)
+        await client.aclose()
+
+
+class TestRequestPipeline:
+    def setup_method(self):
+        reset_rate_limiters()
+
+    def test_acquires_token_per_attempt(self):
+        limiter = MagicMock()
+        send = MagicMock(side_effect=[MagicMock(status_code=503, headers={}), MagicMock(status_code=200, headers={})])
+        pipeline = RequestPipeline("zephyr.example", RetryPolicy(backoff_base=0.0), limiter)
+
+        assert pipeline.send(send, "GET").status_code == 200
+        assert limiter.acquire.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_async_acquires_token_per_attempt(self):
+        limiter = MagicMock()
+        limiter.acquire_async = AsyncMock()
+        send = AsyncMock(return_value=MagicMock(status_code=200, headers={}))
+        pipeline = RequestPipeline("zephyr.example", RetryPolicy(), limiter)
+
+        assert (await pipeline.send_async(send, "GET")).status_code == 200
+        limiter.acquire_async.assert_awaited_once()
+
+    def test_build_shares_limiter_per_host_and_credential(self):
+        config = ZephyrConfig(url="https://zephyr.example/v2", personal_token="tok", rate_limit=RateLimitPolicy(rate=5.0, burst=5))
+        other = ZephyrConfig(url="https://zephyr.example/v2", personal_token="other", rate_limit=RateLimitPolicy(rate=5.0, burst=5))
+
+        first = build_request_pipeline("https://zephyr.example/v2", config)
+        second = build_request_pipeline("https://zephyr.example/v2", config)
+        assert first.target == "zephyr.example"
+        assert first.rate_limiter is second.rate_limiter
+        assert build_request_pipeline("https://zephyr.example/v2", other).rate_limiter is not first.rate_limiter
+
+    def test_build_shares_hedger_per_host(self):
+        hedging = HedgingPolicy(endpoints=frozenset({"testcases"}))
+        config = ZephyrConfig(url="https://zephyr.example/v2", personal_token="tok")
+        other = ZephyrConfig(url="https://zephyr.example/v2", personal_token="other")
+
+        first = build_request_pipeline(config.url, config, hedging=hedging)
+        assert first.hedger is build_request_pipeline(other.url, other, hedging=hedging).hedger
+        assert build_request_pipeline(config.url, config).hedger is None
+
+    def test_unused_pipeline_leaves_no_registry_entries(self):
+        config = ZephyrConfig(url="https://zephyr.example/v2", personal_token="tok", rate_limit=RateLimitPolicy(rate=5.0, burst=5))
+        pipeline = build_request_pipeline(config.url, config, hedging=HedgingPolicy(endpoints=frozenset({"testcases"})))
+        assert pipeline.rate_limiter is not None and pipeline.concurrency_limiter is not None and pipeline.hedger is not None
+
+        del pipeline
+        gc.collect()
+
+        key = f"zephyr.example|{config.credential_id()}"
+        assert key not in ratelimit._buckets and key not in concurrency._limiters and "zephyr.example" not in hedging._hedgers
+
+    def test_build_without_rate_limit(self):
+        config = ZephyrConfig(url="https://zephyr.example/v2", personal_token="tok", rate_limit=RateLimitPolicy())
+        assert build_request_pipeline(config.url, config).rate_limiter is None
+
+    def test_concurrency_slot_released_with_outcome(self):
+        limiter = MagicMock()
+        limiter.acquire.return_value = 1.0
+        send = MagicMock(return_value=MagicMock(status_code=429, headers={}))
+        pipeline = RequestPipeline("zephyr.example", RetryPolicy(max_attempts=1), concurrency_limiter=limiter)
+
+        pipeline.send(send, "GET", endpoint="/testcases/search")
+        limiter.release.assert_called_once_with(1.0, overloaded=True, succeeded=True, kind="testcases")
+
+    def test_concurrency_timeout_reported_as_overload(self):
+        limiter = MagicMock()
+        limiter.acquire.return_value = 1.0
+        send = MagicMock(side_effect=requests.exceptions.ReadTimeout("slow"))
+        pipeline = RequestPipeline("zephyr.example", RetryPolicy(max_attempts=1), concurrency_limiter=limiter)
+
+        with pytest.raises(requests.exceptions.ReadTimeout):
+            pipeline.send(send, "GET")
+        limiter.release.assert_called_once_with(1.0, overloaded=True, succeeded=False, kind="")
+
+    def _hedging_pipeline(self, limiter):
+        hedger = Hedger(HedgingPolicy(endpoints=frozenset({"testcases"}), budget=1.0, min_samples=1))
+        hedger.record("testcases", 0.01)
+        return RequestPipeline("zephyr.example", RetryPolicy(max_attempts=1), limiter, hedger=hedger)
+
+    @staticmethod
+    def _slow_then_fast():
+        calls = []
+
+        def send():
+            calls.append(1)
+            if len(calls) == 1:
+                time.sleep(0.2)
+            return MagicMock(status_code=200, headers={})
+
+        return send, calls
+
+    def test_hedge_takes_its_own_token(self):
+        limiter = MagicMock()
+        limiter.has_token.return_value = True
+        send, calls = self._slow_then_fast()
+
+        self._hedging_pipeline(limiter).send(send, "GET", endpoint="/testcases/PROJ-T1", hedge=True)
+        assert len(calls) == 2
+        assert limiter.acquire.call_count == 2
+
+    def test_no_hedge_while_rate_limited(self):
+        limiter = MagicMock()
+        limiter.has_token.return_value = False
+        send, calls = self._slow_then_fast()
+
+        self._hedging_pipeline(limiter).send(send, "GET", endpoint="/testcases/PROJ-T1", hedge=True)
+        assert len(calls) == 1
+        assert limiter.acquire.call_count == 1
+
+
+class TestHTTPSettings:
+    def test_defaults(self):
+        with patch.dict(os.environ, {}, clear=True):
+            settings = HTTPSettings.from_env()
+        assert settings == HTTPSettings()
+        assert settings.timeout == (10.0, 60.0)
+
+    def test_from_env(self):
+        env = {
+            "ZEPHYR_CONNECT_TIMEOUT": "3",
+            "ZEPHYR_READ_TIMEOUT": "20",
+            "ZEPHYR_POOL_CONNECTIONS": "4",
+            "ZEPHYR_POOL_MAXSIZE": "64",
+            "ZEPHYR_POOL_BLOCK": "true",
+        }
+        with patch.dict(os.environ, env, clear=True):
+            settings = HTTPSettings.from_env()
+        assert settings == HTTPSettings(connect_timeout=3.0, read_timeout=20.0, pool_connections=4, pool_maxsize=64, pool_block=True)
+
+    def test_prefix_fallback_per_setting(self):
+        env = {"ZEPHYR_SQUAD_READ_TIMEOUT": "5", "ZEPHYR_READ_TIMEOUT": "30", "ZEPHYR_POOL_MAXSIZE": "16"}
+        with patch.dict(os.environ, env, clear=True):
+            settings = HTTPSettings.from_env("ZEPHYR_SQUAD", "ZEPHYR")
+        assert settings.read_timeout == 5.0
+        assert settings.pool_maxsize == 16
+
+    def test_configure_http_session_mounts_sized_adapter(self):
+        session = requests.Session()
+        configure_http_session(session, HTTPSettings(pool_maxsize=50, pool_block=True))
+        adapter = session.get_adapter("https://api.example.com")
+        assert adapter._pool_maxsize == 50
+        assert adapter._pool_block is True
+
+    @pytest.mark.asyncio
+    async def test_async_client_uses_settings(self):
+        client = build_async_http_client(requests.Session(), settings=HTTPSettings(connect_timeout=2.0, read_timeout=7.0))
+        assert client.timeout.connect == 2.0
+        assert client.timeout.read == 7.0
+        await client.aclose()
+
+
+def _wait_for_coalesced(target: str, count: int) -> None:
+    deadline = time.monotonic() + 5
+    while (metrics.get("zephyr_http_coalesced_total", labels={"target": target}) or 0) < count and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+class TestRequestPipelineCoalescing:
+    def test_identical_gets_share_one_send(self):
+        release = threading.Event()
+        send = MagicMock(side_effect=lambda: release.wait(timeout=5) and MagicMock(status_code=200, headers={}))
+        pipeline = RequestPipeline("zephyr.example", RetryPolicy(), singleflight=SingleFlight(name="coalesce-test"), scope="zephyr.example|cred")
+        metrics.reset()
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(pipeline.send(send, "GET", coalesce_key="k"))) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        _wait_for_coalesced("coalesce-test", 2)
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert send.call_count == 1
+        assert len(results) == 3
+
+    def test_without_key_each_request_is_sent(self):
+        send = MagicMock(return_value=MagicMock(status_code=200, headers={}))
+        pipeline = RequestPipeline("zephyr.example", RetryPolicy(), singleflight=SingleFlight())
+
+        pipeline.send(send, "GET")
+        pipeline.send(send, "GET")
+        assert send.call_count == 2
+
+    def test_scope_separates_credentials(self):
+        group = SingleFlight()
+        first = RequestPipeline("zephyr.example", RetryPolicy(), singleflight=group, scope="zephyr.example|a")
+        second = RequestPipeline("zephyr.example", RetryPolicy(), singleflight=group, scope="zephyr.example|b")
+        ok = MagicMock(status_code=200, headers={})
+        inner = MagicMock(return_value=ok)
+
+        def send_from_second():
+            # Coalescing across scopes would deadlock here waiting on the outer call.
+            second.send(inner, "GET", coalesce_key="k")
+            return ok
+
+        assert first.send(send_from_second, "GET", coalesce_key="k") is ok
+        inner.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_async_identical_gets_share_one_send(self):
+        calls = []
+
+        async def send():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return MagicMock(status_code=200, headers={})
+
+        pipeline = RequestPipeline("zephyr.example", RetryPolicy(), singleflight=SingleFlight())
+        await asyncio.gather(*(pipeline.send_async(send, "GET", coalesce_key="k") for _ in range(4)))
+        assert len(calls) == 1
+
+    def test_builder_honours_coalesce_switch(self):
+        config = MagicMock(coalesce_gets=False, rate_limit=RateLimitPolicy(), concurrency=ConcurrencyPolicy(enabled=False))
+        assert build_request_pipeline("https://api.example.com", config).singleflight is None
+
+
+class TestRequestPipelineCircuitBreaker:
+    def test_failures_open_circuit_and_fail_fast(self):
+        breaker = CircuitBreaker(CircuitBreakerPolicy(min_requests=2), name="zephyr.example")
+        send = MagicMock(return_value=MagicMock(status_code=503, headers={}))
+        pipeline = RequestPipeline("zephyr.example", RetryPolicy(max_attempts=5, backoff_base=0.0), circuit_breaker=breaker)
+
+        with pytest.raises(CircuitOpenError):
+            pipeline.send(send, "GET")
+        # Retries stop as soon as the circuit opens.
+        assert send.call_count == 2
+
+    def test_client_errors_do_not_count(self):
+        breaker = CircuitBreaker(CircuitBreakerPolicy(min_requests=1))
+        pipeline = RequestPipeline("zephyr.example", RetryPolicy(), circuit_breaker=breaker)
+
+        pipeline.send(MagicMock(return_value=MagicMock(status_code=404, headers={})), "GET")
+        assert breaker.state == "closed"
+
+    def test_connection_errors_count(self):
+        breaker = CircuitBreaker(CircuitBreakerPolicy(min_requests=1))
+        pipeline = RequestPipeline("zephyr.example", RetryPolicy(max_attempts=1), circuit_breaker=breaker)
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            pipeline.send(MagicMock(side_effect=requests.exceptions.ConnectionError("refused")), "GET")
+        assert breaker.state == "open"
+
+    @pytest.mark.asyncio
+    async def test_async_open_circuit_fails_fast(self):
+        breaker = CircuitBreaker(CircuitBreakerPolicy(min_requests=1))
+        pipeline = RequestPipeline("zephyr.example", RetryPolicy(max_attempts=1), circuit_breaker=breaker)
+        send = AsyncMock(return_value=MagicMock(status_code=500, headers={}))
+
+        await pipeline.send_async(send, "GET")
+        with pytest.raises(CircuitOpenError):
+            await pipeline.send_async(send, "GET")
+        assert send.await_count == 1
+
+    def test_builder_keys_breaker_by_base_url(self):
+        reset_circuit_breakers()
+        config = MagicMock(rate_limit=RateLimitPolicy(), concurrency=ConcurrencyPolicy(enabled=False), circuit_breaker=CircuitBreakerPolicy())
+        first = build_request_pipeline("https://zephyr.example/v2", config)
+        config.credential_id.return_value = "other"
+        second = build_request_pipeline("https://zephyr.example/v2", config)
+        assert first.circuit_breaker is second.circuit_breaker
+
+
+class TestRequestPipelineCancellation:
+    def test_cancelled_scope_stops_before_sending(self):
+        send = MagicMock()
+        pipeline = RequestPipeline("zephyr.example", RetryPolicy())
+
+        with cancellation_scope() as scope:
+            scope.cancel()
+            with pytest.raises(RequestCancelledError):
+                pipeline.send(send, "GET")
+        send.assert_not_called()
+
+    def test_cancellation_during_backoff_stops_retries(self):
+        pipeline = RequestPipeline("zephyr.example", RetryPolicy(max_attempts=5, backoff_base=10.0, backoff_max=10.0))
+        with cancellation_scope() as scope:
+            send = MagicMock(side_effect=lambda: scope.cancel() or MagicMock(status_code=503, headers={}))
+            with pytest.raises(RequestCancelledError):
+                pipeline.send(send, "GET")
+        assert send.call_count == 1
@@ -0,0 +1,94 @@
+"""Tests for zephyr_mcp.utils.jsoncodec module."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from zephyr_mcp.utils import jsoncodec
+from zephyr_mcp.utils.jsoncodec import RawJSON, decode_response, dumps, is_pretty_json_from_env, loads
+
+BACKENDS = ["default", "stdlib"]
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    """Run a test with the installed backend and again with the standard library."""
+    if request.param == "stdlib":
+        with patch.object(jsoncodec, "orjson", None):
+            yield request.param
+    else:
+        yield request.param
+
+
+class TestLoads:
+    def test_bytes(self, backend):
+        assert loads(b'{"key": "T1", "n": [1, 2.5, null, true]}') == {"key": "T1", "n": [1, 2.5, None, True]}
+
+    def test_str_and_memoryview(self, backend):
+        assert loads('["a"]') == ["a"]
+        assert loads(memoryview(b'["a"]')) == ["a"]
+
+    def test_utf8(self, backend):
+        assert loads('{"name": "Prüfung ✓"}'.encode()) == {"name": "Prüfung ✓"}
+
+    def test_invalid_raises_value_error(self, backend):
+        with pytest.raises(ValueError):
+            loads(b"not json")
+
+
+class TestDumps:
+    def test_compact(self, backend):
+        assert dumps({"key": "T1", "items": [1, 2]}) == '{"key":"T1","items":[1,2]}'
+
+    def test_pretty(self, backend):
+        assert dumps({"key": "T1"}, pretty=True) == '{\n  "key": "T1"\n}'
+
+    def test_keeps_non_ascii(self, backend):
+        assert dumps({"name": "Prüfung"}) == '{"name":"Prüfung"}'
+
+    def test_falls_back_for_non_string_keys(self, backend):
+        assert dumps({1: "a"}) == '{"1":"a"}'
+
+    def test_unserializable_raises_type_error(self, backend):
+        with pytest.raises(TypeError):
+            dumps({"key": object()})
+
+
+class TestRawJSON:
+    def test_parsed_lazily_once(self):
+        raw = RawJSON(b'{"key": "T1"}')
+        with patch.object(jsoncodec, "loads", wraps=loads) as mock_loads:
+            assert raw.text == '{"key": "T1"}'
+            mock_loads.assert_not_called()
+            assert raw.value == {"key": "T1"}
+            assert raw.value == {"key": "T1"}
+        mock_loads.assert_called_once()
+
+    def test_dumps_passes_body_through(self, backend):
+        body = '{"key": "T1",  "name": "Prüfung"}'
+        assert dumps(RawJSON(body.encode())) == body
+
+    def test_dumps_pretty_reformats(self, backend):
+        assert dumps(RawJSON(b'{"key":"T1"}'), pretty=True) == '{\n  "key": "T1"\n}'
+
+
+class TestDecodeResponse:
+    def test_decodes_content(self):
+        response = MagicMock(content=b'{"key": "T1"}')
+        assert decode_response(response) == {"key": "T1"}
+
+    def test_raw(self):
+        response = MagicMock(content=b'{"key": "T1"}')
+        result = decode_response(response, raw=True)
+        assert isinstance(result, RawJSON)
+        assert result.content is response.content
+
+
+class TestPrettyJsonFromEnv:
+    def test_default_compact(self, monkeypatch):
+        monkeypatch.delenv("ZEPHYR_JSON_PRETTY", raising=False)
+        assert is_pretty_json_from_env() is False
+
+    def test_enabled(self, monkeypatch):
+        monkeypatch.setenv("ZEPHYR_JSON_PRETTY", "true")
+        assert is_pretty_json_from_env() is True
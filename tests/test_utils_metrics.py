@@ -0,0 +1,43 @@
+"""Tests for zephyr_mcp.utils.metrics module."""
+
+from zephyr_mcp.utils.metrics import MetricsRegistry
+
+
+class TestMetricsRegistry:
+    def test_counter_accumulates(self):
+        registry = MetricsRegistry()
+        registry.increment("requests_total", labels={"status": "200"})
+        registry.increment("requests_total", 2, labels={"status": "200"})
+        assert registry.get("requests_total", {"status": "200"}) == 3
+        assert registry.get("requests_total", {"status": "500"}) is None
+
+    def test_gauge_set_and_add(self):
+        registry = MetricsRegistry()
+        registry.set_gauge("in_flight", 4)
+        registry.add_gauge("in_flight", -1)
+        assert registry.get("in_flight") == 3
+
+    def test_summary_snapshot(self):
+        registry = MetricsRegistry()
+        registry.observe("wait_seconds", 0.5)
+        registry.observe("wait_seconds", 1.5)
+        assert registry.snapshot()["summaries"]["wait_seconds"] == {"count": 2, "sum": 2.0, "max": 1.5}
+
+    def test_render_prometheus(self):
+        registry = MetricsRegistry()
+        registry.increment("requests_total", labels={"host": 'a"b'})
+        registry.set_gauge("in_flight", 1)
+        registry.observe("wait_seconds", 0.25)
+
+        text = registry.render_prometheus()
+        assert "# TYPE requests_total counter" in text
+        assert 'requests_total{host="a\\"b"} 1.0' in text
+        assert "in_flight 1" in text
+        assert "wait_seconds_count 1" in text
+        assert "wait_seconds_sum 0.25" in text
+
+    def test_reset(self):
+        registry = MetricsRegistry()
+        registry.increment("requests_total")
+        registry.reset()
+        assert registry.get("requests_total") is None
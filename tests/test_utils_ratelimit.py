@@ -0,0 +1,81 @@
+"""Tests for zephyr_mcp.utils.ratelimit module."""
+
+import os
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from zephyr_mcp.utils.ratelimit import RateLimitPolicy, TokenBucket, get_rate_limiter, reset_rate_limiters
+
+
+class TestRateLimitPolicy:
+    def test_disabled_by_default(self):
+        with patch.dict(os.environ, {}, clear=True):
+            assert not RateLimitPolicy.from_env().enabled
+
+    def test_rate_and_burst_from_env(self):
+        with patch.dict(os.environ, {"ZEPHYR_RATE_LIMIT": "5", "ZEPHYR_RATE_LIMIT_BURST": "10"}, clear=True):
+            assert RateLimitPolicy.from_env() == RateLimitPolicy(rate=5.0, burst=10)
+
+    def test_burst_defaults_to_rate(self):
+        with patch.dict(os.environ, {"ZEPHYR_RATE_LIMIT": "2.5"}, clear=True):
+            assert RateLimitPolicy.from_env().burst == 2
+
+    def test_first_set_variable_wins(self):
+        env = {"ZEPHYR_RATE_LIMIT": "5", "ZEPHYR_SQUAD_RATE_LIMIT": "1"}
+        with patch.dict(os.environ, env, clear=True):
+            assert RateLimitPolicy.from_env("ZEPHYR_SQUAD_RATE_LIMIT", "ZEPHYR_RATE_LIMIT").rate == 1.0
+
+
+class TestTokenBucket:
+    @patch("zephyr_mcp.utils.ratelimit.time.monotonic", return_value=100.0)
+    def test_burst_then_paced(self, mock_monotonic):
+        bucket = TokenBucket(rate=2.0, burst=2)
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(0.5)
+        # Waiters queue behind each other rather than all waking together.
+        assert bucket.reserve() == pytest.approx(1.0)
+
+    @patch("zephyr_mcp.utils.ratelimit.time.monotonic")
+    def test_refills_over_time_up_to_burst(self, mock_monotonic):
+        mock_monotonic.return_value = 0.0
+        bucket = TokenBucket(rate=1.0, burst=1)
+        assert bucket.reserve() == 0.0
+        mock_monotonic.return_value = 10.0
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(1.0)
+
+    @patch("zephyr_mcp.utils.ratelimit.time.sleep")
+    def test_acquire_sleeps_for_reserved_slot(self, mock_sleep):
+        bucket = TokenBucket(rate=1.0, burst=1)
+        bucket.acquire()
+        waited = bucket.acquire()
+        assert waited > 0
+        mock_sleep.assert_called_once_with(waited)
+
+    @pytest.mark.asyncio
+    @patch("zephyr_mcp.utils.ratelimit.asyncio.sleep", new_callable=AsyncMock)
+    async def test_acquire_async_waits_on_loop(self, mock_sleep):
+        bucket = TokenBucket(rate=1.0, burst=1)
+        await bucket.acquire_async()
+        waited = await bucket.acquire_async()
+        mock_sleep.assert_awaited_once_with(waited)
+
+
+class TestGetRateLimiter:
+    def setup_method(self):
+        reset_rate_limiters()
+
+    def test_disabled_policy_returns_none(self):
+        assert get_rate_limiter("host|cred", RateLimitPolicy()) is None
+
+    def test_same_key_shares_bucket(self):
+        policy = RateLimitPolicy(rate=5.0, burst=5)
+        assert get_rate_limiter("host|cred", policy) is get_rate_limiter("host|cred", policy)
+        assert get_rate_limiter("host|cred", policy) is not get_rate_limiter("host|other", policy)
+
+    def test_changed_policy_updates_bucket(self):
+        bucket = get_rate_limiter("host|cred", RateLimitPolicy(rate=5.0, burst=5))
+        get_rate_limiter("host|cred", RateLimitPolicy(rate=1.0, burst=2))
+        assert (bucket.rate, bucket.burst) == (1.0, 2)
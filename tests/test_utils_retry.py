@@ -0,0 +1,130 @@
+"""Tests for zephyr_mcp.utils.retry module."""
+
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+import requests
+
+from zephyr_mcp.utils.metrics import metrics
+from zephyr_mcp.utils.retry import RetryPolicy, parse_retry_after, send_with_retry, send_with_retry_async
+
+
+def _response(status_code: int, headers: dict | None = None) -> MagicMock:
+    return MagicMock(status_code=status_code, headers=headers or {})
+
+
+class TestParseRetryAfter:
+    def test_seconds(self):
+        assert parse_retry_after("3") == 3.0
+
+    def test_http_date_in_past_is_zero(self):
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    def test_invalid_values(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+
+class TestRetryPolicy:
+    def test_from_env(self):
+        env = {"ZEPHYR_RETRY_MAX_ATTEMPTS": "5", "ZEPHYR_RETRY_BACKOFF_BASE": "0.1", "ZEPHYR_RETRY_BACKOFF_MAX": "2"}
+        with patch.dict(os.environ, env, clear=True):
+            policy = RetryPolicy.from_env()
+        assert policy == RetryPolicy(max_attempts=5, backoff_base=0.1, backoff_max=2.0)
+
+    def test_from_env_floor_of_one_attempt(self):
+        with patch.dict(os.environ, {"ZEPHYR_RETRY_MAX_ATTEMPTS": "0"}, clear=True):
+            assert RetryPolicy.from_env().max_attempts == 1
+
+    def test_idempotent_methods_allowed(self):
+        policy = RetryPolicy()
+        assert policy.allows_retry("get")
+        assert policy.allows_retry("PUT")
+        assert not policy.allows_retry("POST")
+        assert policy.allows_retry("POST", {"idempotency-key": "abc"})
+
+    @patch("zephyr_mcp.utils.retry.random.uniform", side_effect=lambda low, high: high)
+    def test_backoff_is_exponential_and_capped(self, mock_uniform):
+        policy = RetryPolicy(backoff_base=1.0, backoff_max=5.0)
+        assert [policy.backoff(attempt) for attempt in (1, 2, 3, 4)] == [1.0, 2.0, 4.0, 5.0]
+
+    def test_retry_after_capped_by_backoff_max(self):
+        policy = RetryPolicy(backoff_max=10.0)
+        assert policy.delay_for(1, _response(429, {"Retry-After": "120"})) == 10.0
+
+
+class TestSendWithRetry:
+    @patch("zephyr_mcp.utils.retry.time.sleep")
+    def test_returns_first_success(self, mock_sleep):
+        send = MagicMock(return_value=_response(200))
+        assert send_with_retry(send, "GET", RetryPolicy()).status_code == 200
+        send.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    @patch("zephyr_mcp.utils.retry.time.sleep")
+    def test_retries_retryable_status_then_succeeds(self, mock_sleep):
+        send = MagicMock(side_effect=[_response(503), _response(502), _response(200)])
+        assert send_with_retry(send, "GET", RetryPolicy(), target="zephyr.example").status_code == 200
+        assert send.call_count == 3
+        assert mock_sleep.call_count == 2
+
+    @patch("zephyr_mcp.utils.retry.time.sleep")
+    def test_returns_last_response_when_attempts_exhausted(self, mock_sleep):
+        send = MagicMock(return_value=_response(503))
+        assert send_with_retry(send, "GET", RetryPolicy(max_attempts=2)).status_code == 503
+        assert send.call_count == 2
+
+    @patch("zephyr_mcp.utils.retry.time.sleep")
+    def test_non_retryable_status_returned_immediately(self, mock_sleep):
+        send = MagicMock(return_value=_response(404))
+        assert send_with_retry(send, "GET", RetryPolicy()).status_code == 404
+        send.assert_called_once()
+
+    @patch("zephyr_mcp.utils.retry.time.sleep")
+    def test_retries_connection_errors(self, mock_sleep):
+        send = MagicMock(side_effect=[requests.exceptions.ConnectionError("reset"), _response(200)])
+        assert send_with_retry(send, "GET", RetryPolicy()).status_code == 200
+
+    @patch("zephyr_mcp.utils.retry.time.sleep")
+    def test_ssl_errors_not_retried(self, mock_sleep):
+        send = MagicMock(side_effect=requests.exceptions.SSLError("bad cert"))
+        with pytest.raises(requests.exceptions.SSLError):
+            send_with_retry(send, "GET", RetryPolicy())
+        send.assert_called_once()
+
+    @patch("zephyr_mcp.utils.retry.time.sleep")
+    def test_post_with_idempotency_key_retried(self, mock_sleep):
+        send = MagicMock(side_effect=[_response(429, {"Retry-After": "1"}), _response(201)])
+        result = send_with_retry(send, "POST", RetryPolicy(), headers={"Idempotency-Key": "k-1"})
+        assert result.status_code == 201
+        mock_sleep.assert_called_once_with(1.0)
+
+    @patch("zephyr_mcp.utils.retry.time.sleep")
+    def test_records_attempt_metrics(self, mock_sleep):
+        metrics.reset()
+        send = MagicMock(side_effect=[_response(503), _response(200)])
+        send_with_retry(send, "GET", RetryPolicy(), target="metrics.example")
+        assert metrics.get("zephyr_http_attempts_total", {"target": "metrics.example", "outcome": "503"}) == 1
+        assert metrics.get("zephyr_http_attempts_total", {"target": "metrics.example", "outcome": "200"}) == 1
+        assert metrics.get("zephyr_http_retries_total", {"target": "metrics.example"}) == 1
+
+
+class TestSendWithRetryAsync:
+    @pytest.mark.asyncio
+    @patch("zephyr_mcp.utils.retry.asyncio.sleep", new_callable=AsyncMock)
+    async def test_retries_then_succeeds(self, mock_sleep):
+        send = AsyncMock(side_effect=[httpx.ConnectError("refused"), _response(429, {"Retry-After": "0.5"}), _response(200)])
+        result = await send_with_retry_async(send, "GET", RetryPolicy())
+        assert result.status_code == 200
+        assert send.await_count == 3
+        assert mock_sleep.await_args_list[-1].args == (0.5,)
+
+    @pytest.mark.asyncio
+    @patch("zephyr_mcp.utils.retry.asyncio.sleep", new_callable=AsyncMock)
+    async def test_non_idempotent_error_raised(self, mock_sleep):
+        send = AsyncMock(side_effect=httpx.ReadTimeout("slow"))
+        with pytest.raises(httpx.ReadTimeout):
+            await send_with_retry_async(send, "POST", RetryPolicy())
+        send.assert_awaited_once()
@@ -0,0 +1,178 @@
+"""Tests for zephyr_mcp.utils.singleflight module."""
+
+import asyncio
+import os
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from zephyr_mcp.exceptions import RequestCancelledError
+from zephyr_mcp.utils.metrics import metrics
+from zephyr_mcp.utils.singleflight import (
+    SingleFlight,
+    coalesce_key,
+    get_singleflight,
+    is_coalescing_enabled_from_env,
+    reset_singleflight_groups,
+)
+
+
+def _wait_for_followers(target: str, count: int) -> None:
+    deadline = time.monotonic() + 5
+    while (metrics.get("zephyr_http_coalesced_total", labels={"target": target}) or 0) < count and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+class TestCoalesceKey:
+    def test_params_order_does_not_matter(self):
+        first = coalesce_key("GET", "https://api/x", {"params": {"a": 1, "b": 2}})
+        second = coalesce_key("get", "https://api/x", {"params": {"b": 2, "a": 1}})
+        assert first == second
+
+    def test_different_params_differ(self):
+        assert coalesce_key("GET", "https://api/x", {"params": {"a": 1}}) != coalesce_key("GET", "https://api/x", {"params": {"a": 2}})
+
+    def test_writes_and_bodies_not_coalesced(self):
+        assert coalesce_key("POST", "https://api/x", {}) is None
+        assert coalesce_key("GET", "https://api/x", {"json": {"q": 1}}) is None
+
+
+class TestCoalescingEnv:
+    def test_enabled_by_default(self):
+        with patch.dict(os.environ, {}, clear=True):
+            assert is_coalescing_enabled_from_env() is True
+
+    def test_disabled(self):
+        with patch.dict(os.environ, {"ZEPHYR_COALESCE_GETS": "false"}, clear=True):
+            assert is_coalescing_enabled_from_env() is False
+
+    def test_first_set_variable_wins(self):
+        env = {"ZEPHYR_SQUAD_COALESCE_GETS": "false", "ZEPHYR_COALESCE_GETS": "true"}
+        with patch.dict(os.environ, env, clear=True):
+            assert is_coalescing_enabled_from_env("ZEPHYR_SQUAD_COALESCE_GETS", "ZEPHYR_COALESCE_GETS") is False
+
+
+class TestSingleFlight:
+    def setup_method(self):
+        metrics.reset()
+
+    def test_concurrent_threads_share_one_call(self):
+        group = SingleFlight(name="zephyr.example")
+        release = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            release.wait(timeout=5)
+            return "result"
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(group.do("key", fetch))) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        _wait_for_followers("zephyr.example", 4)
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert len(calls) == 1
+        assert results == ["result"] * 5
+
+    def test_followers_receive_leader_error(self):
+        group = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def fetch():
+            started.set()
+            release.wait(timeout=5)
+            raise RuntimeError("upstream down")
+
+        errors = []
+
+        def run():
+            try:
+                group.do("key", fetch)
+            except RuntimeError as e:
+                errors.append(e)
+
+        leader = threading.Thread(target=run)
+        leader.start()
+        started.wait(timeout=5)
+        follower = threading.Thread(target=run)
+        follower.start()
+        _wait_for_followers("", 1)
+        release.set()
+        leader.join(timeout=5)
+        follower.join(timeout=5)
+
+        assert len(errors) == 2
+
+    def test_follower_takes_over_from_cancelled_leader(self):
+        group = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def abandoned():
+            started.set()
+            release.wait(timeout=5)
+            raise RequestCancelledError("Request abandoned: cancelled by the client.")
+
+        leader = threading.Thread(target=lambda: pytest.raises(RequestCancelledError, group.do, "key", abandoned))
+        leader.start()
+        started.wait(timeout=5)
+        results = []
+        follower = threading.Thread(target=lambda: results.append(group.do("key", lambda: "fresh")))
+        follower.start()
+        _wait_for_followers("", 1)
+        release.set()
+        leader.join(timeout=5)
+        follower.join(timeout=5)
+
+        assert results == ["fresh"]
+
+    def test_sequential_calls_not_cached(self):
+        group = SingleFlight()
+        assert group.do("key", lambda: 1) == 1
+        assert group.do("key", lambda: 2) == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_coroutines_share_one_call(self):
+        group = SingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "result"
+
+        results = await asyncio.gather(*(group.do_async("key", fetch) for _ in range(5)))
+
+        assert len(calls) == 1
+        assert results == ["result"] * 5
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_call(self):
+        group = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            return "result"
+
+        first = asyncio.create_task(group.do_async("key", fetch))
+        second = asyncio.create_task(group.do_async("key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "result"
+
+
+class TestGetSingleflight:
+    def setup_method(self):
+        reset_singleflight_groups()
+
+    def test_group_shared_by_name(self):
+        assert get_singleflight("a") is get_singleflight("a")
+        assert get_singleflight("a") is not get_singleflight("b")
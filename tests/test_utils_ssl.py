@@ -1,11 +1,19 @@
 """Tests for zephyr_mcp.utils.ssl module."""
 
+import datetime as dt
+import http.server
+import os
+import ssl
+import threading
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 import requests
 
-from zephyr_mcp.utils.ssl import SSLIgnoreAdapter, configure_ssl_verification
+from zephyr_mcp.utils.http import HTTPSettings, configure_http_session
+from zephyr_mcp.utils.metrics import metrics
+from zephyr_mcp.utils.ssl import SSLContextAdapter, SSLIgnoreAdapter, configure_ssl_verification, get_ssl_context, reset_ssl_contexts, session_verify
 
 
 class TestSSLIgnoreAdapter:
@@ -34,6 +42,16 @@ class TestConfigureSslVerification:
         configure_ssl_verification("Zephyr", "https://example.com", session, ssl_verify=False)
         assert any(isinstance(v, SSLIgnoreAdapter) for v in session.adapters.values())
 
+    def test_ssl_ignore_adapter_uses_pool_settings(self):
+        session = requests.Session()
+        configure_ssl_verification(
+            "Zephyr", "https://example.com", session, ssl_verify=False, adapter_kwargs={"pool_maxsize": 40, "pool_block": True}
+        )
+        adapter = session.get_adapter("https://example.com/v2")
+        assert isinstance(adapter, SSLIgnoreAdapter)
+        assert adapter._pool_maxsize == 40
+        assert adapter._pool_block is True
+
     def test_client_cert_configured(self):
         session = requests.Session()
         configure_ssl_verification(
@@ -68,3 +86,122 @@ class TestConfigureSslVerification:
         # Check that adapter is mounted for the domain
         mounted = [k for k, v in session.adapters.items() if isinstance(v, SSLIgnoreAdapter)]
         assert any("myzephyr.example.com" in m for m in mounted)
+
+
+@pytest.fixture
+def tls_server(tmp_path):
+    """A local HTTPS server with a self-signed certificate for localhost; yields (url, cert_path)."""
+    x509 = pytest.importorskip("cryptography.x509")
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = dt.datetime.now(dt.UTC)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - dt.timedelta(minutes=1))
+        .not_valid_after(now + dt.timedelta(hours=1))
+        .add_extension(x509.SubjectAlternativeName([x509.DNSName("localhost")]), critical=False)
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path = tmp_path / "cert.pem"
+    key_path = tmp_path / "key.pem"
+    cert_path.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    key_path.write_bytes(key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()))
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"ok")
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("localhost", 0), Handler)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert_path, key_path)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"https://localhost:{server.server_address[1]}/", str(cert_path)
+    server.shutdown()
+    server.server_close()
+
+
+class TestSharedSSLContexts:
+    def setup_method(self):
+        reset_ssl_contexts()
+        metrics.reset()
+
+    def test_contexts_cached_by_settings(self):
+        assert get_ssl_context(True) is get_ssl_context(True)
+        assert get_ssl_context(False) is not get_ssl_context(True)
+        assert get_ssl_context(False).verify_mode == ssl.CERT_NONE
+        assert get_ssl_context(True).verify_mode == ssl.CERT_REQUIRED
+
+    def test_pool_key_uses_shared_context(self):
+        adapter = SSLContextAdapter()
+        request = requests.Request("GET", "https://example.com/v2").prepare()
+        _, pool_kwargs = adapter.build_connection_pool_key_attributes(request, True)
+        assert pool_kwargs == {"ssl_context": get_ssl_context(True), "cert_reqs": "CERT_REQUIRED"}
+
+        _, pool_kwargs = SSLIgnoreAdapter().build_connection_pool_key_attributes(request, True)
+        assert pool_kwargs == {"ssl_context": get_ssl_context(False), "cert_reqs": "CERT_NONE"}
+
+    def test_cert_verify_leaves_loading_to_context(self):
+        conn = MagicMock()
+        SSLContextAdapter().cert_verify(conn, "https://example.com", True, None)
+        assert conn.cert_reqs == "CERT_REQUIRED"
+        assert conn.ca_certs is None
+        assert conn.ca_cert_dir is None
+
+    def test_session_verify_follows_requests(self):
+        session = requests.Session()
+        with patch.dict(os.environ, {"CURL_CA_BUNDLE": "/etc/corp-ca.pem"}, clear=True):
+            assert session_verify(session) == "/etc/corp-ca.pem"
+            session.trust_env = False
+            assert session_verify(session) is True
+        session.verify = False
+        assert session_verify(session) is False
+
+    def test_ca_bundle_mounts_adapter(self):
+        session = requests.Session()
+        configure_ssl_verification("Zephyr", "https://myzephyr.example.com/api", session, ssl_verify=True, ca_bundle="/etc/ca.pem")
+        adapter = session.get_adapter("https://myzephyr.example.com/api/testcases")
+        assert isinstance(adapter, SSLContextAdapter)
+        assert adapter.ca_bundle == "/etc/ca.pem"
+
+    def test_tls_session_resumed_across_sessions(self, tls_server):
+        url, cert_path = tls_server
+        for _ in range(3):
+            session = requests.Session()
+            configure_http_session(session, HTTPSettings())
+            configure_ssl_verification("Zephyr", url, session, ssl_verify=True, ca_bundle=cert_path)
+            assert session.get(url).text == "ok"
+            session.close()
+
+        counters = metrics.snapshot()["counters"]
+        assert counters['zephyr_tls_handshakes_total{host="localhost",resumed="false"}'] == 1
+        assert counters['zephyr_tls_handshakes_total{host="localhost",resumed="true"}'] == 2
+
+    @pytest.mark.asyncio
+    async def test_tls_session_resumed_by_async_clients(self, tls_server):
+        url, cert_path = tls_server
+        for _ in range(3):
+            async with httpx.AsyncClient(verify=get_ssl_context(cert_path)) as client:
+                assert (await client.get(url)).text == "ok"
+
+        counters = metrics.snapshot()["counters"]
+        assert counters['zephyr_tls_handshakes_total{host="localhost",resumed="false"}'] == 1
+        assert counters['zephyr_tls_handshakes_total{host="localhost",resumed="true"}'] == 2
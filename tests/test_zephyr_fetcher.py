@@ -67,3 +67,13 @@ class TestZephyrFetcher:
         assert hasattr(fetcher, "update_test_execution")
         assert hasattr(fetcher, "delete_test_execution")
         assert hasattr(fetcher, "get_test_execution_results")
+
+    @patch("zephyr_mcp.zephyr.ZephyrClient")
+    def test_close_closes_client(self, mock_client_cls):
+        mock_client = MagicMock()
+        mock_client_cls.return_value = mock_client
+        config = ZephyrConfig(url="https://api.zephyrscale.smartbear.com/v2", auth_type="pat", personal_token="tok")
+        fetcher = ZephyrFetcher(config)
+
+        fetcher.close()
+        mock_client.close.assert_called_once()
@@ -0,0 +1,180 @@
+"""Tests for zephyr_mcp.zephyr.metadata module."""
+
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from zephyr_mcp.cache import MetadataCache, MetadataCachePolicy
+from zephyr_mcp.exceptions import InvalidMetadataError
+from zephyr_mcp.zephyr import AsyncZephyrFetcher, ZephyrFetcher
+from zephyr_mcp.zephyr.config import ZephyrConfig
+from zephyr_mcp.zephyr.metadata import METADATA_CATEGORIES, PAGE_SIZE, MetadataMixin, find_metadata_entry
+
+SCOPE = "https://zephyr.example|pat:abc"
+
+LISTINGS = {
+    ("/statuses", "TEST_CASE"): [
+        {"id": 1, "name": "Approved"},
+        {"id": 2, "name": "Draft"},
+        {"id": 3, "name": "Needs Review"},
+        {"id": 4, "name": "Obsolete", "archived": True},
+    ],
+    ("/priorities", None): [{"id": 20, "name": "High"}, {"id": 21, "name": "Normal"}],
+    ("/environments", None): [],
+    ("/folders", "TEST_CASE"): [
+        {"id": 40, "parentId": None, "name": "Regression"},
+        {"id": 41, "parentId": 40, "name": "Login"},
+        {"id": 42, "parentId": 43, "name": "Login"},
+        {"id": 43, "parentId": None, "name": "Smoke"},
+    ],
+}
+
+
+def _get(endpoint, params=None, **kwargs):
+    values = LISTINGS.get((endpoint, params.get("statusType") or params.get("folderType")), [])
+    return {"values": values, "startAt": params["startAt"], "isLast": True}
+
+
+def _make_mixin(cache: MetadataCache | None = None, is_async: bool = False) -> MetadataMixin:
+    mixin = MetadataMixin()
+    mixin.metadata_cache = cache if cache is not None else MetadataCache(MetadataCachePolicy())
+    mixin.cache_scope = SCOPE
+    mixin.client = MagicMock()
+    mixin.client.get = AsyncMock(side_effect=_get) if is_async else MagicMock(side_effect=_get)
+    mixin.is_async = is_async
+    return mixin
+
+
+class TestGetMetadata:
+    def test_loads_once_per_ttl(self):
+        mixin = _make_mixin()
+
+        first = mixin.get_metadata("PROJ", "testcase_status")
+        second = mixin.get_metadata("PROJ", "testcase_status")
+
+        assert first == second == [{"id": 1, "name": "Approved"}, {"id": 2, "name": "Draft"}, {"id": 3, "name": "Needs Review"}]
+        mixin.client.get.assert_called_once_with(
+            "/statuses", params={"projectKey": "PROJ", "statusType": "TEST_CASE", "maxResults": PAGE_SIZE, "startAt": 0}
+        )
+
+    def test_folders_get_paths(self):
+        folders = _make_mixin().get_metadata("PROJ", "testcase_folder")
+        assert [folder["path"] for folder in folders] == ["/Regression", "/Regression/Login", "/Smoke/Login", "/Smoke"]
+
+    def test_pages_through_long_lists(self):
+        mixin = _make_mixin()
+        pages = [{"values": [{"id": n, "name": f"P{n}"} for n in range(PAGE_SIZE)]}, {"values": [{"id": PAGE_SIZE, "name": "Last"}]}]
+        mixin.client.get = MagicMock(side_effect=pages)
+
+        assert len(mixin.get_metadata("PROJ", "priority")) == PAGE_SIZE + 1
+        assert mixin.client.get.call_args.kwargs["params"]["startAt"] == PAGE_SIZE
+
+    def test_unknown_category(self):
+        with pytest.raises(ValueError, match="Unknown metadata category"):
+            _make_mixin().get_metadata("PROJ", "labels")
+
+    def test_project_metadata_covers_every_category(self):
+        metadata = _make_mixin().get_project_metadata("PROJ")
+        assert set(metadata) == set(METADATA_CATEGORIES)
+        assert metadata["priority"] == [{"id": 20, "name": "High"}, {"id": 21, "name": "Normal"}]
+
+
+class TestResolveMetadata:
+    @pytest.mark.parametrize(
+        ("category", "value", "expected"),
+        [
+            ("testcase_status", "Needs Review", 3),
+            ("testcase_status", "needs review", 3),
+            ("testcase_status", "2", 2),
+            ("testcase_folder", "/Regression/Login", 41),
+            ("testcase_folder", "regression/login", 41),
+            ("testcase_folder", "Regression", 40),
+            ("testcase_folder", "41", 41),
+        ],
+    )
+    def test_matches(self, category, value, expected):
+        assert _make_mixin().resolve_metadata("PROJ", category, value)["id"] == expected
+
+    def test_ambiguous_folder_name_is_rejected(self):
+        with pytest.raises(InvalidMetadataError, match="Folder name 'login' is ambiguous, use the full path: /Regression/Login, /Smoke/Login"):
+            _make_mixin().resolve_metadata("PROJ", "testcase_folder", "login")
+
+    def test_archived_value_is_rejected(self):
+        with pytest.raises(InvalidMetadataError, match="Invalid status 'Obsolete' for project PROJ. Valid statuses: Approved, Draft, Needs Review"):
+            _make_mixin().resolve_metadata("PROJ", "testcase_status", "Obsolete")
+
+    def test_unknown_value_reloads_an_old_list_once(self):
+        mixin = _make_mixin(MetadataCache(MetadataCachePolicy(refresh_after=60.0)))
+        mixin.get_metadata("PROJ", "priority")
+        LISTINGS[("/priorities", None)].append({"id": 22, "name": "Blocker"})
+        try:
+            with patch("zephyr_mcp.cache.metadata.time.time", return_value=time.time() + 61):
+                assert mixin.resolve_metadata("PROJ", "priority", "Blocker")["id"] == 22
+        finally:
+            LISTINGS[("/priorities", None)].pop()
+        assert mixin.client.get.call_count == 2
+
+    def test_unknown_value_does_not_reload_a_fresh_list(self):
+        mixin = _make_mixin()
+        mixin.get_metadata("PROJ", "priority")
+        with pytest.raises(InvalidMetadataError):
+            mixin.resolve_metadata("PROJ", "priority", "Hihg")
+        assert mixin.client.get.call_count == 1
+
+    def test_empty_list_is_not_checked(self):
+        assert _make_mixin().resolve_metadata("PROJ", "environment", "Chrome") is None
+
+    def test_without_cache_nothing_is_checked(self):
+        mixin = _make_mixin()
+        mixin.metadata_cache = None
+        assert mixin.resolve_metadata("PROJ", "testcase_status", "Anything") is None
+        mixin.client.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_async_engine(self):
+        mixin = _make_mixin(is_async=True)
+
+        assert (await mixin.resolve_metadata("PROJ", "testcase_status", "draft"))["name"] == "Draft"
+        assert (await mixin.get_metadata("PROJ", "testcase_status"))[0]["name"] == "Approved"
+        assert set(await mixin.get_project_metadata("PROJ")) == set(METADATA_CATEGORIES)
+        with pytest.raises(InvalidMetadataError):
+            await mixin.resolve_metadata("PROJ", "priority", "Urgent")
+
+    @pytest.mark.asyncio
+    async def test_async_engine_without_cache(self):
+        mixin = _make_mixin(is_async=True)
+        mixin.metadata_cache = None
+        assert await mixin.resolve_metadata("PROJ", "testcase_status", "Anything") is None
+        mixin.client.get.assert_not_called()
+
+
+class TestFindMetadataEntry:
+    def test_exact_name_wins_over_case_insensitive(self):
+        entries = [{"id": 1, "name": "pass"}, {"id": 2, "name": "Pass"}]
+        assert find_metadata_entry("testexecution_status", entries, "Pass")["id"] == 2
+
+    def test_exact_folder_name_shared_by_two_paths_is_ambiguous(self):
+        entries = [{"id": 1, "name": "Smoke", "path": "/Web/Smoke"}, {"id": 2, "name": "Smoke", "path": "/Mobile/Smoke"}]
+        with pytest.raises(InvalidMetadataError, match="Folder name 'Smoke' is ambiguous, use the full path: /Web/Smoke, /Mobile/Smoke"):
+            find_metadata_entry("testcase_folder", entries, "Smoke")
+        assert find_metadata_entry("testcase_folder", entries, "/Mobile/Smoke")["id"] == 2
+        assert find_metadata_entry("testcase_folder", entries, "1")["id"] == 1
+
+    def test_duplicate_status_name_asks_for_the_id(self):
+        entries = [{"id": 1, "name": "Pass"}, {"id": 2, "name": "Pass"}]
+        with pytest.raises(InvalidMetadataError, match=r"Status name 'Pass' is ambiguous, use the ID: Pass \(ID 1\), Pass \(ID 2\)"):
+            find_metadata_entry("testexecution_status", entries, "Pass")
+
+
+class TestFetcherMetadata:
+    @pytest.mark.parametrize("fetcher_class", [ZephyrFetcher, AsyncZephyrFetcher])
+    def test_fetchers_share_the_metadata_cache(self, fetcher_class):
+        config = ZephyrConfig(url="https://zephyr.example/v2", auth_type="pat", personal_token="tok")
+        first, second = fetcher_class(config), fetcher_class(config)
+        assert isinstance(first.metadata_cache, MetadataCache)
+        assert first.metadata_cache is second.metadata_cache
+
+    def test_disabled_by_zero_ttl(self):
+        config = ZephyrConfig(url="https://zephyr.example/v2", auth_type="pat", personal_token="tok", metadata_cache=MetadataCachePolicy(ttl=0))
+        assert ZephyrFetcher(config).metadata_cache is None